@@ -14,6 +14,7 @@
 """TensorFlow Quantitative Finance general math functions."""
 
 
+from tf_quant_finance.math import fourier_pricing
 from tf_quant_finance.math import integration
 from tf_quant_finance.math import interpolation
 from tf_quant_finance.math import optimizer
@@ -37,6 +38,7 @@ from tensorflow.python.util.all_util import remove_undocumented  # pylint: disab
 _allowed_symbols = [
     'fwd_gradient',
     'gradients',
+    'fourier_pricing',
     'integration',
     'interpolation',
     'optimizer',
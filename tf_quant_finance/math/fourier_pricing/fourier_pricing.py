@@ -0,0 +1,291 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""European option pricing from characteristic functions."""
+
+import enum
+from typing import Callable, Tuple
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from tf_quant_finance import types
+
+__all__ = [
+    'FourierPricingMethod',
+    'option_price',
+]
+
+
+@enum.unique
+class FourierPricingMethod(enum.Enum):
+  """Methods for pricing European options from characteristic functions.
+
+  * `COS`: Fourier-cosine series expansion of the density of Fang and
+    Oosterlee [1].
+  * `CARR_MADAN`: Fast Fourier transform of the damped call prices of Carr and
+    Madan [2]. The prices are computed on a uniform log-strike grid and
+    linearly interpolated to the requested strikes.
+
+  #### References
+  [1] F. Fang, C.W. Oosterlee. A novel pricing method for European options
+    based on Fourier-cosine series expansions. SIAM Journal on Scientific
+    Computing, 31(2), 2008.
+  [2] P. Carr, D. Madan. Option valuation using the fast Fourier transform.
+    Journal of Computational Finance, 2(4), 1999.
+  """
+  COS = 1
+  CARR_MADAN = 2
+
+
+def option_price(
+    *,
+    characteristic_fn: Callable[[types.ComplexTensor], types.ComplexTensor],
+    strikes: types.RealTensor,
+    forwards: types.RealTensor,
+    discount_factors: types.RealTensor = None,
+    is_call_options: types.BoolTensor = None,
+    method: FourierPricingMethod = None,
+    num_points: int = None,
+    truncation_width: float = 12.0,
+    truncation_bounds: Tuple[types.RealTensor, types.RealTensor] = None,
+    damping: float = 1.5,
+    grid_step: float = 0.25,
+    dtype: tf.DType = None,
+    name: str = None) -> types.RealTensor:
+  """Prices European options given the characteristic function of log-returns.
+
+  The characteristic function `phi(u) = E[exp(i u X)]` of the log-return
+  `X = log(S_T / F)` of the underlying `S_T` at the expiry relative to the
+  forward `F` is evaluated once per characteristic function parameter set on a
+  grid of `num_points` frequencies. All the strikes sharing these parameters
+  (e.g., all the strikes of an expiry) are then priced from the same values of
+  the characteristic function, either by a single cosine expansion
+  (`FourierPricingMethod.COS`) or by a single fast Fourier transform
+  (`FourierPricingMethod.CARR_MADAN`).
+
+  For efficiency, `characteristic_fn` should return the values with the
+  strike dimension of size 1, so that, e.g., for strikes of shape
+  `[num_expiries, num_strikes]` the characteristic function has shape
+  `[num_expiries, 1, num_points]`.
+
+  #### Example
+  ```python
+  # Black-Scholes characteristic function of log(S_T / F).
+  volatilities = np.array([[0.2], [0.3]])
+  expiries = np.array([[0.5], [1.0]])
+  def characteristic_fn(u):
+    var = tf.complex(volatilities**2 * expiries, 0.0)
+    return tf.math.exp(-0.5 * var * (1j * u + u**2))
+
+  prices = tff.math.fourier_pricing.option_price(
+      characteristic_fn=characteristic_fn,
+      strikes=np.array([[90.0, 100.0, 110.0], [80.0, 100.0, 120.0]]),
+      forwards=100.0,
+      dtype=tf.float64)
+  ```
+
+  #### References
+  [1] F. Fang, C.W. Oosterlee. A novel pricing method for European options
+    based on Fourier-cosine series expansions. SIAM Journal on Scientific
+    Computing, 31(2), 2008.
+  [2] P. Carr, D. Madan. Option valuation using the fast Fourier transform.
+    Journal of Computational Finance, 2(4), 1999.
+
+  Args:
+    characteristic_fn: A Python callable which accepts a complex `Tensor` `u`
+      of shape `[num_points]` and returns a complex `Tensor` of shape
+      `batch_shape + [num_points]` with the values of the characteristic
+      function of `log(S_T / F)` at `u`. `batch_shape` should broadcast with
+      the shape of `strikes`. For `CARR_MADAN` the characteristic function is
+      evaluated at complex arguments with imaginary part `-(damping + 1)`.
+    strikes: A real `Tensor` of any shape. The strikes of the options.
+    forwards: A real `Tensor` broadcastable with `strikes`. The forwards to
+      the expiries.
+    discount_factors: An optional real `Tensor` broadcastable with `strikes`.
+      The discount factors to the expiries.
+      Default value: `None` which maps to no discounting.
+    is_call_options: An optional boolean `Tensor` broadcastable with
+      `strikes`. Indicates whether the option is a call (if True) or a put
+      (if False).
+      Default value: `None` which means that all the options are calls.
+    method: An instance of `FourierPricingMethod`.
+      Default value: `None` which maps to `FourierPricingMethod.COS`.
+    num_points: Python integer. The number of terms of the cosine expansion or
+      the size of the Fourier transform.
+      Default value: `None` which maps to 256 for `COS` and 4096 for
+      `CARR_MADAN`.
+    truncation_width: Python float. Used by `COS` if `truncation_bounds` are
+      not supplied. The density of `X` is truncated to the interval
+      `[c1 - L * sqrt(c2), c1 + L * sqrt(c2)]` where `L` is the
+      `truncation_width`, and `c1`, `c2` are the first two cumulants of `X`
+      computed from the characteristic function by finite differences.
+      Default value: 12.
+    truncation_bounds: Optional tuple of two real `Tensor`s of shape
+      `batch_shape`. The interval of `X` used by `COS`.
+      Default value: `None` which means that the interval is computed from the
+      cumulants.
+    damping: Python float. The damping exponent `alpha` of the call prices
+      used by `CARR_MADAN`.
+      Default value: 1.5.
+    grid_step: Python float. The step of the frequency grid used by
+      `CARR_MADAN`. The log-strike grid step is
+      `2 * pi / (num_points * grid_step)`.
+      Default value: 0.25.
+    dtype: Optional `tf.DType`. If supplied, the dtype to be used for
+      conversion of any supplied non-`Tensor` arguments to `Tensor`.
+      Default value: None which maps to the default dtype inferred by
+      TensorFlow.
+    name: str. The name for the ops created by this function.
+      Default value: None which is mapped to the default name
+      `fourier_option_price`.
+
+  Returns:
+    A real `Tensor` of the shape of `strikes` broadcast with the other inputs.
+    The option prices.
+
+  Raises:
+    ValueError: If `method` is not a supported `FourierPricingMethod`.
+  """
+  if method is None:
+    method = FourierPricingMethod.COS
+  with tf.name_scope(name or 'fourier_option_price'):
+    strikes = tf.convert_to_tensor(strikes, dtype=dtype, name='strikes')
+    dtype = strikes.dtype
+    forwards = tf.convert_to_tensor(forwards, dtype=dtype, name='forwards')
+    if discount_factors is None:
+      discount_factors = tf.ones_like(strikes)
+    discount_factors = tf.convert_to_tensor(
+        discount_factors, dtype=dtype, name='discount_factors')
+    if method == FourierPricingMethod.COS:
+      undiscounted_puts = _cos_put_prices(
+          characteristic_fn, strikes, forwards, num_points or 256,
+          truncation_width, truncation_bounds)
+      undiscounted_calls = undiscounted_puts + forwards - strikes
+    elif method == FourierPricingMethod.CARR_MADAN:
+      undiscounted_calls = _carr_madan_call_prices(
+          characteristic_fn, strikes, forwards, num_points or 4096, damping,
+          grid_step)
+      undiscounted_puts = undiscounted_calls - forwards + strikes
+    else:
+      raise ValueError(f'Unsupported pricing method: {method}')
+    if is_call_options is None:
+      return discount_factors * undiscounted_calls
+    is_call_options = tf.convert_to_tensor(
+        is_call_options, dtype=tf.bool, name='is_call_options')
+    return discount_factors * tf.where(is_call_options, undiscounted_calls,
+                                       undiscounted_puts)
+
+
+def _cos_put_prices(characteristic_fn, strikes, forwards, num_points,
+                    truncation_width, truncation_bounds):
+  """Computes the undiscounted put prices with the COS method."""
+  dtype = strikes.dtype
+  complex_dtype = _complex_dtype(dtype)
+  if truncation_bounds is None:
+    # The first two cumulants of `X` from the expansion
+    # `log(phi(u)) = i c1 u - c2 u**2 / 2 + O(u**3)`.
+    h = 1e-2
+    log_phi = tf.math.log(characteristic_fn(
+        tf.constant([h, -h], dtype=complex_dtype)))
+    c1 = tf.math.imag(log_phi[..., 0] - log_phi[..., 1]) / (2 * h)
+    c2 = -tf.math.real(log_phi[..., 0] + log_phi[..., 1]) / h**2
+    half_width = truncation_width * tf.math.sqrt(tf.math.abs(c2))
+    lower, upper = c1 - half_width, c1 + half_width
+  else:
+    lower, upper = truncation_bounds
+    lower = tf.convert_to_tensor(lower, dtype=dtype, name='truncation_lower')
+    upper = tf.convert_to_tensor(upper, dtype=dtype, name='truncation_upper')
+  # Shape `batch_shape + [1]`
+  lower = tf.expand_dims(lower, -1)
+  width = tf.expand_dims(upper, -1) - lower
+  # Shape `[num_points]`
+  k = tf.range(num_points, dtype=dtype)
+  # Shape `batch_shape + [num_points]`
+  frequencies = k * np.pi / width
+  phi = characteristic_fn(tf.complex(k, tf.zeros_like(k)) * np.pi
+                          / tf.cast(width, complex_dtype))
+  # The first term of the series is weighted by 1/2.
+  series_weights = tf.where(tf.equal(k, 0), 0.5 * tf.ones_like(k),
+                            tf.ones_like(k))
+  density_coefficients = series_weights * tf.math.real(
+      phi * tf.math.exp(tf.complex(tf.zeros_like(frequencies),
+                                   -frequencies * lower)))
+  # The put payoff `K (1 - exp(x))^+` in the variable `x = log(S_T / K)`,
+  # integrated over `[a_x, d]` where `a_x = a + log(F / K)` is the lower
+  # bound of the truncation interval for `x` and `d = min(0, b_x)`.
+  # Shape `strikes_shape + [1]`.
+  log_moneyness = tf.expand_dims(tf.math.log(forwards / strikes), -1)
+  lower_x = lower + log_moneyness
+  upper_x = tf.math.minimum(tf.math.maximum(lower_x, 0), lower_x + width)
+  # Shape `strikes_shape + [num_points]`.
+  angles = frequencies * (upper_x - lower_x)
+  chi = (tf.math.exp(upper_x) * (tf.math.cos(angles)
+                                 + frequencies * tf.math.sin(angles))
+         - tf.math.exp(lower_x)) / (1 + frequencies**2)
+  psi = tf.where(
+      tf.equal(k, 0), (upper_x - lower_x) * tf.ones_like(angles),
+      tf.math.sin(angles) / tf.where(tf.equal(k, 0), tf.ones_like(frequencies),
+                                     frequencies))
+  payoff_coefficients = 2 / width * (psi - chi)
+  return strikes * tf.math.reduce_sum(
+      density_coefficients * payoff_coefficients, axis=-1)
+
+
+def _carr_madan_call_prices(characteristic_fn, strikes, forwards, num_points,
+                            damping, grid_step):
+  """Computes the undiscounted call prices with the Carr-Madan method."""
+  dtype = strikes.dtype
+  complex_dtype = _complex_dtype(dtype)
+  # Frequency grid. Shape `[num_points]`.
+  j = tf.range(num_points, dtype=dtype)
+  v = grid_step * j
+  # Log-strike grid `k_u = -b + u * log_strike_step`.
+  log_strike_step = 2 * np.pi / (num_points * grid_step)
+  grid_lower_bound = num_points * log_strike_step / 2
+  u = tf.complex(v, -(damping + 1) * tf.ones_like(v))
+  # Shape `batch_shape + [num_points]`
+  phi = characteristic_fn(u)
+  denominator = tf.complex(damping**2 + damping - v**2, (2 * damping + 1) * v)
+  psi = phi / denominator
+  # Simpson's rule weights.
+  simpson_weights = grid_step / 3 * tf.where(
+      tf.equal(j, 0), tf.ones_like(j),
+      tf.where(tf.equal(tf.math.floormod(j, 2), 0), 2 * tf.ones_like(j),
+               4 * tf.ones_like(j)))
+  fft_input = psi * tf.complex(
+      tf.math.cos(grid_lower_bound * v) * simpson_weights,
+      tf.math.sin(grid_lower_bound * v) * simpson_weights)
+  # Shape `batch_shape + [num_points]`. Call prices normalized by the forward.
+  log_strikes = -grid_lower_bound + log_strike_step * j
+  normalized_calls = (tf.math.exp(-damping * log_strikes) / np.pi
+                      * tf.math.real(tf.signal.fft(fft_input)))
+  # Linear interpolation on the uniform log-strike grid.
+  log_moneyness = tf.math.log(strikes / forwards)
+  batch_shape = tf.broadcast_dynamic_shape(
+      tf.shape(normalized_calls)[:-1], tf.shape(log_moneyness))
+  normalized_calls = tf.broadcast_to(
+      normalized_calls, tf.concat([batch_shape, [num_points]], axis=0))
+  log_moneyness = tf.broadcast_to(log_moneyness, batch_shape)
+  position = (log_moneyness + grid_lower_bound) / log_strike_step
+  index = tf.clip_by_value(
+      tf.cast(tf.math.floor(position), tf.int32), 0, num_points - 2)
+  weight = position - tf.cast(index, dtype)
+  batch_rank = normalized_calls.shape.rank - 1
+  lower_values = tf.gather(normalized_calls, index, batch_dims=batch_rank)
+  upper_values = tf.gather(normalized_calls, index + 1, batch_dims=batch_rank)
+  return forwards * ((1 - weight) * lower_values + weight * upper_values)
+
+
+def _complex_dtype(dtype):
+  return tf.complex128 if dtype == tf.float64 else tf.complex64
@@ -0,0 +1,110 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for characteristic function option pricing."""
+
+from absl.testing import parameterized
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+
+from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
+
+fourier_pricing = tff.math.fourier_pricing
+
+
+def _lognormal_char_fn(volatilities, expiries, dtype):
+  """Characteristic function of log(S_T / F) under Black-Scholes."""
+  variances = tf.constant(volatilities**2 * expiries, dtype=dtype)
+  complex_dtype = tf.complex128 if dtype == np.float64 else tf.complex64
+  def char_fn(u):
+    total_variance = tf.cast(tf.expand_dims(variances, -1), complex_dtype)
+    return tf.math.exp(-0.5 * total_variance * (1j * u + u**2))
+  return char_fn
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class FourierPricingTest(parameterized.TestCase, tf.test.TestCase):
+  """Tests for characteristic function option pricing."""
+
+  @parameterized.named_parameters(
+      {
+          'testcase_name': 'CosDouble',
+          'method': fourier_pricing.FourierPricingMethod.COS,
+          'dtype': np.float64,
+          'tolerance': 1e-8,
+      },
+      {
+          'testcase_name': 'CosSingle',
+          'method': fourier_pricing.FourierPricingMethod.COS,
+          'dtype': np.float32,
+          'tolerance': 1e-3,
+      },
+      {
+          'testcase_name': 'CarrMadanDouble',
+          'method': fourier_pricing.FourierPricingMethod.CARR_MADAN,
+          'dtype': np.float64,
+          'tolerance': 1e-3,
+      })
+  def test_black_scholes_prices(self, method, dtype, tolerance):
+    """Prices strike grids per expiry and compares with Black-Scholes."""
+    # Shape [num_expiries, 1]
+    volatilities = np.array([[0.1], [0.25], [0.4]])
+    expiries = np.array([[0.25], [1.0], [3.0]])
+    # Shape [num_expiries, num_strikes]
+    strikes = np.array([[70.0, 85.0, 100.0, 115.0, 130.0]] * 3)
+    forwards = 100.0
+    discount_factors = np.exp(-0.03 * expiries)
+    is_call_options = np.array([[True, False, True, False, True]] * 3)
+    prices = fourier_pricing.option_price(
+        characteristic_fn=_lognormal_char_fn(volatilities, expiries, dtype),
+        strikes=strikes,
+        forwards=forwards,
+        discount_factors=discount_factors,
+        is_call_options=is_call_options,
+        method=method,
+        dtype=dtype)
+    expected = tff.black_scholes.option_price(
+        volatilities=volatilities,
+        strikes=strikes,
+        expiries=expiries,
+        forwards=forwards,
+        discount_factors=discount_factors,
+        is_call_options=is_call_options,
+        dtype=np.float64)
+    prices, expected = self.evaluate([prices, expected])
+    self.assertEqual(prices.dtype, dtype)
+    self.assertAllClose(prices, expected, rtol=tolerance, atol=tolerance)
+
+  def test_truncation_bounds(self):
+    """Supplied truncation bounds give the same prices as the cumulants."""
+    dtype = np.float64
+    char_fn = _lognormal_char_fn(np.array([0.2]), np.array([1.0]), dtype)
+    strikes = np.array([[90.0, 100.0, 110.0]])
+    prices = fourier_pricing.option_price(
+        characteristic_fn=char_fn,
+        strikes=strikes,
+        forwards=100.0,
+        truncation_bounds=([-2.5], [2.5]),
+        dtype=dtype)
+    expected = tff.black_scholes.option_price(
+        volatilities=0.2, strikes=strikes, expiries=1.0, forwards=100.0,
+        dtype=dtype)
+    self.assertAllClose(self.evaluate(prices), self.evaluate(expected),
+                        rtol=1e-8, atol=1e-8)
+
+
+if __name__ == '__main__':
+  tf.test.main()
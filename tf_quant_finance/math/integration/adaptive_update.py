@@ -20,6 +20,12 @@ def update(
   tolerance. The values for these intervals are added to the sum of good
   estimations. The other intervals get divided in half.
 
+  The subdivision is done independently for each batch element: only the
+  intervals with too large error are divided. To keep the batch rectangular,
+  the number of new intervals is twice the maximum number of bad intervals
+  among the batch elements, and batch elements with fewer bad intervals are
+  padded with zero-width intervals, which do not contribute to the integral.
+
   #### Example
   ```python
     l = tf.constant([[[0.0], [1.0]]])
@@ -63,32 +69,35 @@ def update(
     lower = tf.convert_to_tensor(lower, dtype=dtype, name='lower')
     dtype = lower.dtype
     upper = tf.convert_to_tensor(upper, dtype=dtype, name='upper')
-    relative_error = error / estimate
+    # Zero-width intervals have zero error and are always good.
+    relative_error = tf.where(
+        tf.math.equal(error, 0), tf.zeros_like(error),
+        error / tf.math.abs(estimate))
     condition = (relative_error > tolerance)
-    # To have matching dimensions we keep the same number of sub-intervals from
-    # each batch element.
-    # We do this by finding the maximum number of sub-intervals needed to be
-    # re-calculated among all batch elements (k) and getting the top k worst
-    # sub-intervals from all batch elements.
+    # To have matching dimensions we keep the same number of sub-intervals for
+    # each batch element. We find the maximum number of sub-intervals needed to
+    # be re-calculated among all batch elements (k) and move the bad
+    # sub-intervals of each batch element to the first positions.
     # count max number of True values along batch_dim
     num_bad_sub_intervals = tf.reduce_max(
         tf.math.count_nonzero(condition, axis=1, dtype=tf.int32), axis=0)
-    # get indices where the error ration is in the top 'num_bad_sub_intervals'
     # Shape [batch_dim, num_bad_sub_intervals]
     indices = tf.math.top_k(
-        relative_error, k=num_bad_sub_intervals, sorted=False).indices
+        tf.where(condition, relative_error, -tf.ones_like(relative_error)),
+        k=num_bad_sub_intervals, sorted=False).indices
+    is_bad = tf.gather(condition, indices, batch_dims=-1)
 
     # calculate sum of good estimates
     # Shape [batch_dim]
-    sum_all = tf.reduce_sum(estimate, axis=-1)
-    sum_bad = tf.reduce_sum(
-        tf.gather(estimate, indices, batch_dims=-1), axis=-1)
-    sum_goods = sum_all - sum_bad
+    sum_goods = tf.reduce_sum(
+        tf.where(condition, tf.zeros_like(estimate), estimate), axis=-1)
 
     # calculate new upper and lower bounds
     # Shape [batch_dim, num_bad_sub_intervals]
-    filtered_lower = tf.gather(lower, indices, batch_dims=-1)
     filtered_upper = tf.gather(upper, indices, batch_dims=-1)
+    # Good intervals selected for padding are replaced by zero-width ones.
+    filtered_lower = tf.where(
+        is_bad, tf.gather(lower, indices, batch_dims=-1), filtered_upper)
     mid_points = (filtered_lower + filtered_upper) / 2
     # Shape [batch_dim, num_bad_sub_intervals * 2]
     new_lower = tf.concat([filtered_lower, mid_points], axis=-1)
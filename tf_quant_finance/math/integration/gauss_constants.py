@@ -1,5 +1,9 @@
 """Pre-calculated constant values for Gaussian quadrature methods."""
 
+import functools
+
+import numpy as np
+
 legendre_roots = {
     2: [-0.5773502691896257645091488, 0.5773502691896257645091488],
     3: [-0.7745966692414833770358531, 0, 0.7745966692414833770358531],
@@ -306,3 +310,54 @@ kronrod_weights = {
         0.0053774798729233489878
     ]
 }
+
+
+# The nodes and weights are converted to arrays once per number of points and
+# dtype, so that the conversion from Python lists is not repeated on every call
+# of the quadrature functions.
+@functools.lru_cache(maxsize=None)
+def legendre_nodes_and_weights(num_points, dtype):
+  """Returns Gauss-Legendre nodes and weights as arrays of the given dtype.
+
+  Args:
+    num_points: Python integer. The number of nodes.
+    dtype: The numpy dtype of the arrays.
+
+  Returns:
+    A tuple of two read-only arrays of shape `[num_points]`, containing the
+    nodes and the weights, or `None` if `num_points` is not supported.
+  """
+  if num_points not in legendre_roots:
+    return None
+  return (_readonly_array(legendre_roots[num_points], dtype),
+          _readonly_array(legendre_weights[num_points], dtype))
+
+
+@functools.lru_cache(maxsize=None)
+def kronrod_nodes_and_weights(num_points, dtype):
+  """Returns Gauss-Kronrod nodes and weights as arrays of the given dtype.
+
+  Args:
+    num_points: Python integer. The number of Kronrod nodes.
+    dtype: The numpy dtype of the arrays.
+
+  Returns:
+    A tuple of three read-only arrays containing the nodes (the Legendre roots
+    followed by the Stieltjes roots), the Kronrod weights for all the nodes and
+    the Legendre weights for the first `(num_points - 1) // 2` nodes, or `None`
+    if `num_points` is not supported.
+  """
+  legendre_num_points = (num_points - 1) // 2
+  if (legendre_num_points not in legendre_roots or
+      num_points not in stieltjes_roots):
+    return None
+  nodes = legendre_roots[legendre_num_points] + stieltjes_roots[num_points]
+  return (_readonly_array(nodes, dtype),
+          _readonly_array(kronrod_weights[num_points], dtype),
+          _readonly_array(legendre_weights[legendre_num_points], dtype))
+
+
+def _readonly_array(values, dtype):
+  array = np.array(values, dtype=dtype)
+  array.setflags(write=False)
+  return array
@@ -68,27 +68,22 @@ def _non_adaptive_gauss_kronrod(
     lower = tf.convert_to_tensor(lower, dtype=dtype, name='lower')
     dtype = lower.dtype
     upper = tf.convert_to_tensor(upper, dtype=dtype, name='upper')
-    legendre_num_points = (num_points - 1) // 2
-    # Shape [legendre_num_points]
-    legendre_roots = gauss_constants.legendre_roots.get(legendre_num_points,
-                                                        None)
-    # Shape [num_points - legendre_num_points]
-    stieltjes_roots = gauss_constants.stieltjes_roots.get(num_points, None)
-    if legendre_roots is None:
-      raise ValueError(f'Unsupported value for `num_points`: {num_points}')
-    if stieltjes_roots is None:
+    nodes_and_weights = gauss_constants.kronrod_nodes_and_weights(
+        num_points, dtype.as_numpy_dtype)
+    if nodes_and_weights is None:
       raise ValueError(f'Unsupported value for `num_points`: {num_points}')
+    # Shapes [num_points], [num_points]
+    roots, weights, _ = nodes_and_weights
     # Shape batch_shape + [1]
     lower = tf.expand_dims(lower, -1)
     upper = tf.expand_dims(upper, -1)
     # Shape [num_points]
-    roots = legendre_roots + stieltjes_roots
     roots = tf.constant(roots, dtype=dtype)
     # Shape batch_shape + [num_points]
     grid = ((upper - lower) * roots + upper + lower) / 2
     func_results = func(grid)
     # Shape [num_points]
-    weights = gauss_constants.kronrod_weights.get(num_points, None)
+    weights = tf.constant(weights, dtype=dtype)
     # Shape batch_shape
     result = tf.reduce_sum(
         func_results * (upper - lower) * weights / 2, axis=-1)
@@ -115,7 +110,10 @@ def gauss_kronrod(func: Callable[[types.FloatTensor], types.FloatTensor],
   and the roots of the Stieltjes polynomial of degree `(num_points+1)//2`,
   multiplied with corresponding precalculated coefficients.
   Repeats procedure if not accurate enough by halving the intervals and dividing
-  these into the same number of subintervals.
+  these into the same number of subintervals. Only the intervals whose
+  estimated error is too large are divided, independently for each batch
+  element. If `max_depth` is reached, the latest estimates of the remaining
+  intervals are added to the result.
 
   #### References
   [1] https://en.wikipedia.org/wiki/Gauss%E2%80%93Kronrod_quadrature_formula
@@ -164,20 +162,25 @@ def gauss_kronrod(func: Callable[[types.FloatTensor], types.FloatTensor],
     upper = tf.convert_to_tensor(upper, dtype=dtype, name='upper')
     legendre_num_points = (num_points - 1) // 2
 
-    def cond(lower, upper, sum_estimates):
-      del upper, sum_estimates
+    # Shape [legendre_num_points]
+    legendre_weights = gauss_constants.kronrod_nodes_and_weights(
+        num_points, dtype.as_numpy_dtype)
+    if legendre_weights is None:
+      raise ValueError(f'Unsupported value for `num_points`: {num_points}')
+    legendre_weights = tf.constant(legendre_weights[2], dtype=dtype)
+
+    def cond(lower, upper, sum_estimates, sum_pending):
+      del upper, sum_estimates, sum_pending
       return tf.size(lower) > 0
 
-    def body(lower, upper, sum_estimates):
+    def body(lower, upper, sum_estimates, sum_pending):
+      del sum_pending
       # Shapes [batch_dim, n],
       # [batch_dim, n, num_points]
       kronrod_result, func_results = _non_adaptive_gauss_kronrod(
           func, lower, upper, num_points, dtype, name)
       # Shape [batch_dim, n, legendre_num_points]
       legendre_func_results = func_results[..., :legendre_num_points]
-      # Shape [legendre_num_points]
-      legendre_weights = tf.constant(
-          gauss_constants.legendre_weights[legendre_num_points], dtype=dtype)
       # Shape [batch_dim, n, 1]
       lower_exp = tf.expand_dims(lower, -1)
       upper_exp = tf.expand_dims(upper, -1)
@@ -191,24 +194,28 @@ def gauss_kronrod(func: Callable[[types.FloatTensor], types.FloatTensor],
           lower, upper, kronrod_result, error, tolerance, dtype)
       # Shape [batch_dim]
       sum_estimates += sum_good_estimates
-      # Shapes [batch_dim, n], [batch_dim, n], [batch_dim]
-      return new_lower, new_upper, sum_estimates
+      # The estimates of the intervals which are being subdivided. They are
+      # used if the maximum depth is reached.
+      sum_pending = tf.reduce_sum(kronrod_result, axis=-1) - sum_good_estimates
+      # Shapes [batch_dim, n], [batch_dim, n], [batch_dim], [batch_dim]
+      return new_lower, new_upper, sum_estimates, sum_pending
 
     sum_estimates = tf.zeros_like(lower, dtype=dtype)
     # n = 1
     # Shape [batch_dim, n]
     lower = tf.expand_dims(lower, -1)
     upper = tf.expand_dims(upper, -1)
-    loop_vars = (lower, upper, sum_estimates)
+    loop_vars = (lower, upper, sum_estimates, sum_estimates)
     # Ensure that the lower and upper have the same batch shape
     lower, upper = utils.broadcast_tensors(lower, upper)
     # Extract the batch shape
     batch_shape = lower.shape[:-1]
-    _, _, estimate_result = tf.while_loop(
+    _, _, estimate_result, pending_result = tf.while_loop(
         cond=cond, body=body, loop_vars=loop_vars,
         maximum_iterations=max_depth,
         shape_invariants=(tf.TensorShape(batch_shape + [None]),
                           tf.TensorShape(batch_shape + [None]),
+                          tf.TensorShape(batch_shape),
                           tf.TensorShape(batch_shape)))
     # Shape [batch_dim]
-    return estimate_result
+    return estimate_result + pending_result
@@ -61,14 +61,15 @@ def gauss_legendre(func: Callable[[types.FloatTensor], types.FloatTensor],
     lower = tf.convert_to_tensor(lower, dtype=dtype, name='lower')
     dtype = lower.dtype
     upper = tf.convert_to_tensor(upper, dtype=dtype, name='upper')
-    roots = gauss_constants.legendre_roots.get(num_points, None)
-    if roots is None:
+    nodes_and_weights = gauss_constants.legendre_nodes_and_weights(
+        num_points, dtype.as_numpy_dtype)
+    if nodes_and_weights is None:
       raise ValueError(f'Unsupported value for `num_points`: {num_points}')
-    coefficients = gauss_constants.legendre_weights
+    roots, weights = nodes_and_weights
     lower = tf.expand_dims(lower, -1)
     upper = tf.expand_dims(upper, -1)
     roots = tf.constant(roots, dtype=dtype)
     grid = ((upper - lower) * roots + upper + lower) / 2
-    weights = tf.constant(coefficients[num_points], dtype=dtype)
+    weights = tf.constant(weights, dtype=dtype)
     result = tf.reduce_sum(func(grid) * (upper - lower) * weights / 2, axis=-1)
     return result
@@ -21,6 +21,7 @@ import tensorflow.compat.v2 as tf
 import tf_quant_finance as tff
 from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
 from tf_quant_finance.math.integration import adaptive_update
+from tf_quant_finance.math.integration import gauss_constants
 
 tff_int = tff.math.integration
 
@@ -126,9 +127,11 @@ ADAPTIVE_UPDATE_TEST_CASES = [
         estimate=[[1.0, 2.0], [3.0, 4.0]],
         error=[[0.02, 0.04], [0.1, 0.8]],
         tolerance=0.1,
-        new_lower=[[1.0, 1.5], [4.0, 4.25]],
-        new_upper=[[1.5, 2.0], [4.25, 4.5]],
-        sum_goods=[2.0, 3.0],
+        # The first batch element has no bad intervals and gets zero-width
+        # padding intervals.
+        new_lower=[[2.0, 2.0], [4.0, 4.25]],
+        new_upper=[[2.0, 2.0], [4.25, 4.5]],
+        sum_goods=[3.0, 3.0],
     ),
     AdaptiveUpdateTestCase(
         lower=[[1.0, 2.0, 4.0, 5.0], [3.5, 4.0, 7.5, 8.0]],
@@ -286,6 +289,37 @@ class IntegrationTest(tf.test.TestCase):
               'max_depth': 30
           }, test_case, 1e-8)
 
+  def test_kronrod_per_integrand_subdivision(self):
+    # A batch of a smooth integrand and an integrand with a rapid change.
+    shifts = tf.constant([[1.0], [1e-6]], dtype=tf.float64)
+    func = lambda x: 1.0 / tf.sqrt(x + tf.expand_dims(shifts, -1))
+    lower = tf.constant([0.0, 0.0], dtype=tf.float64)
+    upper = tf.constant([1.0, 1.0], dtype=tf.float64)
+    exact = 2.0 * (np.sqrt(1.0 + np.array([1.0, 1e-6]))
+                   - np.sqrt(np.array([1.0, 1e-6])))
+    with self.subTest('Accuracy'):
+      approx = self.evaluate(
+          tff_int.gauss_kronrod(func, lower, upper, 1e-10, max_depth=30))
+      self.assertAllClose(approx, exact, rtol=1e-8, atol=0)
+    with self.subTest('MaxDepthReached'):
+      # The unfinished intervals still contribute to the result.
+      approx = self.evaluate(
+          tff_int.gauss_kronrod(func, lower, upper, 1e-10, max_depth=4))
+      self.assertAllClose(approx, exact, rtol=1e-2, atol=0)
+
+  def test_gauss_constants_cache(self):
+    nodes, weights = gauss_constants.legendre_nodes_and_weights(5, np.float32)
+    self.assertEqual(nodes.dtype, np.float32)
+    self.assertAllClose(np.sum(weights), 2.0)
+    self.assertIs(
+        gauss_constants.legendre_nodes_and_weights(5, np.float32)[0], nodes)
+    nodes, kronrod_weights, legendre_weights = (
+        gauss_constants.kronrod_nodes_and_weights(21, np.float64))
+    self.assertEqual(nodes.shape, (21,))
+    self.assertAllClose(np.sum(kronrod_weights), 2.0)
+    self.assertEqual(legendre_weights.shape, (10,))
+    self.assertIsNone(gauss_constants.kronrod_nodes_and_weights(17, np.float64))
+
   def test_integrate_gradient(self):
     for method in tff_int.IntegrationMethod:
       self._test_gradient(tff_int.integrate, {'method': method})
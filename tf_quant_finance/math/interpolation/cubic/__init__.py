@@ -15,14 +15,28 @@
 
 from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import BoundaryConditionType
 from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import build as build_spline
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import build_hermite as build_hermite_spline
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import build_plan
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import HermiteSplineParameters
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import HermiteSplineType
 from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import interpolate
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import interpolate_with_plan
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import InterpolationPlan
+from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import node_slopes
 from tf_quant_finance.math.interpolation.cubic.cubic_interpolation import SplineParameters
 from tensorflow.python.util.all_util import remove_undocumented  # pylint: disable=g-direct-tensorflow-import
 
 _allowed_symbols = [
     'build_spline',
+    'build_hermite_spline',
+    'build_plan',
     'interpolate',
+    'interpolate_with_plan',
+    'InterpolationPlan',
+    'node_slopes',
     'SplineParameters',
+    'HermiteSplineParameters',
+    'HermiteSplineType',
     'BoundaryConditionType',
 ]
 
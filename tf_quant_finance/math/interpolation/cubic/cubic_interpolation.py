@@ -22,9 +22,16 @@ from tf_quant_finance import utils as tff_utils
 
 __all__ = [
     'BoundaryConditionType',
+    'HermiteSplineParameters',
+    'HermiteSplineType',
+    'InterpolationPlan',
     'SplineParameters',
     'build',
+    'build_hermite',
+    'build_plan',
     'interpolate',
+    'interpolate_with_plan',
+    'node_slopes',
 ]
 
 
@@ -61,6 +68,79 @@ class SplineParameters:
   spline_coeffs: types.RealTensor
 
 
+@enum.unique
+class HermiteSplineType(enum.Enum):
+  """Specifies how the node slopes of a local cubic Hermite spline are chosen.
+
+  * `FRITSCH_CARLSON`: the slopes are the averages of the adjacent secants
+  limited as in [1] so that the interpolant preserves the monotonicity of the
+  data.
+  * `AKIMA`: the slopes are the weighted averages of the adjacent secants as
+  in [2]. The interpolant avoids the overshoots of the cubic spline near
+  outliers but is not guaranteed to be monotone.
+
+  #### References:
+  [1]: F. N. Fritsch, R. E. Carlson. Monotone Piecewise Cubic Interpolation.
+    SIAM Journal on Numerical Analysis, 17(2), 1980.
+  [2]: H. Akima. A New Method of Interpolation and Smooth Curve Fitting Based
+    on Local Procedures. Journal of the ACM, 17(4), 1970.
+  """
+  FRITSCH_CARLSON = 1
+  AKIMA = 2
+
+
+@tff_utils.dataclass
+class HermiteSplineParameters:
+  """Cubic Hermite spline parameters.
+
+  Attributes:
+    x_data: A real `Tensor` of shape batch_shape + [num_points] containing
+      X-coordinates of the spline.
+    y_data: A `Tensor` of the same shape and `dtype` as `x_data` containing
+      Y-coordinates of the spline.
+    slopes: A `Tensor` of the same shape and `dtype` as `x_data` containing
+      the first derivatives of the spline at `x_data`.
+  """
+  x_data: types.RealTensor
+  y_data: types.RealTensor
+  slopes: types.RealTensor
+
+
+@tff_utils.dataclass
+class InterpolationPlan:
+  """Precomputed cubic interpolation of fixed points on a fixed grid.
+
+  On each interval the spline is represented in the cubic Hermite form, i.e.,
+  the interpolated value at `x[..., i]` is
+  `lower_value_weights[..., i] * y_data[..., lower_indices[..., i]] +
+   upper_value_weights[..., i] * y_data[..., upper_indices[..., i]] +
+   lower_slope_weights[..., i] * slopes[..., lower_indices[..., i]] +
+   upper_slope_weights[..., i] * slopes[..., upper_indices[..., i]]`,
+  where `slopes` are the first derivatives of the spline at `x_data`.
+
+  Attributes:
+    lower_indices: An int32 `Tensor` of shape `batch_shape + [num_x]`. Indices
+      of the lower nodes of the intervals containing the interpolation points.
+    upper_indices: An int32 `Tensor` of the same shape as `lower_indices`.
+      Indices of the upper nodes of the intervals containing the interpolation
+      points.
+    lower_value_weights: A real `Tensor` of shape `batch_shape + [num_x]`.
+      Weights of the values at `lower_indices`.
+    upper_value_weights: A real `Tensor` of the same shape and `dtype` as
+      `lower_value_weights`. Weights of the values at `upper_indices`.
+    lower_slope_weights: A real `Tensor` of the same shape and `dtype` as
+      `lower_value_weights`. Weights of the slopes at `lower_indices`.
+    upper_slope_weights: A real `Tensor` of the same shape and `dtype` as
+      `lower_value_weights`. Weights of the slopes at `upper_indices`.
+  """
+  lower_indices: types.IntTensor
+  upper_indices: types.IntTensor
+  lower_value_weights: types.RealTensor
+  upper_value_weights: types.RealTensor
+  lower_slope_weights: types.RealTensor
+  upper_slope_weights: types.RealTensor
+
+
 def build(x_data: types.RealTensor,
           y_data: types.RealTensor,
           boundary_condition_type: BoundaryConditionType = None,
@@ -191,8 +271,9 @@ def interpolate(x: types.RealTensor,
 
   Args:
     x: A real `Tensor` of shape `batch_shape + [num_points]`.
-    spline_data: An instance of `SplineParameters`. `spline_data.x_data` should
-      have the same batch shape as `x`.
+    spline_data: An instance of `SplineParameters` or
+      `HermiteSplineParameters`. `spline_data.x_data` should have the same
+      batch shape as `x`.
     optimize_for_tpu: A Python bool. If `True`, the algorithm uses one-hot
       encoding to lookup indices of `x` in `spline_data.x_data`. This
       significantly improves performance of the algorithm on a TPU device but
@@ -216,6 +297,10 @@ def interpolate(x: types.RealTensor,
   """
   name = name or 'cubic_spline_interpolate'
   with tf.name_scope(name):
+    if isinstance(spline_data, HermiteSplineParameters):
+      plan = build_plan(x, spline_data.x_data,
+                        dtype=dtype or spline_data.x_data.dtype)
+      return interpolate_with_plan(spline_data, plan)
     x = tf.convert_to_tensor(x, dtype=dtype, name='x')
     dtype = x.dtype
     # Unpack the spline data
@@ -280,6 +365,299 @@ def interpolate(x: types.RealTensor,
     return result
 
 
+def build_hermite(x_data: types.RealTensor,
+                  y_data: types.RealTensor,
+                  spline_type: HermiteSplineType = None,
+                  validate_args: bool = False,
+                  dtype: tf.DType = None,
+                  name=None) -> HermiteSplineParameters:
+  """Builds a local cubic Hermite spline.
+
+  Unlike `build`, which solves a tridiagonal system to obtain a spline with a
+  continuous second derivative, a local spline determines the first derivative
+  at each node from the neighbouring data points only (see
+  `HermiteSplineType`). The spline is once continuously differentiable and
+  a change of a single value of `y_data` only affects the spline on a few
+  adjacent intervals, which makes bucketed sensitivities cheap to compute.
+
+  Repeated entries in `x_data` are only allowed for the *right* boundary values
+  of `x_data` and only for the `FRITSCH_CARLSON` spline type (see `build`).
+
+  #### Example
+
+  ```python
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  x_data = tf.constant([0.0, 1.0, 2.0, 3.0, 4.0], dtype=tf.float64)
+  y_data = tf.constant([0.0, 0.1, 1.0, 1.0, 1.2], dtype=tf.float64)
+  spline = tff.math.interpolation.cubic.build_hermite_spline(x_data, y_data)
+  tff.math.interpolation.cubic.interpolate([0.5, 2.5, 3.5], spline)
+  # Expected: [0.02058258, 1.0, 1.075]
+  ```
+
+  Args:
+    x_data: A real `Tensor` of shape `[..., num_points]` containing
+      X-coordinates of points to fit the splines to. The values have to be
+      monotonically non-decreasing along the last dimension.
+    y_data: A `Tensor` of the same shape and `dtype` as `x_data` containing
+      Y-coordinates of points to fit the splines to.
+    spline_type: Instance of `HermiteSplineType` enum. The method to compute
+      the slopes of the spline at the nodes. The `AKIMA` type requires
+      `num_points >= 3`.
+      Default value: `None` which maps to `HermiteSplineType.FRITSCH_CARLSON`.
+    validate_args: Python `bool`. When `True`, verifies if elements of `x_data`
+      are sorted in the last dimension in non-decreasing order despite possibly
+      degrading runtime performance.
+      Default value: False.
+    dtype: Optional dtype for both `x_data` and `y_data`.
+      Default value: `None` which maps to the default dtype inferred by
+        TensorFlow.
+    name: Python `str` name prefixed to ops created by this function.
+      Default value: `None` which is mapped to the default name
+        `cubic_hermite_spline_build`.
+
+  Returns:
+    An instance of `HermiteSplineParameters`.
+  """
+  if spline_type is None:
+    spline_type = HermiteSplineType.FRITSCH_CARLSON
+  name = name or 'cubic_hermite_spline_build'
+  with tf.name_scope(name):
+    x_data = tf.convert_to_tensor(x_data, dtype=dtype, name='x_data')
+    y_data = tf.convert_to_tensor(y_data, dtype=dtype, name='y_data')
+    if validate_args:
+      assert_sanity_check = [_validate_arguments(x_data)]
+    else:
+      assert_sanity_check = []
+    x_data, y_data = tff_utils.broadcast_common_batch_shape(x_data, y_data)
+    with tf.compat.v1.control_dependencies(assert_sanity_check):
+      dx = x_data[..., 1:] - x_data[..., :-1]
+      dy = y_data[..., 1:] - y_data[..., :-1]
+      # Secants of the intervals. Zero for the right padding.
+      secants = tf.math.divide_no_nan(dy, dx)
+      if spline_type == HermiteSplineType.FRITSCH_CARLSON:
+        slopes = _fritsch_carlson_slopes(dx, secants)
+      elif spline_type == HermiteSplineType.AKIMA:
+        slopes = _akima_slopes(secants)
+      else:
+        raise ValueError('Unsupported spline type {}'.format(spline_type))
+    return HermiteSplineParameters(
+        x_data=x_data, y_data=y_data, slopes=slopes)
+
+
+def build_plan(x: types.RealTensor,
+               x_data: types.RealTensor,
+               dtype: tf.DType = None,
+               name: str = None) -> InterpolationPlan:
+  """Precomputes cubic interpolation of `x` on the grid `x_data`.
+
+  A cubic spline is linear in its node values and node slopes. When the same
+  points `x` are interpolated on splines with the same `x_data` but changing
+  `y_data` (e.g., when a curve is bumped and the spline is rebuilt), the search
+  of the intervals and the computation of the basis weights can be done once
+  with this function. The plan is applied to any number of splines with
+  `interpolate_with_plan`.
+
+  #### Example
+
+  ```python
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  x_data = tf.linspace(-5.0, 5.0,  num=11)
+  plan = tff.math.interpolation.cubic.build_plan([3.3, 3.4, 3.9], x_data)
+  for shift in [0.0, 0.01]:
+    spline = tff.math.interpolation.cubic.build_spline(
+        x_data, 1.0 / (1.0 + x_data**2) + shift)
+    tff.math.interpolation.cubic.interpolate_with_plan(spline, plan)
+  # Expected (for zero shift): [0.0833737 , 0.07881707, 0.06149562]
+  ```
+
+  Args:
+    x: A real `Tensor` of shape `batch_shape + [num_x]`. The points to
+      interpolate at.
+    x_data: A real `Tensor` of shape `batch_shape + [num_points]`. The
+      X-coordinates of the splines the plan is going to be applied to.
+    dtype: Optional dtype for `x` and `x_data`.
+      Default value: `None` which maps to the default dtype inferred by
+        TensorFlow.
+    name: Python `str` name prefixed to ops created by this function.
+      Default value: `None` which is mapped to the default name
+        `cubic_spline_build_plan`.
+
+  Returns:
+    An instance of `InterpolationPlan`.
+  """
+  name = name or 'cubic_spline_build_plan'
+  with tf.name_scope(name):
+    x = tf.convert_to_tensor(x, dtype=dtype, name='x')
+    x_data = tf.convert_to_tensor(x_data, dtype=x.dtype, name='x_data')
+    x, x_data = tff_utils.broadcast_common_batch_shape(x, x_data)
+    indices = tf.searchsorted(x_data, x, side='right', out_type=tf.int32) - 1
+    # Points outside of the domain get `lower_indices == upper_indices` which
+    # results in the constant extrapolation.
+    lower_indices = tf.maximum(indices, 0)
+    upper_indices = tf.minimum(indices + 1,
+                               tff_utils.get_shape(x_data)[-1] - 1)
+    batch_dims = x_data.shape.rank - 1
+    x0 = tf.gather(x_data, lower_indices, axis=-1, batch_dims=batch_dims)
+    x1 = tf.gather(x_data, upper_indices, axis=-1, batch_dims=batch_dims)
+    dx = x1 - x0
+    t = tf.math.divide_no_nan(x - x0, dx)
+    # Cubic Hermite basis functions.
+    one_minus_t = 1 - t
+    return InterpolationPlan(
+        lower_indices=lower_indices,
+        upper_indices=upper_indices,
+        lower_value_weights=(1 + 2 * t) * one_minus_t**2,
+        upper_value_weights=t**2 * (3 - 2 * t),
+        lower_slope_weights=dx * t * one_minus_t**2,
+        upper_slope_weights=-dx * t**2 * one_minus_t)
+
+
+def interpolate_with_plan(spline_data,
+                          plan: InterpolationPlan,
+                          name: str = None) -> types.RealTensor:
+  """Interpolates a spline using a precomputed plan.
+
+  Args:
+    spline_data: An instance of `SplineParameters` or
+      `HermiteSplineParameters`. `spline_data.x_data` should be the same as
+      `x_data` used to build the `plan`. The batch shape of `spline_data` can
+      have extra leading dimensions compared to the batch shape of the `plan`
+      (e.g., for a batch of curve scenarios on the same grid).
+    plan: An instance of `InterpolationPlan` built by `build_plan`.
+    name: Python `str` name prefixed to ops created by this function.
+      Default value: `None` which is mapped to the default name
+        `cubic_spline_interpolate_with_plan`.
+
+  Returns:
+    A `Tensor` of shape `extra_shape + batch_shape + [num_x]` and the same
+    `dtype` as `spline_data.y_data`. Represents the interpolated values.
+  """
+  name = name or 'cubic_spline_interpolate_with_plan'
+  with tf.name_scope(name):
+    y_data = spline_data.y_data
+    if isinstance(spline_data, HermiteSplineParameters):
+      slopes = spline_data.slopes
+    else:
+      slopes = node_slopes(spline_data)
+    lower_indices = plan.lower_indices
+    upper_indices = plan.upper_indices
+    if lower_indices.shape.rank > 1:
+      # Broadcast the indices to the batch shape of the spline so that the batch
+      # dimensions can be gathered over.
+      indices_shape = tf.concat([tff_utils.get_shape(y_data)[:-1],
+                                 tff_utils.get_shape(lower_indices)[-1:]],
+                                axis=0)
+      lower_indices = tf.broadcast_to(lower_indices, indices_shape)
+      upper_indices = tf.broadcast_to(upper_indices, indices_shape)
+      batch_dims = y_data.shape.rank - 1
+    else:
+      batch_dims = 0
+
+    def get_slice(x, indices):
+      return tf.gather(x, indices, axis=-1, batch_dims=batch_dims)
+
+    return (plan.lower_value_weights * get_slice(y_data, lower_indices) +
+            plan.upper_value_weights * get_slice(y_data, upper_indices) +
+            plan.lower_slope_weights * get_slice(slopes, lower_indices) +
+            plan.upper_slope_weights * get_slice(slopes, upper_indices))
+
+
+def node_slopes(spline_data: SplineParameters,
+                name: str = None) -> types.RealTensor:
+  """Computes the first derivatives of a cubic spline at its nodes.
+
+  Together with `spline_data.y_data`, the slopes represent the spline in the
+  cubic Hermite form, e.g., as used by `interpolate_with_plan`.
+
+  Args:
+    spline_data: An instance of `SplineParameters` returned by `build`.
+    name: Python `str` name prefixed to ops created by this function.
+      Default value: `None` which is mapped to the default name
+        `cubic_spline_node_slopes`.
+
+  Returns:
+    A `Tensor` of the same shape and `dtype` as `spline_data.x_data`. The
+    first derivatives of the spline at `spline_data.x_data`.
+  """
+  name = name or 'cubic_spline_node_slopes'
+  with tf.name_scope(name):
+    return _node_slopes(spline_data)
+
+
+def _node_slopes(spline_data):
+  """Computes the first derivatives of a cubic spline at `x_data`."""
+  x_data = spline_data.x_data
+  y_data = spline_data.y_data
+  spline_coeffs = spline_data.spline_coeffs
+  dx = x_data[..., 1:] - x_data[..., :-1]
+  dd = tf.math.divide_no_nan(y_data[..., 1:] - y_data[..., :-1], dx)
+  # Derivatives at the left and at the right ends of each interval. See
+  # `interpolate` for the interpolation formula.
+  left_slopes = dd - dx * (spline_coeffs[..., 1:] +
+                           2 * spline_coeffs[..., :-1]) / 3
+  right_slopes = dd + dx * (2 * spline_coeffs[..., 1:] +
+                            spline_coeffs[..., :-1]) / 3
+  # The slope at a node is taken from the interval to the right of it, unless
+  # the interval is empty (the last node or the right padding).
+  dx_right = tf.concat([dx, tf.zeros_like(dx[..., :1])], axis=-1)
+  return tf.where(dx_right > 0,
+                  tf.concat([left_slopes, right_slopes[..., -1:]], axis=-1),
+                  tf.concat([left_slopes[..., :1], right_slopes], axis=-1))
+
+
+def _fritsch_carlson_slopes(dx, secants):
+  """Computes monotonicity preserving node slopes."""
+  zero = tf.zeros_like(dx[..., :1])
+  dx_left = tf.concat([zero, dx], axis=-1)
+  dx_right = tf.concat([dx, zero], axis=-1)
+  secants_left = tf.concat([secants[..., :1], secants], axis=-1)
+  secants_right = tf.concat([secants, secants[..., -1:]], axis=-1)
+  # Interior slopes are the averages of the adjacent secants or zero at the
+  # local extrema. One-sided secants are used at the end points.
+  slopes = tf.where(secants_left * secants_right > 0,
+                    (secants_left + secants_right) / 2,
+                    tf.zeros_like(secants_left))
+  slopes = tf.where(dx_left > 0, slopes, secants_right)
+  slopes = tf.where(dx_right > 0, slopes, secants_left)
+  # Limit the slopes so that `alpha**2 + beta**2 <= 9` on each interval, where
+  # `alpha` and `beta` are the ratios of the end point slopes to the secant.
+  alpha = tf.math.divide_no_nan(slopes[..., :-1], secants)
+  beta = tf.math.divide_no_nan(slopes[..., 1:], secants)
+  norm = alpha**2 + beta**2
+  tau = tf.where(norm > 9,
+                 3 / tf.math.sqrt(tf.where(norm > 9, norm, tf.ones_like(norm))),
+                 tf.ones_like(norm))
+  one = tf.ones_like(tau[..., :1])
+  # Each slope is scaled by the strongest limiter of the adjacent intervals.
+  scale = tf.math.minimum(tf.concat([one, tau], axis=-1),
+                          tf.concat([tau, one], axis=-1))
+  return scale * slopes
+
+
+def _akima_slopes(secants):
+  """Computes Akima node slopes."""
+  # Extrapolate the secants by two intervals at each end.
+  left_1 = 2 * secants[..., :1] - secants[..., 1:2]
+  left_2 = 2 * left_1 - secants[..., :1]
+  right_1 = 2 * secants[..., -1:] - secants[..., -2:-1]
+  right_2 = 2 * right_1 - secants[..., -1:]
+  ext = tf.concat([left_2, left_1, secants, right_1, right_2], axis=-1)
+  # For node `i`, the secants `m[i-2], m[i-1], m[i], m[i+1]` are
+  # `ext[i], ext[i+1], ext[i+2], ext[i+3]`.
+  w_right = tf.math.abs(ext[..., 3:] - ext[..., 2:-1])
+  w_left = tf.math.abs(ext[..., 1:-2] - ext[..., :-3])
+  total_weight = w_left + w_right
+  return tf.where(
+      total_weight > 0,
+      tf.math.divide_no_nan(w_right * ext[..., 1:-2] + w_left * ext[..., 2:-1],
+                            total_weight),
+      (ext[..., 1:-2] + ext[..., 2:-1]) / 2)
+
+
 def _calculate_spline_coeffs_natural(dx, superdiag, subdiag, diag_values, rhs,
                                      dtype):
   """Calculates spline coefficients for the NATURAL boundary condition."""
@@ -192,6 +192,115 @@ class CubicInterpolationTest(tf.test.TestCase, parameterized.TestCase):
     interpolated = self.evaluate(interpolated)
     np.testing.assert_almost_equal(expected, interpolated)
 
+  @parameterized.named_parameters(
+      ("natural", cubic.BoundaryConditionType.NATURAL),
+      ("clamped", cubic.BoundaryConditionType.CLAMPED),
+  )
+  def test_interpolation_plan(self, boundary_condition_type):
+    """Tests interpolation with a plan across spline rebuilds."""
+    x_data = np.array([[1.0, 2.0, 3.0, 4.0, 4.0, 4.0, 4.0],
+                       [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]])
+    y_data = np.array([[3.0, 1.0, 3.0, 2.0, 2.0, 2.0, 2.0],
+                       [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]])
+    x_values = np.array([[0.0, 1.0, 1.5, 2.0, 2.5, 3.5, 4.0, 5.0],
+                         [0.0, 1.0, 1.5, 2.0, 2.5, 3.5, 4.0, 8.0]])
+    plan = tff.math.interpolation.cubic.build_plan(x_values, x_data)
+    for shift in [0.0, 0.5]:
+      spline = tff.math.interpolation.cubic.build_spline(
+          x_data, y_data + shift * x_data,
+          boundary_condition_type=boundary_condition_type)
+      expected = tff.math.interpolation.cubic.interpolate(x_values, spline)
+      interpolated = tff.math.interpolation.cubic.interpolate_with_plan(
+          spline, plan)
+      with self.subTest("Shift{}".format(shift)):
+        self.assertAllClose(interpolated, expected, rtol=1e-10, atol=1e-10)
+
+  def test_interpolation_plan_scenarios(self):
+    """Tests a plan applied to a batch of splines on the same grid."""
+    x_data = np.linspace(-5.0, 5.0, num=11)
+    y_data = np.stack([1.0 / (1.0 + x_data**2),
+                       1.0 / (1.1 + x_data**2),
+                       np.exp(-x_data**2)])
+    x_values = np.linspace(-6.0, 6.0, num=25)
+    plan = tff.math.interpolation.cubic.build_plan(x_values, x_data)
+    spline = tff.math.interpolation.cubic.build_spline(x_data, y_data)
+    interpolated = tff.math.interpolation.cubic.interpolate_with_plan(
+        spline, plan)
+    expected = tff.math.interpolation.cubic.interpolate(
+        np.broadcast_to(x_values, [3, 25]), spline)
+    self.assertAllClose(interpolated, expected, rtol=1e-10, atol=1e-10)
+
+  def test_node_slopes(self):
+    """Tests the spline slopes against the gradients at the nodes."""
+    x_data = np.array([[1.0, 2.0, 3.5, 4.0, 6.0],
+                       [0.0, 1.0, 2.0, 3.0, 4.0]])
+    y_data = np.array([[3.0, 1.0, 3.0, 2.0, 5.0],
+                       [1.0, 4.0, 9.0, 16.0, 25.0]])
+    spline = tff.math.interpolation.cubic.build_spline(x_data, y_data)
+    slopes = tff.math.interpolation.cubic.node_slopes(spline)
+    # The gradient of `interpolate` is not defined at the right end point.
+    x = tf.constant(x_data[..., :-1])
+    with tf.GradientTape() as tape:
+      tape.watch(x)
+      interpolated = tff.math.interpolation.cubic.interpolate(x, spline)
+    expected = tape.gradient(interpolated, x)
+    self.assertAllClose(slopes[..., :-1], expected, rtol=1e-10, atol=1e-10)
+
+  def test_fritsch_carlson_monotone(self):
+    """Tests that the Fritsch-Carlson spline preserves monotonicity."""
+    x_data = np.array([[0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+                       [0.0, 0.5, 1.0, 3.0, 3.0, 3.0]])
+    y_data = np.array([[0.0, 0.1, 1.0, 1.0, 1.2, 5.0],
+                       [1.0, 0.9, 0.1, 0.0, 0.0, 0.0]])
+    spline = tff.math.interpolation.cubic.build_hermite_spline(
+        x_data, y_data,
+        spline_type=cubic.HermiteSplineType.FRITSCH_CARLSON)
+    x_values = np.stack([np.linspace(-1.0, 6.0, 141),
+                         np.linspace(-1.0, 4.0, 141)])
+    interpolated = self.evaluate(
+        tff.math.interpolation.cubic.interpolate(x_values, spline))
+    diffs = np.diff(interpolated, axis=-1)
+    with self.subTest("Increasing"):
+      self.assertTrue(np.all(diffs[0] >= -1e-12))
+    with self.subTest("Decreasing"):
+      self.assertTrue(np.all(diffs[1] <= 1e-12))
+    with self.subTest("InterpolatesData"):
+      nodes = tff.math.interpolation.cubic.interpolate(x_data, spline)
+      self.assertAllClose(nodes, y_data, rtol=1e-10, atol=1e-10)
+    with self.subTest("Extrapolation"):
+      self.assertAllClose(interpolated[:, 0], [0.0, 1.0])
+      self.assertAllClose(interpolated[:, -1], [5.0, 0.0])
+
+  def test_akima(self):
+    """Tests the Akima spline against precomputed values."""
+    x_data = np.array([0.0, 1.0, 2.0, 3.0, 4.0], dtype=np.float64)
+    y_data = np.array([0.0, 0.1, 1.0, 1.0, 1.2], dtype=np.float64)
+    spline = tff.math.interpolation.cubic.build_hermite_spline(
+        x_data, y_data, spline_type=cubic.HermiteSplineType.AKIMA)
+    interpolated = tff.math.interpolation.cubic.interpolate(
+        [0.5, 2.5, 3.5], spline)
+    # Computed with scipy.interpolate.Akima1DInterpolator.
+    expected = [-0.04705882, 1.00204545, 1.08295455]
+    self.assertAllClose(interpolated, expected, rtol=1e-6, atol=1e-6)
+
+  def test_hermite_spline_local_sensitivity(self):
+    """Tests that a bump of a value only changes nearby intervals."""
+    x_data = tf.constant(np.linspace(0.0, 10.0, 11))
+    y_data = tf.constant(np.sqrt(np.linspace(0.0, 10.0, 11)))
+    x_values = np.linspace(0.0, 10.0, 41)
+    plan = tff.math.interpolation.cubic.build_plan(x_values, x_data)
+    with tf.GradientTape() as tape:
+      tape.watch(y_data)
+      spline = tff.math.interpolation.cubic.build_hermite_spline(
+          x_data, y_data, spline_type=cubic.HermiteSplineType.AKIMA)
+      interpolated = tff.math.interpolation.cubic.interpolate_with_plan(
+          spline, plan)
+    jacobian = self.evaluate(tape.jacobian(interpolated, y_data))
+    # Akima slopes depend on the two nodes on each side, so a bump of the node
+    # at x = 5 does not affect the spline outside of [2, 8].
+    outside = (x_values < 2.0) | (x_values > 8.0)
+    self.assertAllEqual(jacobian[outside, 5], np.zeros(np.sum(outside)))
+
   @parameterized.named_parameters(
       ("default_interpolation", False),
       ("one_hot_interpolation", True),
@@ -18,8 +18,12 @@ from tf_quant_finance.math.interpolation.interpolation_2d import interpolation_2
 from tensorflow.python.util.all_util import remove_undocumented  # pylint: disable=g-direct-tensorflow-import
 
 Interpolation2D = interpolation_2d.Interpolation2D
+RegularGridInterpolation2D = interpolation_2d.RegularGridInterpolation2D
+GridInterpolationType = interpolation_2d.GridInterpolationType
 _allowed_symbols = [
     'Interpolation2D',
+    'RegularGridInterpolation2D',
+    'GridInterpolationType',
 ]
 
 remove_undocumented(__name__, _allowed_symbols)
@@ -14,9 +14,12 @@
 
 """Interpolation functions in a 2-dimensional space."""
 
+import enum
+
 import tensorflow.compat.v2 as tf
 
 from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
 from tf_quant_finance.math.interpolation import cubic
 from tf_quant_finance.math.interpolation import linear
 
@@ -156,3 +159,245 @@ class Interpolation2D:
       # Interpolation takes care of braodcasting
       z_values = linear.interpolate(x, self._xdata, yx)
       return tf.squeeze(tf.transpose(z_values, perm=perm_original), axis=-2)
+
+
+@enum.unique
+class GridInterpolationType(enum.Enum):
+  """Interpolation type used by `RegularGridInterpolation2D`.
+
+  * `BILINEAR`: linear interpolation along both directions.
+  * `LINEAR_CUBIC`: linear interpolation along x-direction and natural cubic
+  spline interpolation along y-direction. This is the same interpolation as
+  the one performed by `Interpolation2D`.
+  * `BICUBIC`: natural cubic spline interpolation along both directions
+  (tensor product spline).
+  """
+  BILINEAR = 1
+  LINEAR_CUBIC = 2
+  BICUBIC = 3
+
+
+class RegularGridInterpolation2D:
+  """Performs interpolation on a rectangular 2-dimensional grid.
+
+  Unlike `Interpolation2D`, the y-coordinates of the data are the same for
+  every x-coordinate, i.e., the data is given on the grid
+  `[x_data] x [y_data]`. All the interpolation coefficients (the values of the
+  function and of its derivatives at the grid nodes) are computed once at
+  construction time, so that an interpolation query reduces to locating the
+  grid cell, gathering the coefficients at the 4 corners of the cell and
+  computing their weighted sum. If the grid is uniform along an axis, the cell
+  lookup is arithmetic instead of a binary search.
+
+  Constant extrapolation is used outside of the grid.
+
+  The class supports batching: a batch of surfaces can be interpolated at once,
+  each one with its own grid.
+
+  ### Example. Volatility surface interpolation
+
+  ```python
+  dtype = np.float64
+  times = tf.constant([2., 2.5, 3, 4.5], dtype=dtype)
+  strikes = tf.constant([16, 22, 35, 40], dtype=dtype)
+
+  times_data = tf.constant([1.5, 2.5, 3.5, 4.5, 5.5], dtype=dtype)
+  strike_data = tf.constant([15, 25, 35, 40, 50, 55], dtype=dtype)
+  # Corresponding squared volatility values
+  sigma_square_data = tf.constant(
+      [[0.15, 0.25, 0.35, 0.4, 0.45, 0.4],
+       [0.2, 0.35, 0.55, 0.45, 0.4, 0.6],
+       [0.3, 0.45, 0.25, 0.4, 0.5, 0.65],
+       [0.25, 0.25, 0.45, 0.25, 0.5, 0.55],
+       [0.35, 0.35, 0.25, 0.4, 0.55, 0.65]], dtype=dtype)
+  # Interpolation is done for the total variance
+  total_variance = tf.expand_dims(times_data, -1) * sigma_square_data
+  interpolator = RegularGridInterpolation2D(
+      times_data, strike_data, total_variance,
+      interpolation_type=GridInterpolationType.BICUBIC, dtype=dtype)
+  interpolated_values = interpolator.interpolate(times, strikes)
+  ```
+  """
+
+  def __init__(self,
+               x_data: types.RealTensor,
+               y_data: types.RealTensor,
+               z_data: types.RealTensor,
+               interpolation_type: GridInterpolationType = None,
+               uniform_grid: bool = False,
+               dtype: tf.DType = None,
+               name: str = None):
+    """Initialize the 2d-interpolation object.
+
+    Args:
+      x_data: A `Tensor` of real `dtype` and shape
+        `batch_shape + [num_x_data_points]`.
+        Defines the x-coordinates of the grid. `num_x_data_points` should
+        be >= 2. The elements of `x_data` should be in an increasing order.
+      y_data: A `Tensor` of the same `dtype` as `x_data` and shape
+        `batch_shape + [num_y_data_points]`. Defines the y-coordinates of the
+        grid. `num_y_data_points` should be >= 2. The elements of `y_data`
+        should be in an increasing order.
+      z_data: A `Tensor` of the same `dtype` as `x_data` and shape
+        `batch_shape + [num_x_data_points, num_y_data_points]`. Defines the
+        function values on the grid.
+      interpolation_type: An instance of `GridInterpolationType`.
+        Default value: `None` which maps to
+        `GridInterpolationType.LINEAR_CUBIC`.
+      uniform_grid: Python `bool`. If `True`, the points of `x_data` and
+        `y_data` are assumed to be equally spaced, and the grid cells of the
+        interpolation points are found arithmetically.
+        Default value: `False`.
+      dtype: Optional dtype for the input `Tensor`s.
+        Default value: `None` which maps to the default dtype inferred by
+        TensorFlow.
+      name: Python `str` name prefixed to ops created by this class.
+        Default value: `None` which is mapped to the default name
+        `regular_grid_interpolation_2d`.
+    """
+    name = name or "regular_grid_interpolation_2d"
+    if interpolation_type is None:
+      interpolation_type = GridInterpolationType.LINEAR_CUBIC
+    with tf.name_scope(name):
+      self._xdata = tf.convert_to_tensor(x_data, dtype=dtype, name="x_data")
+      self._dtype = dtype or self._xdata.dtype
+      self._ydata = tf.convert_to_tensor(
+          y_data, dtype=self._dtype, name="y_data")
+      z_data = tf.convert_to_tensor(z_data, dtype=self._dtype, name="z_data")
+      self._name = name
+      self._interpolation_type = interpolation_type
+      self._uniform_grid = uniform_grid
+      self._num_y = tff_utils.get_shape(self._ydata)[-1]
+      # Node coefficients. Each of them has shape
+      # `batch_shape + [num_x_data_points, num_y_data_points]`.
+      coefficients = [z_data]
+      if interpolation_type != GridInterpolationType.BILINEAR:
+        # Derivatives along y-direction.
+        z_y = _spline_node_slopes(self._ydata, z_data)
+        coefficients.append(z_y)
+      if interpolation_type == GridInterpolationType.BICUBIC:
+        # Derivatives along x-direction and the cross derivatives.
+        z_x = _spline_node_slopes(self._xdata, _swap_last_axes(z_data))
+        z_xy = _spline_node_slopes(self._xdata, _swap_last_axes(z_y))
+        coefficients += [_swap_last_axes(z_x), _swap_last_axes(z_xy)]
+      num_coefficients = len(coefficients)
+      coefficients = tf.stack(coefficients, axis=-1)
+      # Flatten the grid so that the coefficients are gathered with a single
+      # index. Shape `batch_shape + [num_x_data_points * num_y_data_points, k]`
+      # where `k` is the number of coefficients per node.
+      batch_shape = tf.shape(coefficients)[:-3]
+      self._coefficients = tf.reshape(
+          coefficients,
+          tf.concat([batch_shape, [-1, num_coefficients]], axis=0))
+
+  def interpolate(self,
+                  x: types.RealTensor,
+                  y: types.RealTensor,
+                  name: str = None):
+    """Performs 2-D interpolation on a specified set of points.
+
+    Args:
+      x: Real-valued `Tensor` of shape `batch_shape + [num_points]`.
+        Defines the x-coordinates at which the interpolation should be
+        performed. Note that `batch_shape` should be the same as in the
+        underlying data.
+      y: A `Tensor` of the same shape and `dtype` as `x`.
+        Defines the y-coordinates at which the interpolation should be
+        performed.
+      name: Python `str` name prefixed to ops created by this function.
+        Default value: `None` which is mapped to the default name
+        `interpolate`.
+
+    Returns:
+      A `Tensor` of the same shape and `dtype` as `x`. Represents the
+      interpolated values of the function on for the coordinates
+      `(x, y)`.
+    """
+    name = name or self._name + "_interpolate"
+    with tf.name_scope(name):
+      x = tf.convert_to_tensor(x, dtype=self._dtype, name="x")
+      y = tf.convert_to_tensor(y, dtype=self._dtype, name="y")
+      x, y = tff_utils.broadcast_common_batch_shape(x, y)
+      x_indices, x_value_weights, x_slope_weights = _axis_weights(
+          x, self._xdata, cubic_weights=(
+              self._interpolation_type == GridInterpolationType.BICUBIC),
+          uniform_grid=self._uniform_grid)
+      y_indices, y_value_weights, y_slope_weights = _axis_weights(
+          y, self._ydata, cubic_weights=(
+              self._interpolation_type != GridInterpolationType.BILINEAR),
+          uniform_grid=self._uniform_grid)
+      batch_dims = self._coefficients.shape.rank - 2
+      result = tf.zeros_like(x)
+      # Sum up the contributions of the 4 corners of the grid cells.
+      for x_index, x_value_weight, x_slope_weight in zip(
+          x_indices, x_value_weights, x_slope_weights):
+        for y_index, y_value_weight, y_slope_weight in zip(
+            y_indices, y_value_weights, y_slope_weights):
+          # Shape `batch_shape + [num_points, k]`.
+          corner = tf.gather(self._coefficients,
+                             x_index * self._num_y + y_index,
+                             axis=batch_dims, batch_dims=batch_dims)
+          weights = [x_value_weight * y_value_weight]
+          if y_slope_weight is not None:
+            weights.append(x_value_weight * y_slope_weight)
+          if x_slope_weight is not None:
+            weights += [x_slope_weight * y_value_weight,
+                        x_slope_weight * y_slope_weight]
+          result += tf.math.reduce_sum(
+              tf.stack(weights, axis=-1) * corner, axis=-1)
+      return result
+
+
+def _swap_last_axes(tensor):
+  """Transposes the last two axes of a `Tensor`."""
+  rank = tensor.shape.rank
+  return tf.transpose(tensor, list(range(rank - 2)) + [rank - 1, rank - 2])
+
+
+def _spline_node_slopes(grid, values):
+  """Derivatives of the natural cubic splines along the last axis at nodes."""
+  grid = tf.broadcast_to(tf.expand_dims(grid, axis=-2), tf.shape(values))
+  spline = cubic.build_spline(grid, values)
+  return cubic.node_slopes(spline)
+
+
+def _axis_weights(x, grid, cubic_weights, uniform_grid):
+  """Computes the cell indices and the interpolation weights along an axis.
+
+  Args:
+    x: A real `Tensor` of shape `batch_shape + [num_points]`. The interpolation
+      points.
+    grid: A real `Tensor` of shape `batch_shape + [num_grid_points]`. The grid
+      along the axis.
+    cubic_weights: Python `bool`. Whether to compute the cubic Hermite weights
+      or the linear ones.
+    uniform_grid: Python `bool`. Whether the grid is equally spaced.
+
+  Returns:
+    A tuple `(indices, value_weights, slope_weights)` each being a pair of
+    values for the lower and the upper nodes of the cells. `slope_weights` are
+    `None` for the linear weights.
+  """
+  num_grid_points = tff_utils.get_shape(grid)[-1]
+  if uniform_grid:
+    step = (grid[..., 1:2] - grid[..., :1])
+    indices = tf.cast(tf.math.floor((x - grid[..., :1]) / step), tf.int32)
+    indices = tf.clip_by_value(indices, -1, num_grid_points - 1)
+  else:
+    indices = tf.searchsorted(grid, x, side="right", out_type=tf.int32) - 1
+  # Points outside of the grid get `lower == upper` which results in the
+  # constant extrapolation.
+  lower = tf.math.maximum(indices, 0)
+  upper = tf.math.minimum(indices + 1, num_grid_points - 1)
+  batch_dims = grid.shape.rank - 1
+  x0 = tf.gather(grid, lower, axis=-1, batch_dims=batch_dims)
+  x1 = tf.gather(grid, upper, axis=-1, batch_dims=batch_dims)
+  dx = x1 - x0
+  t = tf.clip_by_value(tf.math.divide_no_nan(x - x0, dx), 0, 1)
+  if not cubic_weights:
+    return (lower, upper), (1 - t, t), (None, None)
+  # Cubic Hermite basis functions.
+  one_minus_t = 1 - t
+  value_weights = ((1 + 2 * t) * one_minus_t**2, t**2 * (3 - 2 * t))
+  slope_weights = (dx * t * one_minus_t**2, -dx * t**2 * one_minus_t)
+  return (lower, upper), value_weights, slope_weights
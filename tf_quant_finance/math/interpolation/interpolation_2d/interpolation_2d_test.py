@@ -14,6 +14,8 @@
 
 """Tests for interpolation_2d."""
 
+from absl.testing import parameterized
+
 import numpy as np
 import tensorflow.compat.v1 as tf
 
@@ -23,7 +25,7 @@ interpolation_2d = tff.math.interpolation.interpolation_2d
 
 
 @test_util.run_all_in_graph_and_eager_modes
-class Interpolation2DTest(tf.test.TestCase):
+class Interpolation2DTest(parameterized.TestCase, tf.test.TestCase):
 
   def test_docstring_example(self):
     """Computes values of example in the docstring for function interpolate."""
@@ -237,6 +239,90 @@ class Interpolation2DTest(tf.test.TestCase):
     self.assertAllClose(
         grad_strikes, expected_grad_strikes, rtol=1e-04, atol=1e-04)
 
+  @parameterized.named_parameters(
+      ("NonUniform", False),
+      ("Uniform", True))
+  def test_regular_grid_linear_cubic(self, uniform_grid):
+    """Regular grid interpolation agrees with `Interpolation2D`."""
+    dtype = np.float64
+    x_data = np.array([1.5, 2.5, 3.5, 4.5], dtype=dtype)
+    y_data = np.array([15., 25., 35., 45., 55.], dtype=dtype)
+    z_data = np.array(
+        [[0.15, 0.25, 0.35, 0.4, 0.45],
+         [0.2, 0.35, 0.55, 0.45, 0.4],
+         [0.3, 0.45, 0.25, 0.4, 0.5],
+         [0.25, 0.25, 0.45, 0.25, 0.5]], dtype=dtype)
+    # Includes points outside of the grid
+    x = tf.constant([1., 2., 2.5, 3.7, 4.5, 5.], dtype=dtype)
+    y = tf.constant([16., 10., 22., 35., 54., 60.], dtype=dtype)
+    interpolator = interpolation_2d.RegularGridInterpolation2D(
+        x_data, y_data, z_data, uniform_grid=uniform_grid, dtype=dtype)
+    result = interpolator.interpolate(x, y)
+    reference = interpolation_2d.Interpolation2D(
+        x_data, np.broadcast_to(y_data, [4, 5]), z_data, dtype=dtype)
+    expected = reference.interpolate(x, y)
+    with self.subTest("CorrectDtype"):
+      self.assertEqual(result.dtype.as_numpy_dtype, dtype)
+    with self.subTest("CorrectInterpolation"):
+      self.assertAllClose(result, expected, rtol=1e-8, atol=1e-8)
+
+  @parameterized.named_parameters(
+      ("NonUniform", False),
+      ("Uniform", True))
+  def test_regular_grid_bilinear(self, uniform_grid):
+    """Bilinear interpolation on a batch of regular grids."""
+    dtype = np.float64
+    x_data = np.array([[0., 1., 2.], [1., 2., 3.]], dtype=dtype)
+    y_data = np.array([[0., 2., 4., 6.], [0., 1., 2., 3.]], dtype=dtype)
+    z_data = (x_data[..., np.newaxis]**2
+              + 2 * x_data[..., np.newaxis] * y_data[:, np.newaxis, :])
+    x = np.array([[0.5, 1.5, 2.], [1.2, 2.7, 4.]], dtype=dtype)
+    y = np.array([[1., 5., 3.], [0.5, 2.5, 1.]], dtype=dtype)
+    interpolator = interpolation_2d.RegularGridInterpolation2D(
+        x_data, y_data, z_data,
+        interpolation_type=interpolation_2d.GridInterpolationType.BILINEAR,
+        uniform_grid=uniform_grid, dtype=dtype)
+    result = self.evaluate(interpolator.interpolate(x, y))
+    # The function is linear in `y`, so only the interpolation along `x`
+    # contributes to the error. Compute the expected values in numpy.
+    expected = []
+    for i in range(2):
+      xs = np.clip(x[i], x_data[i, 0], x_data[i, -1])
+      ys = np.clip(y[i], y_data[i, 0], y_data[i, -1])
+      values = [np.interp(xv, x_data[i], x_data[i]**2 + 2 * x_data[i] * yv)
+                for xv, yv in zip(xs, ys)]
+      expected.append(values)
+    self.assertAllClose(result, expected, rtol=1e-8, atol=1e-8)
+
+  def test_regular_grid_bicubic(self):
+    """Bicubic interpolation of a separable function."""
+    dtype = np.float64
+    x_data = np.linspace(0., 2., 6, dtype=dtype)
+    y_data = np.linspace(-1., 1., 7, dtype=dtype)
+    f = np.exp(-x_data)
+    g = np.sin(y_data)
+    z_data = f[:, np.newaxis] * g[np.newaxis, :]
+    x = np.array([0.1, 0.7, 1.3, 1.9], dtype=dtype)
+    y = np.array([-0.9, 0.05, 0.5, 0.8], dtype=dtype)
+    interpolator = interpolation_2d.RegularGridInterpolation2D(
+        x_data, y_data, z_data,
+        interpolation_type=interpolation_2d.GridInterpolationType.BICUBIC,
+        dtype=dtype)
+    result = interpolator.interpolate(x, y)
+    # The tensor product spline of a separable function is the product of the
+    # 1-dimensional splines.
+    f_interpolated = tff.math.interpolation.cubic.interpolate(
+        x, tff.math.interpolation.cubic.build_spline(x_data, f))
+    g_interpolated = tff.math.interpolation.cubic.interpolate(
+        y, tff.math.interpolation.cubic.build_spline(y_data, g))
+    with self.subTest("MatchesSplines"):
+      self.assertAllClose(result, f_interpolated * g_interpolated,
+                          rtol=1e-8, atol=1e-8)
+    with self.subTest("InterpolatesNodes"):
+      xx, yy = np.meshgrid(x_data, y_data, indexing="ij")
+      nodes = interpolator.interpolate(xx.reshape(-1), yy.reshape(-1))
+      self.assertAllClose(nodes, z_data.reshape(-1), rtol=1e-8, atol=1e-8)
+
 
 if __name__ == "__main__":
   tf.test.main()
@@ -14,11 +14,17 @@
 """Linear interpolation."""
 
 
+from tf_quant_finance.math.interpolation.linear.linear_interpolation import build_plan
 from tf_quant_finance.math.interpolation.linear.linear_interpolation import interpolate
+from tf_quant_finance.math.interpolation.linear.linear_interpolation import interpolate_with_plan
+from tf_quant_finance.math.interpolation.linear.linear_interpolation import InterpolationPlan
 from tensorflow.python.util.all_util import remove_undocumented  # pylint: disable=g-direct-tensorflow-import
 
 _allowed_symbols = [
+    'build_plan',
     'interpolate',
+    'interpolate_with_plan',
+    'InterpolationPlan',
 ]
 
 remove_undocumented(__name__, _allowed_symbols)
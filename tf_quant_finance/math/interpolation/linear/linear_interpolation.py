@@ -21,10 +21,42 @@ from tf_quant_finance import utils as tff_utils
 
 
 __all__ = [
+    'InterpolationPlan',
+    'build_plan',
     'interpolate',
+    'interpolate_with_plan',
 ]
 
 
+@tff_utils.dataclass
+class InterpolationPlan:
+  """Precomputed linear interpolation of fixed points on a fixed grid.
+
+  The interpolated value at `x[..., i]` is
+  `lower_weights[..., i] * y_data[..., lower_indices[..., i]] +
+   upper_weights[..., i] * y_data[..., upper_indices[..., i]] +
+   offsets[..., i]`.
+
+  Attributes:
+    lower_indices: An int32 `Tensor` of shape `batch_shape + [num_x]`. Indices
+      of the lower nodes of the intervals containing the interpolation points.
+    upper_indices: An int32 `Tensor` of the same shape as `lower_indices`.
+      Indices of the upper nodes of the intervals containing the interpolation
+      points.
+    lower_weights: A real `Tensor` of shape `batch_shape + [num_x]`. Weights of
+      the values at `lower_indices`.
+    upper_weights: A real `Tensor` of the same shape and `dtype` as
+      `lower_weights`. Weights of the values at `upper_indices`.
+    offsets: A real `Tensor` of the same shape and `dtype` as `lower_weights`.
+      Extrapolation terms that do not depend on the y-values.
+  """
+  lower_indices: types.IntTensor
+  upper_indices: types.IntTensor
+  lower_weights: types.RealTensor
+  upper_weights: types.RealTensor
+  offsets: types.RealTensor
+
+
 def interpolate(x: types.RealTensor,
                 x_data: types.RealTensor,
                 y_data: types.RealTensor,
@@ -194,3 +226,173 @@ def interpolate(x: types.RealTensor,
         return interpolated
       else:
         return tf.squeeze(interpolated, 0)
+
+
+def build_plan(x: types.RealTensor,
+               x_data: types.RealTensor,
+               left_slope: types.RealTensor = None,
+               right_slope: types.RealTensor = None,
+               validate_args: bool = False,
+               dtype: tf.DType = None,
+               name: str = None) -> InterpolationPlan:
+  """Precomputes linear interpolation of `x` on the grid `x_data`.
+
+  Linear interpolation is linear in the y-values. When the same points `x` are
+  repeatedly interpolated on the same grid `x_data` with changing `y_data`
+  (e.g., cashflow dates on a bumped discount curve), the search of the
+  interpolation intervals and the computation of the interpolation weights can
+  be done once with this function. The resulting plan is then applied to any
+  number of `y_data` with `interpolate_with_plan`, which only gathers the
+  y-values and computes a weighted sum.
+
+  #### Examples
+
+  ```python
+  import tf_quant_finance as tff
+  x = [-10, -1, 1, 3, 6, 7, 8, 15, 18, 25, 30, 35]
+  x_data = [-1, 2, 6, 8, 18, 30.0]
+  plan = tff.math.interpolation.linear.build_plan(x, x_data, dtype=tf.float64)
+  # A batch of 2 scenarios of curve values.
+  y_data = [[10, -1, -5, 7, 9, 20], [11, 0, -4, 8, 10, 21]]
+  tff.math.interpolation.linear.interpolate_with_plan(y_data, plan)
+  # Expected: [[10, 10, 2.66666667, -2, -5, 1, 7, 8.4, 9, 15.41666667, 20, 20],
+  #            [11, 11, 3.66666667, -1, -4, 2, 8, 9.4, 10, 16.41666667, 21, 21]]
+  ```
+
+  Args:
+    x: x-coordinates for which we need to get interpolation. A N-D
+      `Tensor` of real dtype. First N-1 dimensions represent batching
+      dimensions.
+    x_data: x coordinates. A N-D `Tensor` of real dtype. Should be sorted
+      in non decreasing order. First N-1 dimensions represent batching
+      dimensions.
+    left_slope: The slope to use for extrapolation with x-coordinate smaller
+      than the min `x_data`. It's a 0-D or N-D `Tensor`.
+      Default value: `None`, which maps to `0.0` meaning constant extrapolation,
+      i.e. extrapolated value will be the leftmost `y_data`.
+    right_slope: The slope to use for extrapolation with x-coordinate greater
+      than the max `x_data`. It's a 0-D or N-D `Tensor`.
+      Default value: `None` which maps to `0.0` meaning constant extrapolation,
+      i.e. extrapolated value will be the rightmost `y_data`.
+    validate_args: Python `bool` that indicates whether the function performs
+      the check that the elements in `x_data` are non decreasing. If this value
+      is set to `False` and the elements in `x_data` are not increasing, the
+      result of linear interpolation may be wrong.
+      Default value: `False`.
+    dtype: Optional tf.dtype for `x`, x_data`, `left_slope` and `right_slope`.
+      Default value: `None` which means that the `dtype` inferred from
+        `x`.
+    name: Python str. The name prefixed to the ops created by this function.
+      Default value: `None` which maps to 'linear_interpolation_build_plan'.
+
+  Returns:
+    An instance of `InterpolationPlan` with the batch shape being the common
+    batch shape of `x` and `x_data`.
+  """
+  name = name or 'linear_interpolation_build_plan'
+  with tf.name_scope(name):
+    x = tf.convert_to_tensor(x, dtype=dtype, name='x')
+    dtype = dtype or x.dtype
+    x_data = tf.convert_to_tensor(x_data, dtype=dtype, name='x_data')
+    # Try broadcast batch_shapes
+    x, x_data = tff_utils.broadcast_common_batch_shape(x, x_data)
+    if left_slope is None:
+      left_slope = tf.constant(0.0, dtype=dtype, name='left_slope')
+    else:
+      left_slope = tf.convert_to_tensor(left_slope, dtype=dtype,
+                                        name='left_slope')
+    if right_slope is None:
+      right_slope = tf.constant(0.0, dtype=dtype, name='right_slope')
+    else:
+      right_slope = tf.convert_to_tensor(right_slope, dtype=dtype,
+                                         name='right_slope')
+    control_deps = []
+    if validate_args:
+      # Check that `x_data` elements is non-decreasing
+      diffs = x_data[..., 1:] - x_data[..., :-1]
+      assertion = tf.debugging.assert_greater_equal(
+          diffs,
+          tf.zeros_like(diffs),
+          message='x_data is not sorted in non-decreasing order.')
+      control_deps.append(assertion)
+
+    with tf.control_dependencies(control_deps):
+      # Get upper bound indices for `x`.
+      upper_indices = tf.searchsorted(x_data, x, side='left', out_type=tf.int32)
+      x_data_size = tff_utils.get_shape(x_data)[-1]
+      at_min = tf.equal(upper_indices, 0)
+      at_max = tf.equal(upper_indices, x_data_size)
+      # Cap the indices to ensure they won't go out of bounds.
+      lower_indices = tf.math.maximum(upper_indices - 1, 0)
+      upper_indices = tf.math.minimum(upper_indices, x_data_size - 1)
+      batch_dims = x_data.shape.rank - 1
+      x_data_lower = tf.gather(x_data, lower_indices, axis=-1,
+                               batch_dims=batch_dims)
+      x_data_upper = tf.gather(x_data, upper_indices, axis=-1,
+                               batch_dims=batch_dims)
+      # Points outside of the grid take the value of the closest boundary
+      # node plus the extrapolation offset.
+      upper_weights = tf.math.divide_no_nan(x - x_data_lower,
+                                            x_data_upper - x_data_lower)
+      upper_weights = tf.where(at_min | at_max, tf.zeros_like(upper_weights),
+                               upper_weights)
+      lower_weights = 1 - upper_weights
+      offsets_min = left_slope * (x - x_data[..., :1])
+      offsets_max = right_slope * (x - x_data[..., -1:])
+      offsets = tf.where(at_min, offsets_min, tf.zeros_like(offsets_min))
+      offsets = tf.where(at_max, offsets_max, offsets)
+      return InterpolationPlan(
+          lower_indices=lower_indices,
+          upper_indices=upper_indices,
+          lower_weights=lower_weights,
+          upper_weights=upper_weights,
+          offsets=offsets)
+
+
+def interpolate_with_plan(y_data: types.RealTensor,
+                          plan: InterpolationPlan,
+                          dtype: tf.DType = None,
+                          name: str = None) -> types.RealTensor:
+  """Performs linear interpolation of `y_data` using a precomputed plan.
+
+  Args:
+    y_data: y coordinates. A N-D `Tensor` of real dtype of shape
+      `extra_shape + batch_shape + [num_points]`, where `batch_shape` is the
+      batch shape of the `plan` and `num_points` is the size of `x_data` used to
+      build the `plan`. The optional leading `extra_shape` allows to interpolate
+      many sets of y-values (e.g., scenarios) at once.
+    plan: An instance of `InterpolationPlan` built by `build_plan`.
+    dtype: Optional tf.dtype for `y_data`.
+      Default value: `None` which means that the `dtype` of the `plan` weights
+        is used.
+    name: Python str. The name prefixed to the ops created by this function.
+      Default value: `None` which maps to
+      'linear_interpolation_with_plan'.
+
+  Returns:
+    A `Tensor` of shape `extra_shape + batch_shape + [num_x]` of the same
+    `dtype` as `y_data` corresponding to the interpolated values.
+  """
+  name = name or 'linear_interpolation_with_plan'
+  with tf.name_scope(name):
+    dtype = dtype or plan.lower_weights.dtype
+    y_data = tf.convert_to_tensor(y_data, dtype=dtype, name='y_data')
+    lower_indices = plan.lower_indices
+    upper_indices = plan.upper_indices
+    if lower_indices.shape.rank > 1:
+      # Broadcast the indices to the batch shape of `y_data` so that the batch
+      # dimensions can be gathered over.
+      indices_shape = tf.concat([tff_utils.get_shape(y_data)[:-1],
+                                 tff_utils.get_shape(lower_indices)[-1:]],
+                                axis=0)
+      lower_indices = tf.broadcast_to(lower_indices, indices_shape)
+      upper_indices = tf.broadcast_to(upper_indices, indices_shape)
+      batch_dims = y_data.shape.rank - 1
+    else:
+      batch_dims = 0
+    y_data_lower = tf.gather(y_data, lower_indices, axis=-1,
+                             batch_dims=batch_dims)
+    y_data_upper = tf.gather(y_data, upper_indices, axis=-1,
+                             batch_dims=batch_dims)
+    return (plan.lower_weights * y_data_lower +
+            plan.upper_weights * y_data_upper + plan.offsets)
@@ -329,5 +329,64 @@ class LinearInterpolation(tf.test.TestCase, parameterized.TestCase):
     self.assertAllClose(
         results, np.array([[[0.5, 1.0, 1.0], [2.5, 3.0, 2.0]]]), 1e-8)
 
+  def test_interpolation_plan(self):
+    """Tests interpolation with a plan against the direct interpolation."""
+    dtype = np.float64
+    x = [-10, -1, 1, 3, 6, 7, 8, 15, 18, 25, 30, 35]
+    x_data = [-1, 2, 6, 8, 18, 30]
+    # A batch of curve scenarios for the same `x_data`.
+    y_data = np.array([[10, -1, -5, 7, 9, 20],
+                       [11, 0, -4, 8, 10, 21],
+                       [1, 2, 3, 4, 5, 6]], dtype=dtype)
+    plan = tff.math.interpolation.linear.build_plan(
+        x, x_data, left_slope=2, right_slope=-1, dtype=dtype)
+    result = tff.math.interpolation.linear.interpolate_with_plan(y_data, plan)
+    expected = [
+        tff.math.interpolation.linear.interpolate(
+            x, x_data, y, left_slope=2, right_slope=-1, dtype=dtype)
+        for y in y_data]
+    result, expected = self.evaluate([result, expected])
+    with self.subTest('Shape'):
+      self.assertAllEqual(result.shape, [3, 12])
+    with self.subTest('Values'):
+      self.assertAllClose(result, expected, 1e-8)
+
+  def test_interpolation_plan_batching(self):
+    """Tests interpolation with a batched plan and repeated x_data values."""
+    dtype = np.float64
+    x = [[0, 1.5, 4, 2], [4, 5.5, 8, 7]]
+    x_data = [[1, 2, 2, 3], [5, 6, 7, 7]]
+    y_data = [[0, 2, 2, 4], [1, 2, 3, 3]]
+    left_slope = [[1], [1]]
+    right_slope = [[-1], [-1]]
+    plan = tff.math.interpolation.linear.build_plan(
+        x, x_data, left_slope, right_slope, dtype=dtype)
+    # Extra leading dimension of y-values.
+    y_data_scenarios = [y_data, 2 * np.array(y_data)]
+    result = tff.math.interpolation.linear.interpolate_with_plan(
+        y_data_scenarios, plan)
+    expected = [
+        tff.math.interpolation.linear.interpolate(
+            x, x_data, y, left_slope, right_slope, dtype=dtype)
+        for y in y_data_scenarios]
+    result, expected = self.evaluate([result, expected])
+    self.assertAllClose(result, expected, 1e-8)
+
+  def test_interpolation_plan_gradients(self):
+    """Tests gradients of the interpolated values with respect to y_data."""
+    dtype = np.float64
+    x = tf.constant([0.5, 1.5, 2.5, 3.5], dtype=dtype)
+    x_data = tf.constant([1, 2, 3], dtype=dtype)
+    y_data = tf.constant([1, 4, 9], dtype=dtype)
+    plan = tff.math.interpolation.linear.build_plan(x, x_data)
+    with tf.GradientTape() as tape:
+      tape.watch(y_data)
+      result = tff.math.interpolation.linear.interpolate_with_plan(y_data,
+                                                                   plan)
+      value = tf.math.reduce_sum(result)
+    grad = self.evaluate(tape.gradient(value, y_data))
+    self.assertAllClose(grad, [1.5, 1.0, 1.5], 1e-8)
+
+
 if __name__ == '__main__':
   tf.test.main()
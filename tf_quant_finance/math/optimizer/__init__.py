@@ -26,6 +26,8 @@ from tensorflow_probability.python.optimizer import nelder_mead_one_step
 
 from tf_quant_finance.math.optimizer.conjugate_gradient import ConjugateGradientParams
 from tf_quant_finance.math.optimizer.conjugate_gradient import minimize as conjugate_gradient_minimize
+from tf_quant_finance.math.optimizer.lbfgs_b import minimize as lbfgs_b_minimize
+from tf_quant_finance.math.optimizer.levenberg_marquardt import minimize as levenberg_marquardt_minimize
 from tensorflow.python.util.all_util import remove_undocumented  # pylint: disable=g-direct-tensorflow-import
 
 _allowed_symbols = [
@@ -36,6 +38,8 @@ _allowed_symbols = [
     'converged_all',
     'converged_any',
     'lbfgs_minimize',
+    'lbfgs_b_minimize',
+    'levenberg_marquardt_minimize',
     'linesearch',
     'nelder_mead_minimize',
     'nelder_mead_one_step',
@@ -0,0 +1,390 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The limited memory BFGS algorithm with box constraints.
+
+References:
+[BLNZ1995] R. H. Byrd, P. Lu, J. Nocedal, C. Zhu. A limited memory algorithm
+  for bound constrained optimization. SIAM Journal on Scientific Computing,
+  16(5), 1995.
+[KSD2010] D. Kim, S. Sra, I. S. Dhillon. Tackling box-constrained optimization
+  via a new projected quasi-Newton approach. SIAM Journal on Scientific
+  Computing, 32(6), 2010.
+[NW2006] J. Nocedal, S. Wright. Numerical Optimization. 2nd Edition, Springer,
+  2006.
+"""
+
+from typing import Callable, Tuple
+
+import tensorflow.compat.v2 as tf
+
+from tensorflow_probability.python.optimizer import converged_all
+from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
+from tf_quant_finance.math.optimizer import conjugate_gradient
+
+
+__all__ = [
+    'minimize',
+]
+
+
+@tff_utils.dataclass
+class _OptimizerState:
+  """Internal state of optimizer."""
+  converged: types.BoolTensor
+  failed: types.BoolTensor
+  num_iterations: types.IntTensor
+  num_objective_evaluations: types.IntTensor
+  position: types.RealTensor
+  objective_value: types.RealTensor
+  objective_gradient: types.RealTensor
+  # Last `num_correction_pairs` position and gradient differences, ordered
+  # from the oldest to the newest. Shape `[..., num_correction_pairs, n]`.
+  position_deltas: types.RealTensor
+  gradient_deltas: types.RealTensor
+
+
+def minimize(
+    value_and_gradients_function: Callable[
+        [types.RealTensor], Tuple[types.RealTensor, types.RealTensor]],
+    initial_position: types.RealTensor,
+    lower_bounds: types.RealTensor = None,
+    upper_bounds: types.RealTensor = None,
+    num_correction_pairs: int = 10,
+    tolerance: types.RealTensor = 1e-8,
+    x_tolerance: types.RealTensor = 0,
+    f_relative_tolerance: types.RealTensor = 0,
+    max_iterations: types.IntTensor = 50,
+    max_line_search_iterations: int = 20,
+    stopping_condition: Callable[[types.BoolTensor, types.BoolTensor],
+                                 types.BoolTensor] = None,
+    name: str = None) -> conjugate_gradient.OptimizerResult:
+  """Minimizes a differentiable function subject to box constraints.
+
+  Minimizes `f(x)` subject to `lower_bounds <= x <= upper_bounds` with a
+  projected limited memory BFGS method. At each iteration, the variables at
+  the bounds for which the gradient points outside of the feasible box are
+  fixed, and the limited memory BFGS direction [NW2006] is computed on the
+  remaining free variables. A backtracking line search along the projected path
+  `P(x + a * d)` then ensures a sufficient decrease of the objective. This is
+  the approach of [KSD2010]; unlike the original L-BFGS-B algorithm [BLNZ1995],
+  the active set is identified from the projected gradient rather than from
+  the generalized Cauchy point, which avoids the sequential breakpoint search
+  and keeps all the operations batched.
+
+  Supports batches of independent problems of arbitrary batch shape which are
+  optimized in lock-step with a convergence mask per problem; converged
+  members are no longer updated.
+
+  #### References:
+  [BLNZ1995] R. H. Byrd, P. Lu, J. Nocedal, C. Zhu. A limited memory algorithm
+    for bound constrained optimization. SIAM Journal on Scientific Computing,
+    16(5), 1995.
+  [KSD2010] D. Kim, S. Sra, I. S. Dhillon. Tackling box-constrained
+    optimization via a new projected quasi-Newton approach. SIAM Journal on
+    Scientific Computing, 32(6), 2010.
+  [NW2006] J. Nocedal, S. Wright. Numerical Optimization. 2nd Edition,
+    Springer, 2006.
+
+  ### Usage:
+  The following example minimizes a quadratic function whose unconstrained
+  minimum lies outside of the feasible box.
+
+  ```python
+  minimum = np.array([1.0, -1.0])
+  scales = np.array([2.0, 3.0])
+
+  @tff.math.make_val_and_grad_fn
+  def quadratic(x):
+    return tf.reduce_sum(scales * (x - minimum)**2, axis=-1)
+
+  results = tff.math.optimizer.lbfgs_b_minimize(
+      quadratic,
+      initial_position=tf.constant([0.5, 0.5], dtype=tf.float64),
+      lower_bounds=[0., 0.], upper_bounds=[2., 2.])
+  # results.position is close to [1., 0.]
+  ```
+
+  Args:
+    value_and_gradients_function: A Python callable that accepts a point as a
+      real `Tensor` of shape `[..., n]` and returns a tuple of `Tensor`s
+      containing the value of the function of shape `[...]` and its gradient
+      of shape `[..., n]` at that point.
+    initial_position: Real `Tensor` of shape `[..., n]`. The starting point, or
+      points when using batching dimensions, of the search procedure. Points
+      outside of the bounds are projected onto the feasible box.
+    lower_bounds: Optional real `Tensor` broadcastable with `initial_position`.
+      The lower bounds of the position.
+      Default value: `None` which means no lower bounds.
+    upper_bounds: Optional real `Tensor` broadcastable with `initial_position`.
+      The upper bounds of the position.
+      Default value: `None` which means no upper bounds.
+    num_correction_pairs: Positive Python integer. The number of the last
+      position and gradient differences used to approximate the inverse
+      Hessian.
+      Default value: 10.
+    tolerance: Scalar `Tensor` of real dtype. Specifies the gradient tolerance
+      for the procedure. If the supremum norm of the projected gradient vector
+      is below this number, the algorithm is stopped.
+      Default value: `1e-8`.
+    x_tolerance: Scalar `Tensor` of real dtype. If the supremum norm of a step
+      is smaller than this number, the algorithm is stopped.
+      Default value: 0.
+    f_relative_tolerance: Scalar `Tensor` of real dtype. If the relative change
+      in the objective value between one iteration and the next is smaller
+      than this value, the algorithm is stopped.
+      Default value: 0.
+    max_iterations: Scalar positive int32 `Tensor`. The maximum number of
+      iterations.
+      Default value: 50.
+    max_line_search_iterations: Positive Python integer. The maximum number of
+      step halvings in the line search.
+      Default value: 20.
+    stopping_condition: (Optional) A Python function that takes as input two
+      Boolean tensors of shape `[...]`, and returns a Boolean scalar tensor. The
+      input tensors are `converged` and `failed`, indicating the current status
+      of each respective batch member; the return value states whether the
+      algorithm should stop. The default is tfp.optimizer.converged_all which
+      only stops when all batch members have either converged or failed.
+    name: (Optional) Python str. The name prefixed to the ops created by this
+      function. If not supplied, the default name 'lbfgs_b_minimize' is used.
+
+  Returns:
+    optimizer_results: An `OptimizerResult` object containing the following
+    items:
+      converged: boolean tensor of shape `[...]` indicating for each batch
+        member whether the minimum was found within tolerance.
+      failed:  boolean tensor of shape `[...]` indicating for each batch
+        member whether the line search failed to find a point with a
+        sufficient decrease of the objective.
+      num_iterations: int32 tensor of shape `[...]` with the number of
+        iterations performed for each batch member.
+      num_objective_evaluations: The total number of objective
+        evaluations performed.
+      position: A tensor of shape `[..., n]` containing the last argument value
+        found during the search from each starting point.
+      objective_value: A tensor of shape `[...]` with the value of the
+        objective function at the `position`.
+      objective_gradient: A tensor of shape `[..., n]` containing the gradient
+        of the objective function at the `position`.
+  """
+  with tf.name_scope(name or 'lbfgs_b_minimize'):
+    initial_position = tf.convert_to_tensor(
+        initial_position, name='initial_position')
+    dtype = initial_position.dtype
+    if lower_bounds is None:
+      lower_bounds = -float('inf')
+    if upper_bounds is None:
+      upper_bounds = float('inf')
+    lower_bounds = tf.convert_to_tensor(
+        lower_bounds, dtype=dtype, name='lower_bounds')
+    upper_bounds = tf.convert_to_tensor(
+        upper_bounds, dtype=dtype, name='upper_bounds')
+    tolerance = tf.convert_to_tensor(
+        tolerance, dtype=dtype, name='grad_tolerance')
+    f_relative_tolerance = tf.convert_to_tensor(
+        f_relative_tolerance, dtype=dtype, name='f_relative_tolerance')
+    x_tolerance = tf.convert_to_tensor(
+        x_tolerance, dtype=dtype, name='x_tolerance')
+    max_iterations = tf.convert_to_tensor(
+        max_iterations, name='max_iterations')
+    stopping_condition = stopping_condition or converged_all
+    # Armijo sufficient decrease parameter.
+    sufficient_decrease_param = tf.constant(1e-4, dtype=dtype)
+
+    def _project(x):
+      return tf.math.minimum(tf.math.maximum(x, lower_bounds), upper_bounds)
+
+    def _projected_gradient(x, gradient):
+      return x - _project(x - gradient)
+
+    initial_position = _project(initial_position)
+    f0, df0 = value_and_gradients_function(initial_position)
+    failed = ~tf.math.is_finite(f0)
+    converged = ~failed & (
+        _norm_inf(_projected_gradient(initial_position, df0)) <= tolerance)
+    history_shape = tf.concat(
+        [tf.shape(initial_position)[:-1], [num_correction_pairs],
+         tf.shape(initial_position)[-1:]], axis=0)
+    initial_state = _OptimizerState(
+        converged=converged,
+        failed=failed,
+        num_iterations=tf.zeros_like(converged, dtype=tf.int32),
+        num_objective_evaluations=tf.convert_to_tensor(1),
+        position=initial_position,
+        objective_value=f0,
+        objective_gradient=df0,
+        position_deltas=tf.zeros(history_shape, dtype=dtype),
+        gradient_deltas=tf.zeros(history_shape, dtype=dtype))
+
+    def _cond(state):
+      """Continue if iterations remain and stopping condition is not met."""
+      return (
+          (tf.math.reduce_max(state.num_iterations) < max_iterations)
+          & ~stopping_condition(state.converged, state.failed))
+
+    def _body(state):
+      """Main optimization loop."""
+      active = ~(state.converged | state.failed)
+      x_k = state.position
+      f_k = state.objective_value
+      g_k = state.objective_gradient
+      # Variables at the bounds with the gradient pointing outwards are fixed.
+      fixed = (((x_k <= lower_bounds) & (g_k > 0))
+               | ((x_k >= upper_bounds) & (g_k < 0)))
+      free = tf.cast(~fixed, dtype)
+      direction = -_two_loop_recursion(
+          g_k * free, state.position_deltas * tf.expand_dims(free, -2),
+          state.gradient_deltas * tf.expand_dims(free, -2)) * free
+      # Fall back to the projected steepest descent if the quasi-Newton
+      # direction is not a descent direction.
+      not_descent = _dot(direction, g_k) >= 0
+      direction = tf.where(tf.expand_dims(not_descent, -1), -g_k * free,
+                           direction)
+      # Without curvature information, scale the first step to unit length.
+      no_history = tf.math.reduce_all(
+          tf.equal(state.position_deltas, 0), axis=[-2, -1])
+      initial_step = tf.where(
+          no_history | not_descent,
+          tf.math.minimum(
+              tf.ones_like(f_k),
+              tf.math.divide_no_nan(tf.ones_like(f_k),
+                                    _norm_inf(direction))),
+          tf.ones_like(f_k))
+
+      def _ls_cond(step_size, x, f, g, done, num_evals):
+        del step_size, x, f, g, num_evals
+        return ~tf.math.reduce_all(done)
+
+      def _ls_body(step_size, x, f, g, done, num_evals):
+        """Evaluates the objective along the projected path."""
+        x_trial = _project(x_k + tf.expand_dims(step_size, -1) * direction)
+        f_trial, g_trial = value_and_gradients_function(x_trial)
+        sufficient_decrease = tf.math.is_finite(f_trial) & (
+            f_trial <= f_k + sufficient_decrease_param * _dot(g_k,
+                                                              x_trial - x_k))
+        update = ~done & sufficient_decrease
+        x = tf.where(tf.expand_dims(update, -1), x_trial, x)
+        f = tf.where(update, f_trial, f)
+        g = tf.where(tf.expand_dims(update, -1), g_trial, g)
+        done |= sufficient_decrease
+        step_size = tf.where(done, step_size, step_size / 2)
+        return step_size, x, f, g, done, num_evals + 1
+
+      _, x_kp1, f_kp1, g_kp1, ls_converged, ls_evals = tf.while_loop(
+          _ls_cond, _ls_body,
+          (initial_step, x_k, f_k, g_k, ~active, tf.constant(0)),
+          maximum_iterations=max_line_search_iterations)
+      failed = state.failed | (active & ~ls_converged)
+      step = x_kp1 - x_k
+      gradient_delta = g_kp1 - g_k
+      # Store the correction pair only if the curvature condition holds.
+      curvature = _dot(step, gradient_delta)
+      update_history = active & ls_converged & (
+          curvature > tf.constant(1e-10, dtype=dtype) *
+          _norm_sq(gradient_delta))
+      update_history = tf.expand_dims(tf.expand_dims(update_history, -1), -1)
+      position_deltas = tf.where(
+          update_history,
+          tf.concat([state.position_deltas[..., 1:, :],
+                     tf.expand_dims(step, -2)], axis=-2),
+          state.position_deltas)
+      gradient_deltas = tf.where(
+          update_history,
+          tf.concat([state.gradient_deltas[..., 1:, :],
+                     tf.expand_dims(gradient_delta, -2)], axis=-2),
+          state.gradient_deltas)
+
+      grad_converged = _norm_inf(_projected_gradient(x_kp1, g_kp1)) <= tolerance
+      x_converged = _norm_inf(step) <= x_tolerance
+      f_converged = (
+          tf.math.abs(f_kp1 - f_k) <= f_relative_tolerance * tf.math.abs(f_k))
+      converged = state.converged | (
+          active & ls_converged & (grad_converged | x_converged | f_converged))
+      new_state = _OptimizerState(
+          converged=converged,
+          failed=failed & ~converged,
+          num_iterations=tf.where(active, state.num_iterations + 1,
+                                  state.num_iterations),
+          num_objective_evaluations=state.num_objective_evaluations + ls_evals,
+          position=x_kp1,
+          objective_value=f_kp1,
+          objective_gradient=g_kp1,
+          position_deltas=position_deltas,
+          gradient_deltas=gradient_deltas)
+      return (new_state,)
+
+    final_state = tf.while_loop(_cond, _body, (initial_state,))[0]
+    return conjugate_gradient.OptimizerResult(
+        converged=final_state.converged,
+        failed=final_state.failed,
+        num_iterations=final_state.num_iterations,
+        num_objective_evaluations=final_state.num_objective_evaluations,
+        position=final_state.position,
+        objective_value=final_state.objective_value,
+        objective_gradient=final_state.objective_gradient)
+
+
+def _two_loop_recursion(gradient, position_deltas, gradient_deltas):
+  """Multiplies the gradient by the L-BFGS inverse Hessian approximation.
+
+  Algorithm 7.4 of [NW2006]. Correction pairs which are zero do not contribute.
+
+  Args:
+    gradient: Real `Tensor` of shape `[..., n]`.
+    position_deltas: Real `Tensor` of shape `[..., m, n]`. The position
+      differences ordered from the oldest to the newest.
+    gradient_deltas: Real `Tensor` of shape `[..., m, n]`. The gradient
+      differences ordered from the oldest to the newest.
+
+  Returns:
+    A real `Tensor` of shape `[..., n]`.
+  """
+  num_correction_pairs = position_deltas.shape[-2]
+  # Shape `[..., m]`.
+  rho = tf.math.divide_no_nan(
+      tf.ones_like(position_deltas[..., 0]),
+      _dot(position_deltas, gradient_deltas))
+  q = gradient
+  alphas = []
+  for i in reversed(range(num_correction_pairs)):
+    alpha = rho[..., i] * _dot(position_deltas[..., i, :], q)
+    q -= tf.expand_dims(alpha, -1) * gradient_deltas[..., i, :]
+    alphas.append(alpha)
+  alphas.reverse()
+  # Scale the initial inverse Hessian with the newest correction pair.
+  newest_s = position_deltas[..., -1, :]
+  newest_y = gradient_deltas[..., -1, :]
+  gamma = tf.math.divide_no_nan(_dot(newest_s, newest_y), _norm_sq(newest_y))
+  gamma = tf.where(tf.equal(gamma, 0), tf.ones_like(gamma), gamma)
+  r = tf.expand_dims(gamma, -1) * q
+  for i in range(num_correction_pairs):
+    beta = rho[..., i] * _dot(gradient_deltas[..., i, :], r)
+    r += tf.expand_dims(alphas[i] - beta, -1) * position_deltas[..., i, :]
+  return r
+
+
+def _dot(x, y):
+  """Evaluates scalar product."""
+  return tf.math.reduce_sum(x * y, axis=-1)
+
+
+def _norm_sq(x):
+  """Evaluates L2 norm squared."""
+  return tf.math.reduce_sum(tf.square(x), axis=-1)
+
+
+def _norm_inf(x):
+  """Evaluates inf-norm."""
+  return tf.reduce_max(tf.abs(x), axis=-1)
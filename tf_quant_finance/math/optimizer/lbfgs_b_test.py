@@ -0,0 +1,98 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for L-BFGS-B algorithm."""
+
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
+
+minimize = tff.math.optimizer.lbfgs_b_minimize
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class LbfgsBTest(tf.test.TestCase):
+
+  def test_quadratic_bowls(self):
+    """Minimizes a batch of quadratic functions with bounds."""
+    np.random.seed(12345)
+    dim = 5
+    batches = 20
+    minima = np.random.randn(batches, dim)
+    scales = np.exp(np.random.randn(batches, dim))
+
+    @tff.math.make_val_and_grad_fn
+    def quadratic(x):
+      return tf.reduce_sum(scales * (x - minima)**2, axis=-1)
+
+    lower_bounds = -0.5 * np.ones(dim)
+    upper_bounds = 0.5 * np.ones(dim)
+    results = self.evaluate(
+        minimize(quadratic, initial_position=tf.zeros([batches, dim],
+                                                      dtype=tf.float64),
+                 lower_bounds=lower_bounds, upper_bounds=upper_bounds,
+                 tolerance=1e-8))
+    self.assertTrue(results.converged.all())
+    self.assertFalse(results.failed.any())
+    # The function is separable, so the solution is the projected minimum.
+    self.assertAllClose(results.position,
+                        np.clip(minima, lower_bounds, upper_bounds),
+                        rtol=1e-6, atol=1e-6)
+
+  def test_rosenbrock(self):
+    """Minimizes the Rosenbrock function with and without active bounds."""
+    @tff.math.make_val_and_grad_fn
+    def rosenbrock(x):
+      x0, x1 = x[..., 0], x[..., 1]
+      return 100 * (x1 - x0**2)**2 + (1 - x0)**2
+
+    start = tf.constant([[-1.2, 1.], [0.5, 0.5]], dtype=tf.float64)
+    # The first problem is unconstrained in the feasible region, while for the
+    # second one the upper bound `x1 <= 0.5` is active.
+    lower_bounds = np.array([[-2., -2.], [-2., -2.]])
+    upper_bounds = np.array([[2., 2.], [2., 0.5]])
+    results = self.evaluate(
+        minimize(rosenbrock, initial_position=start,
+                 lower_bounds=lower_bounds, upper_bounds=upper_bounds,
+                 tolerance=1e-7, max_iterations=200))
+    self.assertTrue(results.converged.all())
+    self.assertAllClose(results.position[0], [1., 1.], atol=1e-5)
+    # With `x1 = 0.5` fixed, the minimum over `x0` solves
+    # `400 x0 (x0**2 - 0.5) + 2 (x0 - 1) = 0`.
+    x0 = np.roots([400, 0, -198, -2])
+    x0 = np.real(x0[np.isreal(x0) & (np.real(x0) > 0)])[0]
+    self.assertAllClose(results.position[1], [x0, 0.5], atol=1e-5)
+
+  def test_matches_unbounded_lbfgs(self):
+    """Without bounds, the minimum agrees with the L-BFGS minimizer."""
+    @tff.math.make_val_and_grad_fn
+    def himmelblau(coord):
+      x, y = coord[..., 0], coord[..., 1]
+      return (x * x + y - 11)**2 + (x + y * y - 7)**2
+
+    start = tf.constant([[1, 1], [-2, 2], [-1, -1], [1, -2]], dtype=tf.float64)
+    results = self.evaluate(
+        minimize(himmelblau, initial_position=start, tolerance=1e-8))
+    expected_minima = np.array([[3, 2],
+                                [-2.805118, 3.131312],
+                                [-3.779310, -3.283186],
+                                [3.584428, -1.848126]])
+    self.assertTrue(results.converged.all())
+    self.assertAllClose(results.position, expected_minima, atol=1e-5)
+
+
+if __name__ == '__main__':
+  tf.test.main()
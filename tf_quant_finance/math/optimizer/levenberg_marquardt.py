@@ -0,0 +1,353 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The Levenberg-Marquardt algorithm for bounded nonlinear least squares.
+
+References:
+[MNT2004] K. Madsen, H.B. Nielsen, O. Tingleff. Methods for non-linear least
+  squares problems. 2nd Edition, 2004.
+  http://www2.imm.dtu.dk/pubdb/edoc/imm3215.pdf
+[KYF2004] C. Kanzow, N. Yamashita, M. Fukushima. Levenberg-Marquardt methods
+  with strong local convergence properties for solving nonlinear equations with
+  convex constraints. Journal of Computational and Applied Mathematics, 2004.
+"""
+
+from typing import Callable, Tuple
+
+import tensorflow.compat.v2 as tf
+
+from tensorflow_probability.python.optimizer import converged_all
+from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
+from tf_quant_finance.math.optimizer import conjugate_gradient
+
+
+__all__ = [
+    'minimize',
+]
+
+
+# Upper bound for the damping parameter relative to `diag(J^T J)`. Steps
+# computed with larger damping are negligible in any floating point precision.
+_MAX_DAMPING = 1e16
+
+
+@tff_utils.dataclass
+class _OptimizerState:
+  """Internal state of optimizer."""
+  converged: types.BoolTensor
+  failed: types.BoolTensor
+  num_iterations: types.IntTensor
+  num_objective_evaluations: types.IntTensor
+  position: types.RealTensor
+  # Residuals and their Jacobian at the position.
+  residuals: types.RealTensor
+  jacobian: types.RealTensor
+  objective_value: types.RealTensor
+  objective_gradient: types.RealTensor
+  # Damping parameter (`mu` in [MNT2004]).
+  damping: types.RealTensor
+  # Damping growth factor on rejected steps (`nu` in [MNT2004]).
+  damping_factor: types.RealTensor
+
+
+def minimize(
+    residuals_and_jacobian_fn: Callable[
+        [types.RealTensor], Tuple[types.RealTensor, types.RealTensor]],
+    initial_position: types.RealTensor,
+    lower_bounds: types.RealTensor = None,
+    upper_bounds: types.RealTensor = None,
+    tolerance: types.RealTensor = 1e-8,
+    x_tolerance: types.RealTensor = 0,
+    f_relative_tolerance: types.RealTensor = 0,
+    max_iterations: types.IntTensor = 50,
+    initial_damping: types.RealTensor = 1e-3,
+    stopping_condition: Callable[[types.BoolTensor, types.BoolTensor],
+                                 types.BoolTensor] = None,
+    name: str = None) -> conjugate_gradient.OptimizerResult:
+  """Minimizes a sum of squares with box constraints.
+
+  Finds the minimum of `0.5 * sum(r(x)**2)` for a vector function `r` subject
+  to the constraints `lower_bounds <= x <= upper_bounds`. At each iteration the
+  damped Gauss-Newton step
+
+    `d = -(J^T J + mu * diag(J^T J))^-1 J^T r`
+
+  is computed and projected onto the feasible box. The step is accepted if it
+  reduces the objective. The damping `mu` is updated according to the ratio of
+  the actual and predicted reduction of the objective (see Section 3.2 of
+  [MNT2004]). Projecting the steps onto the box is the approach of [KYF2004].
+
+  Supports batches of independent problems of arbitrary batch shape which are
+  optimized in lock-step. Each batch member has its own damping and its own
+  convergence mask; converged members are no longer updated.
+
+  #### References:
+  [MNT2004] K. Madsen, H.B. Nielsen, O. Tingleff. Methods for non-linear least
+    squares problems. 2nd Edition, 2004.
+  [KYF2004] C. Kanzow, N. Yamashita, M. Fukushima. Levenberg-Marquardt methods
+    with strong local convergence properties for solving nonlinear equations
+    with convex constraints. Journal of Computational and Applied Mathematics,
+    2004.
+
+  ### Usage:
+  Fit `a * exp(-b * t)` to the data for a batch of two problems.
+
+  ```python
+  t = np.array([0., 1., 2., 3.])
+  data = np.array([[2., 2. * np.exp(-0.5), 2. * np.exp(-1.), 2. * np.exp(-1.5)],
+                   [1., np.exp(-1.), np.exp(-2.), np.exp(-3.)]])
+
+  def residuals_and_jacobian(x):
+    a, b = x[..., :1], x[..., 1:]
+    model = a * tf.math.exp(-b * t)
+    jacobian = tf.stack([model / a, -t * model], axis=-1)
+    return model - data, jacobian
+
+  results = tff.math.optimizer.levenberg_marquardt_minimize(
+      residuals_and_jacobian,
+      initial_position=tf.constant([[1., 1.], [1., 1.]], dtype=tf.float64),
+      lower_bounds=[0., 0.], upper_bounds=[10., 10.])
+  # results.position is close to [[2., 0.5], [1., 1.]]
+  ```
+
+  Args:
+    residuals_and_jacobian_fn: A Python callable that accepts a point as a real
+      `Tensor` of shape `[..., n]` and returns a tuple of `Tensor`s containing
+      the residuals of shape `[..., m]` and their Jacobian of shape
+      `[..., m, n]` at that point.
+    initial_position: Real `Tensor` of shape `[..., n]`. The starting point, or
+      points when using batching dimensions, of the search procedure. Should
+      be within the bounds.
+    lower_bounds: Optional real `Tensor` broadcastable with `initial_position`.
+      The lower bounds of the position.
+      Default value: `None` which means no lower bounds.
+    upper_bounds: Optional real `Tensor` broadcastable with `initial_position`.
+      The upper bounds of the position.
+      Default value: `None` which means no upper bounds.
+    tolerance: Scalar `Tensor` of real dtype. Specifies the gradient tolerance
+      for the procedure. If the supremum norm of the projected gradient vector
+      is below this number, the algorithm is stopped.
+      Default value: `1e-8`.
+    x_tolerance: Scalar `Tensor` of real dtype. If the supremum norm of an
+      accepted step is smaller than this number, the algorithm is stopped.
+      Default value: 0.
+    f_relative_tolerance: Scalar `Tensor` of real dtype. If the relative change
+      in the objective value on an accepted step is smaller than this value,
+      the algorithm is stopped.
+      Default value: 0.
+    max_iterations: Scalar positive int32 `Tensor`. The maximum number of
+      iterations.
+      Default value: 50.
+    initial_damping: Positive scalar `Tensor` of real dtype. The initial value
+      of the damping parameter relative to `diag(J^T J)`.
+      Default value: `1e-3`.
+    stopping_condition: (Optional) A Python function that takes as input two
+      Boolean tensors of shape `[...]`, and returns a Boolean scalar tensor. The
+      input tensors are `converged` and `failed`, indicating the current status
+      of each respective batch member; the return value states whether the
+      algorithm should stop. The default is tfp.optimizer.converged_all which
+      only stops when all batch members have either converged or failed.
+    name: (Optional) Python str. The name prefixed to the ops created by this
+      function. If not supplied, the default name
+      'levenberg_marquardt_minimize' is used.
+
+  Returns:
+    optimizer_results: An `OptimizerResult` object containing the following
+    items:
+      converged: boolean tensor of shape `[...]` indicating for each batch
+        member whether the minimum was found within tolerance.
+      failed: boolean tensor of shape `[...]` indicating for each batch
+        member whether the objective function is not finite at the position.
+      num_iterations: int32 tensor of shape `[...]` with the number of
+        iterations performed for each batch member.
+      num_objective_evaluations: The total number of objective
+        evaluations performed.
+      position: A tensor of shape `[..., n]` containing the last argument value
+        found during the search from each starting point.
+      objective_value: A tensor of shape `[...]` with the value of the
+        objective function, `0.5 * sum(r**2)`, at the `position`.
+      objective_gradient: A tensor of shape `[..., n]` containing the gradient
+        of the objective function at the `position`.
+  """
+  with tf.name_scope(name or 'levenberg_marquardt_minimize'):
+    initial_position = tf.convert_to_tensor(
+        initial_position, name='initial_position')
+    dtype = initial_position.dtype
+    lower_bounds, upper_bounds = _prepare_bounds(
+        initial_position, lower_bounds, upper_bounds)
+    tolerance = tf.convert_to_tensor(
+        tolerance, dtype=dtype, name='grad_tolerance')
+    f_relative_tolerance = tf.convert_to_tensor(
+        f_relative_tolerance, dtype=dtype, name='f_relative_tolerance')
+    x_tolerance = tf.convert_to_tensor(
+        x_tolerance, dtype=dtype, name='x_tolerance')
+    initial_damping = tf.convert_to_tensor(
+        initial_damping, dtype=dtype, name='initial_damping')
+    max_iterations = tf.convert_to_tensor(
+        max_iterations, name='max_iterations')
+    stopping_condition = stopping_condition or converged_all
+
+    residuals, jacobian = residuals_and_jacobian_fn(initial_position)
+    objective_value = 0.5 * _norm_sq(residuals)
+    gradient = _matvec(jacobian, residuals, adjoint=True)
+    failed = ~tf.math.is_finite(objective_value)
+    converged = ~failed & (_norm_inf(
+        _projected_gradient(initial_position, gradient, lower_bounds,
+                            upper_bounds)) <= tolerance)
+    initial_state = _OptimizerState(
+        converged=converged,
+        failed=failed,
+        num_iterations=tf.zeros_like(converged, dtype=tf.int32),
+        num_objective_evaluations=tf.convert_to_tensor(1),
+        position=initial_position,
+        residuals=residuals,
+        jacobian=jacobian,
+        objective_value=objective_value,
+        objective_gradient=gradient,
+        damping=initial_damping * tf.ones_like(objective_value),
+        damping_factor=2 * tf.ones_like(objective_value))
+
+    def _cond(state):
+      """Continue if iterations remain and stopping condition is not met."""
+      return (
+          (tf.math.reduce_max(state.num_iterations) < max_iterations)
+          & ~stopping_condition(state.converged, state.failed))
+
+    def _body(state):
+      """Main optimization loop."""
+      active = ~(state.converged | state.failed)
+      x_k = state.position
+      f_k = state.objective_value
+      g_k = state.objective_gradient
+      jtj = tf.linalg.matmul(state.jacobian, state.jacobian, transpose_a=True)
+      # Marquardt's scaling of the damping term. The diagonal is floored to
+      # keep the system positive definite for vanishing columns of `J`.
+      jtj_diag = tf.linalg.diag_part(jtj)
+      scaling = tf.math.maximum(
+          jtj_diag, tf.math.reduce_max(jtj_diag, axis=-1, keepdims=True)
+          * tf.constant(1e-12, dtype=dtype)) + tf.constant(1e-30, dtype=dtype)
+      damping = tf.expand_dims(state.damping, axis=-1)
+      system = jtj + tf.linalg.diag(damping * scaling)
+      # Replace the systems of the finished batch members with the identity to
+      # keep the factorization well-defined.
+      system = tf.where(
+          tf.expand_dims(tf.expand_dims(active, -1), -1), system,
+          tf.eye(tff_utils.get_shape(g_k)[-1], dtype=dtype))
+      step = -tf.linalg.cholesky_solve(
+          tf.linalg.cholesky(system), tf.expand_dims(g_k, axis=-1))[..., 0]
+      x_kp1 = _project(x_k + step, lower_bounds, upper_bounds)
+      # Use the projected step to compute the predicted reduction.
+      step = x_kp1 - x_k
+      predicted_reduction = -(
+          _dot(g_k, step) + 0.5 * _dot(step, _matvec(jtj, step)))
+      residuals, jacobian = residuals_and_jacobian_fn(x_kp1)
+      f_kp1 = 0.5 * _norm_sq(residuals)
+      gain_ratio = tf.math.divide_no_nan(f_k - f_kp1, predicted_reduction)
+      accept = active & tf.math.is_finite(f_kp1) & (f_kp1 < f_k)
+      # Damping update of [MNT2004], Eq. (2.21).
+      damping = tf.where(
+          accept,
+          state.damping * tf.math.maximum(
+              tf.constant(1 / 3, dtype=dtype), 1 - (2 * gain_ratio - 1)**3),
+          state.damping * state.damping_factor)
+      damping = tf.math.minimum(damping, _MAX_DAMPING)
+      damping_factor = tf.where(accept, 2 * tf.ones_like(damping),
+                                2 * state.damping_factor)
+      g_kp1 = _matvec(jacobian, residuals, adjoint=True)
+
+      position = tf.where(tf.expand_dims(accept, -1), x_kp1, x_k)
+      objective_value = tf.where(accept, f_kp1, f_k)
+      objective_gradient = tf.where(tf.expand_dims(accept, -1), g_kp1, g_k)
+      grad_converged = _norm_inf(
+          _projected_gradient(position, objective_gradient, lower_bounds,
+                              upper_bounds)) <= tolerance
+      x_converged = accept & (_norm_inf(step) <= x_tolerance)
+      f_converged = accept & (
+          tf.math.abs(f_kp1 - f_k) <= f_relative_tolerance * tf.math.abs(f_k))
+      # A step which does not change the position means the damping is too
+      # large for the available precision.
+      stalled = active & tf.math.reduce_all(tf.equal(step, 0), axis=-1)
+      converged = state.converged | (
+          active & (grad_converged | x_converged | f_converged | stalled))
+      new_state = _OptimizerState(
+          converged=converged,
+          failed=state.failed,
+          num_iterations=tf.where(active, state.num_iterations + 1,
+                                  state.num_iterations),
+          num_objective_evaluations=state.num_objective_evaluations + 1,
+          position=position,
+          residuals=tf.where(tf.expand_dims(accept, -1), residuals,
+                             state.residuals),
+          jacobian=tf.where(tf.expand_dims(tf.expand_dims(accept, -1), -1),
+                            jacobian, state.jacobian),
+          objective_value=objective_value,
+          objective_gradient=objective_gradient,
+          damping=tf.where(active, damping, state.damping),
+          damping_factor=tf.where(active, damping_factor,
+                                  state.damping_factor))
+      return (new_state,)
+
+    final_state = tf.while_loop(_cond, _body, (initial_state,))[0]
+    return conjugate_gradient.OptimizerResult(
+        converged=final_state.converged,
+        failed=final_state.failed,
+        num_iterations=final_state.num_iterations,
+        num_objective_evaluations=final_state.num_objective_evaluations,
+        position=final_state.position,
+        objective_value=final_state.objective_value,
+        objective_gradient=final_state.objective_gradient)
+
+
+def _prepare_bounds(position, lower_bounds, upper_bounds):
+  """Converts the bounds to `Tensor`s broadcastable with `position`."""
+  dtype = position.dtype
+  if lower_bounds is None:
+    lower_bounds = tf.constant(-float('inf'), dtype=dtype)
+  if upper_bounds is None:
+    upper_bounds = tf.constant(float('inf'), dtype=dtype)
+  lower_bounds = tf.convert_to_tensor(
+      lower_bounds, dtype=dtype, name='lower_bounds')
+  upper_bounds = tf.convert_to_tensor(
+      upper_bounds, dtype=dtype, name='upper_bounds')
+  return lower_bounds, upper_bounds
+
+
+def _project(x, lower_bounds, upper_bounds):
+  """Projects `x` onto the box defined by the bounds."""
+  return tf.math.minimum(tf.math.maximum(x, lower_bounds), upper_bounds)
+
+
+def _projected_gradient(x, gradient, lower_bounds, upper_bounds):
+  """Computes the projected gradient used to check the optimality."""
+  return x - _project(x - gradient, lower_bounds, upper_bounds)
+
+
+def _matvec(matrix, vector, adjoint=False):
+  """Multiplies a batch of matrices by a batch of vectors."""
+  return tf.linalg.matvec(matrix, vector, adjoint_a=adjoint)
+
+
+def _dot(x, y):
+  """Evaluates scalar product."""
+  return tf.math.reduce_sum(x * y, axis=-1)
+
+
+def _norm_sq(x):
+  """Evaluates L2 norm squared."""
+  return tf.math.reduce_sum(tf.square(x), axis=-1)
+
+
+def _norm_inf(x):
+  """Evaluates inf-norm."""
+  return tf.reduce_max(tf.abs(x), axis=-1)
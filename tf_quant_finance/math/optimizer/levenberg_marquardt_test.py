@@ -0,0 +1,114 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for Levenberg-Marquardt algorithm."""
+
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
+
+minimize = tff.math.optimizer.levenberg_marquardt_minimize
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class LevenbergMarquardtTest(tf.test.TestCase):
+
+  def test_exponential_fit(self):
+    """Fits a batch of exponential decay curves."""
+    t = np.linspace(0., 3., 7)
+    true_params = np.array([[2., 0.5], [1., 1.], [0.5, 2.], [3., 0.1]])
+    data = true_params[:, :1] * np.exp(-true_params[:, 1:] * t)
+
+    def residuals_and_jacobian(x):
+      a, b = x[..., :1], x[..., 1:]
+      model = a * tf.math.exp(-b * t)
+      jacobian = tf.stack([model / a, -t * model], axis=-1)
+      return model - data, jacobian
+
+    results = self.evaluate(
+        minimize(residuals_and_jacobian,
+                 initial_position=tf.ones([4, 2], dtype=tf.float64),
+                 lower_bounds=[0.01, 0.], upper_bounds=[10., 10.],
+                 tolerance=1e-12))
+    self.assertTrue(results.converged.all())
+    self.assertFalse(results.failed.any())
+    self.assertAllClose(results.position, true_params, rtol=1e-8, atol=1e-8)
+    self.assertAllClose(results.objective_value, np.zeros(4), atol=1e-16)
+    # Each problem converges after its own number of iterations.
+    self.assertAllEqual(results.num_iterations.shape, [4])
+    self.assertLessEqual(np.max(results.num_iterations), 30)
+
+  def test_active_bounds(self):
+    """The solution of a linear problem lies at the bounds."""
+    # Residuals `A x - b` for a batch of two problems.
+    matrix = np.array([[[1., 0.], [0., 2.], [1., 1.]],
+                       [[2., 1.], [1., 3.], [0., 1.]]])
+    rhs = np.array([[3., -2., 1.], [1., 2., 0.5]])
+
+    def residuals_and_jacobian(x):
+      return tf.linalg.matvec(matrix, x) - rhs, tf.constant(matrix)
+
+    lower_bounds = np.array([0., 0.])
+    upper_bounds = np.array([1.5, 1.5])
+    results = self.evaluate(
+        minimize(residuals_and_jacobian,
+                 initial_position=np.full([2, 2], 0.5),
+                 lower_bounds=lower_bounds, upper_bounds=upper_bounds,
+                 tolerance=1e-10))
+    self.assertTrue(results.converged.all())
+    # Reference solution computed by enumerating the faces of the box.
+    expected = []
+    for a, b in zip(matrix, rhs):
+      best = None
+      for fix in [(), (0, 0.), (0, 1.5), (1, 0.), (1, 1.5)]:
+        x = np.zeros(2)
+        if fix:
+          i, v = fix
+          j = 1 - i
+          x[i] = v
+          x[j] = np.dot(a[:, j], b - a[:, i] * v) / np.dot(a[:, j], a[:, j])
+        else:
+          x = np.linalg.lstsq(a, b, rcond=None)[0]
+        x = np.clip(x, lower_bounds, upper_bounds)
+        value = np.sum((a @ x - b)**2)
+        if best is None or value < best[0]:
+          best = (value, x)
+      expected.append(best[1])
+    self.assertAllClose(results.position, expected, rtol=1e-6, atol=1e-6)
+    self.assertTrue(np.all(results.position >= lower_bounds))
+    self.assertTrue(np.all(results.position <= upper_bounds))
+
+  def test_rosenbrock_residuals(self):
+    """Minimizes the Rosenbrock function written as a sum of squares."""
+    def residuals_and_jacobian(x):
+      x0, x1 = x[..., 0], x[..., 1]
+      residuals = tf.stack([10 * (x1 - x0**2), 1 - x0], axis=-1)
+      zeros = tf.zeros_like(x0)
+      jacobian = tf.stack([tf.stack([-20 * x0, 10 + zeros], axis=-1),
+                           tf.stack([-1 + zeros, zeros], axis=-1)], axis=-2)
+      return residuals, jacobian
+
+    results = self.evaluate(
+        minimize(residuals_and_jacobian,
+                 initial_position=tf.constant([[-1.2, 1.], [2., 2.]],
+                                              dtype=tf.float64),
+                 max_iterations=100))
+    self.assertTrue(results.converged.all())
+    self.assertAllClose(results.position, np.ones([2, 2]), atol=1e-6)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -13,12 +13,28 @@
 # limitations under the License.
 """Functions for solving linear parabolic PDEs."""
 
+import collections
+
 import tensorflow.compat.v2 as tf
 from tf_quant_finance import utils
 from tf_quant_finance.math.pde.steppers.douglas_adi import douglas_adi_step
 from tf_quant_finance.math.pde.steppers.oscillation_damped_crank_nicolson import oscillation_damped_crank_nicolson_step
 
 
+RecordedValues = collections.namedtuple(
+    'RecordedValues',
+    [
+        # The times at which the values grid was recorded.
+        'times',
+        # The recorded values grids.
+        'values',
+        # The first derivatives of the recorded values grids along each axis.
+        'first_derivatives',
+        # The second derivatives of the recorded values grids along each axis.
+        'second_derivatives',
+    ])
+
+
 def solve_backward(start_time,
                    end_time,
                    coord_grid,
@@ -36,6 +52,9 @@ def solve_backward(start_time,
                    inner_first_order_coeff_fn=None,
                    maximum_steps=None,
                    swap_memory=True,
+                   record_times=None,
+                   record_derivatives=False,
+                   adjoint_params=None,
                    dtype=None,
                    name=None):
   """Evolves a grid of function values backwards in time according to a PDE.
@@ -333,6 +352,34 @@ def solve_backward(start_time,
     swap_memory: Whether GPU-CPU memory swap is enabled for this op. See
       equivalent flag in `tf.while_loop` documentation for more details. Useful
       when computing a gradient of the op.
+    record_times: Optional real rank 1 `Tensor` of times at which the values
+      grid should be recorded during the solve. The time stepping is adjusted so
+      that a step ends exactly at each of the record times (this may add at
+      most `len(record_times)` extra steps). The recorded grid is the one
+      obtained after `values_transform_fn` has been applied. Times outside of
+      the interval between `start_time` and `end_time` are clipped to it. If
+      `record_times` is empty, the recorded values are empty.
+      Default value: `None` which means no intermediate grids are recorded.
+    record_derivatives: Python bool. If `True`, the first and the second
+      derivatives of the values grid along each of the spatial axes are also
+      recorded at `record_times` (e.g., for computing deltas and gammas). The
+      derivatives are approximated with the central finite differences on the
+      coordinate grid and one-sided differences at the boundaries. Ignored if
+      `record_times` is `None`.
+      Default value: `False`.
+    adjoint_params: Optional list of real `Tensor`s used by the PDE
+      coefficients, the boundary conditions or `values_transform_fn`, with
+      respect to which the solution is going to be differentiated. If supplied,
+      the gradient of the final values grid with respect to `values_grid`,
+      `adjoint_params` and any `tf.Variable`s used by the callables is computed
+      with the discrete adjoint method: only the values grid at the start of
+      each time step is stored during the solve (rather than all the
+      intermediate tensors of the time marching scheme), and the gradient of
+      each step is recomputed during the backward sweep. The gradients with
+      respect to other tensors captured by the callables are not propagated.
+      Can not be used together with `record_times`.
+      Default value: `None` which means the gradients are computed by
+      differentiating through the time stepping loop.
     dtype: The dtype to use.
       Default value: None, which means dtype will be inferred from
       `values_grid`.
@@ -341,11 +388,23 @@ def solve_backward(start_time,
 
   Returns:
     The final values grid, final coordinate grid, final time and number of steps
-    performed.
+    performed. If `record_times` is supplied, a `RecordedValues` namedtuple is
+    returned as the fifth element. It contains the following fields:
+      times: A `Tensor` of shape `[k]` with the record times (clipped to the
+        solution interval) in the order they were supplied.
+      values: A `Tensor` of shape `[k] + values_shape`, where `values_shape` is
+        the shape of the values grid. The `i`-th element is the values grid
+        at `times[i]`.
+      first_derivatives: A `Tensor` of shape `[k, n] + values_shape` with the
+        first derivatives along each of the `n` spatial axes, or `None` if
+        `record_derivatives` is `False`.
+      second_derivatives: A `Tensor` of shape `[k, n] + values_shape` with the
+        second derivatives along each of the `n` spatial axes, or `None` if
+        `record_derivatives` is `False`.
 
   Raises:
     ValueError if neither num steps nor time steps are provided or if both
-    are provided.
+    are provided, or if both `record_times` and `adjoint_params` are provided.
   """
   values_grid = tf.convert_to_tensor(values_grid, dtype=dtype)
   start_time = tf.convert_to_tensor(
@@ -373,6 +432,9 @@ def solve_backward(start_time,
                 inner_first_order_coeff_fn,
                 maximum_steps,
                 swap_memory,
+                record_times,
+                record_derivatives,
+                adjoint_params,
                 name or 'solve_backward')
 
 
@@ -393,6 +455,9 @@ def solve_forward(start_time,
                   inner_first_order_coeff_fn=None,
                   maximum_steps=None,
                   swap_memory=True,
+                  record_times=None,
+                  record_derivatives=False,
+                  adjoint_params=None,
                   dtype=None,
                   name=None):
   """Evolves a grid of function values forward in time according to a PDE.
@@ -571,6 +636,34 @@ def solve_forward(start_time,
     swap_memory: Whether GPU-CPU memory swap is enabled for this op. See
       equivalent flag in `tf.while_loop` documentation for more details. Useful
       when computing a gradient of the op.
+    record_times: Optional real rank 1 `Tensor` of times at which the values
+      grid should be recorded during the solve. The time stepping is adjusted so
+      that a step ends exactly at each of the record times (this may add at
+      most `len(record_times)` extra steps). The recorded grid is the one
+      obtained after `values_transform_fn` has been applied. Times outside of
+      the interval between `start_time` and `end_time` are clipped to it. If
+      `record_times` is empty, the recorded values are empty.
+      Default value: `None` which means no intermediate grids are recorded.
+    record_derivatives: Python bool. If `True`, the first and the second
+      derivatives of the values grid along each of the spatial axes are also
+      recorded at `record_times` (e.g., for computing deltas and gammas). The
+      derivatives are approximated with the central finite differences on the
+      coordinate grid and one-sided differences at the boundaries. Ignored if
+      `record_times` is `None`.
+      Default value: `False`.
+    adjoint_params: Optional list of real `Tensor`s used by the PDE
+      coefficients, the boundary conditions or `values_transform_fn`, with
+      respect to which the solution is going to be differentiated. If supplied,
+      the gradient of the final values grid with respect to `values_grid`,
+      `adjoint_params` and any `tf.Variable`s used by the callables is computed
+      with the discrete adjoint method: only the values grid at the start of
+      each time step is stored during the solve (rather than all the
+      intermediate tensors of the time marching scheme), and the gradient of
+      each step is recomputed during the backward sweep. The gradients with
+      respect to other tensors captured by the callables are not propagated.
+      Can not be used together with `record_times`.
+      Default value: `None` which means the gradients are computed by
+      differentiating through the time stepping loop.
     dtype: The dtype to use.
       Default value: None, which means dtype will be inferred from
       `values_grid`.
@@ -579,11 +672,23 @@ def solve_forward(start_time,
 
   Returns:
     The final values grid, final coordinate grid, final time and number of steps
-    performed.
+    performed. If `record_times` is supplied, a `RecordedValues` namedtuple is
+    returned as the fifth element. It contains the following fields:
+      times: A `Tensor` of shape `[k]` with the record times (clipped to the
+        solution interval) in the order they were supplied.
+      values: A `Tensor` of shape `[k] + values_shape`, where `values_shape` is
+        the shape of the values grid. The `i`-th element is the values grid
+        at `times[i]`.
+      first_derivatives: A `Tensor` of shape `[k, n] + values_shape` with the
+        first derivatives along each of the `n` spatial axes, or `None` if
+        `record_derivatives` is `False`.
+      second_derivatives: A `Tensor` of shape `[k, n] + values_shape` with the
+        second derivatives along each of the `n` spatial axes, or `None` if
+        `record_derivatives` is `False`.
 
   Raises:
     ValueError if neither num steps nor time steps are provided or if both
-    are provided.
+    are provided, or if both `record_times` and `adjoint_params` are provided.
   """
   values_grid = tf.convert_to_tensor(values_grid, dtype=dtype)
   start_time = tf.convert_to_tensor(
@@ -609,6 +714,9 @@ def solve_forward(start_time,
                 inner_first_order_coeff_fn,
                 maximum_steps,
                 swap_memory,
+                record_times,
+                record_derivatives,
+                adjoint_params,
                 name or 'solve_forward')
 
 
@@ -631,11 +739,17 @@ def _solve(
     inner_first_order_coeff_fn=None,
     maximum_steps=None,
     swap_memory=True,
+    record_times=None,
+    record_derivatives=False,
+    adjoint_params=None,
     name=None):
   """Common code for solve_backward and solve_forward."""
   if (num_steps is None) == (time_step is None):
     raise ValueError('Exactly one of num_steps or time_step'
                      ' should be supplied.')
+  if adjoint_params is not None and record_times is not None:
+    raise ValueError('`record_times` is not supported together with'
+                     ' `adjoint_params`.')
   coord_grid = [
       tf.convert_to_tensor(dim_grid, dtype=values_grid.dtype)
       for dim_grid in coord_grid
@@ -674,14 +788,82 @@ def _solve(
     if est_max_steps is None and maximum_steps is not None:
       est_max_steps = maximum_steps
 
-    def loop_cond(should_stop, time, x_grid, f_grid, steps_performed):
-      del time, x_grid, f_grid, steps_performed
-      return tf.logical_not(should_stop)
+    if record_times is not None:
+      record_times = tf.convert_to_tensor(
+          record_times, dtype=values_grid.dtype, name='record_times')
+      record_times = tf.clip_by_value(record_times,
+                                      tf.math.minimum(start_time, end_time),
+                                      tf.math.maximum(start_time, end_time))
+      num_records = tf.size(record_times)
+      # Record times are processed in the order they are reached by the solver.
+      record_order = tf.argsort(tf.math.abs(record_times - start_time),
+                                stable=True)
+      # The end time is appended so that the next record time is defined when
+      # all the record times have been reached, including for an empty
+      # `record_times`.
+      sorted_record_times = tf.concat(
+          [tf.gather(record_times, record_order),
+           tf.reshape(tf.cast(end_time, record_times.dtype), [1])], axis=0)
+      direction = end_time - start_time
+      if est_max_steps is not None:
+        # Each record time may split one of the time steps in two.
+        est_max_steps += num_records
 
-    def loop_body(should_stop, time, x_grid, f_grid, steps_performed):
-      """Propagates the grid in time."""
-      del should_stop
-      next_should_stop, t_next = time_step_fn(time)
+      def next_record_time(record_index):
+        return tf.gather(sorted_record_times,
+                         tf.math.minimum(record_index, num_records))
+
+      def record(time, x_grid, f_grid, record_state):
+        """Writes the values grid for all record times reached at `time`."""
+
+        def record_cond(record_index, *arrays):
+          del arrays
+          # A record time is reached if it is not beyond `time` in the
+          # direction of the evolution.
+          return tf.math.logical_and(
+              record_index < num_records,
+              (next_record_time(record_index) - time) * direction <= 0)
+
+        def record_body(record_index, values_array, *derivative_arrays):
+          values_array = values_array.write(record_index, f_grid)
+          if derivative_arrays:
+            first_array, second_array = derivative_arrays
+            first_derivatives, second_derivatives = _values_grid_derivatives(
+                x_grid, f_grid)
+            derivative_arrays = (
+                first_array.write(record_index, first_derivatives),
+                second_array.write(record_index, second_derivatives))
+          return (record_index + 1, values_array) + tuple(derivative_arrays)
+
+        return tf.while_loop(record_cond, record_body, record_state)
+
+      def clip_to_record_time(time, t_next, should_stop, record_index):
+        """Shortens the time step so that it ends at the next record time."""
+        r_next = next_record_time(record_index)
+        clip = tf.math.logical_and(record_index < num_records,
+                                   (r_next - time) * (t_next - r_next) > 0)
+        t_next = tf.where(clip, r_next, t_next)
+        should_stop = tf.math.logical_and(should_stop,
+                                          tf.math.logical_not(clip))
+        return t_next, should_stop
+
+      arrays = [tf.TensorArray(values_grid.dtype, size=num_records,
+                               element_shape=values_grid.shape)]
+      if record_derivatives:
+        derivatives_shape = tf.TensorShape([n_dims]).concatenate(
+            values_grid.shape)
+        arrays += [
+            tf.TensorArray(values_grid.dtype, size=num_records,
+                           element_shape=derivatives_shape)
+            for _ in range(2)
+        ]
+      record_state = record(start_time, coord_grid, values_grid,
+                            (tf.constant(0, dtype=tf.int32),) + tuple(arrays))
+    else:
+      record_state = ()
+
+    def step_fn(time, t_next, x_grid, f_grid, steps_performed):
+      """Performs one time step followed by the values transform."""
       next_xs, next_fs = one_step_fn(
           time=time,
           next_time=t_next,
@@ -697,22 +879,232 @@ def _solve(
 
       if values_transform_fn is not None:
         next_xs, next_fs = values_transform_fn(t_next, next_xs, next_fs)
-      return next_should_stop, t_next, next_xs, next_fs, steps_performed + 1
-
-    # If the start time is already equal to end time, no stepping is needed.
-    # solve_backward, solve_forward already took care of the case when end_time
-    # is on the "wrong side" of start_time.
-    should_already_stop = (start_time == end_time)
-    initial_args = (should_already_stop, start_time, coord_grid, values_grid,
-                    start_step_count)
-    (_, final_time, final_coords, final_values,
-     steps_performed) = tf.while_loop(
-         loop_cond,
-         loop_body,
-         initial_args,
-         swap_memory=swap_memory,
-         maximum_iterations=est_max_steps)
-    return final_values, final_coords, final_time, steps_performed
+      return next_xs, next_fs
+
+    def loop_cond(should_stop, time, x_grid, f_grid, steps_performed,
+                  record_state, history):
+      del time, x_grid, f_grid, steps_performed, record_state, history
+      return tf.logical_not(should_stop)
+
+    def loop_body(should_stop, time, x_grid, f_grid, steps_performed,
+                  record_state, history):
+      """Propagates the grid in time."""
+      del should_stop
+      next_should_stop, t_next = time_step_fn(time)
+      if record_state:
+        t_next, next_should_stop = clip_to_record_time(
+            time, t_next, next_should_stop, record_state[0])
+      next_xs, next_fs = step_fn(time, t_next, x_grid, f_grid,
+                                 steps_performed)
+      if record_state:
+        record_state = record(t_next, next_xs, next_fs, record_state)
+      if history:
+        # Only the inputs of the step are stored for the adjoint sweep.
+        index = steps_performed - start_step_count
+        times_array, next_times_array, coords_arrays, values_array = history
+        history = (times_array.write(index, time),
+                   next_times_array.write(index, t_next),
+                   [array.write(index, x)
+                    for array, x in zip(coords_arrays, x_grid)],
+                   values_array.write(index, f_grid))
+      return (next_should_stop, t_next, next_xs, next_fs, steps_performed + 1,
+              record_state, history)
+
+    def run_loop(values_grid, history):
+      # If the start time is already equal to end time, no stepping is needed.
+      # solve_backward, solve_forward already took care of the case when
+      # end_time is on the "wrong side" of start_time.
+      should_already_stop = (start_time == end_time)
+      initial_args = (should_already_stop, start_time, coord_grid, values_grid,
+                      start_step_count, record_state, history)
+      return tf.while_loop(
+          loop_cond,
+          loop_body,
+          initial_args,
+          swap_memory=swap_memory,
+          maximum_iterations=est_max_steps)[1:]
+
+    if adjoint_params is None:
+      (final_time, final_coords, final_values,
+       steps_performed, record_state, _) = run_loop(values_grid, ())
+    else:
+      (final_values, final_coords, final_time,
+       steps_performed) = _solve_with_adjoint(step_fn, run_loop, values_grid,
+                                              coord_grid, adjoint_params,
+                                              start_step_count)
+    if not record_state:
+      return final_values, final_coords, final_time, steps_performed
+    # Restore the order in which the record times were supplied.
+    inverse_order = tf.math.invert_permutation(record_order)
+    recorded = [tf.gather(array.stack(), inverse_order)
+                for array in record_state[1:]]
+    if record_derivatives:
+      first_derivatives, second_derivatives = recorded[1:]
+    else:
+      first_derivatives, second_derivatives = None, None
+    recorded_values = RecordedValues(
+        times=record_times,
+        values=recorded[0],
+        first_derivatives=first_derivatives,
+        second_derivatives=second_derivatives)
+    return (final_values, final_coords, final_time, steps_performed,
+            recorded_values)
+
+
+def _solve_with_adjoint(step_fn, run_loop, values_grid, coord_grid,
+                        adjoint_params, start_step_count):
+  """Runs the time stepping loop with the discrete adjoint gradient.
+
+  The forward loop stores the values grid at the start of each time step
+  instead of all the intermediate tensors of the time marching scheme. The
+  gradient is computed by sweeping through the steps in reverse order and
+  recomputing the vector-Jacobian product of one step at a time.
+
+  Args:
+    step_fn: Callable performing one time step. Accepts the current time, the
+      next time, the coordinate grid, the values grid and the number of steps
+      performed and returns the next coordinate and values grids.
+    run_loop: Callable accepting the initial values grid and the history
+      accumulators and running the time stepping loop.
+    values_grid: Real `Tensor`. The initial values grid.
+    coord_grid: List of real `Tensor`s. The initial coordinate grid.
+    adjoint_params: List of real `Tensor`s with respect to which the gradients
+      are computed in addition to `values_grid`.
+    start_step_count: A scalar integer `Tensor`. Number of steps performed
+      before the solve.
+
+  Returns:
+    The final values grid, final coordinate grid, final time and number of
+    steps performed.
+  """
+  adjoint_params = [tf.convert_to_tensor(param, dtype=values_grid.dtype)
+                    for param in adjoint_params]
+  num_params = len(adjoint_params)
+  dtype = values_grid.dtype
+  # Stores the outputs which are not differentiated.
+  outputs = {}
+
+  @tf.custom_gradient
+  def solve(*args):
+    """Runs the forward loop and defines the adjoint sweep."""
+    values_grid = args[0]
+    history = (tf.TensorArray(dtype, size=0, dynamic_size=True,
+                              element_shape=[]),
+               tf.TensorArray(dtype, size=0, dynamic_size=True,
+                              element_shape=[]),
+               [tf.TensorArray(dtype, size=0, dynamic_size=True,
+                               element_shape=x.shape) for x in coord_grid],
+               tf.TensorArray(dtype, size=0, dynamic_size=True,
+                              element_shape=values_grid.shape))
+    (final_time, final_coords, final_values,
+     steps_performed, _, history) = run_loop(values_grid, history)
+    outputs['final_time'] = final_time
+    outputs['final_coords'] = final_coords
+    outputs['steps_performed'] = steps_performed
+    num_steps_taken = steps_performed - start_step_count
+    times = history[0].stack()
+    next_times = history[1].stack()
+    coords = [array.stack() for array in history[2]]
+    values = history[3].stack()
+
+    def gradient(d_values, variables=None):
+      """Propagates the adjoint backwards through the time steps."""
+      variables = list(variables or [])
+
+      def reverse_cond(i, adjoint, param_adjoints, variable_adjoints):
+        del adjoint, param_adjoints, variable_adjoints
+        return i > 0
+
+      def reverse_body(i, adjoint, param_adjoints, variable_adjoints):
+        index = i - 1
+        f_grid = values[index]
+        x_grid = [x[index] for x in coords]
+        with tf.GradientTape() as tape:
+          tape.watch(f_grid)
+          tape.watch(adjoint_params)
+          _, next_fs = step_fn(times[index], next_times[index], x_grid, f_grid,
+                               start_step_count + index)
+        grads = tape.gradient(
+            next_fs, [f_grid] + adjoint_params + variables,
+            output_gradients=adjoint,
+            unconnected_gradients=tf.UnconnectedGradients.ZERO)
+        param_adjoints = [
+            a + g for a, g in zip(param_adjoints, grads[1:num_params + 1])
+        ]
+        variable_adjoints = [
+            a + g for a, g in zip(variable_adjoints, grads[num_params + 1:])
+        ]
+        return index, grads[0], param_adjoints, variable_adjoints
+
+      initial_args = (num_steps_taken,
+                      d_values,
+                      [tf.zeros_like(param) for param in adjoint_params],
+                      [tf.zeros_like(v) for v in variables])
+      _, d_values_grid, d_params, d_variables = tf.while_loop(
+          reverse_cond, reverse_body, initial_args,
+          maximum_iterations=num_steps_taken)
+      d_args = [d_values_grid] + d_params
+      if variables:
+        return d_args, d_variables
+      return d_args
+
+    return final_values, gradient
+
+  final_values = solve(values_grid, *adjoint_params)
+  return (final_values, outputs['final_coords'], outputs['final_time'],
+          outputs['steps_performed'])
+
+
+def _values_grid_derivatives(coord_grid, values_grid):
+  """Computes first and second derivatives of the values along each axis.
+
+  Uses central finite differences on a (possibly non-uniform) grid in the
+  interior and one-sided differences at the boundaries.
+
+  Args:
+    coord_grid: List of `n` real `Tensor`s of shapes `B + [d_i]`. The
+      coordinate grid.
+    values_grid: Real `Tensor` of shape `B + [d_1, ..., d_n]`. The values grid.
+
+  Returns:
+    A tuple of two `Tensor`s of shape `[n] + B + [d_1, ..., d_n]` with the first
+    and the second derivatives along each of the axes.
+  """
+  n_dims = len(coord_grid)
+  first_derivatives = []
+  second_derivatives = []
+  for axis in range(n_dims):
+    num_trailing = n_dims - 1 - axis
+
+    def along_axis(tensor, begin, end, num_trailing=num_trailing):
+      return tensor[(Ellipsis, slice(begin, end)) +
+                    (slice(None),) * num_trailing]
+
+    # Reshape coordinates so that they broadcast with the values grid.
+    x = coord_grid[axis][(Ellipsis, slice(None)) + (None,) * num_trailing]
+    dx = along_axis(x, 1, None) - along_axis(x, None, -1)
+    dx_minus = along_axis(dx, None, -1)
+    dx_plus = along_axis(dx, 1, None)
+    f_minus = along_axis(values_grid, None, -2)
+    f_center = along_axis(values_grid, 1, -1)
+    f_plus = along_axis(values_grid, 2, None)
+    denominator = dx_minus * dx_plus * (dx_minus + dx_plus)
+    first_inner = (dx_minus**2 * f_plus - dx_plus**2 * f_minus +
+                   (dx_plus**2 - dx_minus**2) * f_center) / denominator
+    second_inner = 2 * (dx_minus * f_plus - (dx_minus + dx_plus) * f_center +
+                        dx_plus * f_minus) / denominator
+    first_lower = (along_axis(values_grid, 1, 2) -
+                   along_axis(values_grid, None, 1)) / along_axis(dx, None, 1)
+    first_upper = (along_axis(values_grid, -1, None) -
+                   along_axis(values_grid, -2, -1)) / along_axis(dx, -1, None)
+    first_derivatives.append(
+        tf.concat([first_lower, first_inner, first_upper], axis=axis - n_dims))
+    # The second derivative at the boundaries is extrapolated from the
+    # adjacent interior points.
+    second_derivatives.append(
+        tf.concat([along_axis(second_inner, None, 1), second_inner,
+                   along_axis(second_inner, -1, None)], axis=axis - n_dims))
+  return tf.stack(first_derivatives), tf.stack(second_derivatives)
 
 
 def _is_callable(var_or_fn):
@@ -766,4 +1158,4 @@ def _time_direction_backward_fn(t, dt, end_time):
   return t_next <= end_time, t_next
 
 
-__all__ = ['solve_backward', 'solve_forward']
+__all__ = ['solve_backward', 'solve_forward', 'RecordedValues']
@@ -18,6 +18,7 @@ import math
 from absl.testing import parameterized
 
 import numpy as np
+import scipy.stats
 import tensorflow.compat.v2 as tf
 
 import tf_quant_finance as tff
@@ -623,6 +624,236 @@ class ParabolicEquationStepperTest(tf.test.TestCase, parameterized.TestCase):
     call_price = 12.582092
     self.assertAllClose(call_price, value_grid[loc_1], rtol=1e-02, atol=1e-02)
 
+  def testRecordTimes(self):
+    """Tests recording the intermediate grids in the forward direction."""
+    grid = grids.uniform_grid(
+        minimums=[0], maximums=[1], sizes=[501], dtype=tf.float32)
+    xs = grid[0]
+
+    def second_order_coeff_fn(t, coord_grid):
+      del t, coord_grid
+      return [[-1]]
+
+    # Record times are not ordered and some of them are not multiples of the
+    # time step.
+    record_times = [0.1, 0.0375, 0.05, 0.0, 0.0375]
+    initial = _reference_pde_initial_cond(xs)
+    result = fd_solvers.solve_forward(
+        start_time=0,
+        end_time=0.1,
+        coord_grid=grid,
+        values_grid=initial,
+        time_step=0.001,
+        second_order_coeff_fn=second_order_coeff_fn,
+        record_times=record_times)
+    final_values, recorded = result[0], result[4]
+    with self.subTest('Times'):
+      self.assertAllClose(recorded.times, record_times)
+    with self.subTest('FinalValues'):
+      self.assertAllClose(recorded.values[0], final_values)
+    with self.subTest('InitialValues'):
+      self.assertAllClose(recorded.values[3], initial)
+    with self.subTest('IntermediateValues'):
+      for i in (1, 2, 4):
+        expected = _reference_pde_solution(xs, record_times[i])
+        self.assertAllClose(expected, recorded.values[i], atol=1e-3,
+                            rtol=1e-3)
+    with self.subTest('NoDerivatives'):
+      self.assertIsNone(recorded.first_derivatives)
+      self.assertIsNone(recorded.second_derivatives)
+
+  def testEmptyRecordTimes(self):
+    """Tests that empty record times do not change the solution."""
+    grid = grids.uniform_grid(
+        minimums=[0], maximums=[1], sizes=[501], dtype=tf.float64)
+
+    def second_order_coeff_fn(t, coord_grid):
+      del t, coord_grid
+      return [[-1]]
+
+    kwargs = dict(
+        start_time=0.1,
+        end_time=0,
+        coord_grid=grid,
+        values_grid=_reference_pde_initial_cond(grid[0]),
+        time_step=0.001,
+        second_order_coeff_fn=second_order_coeff_fn)
+    final_values, _, _, num_steps = fd_solvers.solve_backward(**kwargs)
+    result = fd_solvers.solve_backward(
+        record_times=tf.constant([], dtype=tf.float64), **kwargs)
+    with self.subTest('FinalValues'):
+      self.assertAllClose(result[0], final_values)
+    with self.subTest('NumSteps'):
+      self.assertAllEqual(result[3], num_steps)
+    with self.subTest('RecordedValues'):
+      self.assertAllEqual(self.evaluate(tf.shape(result[4].values)), [0, 501])
+
+  def testRecordTimesWithDerivatives(self):
+    """Tests recording values, deltas and gammas of a European call."""
+    dtype = np.float64
+    grid = grids.uniform_grid(
+        minimums=[0.0], maximums=[300.0], sizes=[601], dtype=dtype)
+    volatility = 0.3
+    rate = 0.02
+    strike = 100.0
+    expiry = 1.0
+
+    def second_order_coeff_fn(t, coord_grid):
+      del t
+      return [[volatility**2 * coord_grid[0]**2 / 2]]
+
+    def first_order_coeff_fn(t, coord_grid):
+      del t
+      return [rate * coord_grid[0]]
+
+    def zeroth_order_coeff_fn(t, coord_grid):
+      del t, coord_grid
+      return -rate
+
+    @dirichlet
+    def lower_boundary_fn(t, coord_grid):
+      del t, coord_grid
+      return 0
+
+    @dirichlet
+    def upper_boundary_fn(t, coord_grid):
+      return coord_grid[0][-1] - strike * tf.math.exp(-rate * (expiry - t))
+
+    record_times = np.array([0.5, 0.25, 0.0])
+    result = fd_solvers.solve_backward(
+        start_time=expiry,
+        end_time=0,
+        coord_grid=grid,
+        values_grid=tf.nn.relu(grid[0] - strike),
+        num_steps=100,
+        boundary_conditions=[(lower_boundary_fn, upper_boundary_fn)],
+        second_order_coeff_fn=second_order_coeff_fn,
+        first_order_coeff_fn=first_order_coeff_fn,
+        zeroth_order_coeff_fn=zeroth_order_coeff_fn,
+        record_times=record_times,
+        record_derivatives=True)
+    recorded = self.evaluate(result[4])
+    # Compare at spots 80, 100 and 120.
+    locs = [160, 200, 240]
+    spots = np.array([80.0, 100.0, 120.0])
+    for i, t in enumerate(record_times):
+      tau = expiry - t
+      d1 = ((np.log(spots / strike) + (rate + volatility**2 / 2) * tau) /
+            (volatility * np.sqrt(tau)))
+      expected_delta = scipy.stats.norm.cdf(d1)
+      expected_gamma = scipy.stats.norm.pdf(d1) / (
+          spots * volatility * np.sqrt(tau))
+      expected_price = tff.black_scholes.option_price(
+          volatilities=volatility, strikes=strike, expiries=tau,
+          discount_rates=rate, spots=spots, dtype=dtype)
+      with self.subTest('Price{}'.format(i)):
+        self.assertAllClose(recorded.values[i][locs], expected_price,
+                            rtol=1e-3, atol=1e-2)
+      with self.subTest('Delta{}'.format(i)):
+        self.assertAllClose(recorded.first_derivatives[i, 0][locs],
+                            expected_delta, rtol=1e-3, atol=1e-3)
+      with self.subTest('Gamma{}'.format(i)):
+        self.assertAllClose(recorded.second_derivatives[i, 0][locs],
+                            expected_gamma, rtol=1e-2, atol=1e-3)
+
+  @parameterized.named_parameters(
+      ('CrankNicolson', crank_nicolson_step()),
+      ('OscillationDamped', crank_nicolson_with_oscillation_damping_step()),
+      ('Implicit', implicit_step()))
+  def testAdjointGradients(self, one_step_fn):
+    """Tests the discrete adjoint gradients against the loop gradients."""
+    dtype = np.float64
+    grid = grids.uniform_grid(
+        minimums=[0.0], maximums=[300.0], sizes=[301], dtype=dtype)
+    volatility = tf.constant([0.3, 0.2], dtype=dtype)
+    rate = tf.constant(0.02, dtype=dtype)
+    strike = tf.constant([[90.0], [110.0]], dtype=dtype)
+
+    def second_order_coeff_fn(t, coord_grid):
+      del t
+      return [[tf.expand_dims(volatility**2, -1) * coord_grid[0]**2 / 2]]
+
+    def first_order_coeff_fn(t, coord_grid):
+      del t
+      return [rate * coord_grid[0]]
+
+    def zeroth_order_coeff_fn(t, coord_grid):
+      del t, coord_grid
+      return -rate
+
+    def values_transform_fn(t, coord_grid, values_grid):
+      # Early exercise of a put.
+      del t
+      return coord_grid, tf.math.maximum(values_grid, strike - coord_grid[0])
+
+    def price(adjoint_params):
+      with tf.GradientTape() as tape:
+        tape.watch([volatility, rate, strike])
+        final_values = tf.nn.relu(strike - grid[0])
+        tape.watch(final_values)
+        result = fd_solvers.solve_backward(
+            start_time=1.0,
+            end_time=0.0,
+            coord_grid=grid,
+            values_grid=final_values,
+            num_steps=20,
+            one_step_fn=one_step_fn,
+            values_transform_fn=values_transform_fn,
+            second_order_coeff_fn=second_order_coeff_fn,
+            first_order_coeff_fn=first_order_coeff_fn,
+            zeroth_order_coeff_fn=zeroth_order_coeff_fn,
+            adjoint_params=adjoint_params)
+        # Objective depending on the whole grid.
+        objective = tf.math.reduce_sum(
+            result[0][:, 80:120] * tf.constant([[1.0], [2.0]], dtype=dtype))
+      return result, tape.gradient(
+          objective, [final_values, volatility, rate, strike])
+
+    expected_result, expected_grads = price(None)
+    actual_result, actual_grads = price([volatility, rate, strike])
+    expected_result, expected_grads, actual_result, actual_grads = (
+        self.evaluate([expected_result, expected_grads,
+                       actual_result, actual_grads]))
+    with self.subTest('Values'):
+      self.assertAllClose(expected_result[0], actual_result[0])
+    with self.subTest('Time'):
+      self.assertAllClose(expected_result[2], actual_result[2])
+    with self.subTest('NumSteps'):
+      self.assertEqual(expected_result[3], actual_result[3])
+    for name, expected, actual in zip(
+        ['ValuesGrid', 'Volatility', 'Rate', 'Strike'],
+        expected_grads, actual_grads):
+      with self.subTest(name):
+        self.assertAllClose(expected, actual, rtol=1e-8, atol=1e-8)
+
+  def testAdjointGradientsWithVariables(self):
+    """Tests the discrete adjoint gradients with respect to variables."""
+    dtype = np.float64
+    grid = grids.uniform_grid(
+        minimums=[0.0], maximums=[1.0], sizes=[101], dtype=dtype)
+    diffusion = tf.Variable(1.0, dtype=dtype)
+    self.evaluate(diffusion.initializer)
+
+    def second_order_coeff_fn(t, coord_grid):
+      del t, coord_grid
+      return [[-diffusion]]
+
+    def solve(adjoint_params):
+      with tf.GradientTape() as tape:
+        values = fd_solvers.solve_forward(
+            start_time=0,
+            end_time=0.1,
+            coord_grid=grid,
+            values_grid=_reference_pde_initial_cond(grid[0]),
+            time_step=0.01,
+            second_order_coeff_fn=second_order_coeff_fn,
+            adjoint_params=adjoint_params)[0]
+        objective = tf.math.reduce_sum(values)
+      return tape.gradient(objective, diffusion)
+
+    expected, actual = self.evaluate([solve(None), solve([])])
+    self.assertAllClose(expected, actual, rtol=1e-8, atol=1e-8)
+
   def testHeatEquation_InForwardDirection(self):
     """Test solving heat equation with various time marching schemes.
 
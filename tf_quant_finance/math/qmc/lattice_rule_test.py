@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for lattice rules."""
 
+import numpy as np
 import tensorflow.compat.v2 as tf
 import tf_quant_finance as tff
 
@@ -227,6 +228,68 @@ class LatticeRuleTest(tf.test.TestCase):
       with self.subTest('DType'):
         self.assertEqual(actual.dtype, dtype)
 
+  def test_lattice_rule_generating_vectors(self):
+    dim = 5
+    weights = 1 / np.arange(1, dim + 1)**2
+
+    def omega(x):
+      return 2 * np.pi**2 * (x * x - x + 1 / 6)
+
+    for num_results in [31, 64, 1021, 1024]:
+      generating_vectors = self.evaluate(
+          qmc.lattice_rule_generating_vectors(dim, num_results))
+      indices = np.arange(num_results)
+      candidates = indices[np.gcd(indices, num_results) == 1]
+      products = np.ones([num_results])
+      for s in range(dim):
+        # Each component minimizes the worst-case error given the previous
+        # components.
+        errors = np.mean(
+            products * (1 + weights[s] * omega(
+                np.outer(candidates, indices) % num_results / num_results)),
+            axis=-1)
+        error = np.mean(products * (1 + weights[s] * omega(
+            generating_vectors[s] * indices % num_results / num_results)))
+        with self.subTest('Component'):
+          self.assertAllClose(error, np.min(errors), rtol=1e-10, atol=0)
+        products *= 1 + weights[s] * omega(
+            generating_vectors[s] * indices % num_results / num_results)
+
+  def test_lattice_rule_generating_vectors_integration(self):
+    dim = 8
+    num_results = 1024
+    weights = 0.5**np.arange(dim)
+
+    for dtype in [tf.int32, tf.int64]:
+      generating_vectors = qmc.lattice_rule_generating_vectors(
+          dim, num_results, weights=weights, dtype=dtype)
+      naive_vectors = tf.range(1, 2 * dim, 2, dtype=dtype)
+
+      def integration_error(vectors):
+        points = qmc.lattice_rule_sample(
+            vectors, dim, num_results, dtype=tf.float64)
+        # The integral of the kernel of the weighted Korobov space is 1.
+        integrand = tf.math.reduce_prod(
+            1 + weights * 2 * np.pi**2 * (points**2 - points + 1 / 6),
+            axis=-1)
+        return tf.math.abs(tf.math.reduce_mean(integrand) - 1)
+
+      error, naive_error = self.evaluate(
+          [integration_error(generating_vectors),
+           integration_error(naive_vectors)])
+
+      with self.subTest('Shape'):
+        self.assertEqual(generating_vectors.shape, (dim,))
+      with self.subTest('DType'):
+        self.assertEqual(generating_vectors.dtype, dtype)
+      with self.subTest('Error'):
+        self.assertLess(error, 1e-2)
+        self.assertLess(error, 0.1 * naive_error)
+
+  def test_lattice_rule_generating_vectors_invalid_num_results(self):
+    with self.assertRaises(ValueError):
+      qmc.lattice_rule_generating_vectors(2, 1000)
+
 
 if __name__ == '__main__':
   tf.test.main()
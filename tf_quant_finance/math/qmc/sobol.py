@@ -13,6 +13,9 @@
 # limitations under the License.
 """Support for Sobol sequence generation."""
 
+import functools
+
+import numpy as np
 import tensorflow.compat.v2 as tf
 
 from tf_quant_finance import types
@@ -23,6 +26,7 @@ from tf_quant_finance.math.random_ops import sobol
 __all__ = [
     'sobol_sample',
     'sobol_generating_matrices',
+    'SobolSampler',
 ]
 
 (_PRIMITIVE_POLYNOMIAL_COEFFICIENTS,
@@ -97,17 +101,29 @@ def sobol_sample(dim: types.IntTensor,
   with tf.name_scope(name or 'sobol_sample'):
     dtype = dtype or tf.float32
 
-    num_digits = tf.cast(
-        tf.math.ceil(utils.log2(tf.cast(num_results, dtype=tf.float32))),
-        tf.int32)
-
-    # shape: (dim, log_num_results)
-    generating_matrices = sobol_generating_matrices(
-        dim,
-        num_results,
-        num_digits,
-        validate_args=validate_args,
-        dtype=tf.int32)
+    static_dim = tf.get_static_value(dim)
+    static_num_results = tf.get_static_value(num_results)
+    if (static_dim is not None and static_num_results is not None and
+        not validate_args):
+      # The generating matrices only depend on `dim` and `num_digits`, reuse
+      # the cached values when these are known statically. The number of
+      # digits is computed exactly so that it matches the cached matrices.
+      num_digits = (int(static_num_results) - 1).bit_length()
+      # shape: (dim, log_num_results)
+      generating_matrices = tf.constant(
+          _cached_generating_matrices(int(static_dim), num_digits),
+          dtype=tf.int32)
+    else:
+      num_digits = tf.cast(
+          tf.math.ceil(utils.log2(tf.cast(num_results, dtype=tf.float32))),
+          tf.int32)
+      # shape: (dim, log_num_results)
+      generating_matrices = sobol_generating_matrices(
+          dim,
+          num_results,
+          num_digits,
+          validate_args=validate_args,
+          dtype=tf.int32)
 
     if scrambling_matrices is not None:
       # shape: (dim, log_num_results)
@@ -218,6 +234,255 @@ def sobol_generating_matrices(dim: types.IntTensor,
       return tf.concat((identity, matrices), axis=0)
 
 
+class SobolSampler:
+  """Streaming sampler of the Sobol sequence in Gray-code order.
+
+  Successive calls to `next_block` return consecutive blocks of `block_size`
+  points, so that arbitrarily long sequences can be sampled in fixed memory.
+  The points are generated in the Gray-code order of Antonov and Saleev: the
+  `n`-th point of the sampler is the point of `sobol_sample` with sequence
+  index `n ^ (n >> 1)`. Any aligned block of `2**k` points is therefore the
+  same set of points as in the natural order.
+
+  The first `2**k >= block_size` points are precomputed once. Since
+  `gray(h * 2**k + i) = gray(h * 2**k) ^ gray(i)` for `i < 2**k`, a block is
+  obtained from the precomputed points with a single bitwise xor per point
+  with at most two base points, whatever the starting position. Skipping ahead
+  is free, which allows splitting a sequence between several workers without
+  overlap by setting `skip` to the first position of each worker.
+
+  The generating matrices are cached for each `(dim, num_digits)` pair.
+
+  #### Examples
+
+  ```python
+  import tf_quant_finance as tff
+
+  # Example: Sampling 10 blocks of 1,000 2D points starting at the 2**20-th
+  # point (e.g., for the second worker of a job split in chunks of 2**20).
+
+  sampler = tff.math.qmc.SobolSampler(
+      dim=2, block_size=1000, skip=2**20, dtype=tf.float64)
+  for _ in range(10):
+    points = sampler.next_block()  # shape: (1000, 2)
+  sampler.position
+  # ==> 1058576
+  ```
+
+  #### References
+  [1]: I.A. Antonov, V.M. Saleev. An economic method of computing LP-tau
+    sequences. USSR Computational Mathematics and Mathematical Physics,
+    19(1), 1979.
+  """
+
+  def __init__(self,
+               dim: int,
+               block_size: int,
+               num_digits: int = 32,
+               skip: int = 0,
+               digital_shift: types.IntTensor = None,
+               scrambling_matrices: types.IntTensor = None,
+               apply_tent_transform: bool = False,
+               dtype: tf.DType = None,
+               name: str = None):
+    """Initializes the sampler.
+
+    Args:
+      dim: Positive Python integer. The event size of the sampled points.
+      block_size: Positive Python integer. The number of points returned by
+        each call to `next_block`.
+      num_digits: Positive Python integer smaller than 63. The base-2
+        precision of the sampled points. At most `2**num_digits` points can
+        be sampled.
+        Default value: 32.
+      skip: Non-negative Python integer. The position of the first point to
+        sample.
+        Default value: 0.
+      digital_shift: Optional positive scalar `Tensor` of integers with shape
+        `(dim)`. The digital shift to apply to all the sampled points via a
+        bitwise xor.
+        Default value: `None`.
+      scrambling_matrices: Optional positive scalar `Tensor` of integers with
+        shape `(dim, num_digits)`. The left matrix scramble to apply to the
+        generating matrices.
+        Default value: `None`.
+      apply_tent_transform: Python `bool` indicating whether to apply a tent
+        transform to the sampled points.
+        Default value: `False`.
+      dtype: Optional `dtype`. The `dtype` of the sampled points (either
+        `float32` or `float64`).
+        Default value: `None` which maps to `float32`.
+      name: Python `str` name prefixed to ops created by this class.
+        Default value: `None` which maps to `sobol_sampler`.
+
+    Raises:
+      ValueError: If `dim` or `block_size` are not positive, if `num_digits`
+        is not in `[1, 62]` or if `skip` is negative.
+    """
+    if dim < 1:
+      raise ValueError(f'dim must be positive, got {dim}')
+    if block_size < 1:
+      raise ValueError(f'block_size must be positive, got {block_size}')
+    if not 0 < num_digits < 63:
+      raise ValueError(f'num_digits must be in [1, 62], got {num_digits}')
+    if skip < 0:
+      raise ValueError(f'skip must be non-negative, got {skip}')
+    self._dim = dim
+    self._block_size = block_size
+    self._num_digits = num_digits
+    self._position = skip
+    self._apply_tent_transform = apply_tent_transform
+    self._dtype = dtype or tf.float32
+    self._name = name or 'sobol_sampler'
+    # The precomputed points cover aligned blocks of `2**log_table_size`.
+    self._log_table_size = min((block_size - 1).bit_length(), num_digits)
+    with tf.name_scope(self._name):
+      # shape: (dim, num_digits)
+      generating_matrices = tf.constant(
+          _cached_generating_matrices(dim, num_digits), dtype=tf.int64)
+      if scrambling_matrices is not None:
+        generating_matrices = digital_net.scramble_generating_matrices(
+            generating_matrices, scrambling_matrices, num_digits,
+            dtype=tf.int64)
+      self._generating_matrices = generating_matrices
+      if digital_shift is None:
+        self._digital_shift = None
+      else:
+        self._digital_shift = tf.cast(digital_shift, tf.int64,
+                                      name='digital_shift')
+      # shape: (2**log_table_size, dim)
+      self._table = _gray_code_points(
+          generating_matrices, np.arange(2**self._log_table_size),
+          self._log_table_size)
+
+  @property
+  def position(self) -> int:
+    """The position of the next point to sample."""
+    return self._position
+
+  @property
+  def generating_matrices(self) -> types.IntTensor:
+    """The (possibly scrambled) generating matrices of shape `(dim, digits)`."""
+    return self._generating_matrices
+
+  def skip_ahead(self, num_points: int):
+    """Advances the position of the sampler by `num_points` points."""
+    if num_points < 0:
+      raise ValueError(f'num_points must be non-negative, got {num_points}')
+    self._position += num_points
+
+  def next_block(self) -> types.RealTensor:
+    """Returns the next `block_size` points and advances the position.
+
+    Returns:
+      A `Tensor` of shape `(block_size, dim)`.
+
+    Raises:
+      ValueError: If the block exceeds the `2**num_digits` available points.
+    """
+    start = self._position
+    if start + self._block_size > 2**self._num_digits:
+      raise ValueError(
+          f'Cannot sample points beyond position 2**{self._num_digits}')
+    with tf.name_scope(self._name):
+      table_size = 2**self._log_table_size
+      block_index, offset = divmod(start, table_size)
+      # shape: (2, dim). The points at the two aligned positions which the
+      # block can span.
+      base_points = _gray_code_points(
+          self._generating_matrices,
+          np.array([block_index, block_index + 1]) * table_size,
+          self._num_digits)
+      offsets = offset + np.arange(self._block_size)
+      # shape: (block_size, dim)
+      binary_points = tf.bitwise.bitwise_xor(
+          tf.gather(self._table, offsets % table_size),
+          tf.gather(base_points, (offsets >= table_size).astype(np.int32)))
+      if self._digital_shift is not None:
+        binary_points = tf.bitwise.bitwise_xor(
+            binary_points, tf.expand_dims(self._digital_shift, 0))
+      points = tf.divide(
+          tf.cast(binary_points, self._dtype),
+          tf.constant(2.0**self._num_digits, dtype=self._dtype))
+      self._position += self._block_size
+      if self._apply_tent_transform:
+        return utils.tent_transform(points)
+      return points
+
+
+def _gray_code_points(generating_matrices: types.IntTensor,
+                      positions: np.ndarray,
+                      num_columns: int) -> types.IntTensor:
+  r"""Returns the binary points at the given positions in Gray-code order.
+
+  Args:
+    generating_matrices: Positive scalar `Tensor` of integers with shape
+      `(dim, num_digits)`.
+    positions: Non-negative numpy array of integers with shape
+      `(num_points,)`.
+    num_columns: Python integer. The number of columns of
+      `generating_matrices` to use.
+
+  Returns:
+    A scalar `Tensor` with shape `(num_points, dim)`.
+  """
+  # shape: (num_points, 1)
+  gray_codes = tf.constant(
+      np.expand_dims(positions ^ (positions >> 1), axis=1),
+      dtype=generating_matrices.dtype)
+  binary_points = tf.zeros(
+      (positions.shape[0], utils.get_shape(generating_matrices)[0]),
+      dtype=generating_matrices.dtype)
+  for column in range(num_columns):
+    binary_points = tf.bitwise.bitwise_xor(
+        binary_points,
+        utils.filter_tensor(
+            # shape: (1, dim)
+            tf.expand_dims(generating_matrices[:, column], axis=0),
+            gray_codes,
+            tf.constant(column, dtype=generating_matrices.dtype)))
+  return binary_points
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_generating_matrices(dim: int, num_digits: int) -> np.ndarray:
+  """Returns the Sobol generating matrices as a read-only numpy array.
+
+  This is the numpy counterpart of `sobol_generating_matrices` with
+  `num_results = 2**num_digits`.
+
+  Args:
+    dim: Positive Python integer. The event size of the points.
+    num_digits: Positive Python integer. The number of columns and the base-2
+      precision of the generating matrices.
+
+  Returns:
+    A numpy array of `int64` with shape `(dim, num_digits)`.
+  """
+  shifts = num_digits - 1 - np.arange(num_digits)
+  matrices = np.zeros((dim, num_digits), dtype=np.int64)
+  matrices[0] = np.left_shift(1, shifts)
+  for i in range(1, dim):
+    polynomial = int(_PRIMITIVE_POLYNOMIAL_COEFFICIENTS[i - 1])
+    degree = polynomial.bit_length() - 1
+    # See `_sobol_generating_matrices` for the recurrence.
+    columns = []
+    for column in range(num_digits):
+      if column < degree:
+        value = int(_INITIAL_DIRECTION_NUMBERS[column, i - 1]) << int(
+            shifts[column])
+      else:
+        value = columns[column - degree]
+        value ^= value >> degree
+        for k in range(1, degree):
+          if (polynomial >> (degree - k)) & 1:
+            value ^= columns[column - k]
+      columns.append(value)
+    matrices[i] = columns
+  matrices.flags.writeable = False
+  return matrices
+
+
 def _identity_matrix(num_columns: types.IntTensor,
                      num_digits: types.IntTensor,
                      dtype: tf.DType = None) -> types.IntTensor:
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for Sobol sequence generation."""
 
+import numpy as np
 import tensorflow.compat.v2 as tf
 import tensorflow_probability as tfp
 import tf_quant_finance as tff
@@ -121,6 +122,22 @@ class SobolTest(tf.test.TestCase):
         self.evaluate(actual), self.evaluate(expected), rtol=1e-6)
     self.assertEqual(actual.dtype, expected.dtype)
 
+  def test_sobol_sample_num_results_above_power_of_two(self):
+    # `log2(num_results)` is rounded to an integer in float32.
+    num_results = 2**24 + 1
+    indices = [0, 1, 2, 3, 5]
+
+    expected = qmc.sobol_sample(
+        2, num_results, sequence_indices=indices, validate_args=True)
+    actual = qmc.sobol_sample(2, num_results, sequence_indices=indices)
+
+    self.assertAllClose(
+        self.evaluate(actual), self.evaluate(expected), rtol=1e-6)
+    self.assertAllClose(
+        self.evaluate(actual),
+        [[0.0, 0.0], [0.5, 0.5], [0.25, 0.75], [0.75, 0.25], [0.625, 0.125]],
+        rtol=1e-6)
+
   def test_sobol_sample_with_tent_transform(self):
 
     expected = tf.constant([[0.00, 0.00, 0.00, 0.00, 0.00, 0.00],
@@ -192,6 +209,74 @@ class SobolTest(tf.test.TestCase):
       self.assertAllEqual(self.evaluate(actual), self.evaluate(expected))
       self.assertEqual(actual.dtype, dtype)
 
+  def test_sobol_sampler_matches_sobol_sample(self):
+    dim = 7
+    num_digits = 10
+    num_results = 2**num_digits
+    block_size = 100
+    skip = 37
+    sampler = qmc.SobolSampler(
+        dim, block_size, num_digits=num_digits, skip=skip, dtype=tf.float64)
+    blocks = [sampler.next_block() for _ in range(9)]
+    positions = np.arange(skip, skip + 9 * block_size)
+    expected = qmc.sobol_sample(
+        dim,
+        num_results,
+        # The sampler returns the points in Gray-code order.
+        sequence_indices=tf.constant(positions ^ (positions >> 1)),
+        dtype=tf.float64)
+    with self.subTest('Values'):
+      self.assertAllEqual(
+          self.evaluate(tf.concat(blocks, axis=0)), self.evaluate(expected))
+    with self.subTest('Position'):
+      self.assertEqual(sampler.position, skip + 9 * block_size)
+
+  def test_sobol_sampler_skip_ahead_splits_sequence(self):
+    dim = 3
+    block_size = 64
+    # A single sampler and two workers sampling consecutive chunks.
+    sampler = qmc.SobolSampler(dim, block_size, dtype=tf.float64)
+    first_worker = qmc.SobolSampler(dim, block_size, dtype=tf.float64)
+    second_worker = qmc.SobolSampler(dim, block_size, dtype=tf.float64)
+    second_worker.skip_ahead(2 * block_size)
+    expected = tf.concat([sampler.next_block() for _ in range(4)], axis=0)
+    actual = tf.concat([first_worker.next_block(), first_worker.next_block(),
+                        second_worker.next_block(), second_worker.next_block()],
+                       axis=0)
+    self.assertAllEqual(self.evaluate(actual), self.evaluate(expected))
+
+  def test_sobol_sampler_with_digital_shift_and_scrambling(self):
+    dim = 4
+    num_digits = 8
+    block_size = 32
+    seed = (2, 3)
+    scrambling_matrices = qmc.random_scrambling_matrices(
+        dim, num_digits, seed=seed)
+    digital_shift = qmc.random_digital_shift(dim, num_digits, seed=seed)
+    sampler = qmc.SobolSampler(
+        dim,
+        block_size,
+        num_digits=num_digits,
+        digital_shift=digital_shift,
+        scrambling_matrices=scrambling_matrices)
+    actual = tf.concat([sampler.next_block() for _ in range(2)], axis=0)
+    positions = np.arange(2 * block_size)
+    expected = qmc.sobol_sample(
+        dim,
+        2**num_digits,
+        sequence_indices=tf.constant(positions ^ (positions >> 1)),
+        digital_shift=digital_shift,
+        scrambling_matrices=scrambling_matrices)
+    self.assertAllClose(
+        self.evaluate(actual), self.evaluate(expected), rtol=1e-6)
+
+  def test_sobol_sampler_raises_beyond_capacity(self):
+    sampler = qmc.SobolSampler(2, 4, num_digits=3)
+    sampler.next_block()
+    sampler.next_block()
+    with self.assertRaises(ValueError):
+      sampler.next_block()
+
 
 if __name__ == '__main__':
   tf.test.main()
@@ -17,6 +17,7 @@
 from tf_quant_finance.math.random_ops import halton
 from tf_quant_finance.math.random_ops import sobol
 from tf_quant_finance.math.random_ops.multivariate_normal import multivariate_normal as mv_normal_sample
+from tf_quant_finance.math.random_ops.multivariate_normal import MultivariateNormalSampler
 from tf_quant_finance.math.random_ops.multivariate_normal import RandomType
 from tf_quant_finance.math.random_ops.stateless import stateless_random_shuffle
 from tf_quant_finance.math.random_ops.uniform import uniform
@@ -26,6 +27,7 @@ _allowed_symbols = [
     'halton',
     'sobol',
     'mv_normal_sample',
+    'MultivariateNormalSampler',
     'RandomType',
     'stateless_random_shuffle',
     'uniform',
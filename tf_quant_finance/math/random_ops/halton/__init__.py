@@ -15,6 +15,7 @@
 
 
 from tf_quant_finance.math.random_ops.halton.halton_impl import HaltonParams
+from tf_quant_finance.math.random_ops.halton.halton_impl import HaltonSampler
 from tf_quant_finance.math.random_ops.halton.halton_impl import sample
 
 
@@ -22,6 +23,7 @@ from tensorflow.python.util.all_util import remove_undocumented  # pylint: disab
 
 _allowed_symbols = [
     'sample',
+    'HaltonSampler',
 ]
 
 remove_undocumented(__name__, _allowed_symbols)
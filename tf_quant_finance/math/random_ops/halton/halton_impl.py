@@ -14,16 +14,18 @@
 
 """Quasi Monte Carlo support: Halton sequence."""
 
+import functools
+
 import numpy as np
 import tensorflow.compat.v2 as tf
 
 from tf_quant_finance import types
 from tf_quant_finance import utils
-from tf_quant_finance.math.random_ops import stateless
 
 
 __all__ = [
     'sample',
+    'HaltonSampler',
 ]
 
 # The maximum dimension we support. This is limited by the number of primes
@@ -254,27 +256,21 @@ def sample(dim: int,
           _MAX_SIZES_BY_AXES[dtype],
           dtype=dtype,
           name='max_sizes_by_axes')[:dim]
-      max_size = tf.reduce_max(max_sizes_by_axes)
-
-      # The powers of the radixes that we will need. Note that there is a bit
-      # of an excess here. Suppose we need the place value coefficients of 7
-      # in base 2 and 3. For 2, we will have 3 digits but we only need 2 digits
-      # for base 3. However, we can only create rectangular tensors so we
-      # store both expansions in a [2, 3] tensor. This leads to the problem that
-      # we might end up attempting to raise large numbers to large powers. For
-      # example, base 2 expansion of 1024 has 10 digits. If we were in 10
-      # dimensions, then the 10th prime (29) we will end up computing 29^10 even
-      # though we don't need it. We avoid this by setting the exponents for each
-      # axes to 0 beyond the maximum value needed for that dimension.
-      exponents_by_axes = tf.tile([tf.range(max_size, dtype=dtype)], [dim, 1])
-
-      # The mask is true for those coefficients that are irrelevant.
-      weight_mask = exponents_by_axes >= max_sizes_by_axes
-      capped_exponents = tf.where(weight_mask, tf.zeros_like(exponents_by_axes),
-                                  exponents_by_axes)
-      # Round to nearest integer to correct small errors when applying floating-
-      # point pow(radixes, capped_exponents).
-      weights = tf.compat.v1.round(radixes**capped_exponents)
+
+      # The place values `(1, b, b^2, ...)` of each base and the scales
+      # `(1 / b, 1 / b^2, ...)` of the digits in the radical inverse. See
+      # `_radical_inverse_tables` for details.
+      # When `dim` is not known statically, the tables of all the supported
+      # bases are sliced.
+      static_dim = tf.get_static_value(dim)
+      num_bases = (_MAX_DIMENSION if static_dim is None
+                   else min(max(int(static_dim), 1), _MAX_DIMENSION))
+      weights, scales = _radical_inverse_tables(
+          num_bases, tf.as_dtype(dtype).as_numpy_dtype)
+      weights = tf.constant(weights, dtype=dtype, name='weights')
+      scales = tf.constant(scales, dtype=dtype, name='scales')
+      if static_dim is None:
+        weights, scales = weights[:dim], scales[:dim]
       # The following computes the base b expansion of the indices. Suppose,
       # x = a0 + a1*b + a2*b^2 + ... Then, performing a floor div of x with
       # the vector (1, b, b^2, b^3, ...) will produce
@@ -282,24 +278,29 @@ def sample(dim: int,
       # about. Noting that all a_i < b by definition of place value expansion,
       # we see that taking the elements mod b of the above vector produces the
       # place value expansion coefficients.
-      coeffs = tf.compat.v1.floor_div(indices, weights)
-      coeffs *= 1. - tf.cast(weight_mask, dtype)
-      coeffs %= radixes
+      #
+      # The digits of the indices are zero beyond the size of their base 2
+      # expansion (one digit is added to guard against rounding), so only these
+      # leading digits need to be computed for each index.
+      num_digits = tf.math.minimum(
+          tf.cast(tf.math.floor(
+              tf.math.log(tf.reduce_max(indices)) / np.log(2.0)), tf.int32) + 2,
+          tf.shape(weights)[-1])
+      coeffs = tf.compat.v1.floor_div(
+          indices, weights[:, :num_digits]) % radixes
       if not randomized:
-        coeffs /= radixes
-        return tf.reduce_sum(input_tensor=coeffs / weights, axis=-1), None
+        return tf.reduce_sum(
+            input_tensor=coeffs * scales[:, :num_digits], axis=-1), None
 
       if randomization_params is None:
         perms, zero_correction = None, None
       else:
         perms, zero_correction = randomization_params
-      coeffs, perms = _randomize(coeffs, radixes, seed, perms=perms)
-      # Remove the contribution from randomizing the trailing zero for the
-      # axes where max_size_by_axes < max_size. This will be accounted
-      # for separately below (using zero_correction).
-      coeffs *= 1. - tf.cast(weight_mask, dtype)
-      coeffs /= radixes
-      base_values = tf.reduce_sum(input_tensor=coeffs / weights, axis=-1)
+      # The zero scales remove the contribution from randomizing the trailing
+      # zero for the axes where max_size_by_axes < max_size. This will be
+      # accounted for separately below (using zero_correction).
+      base_values, perms = _randomize(coeffs, radixes, scales, seed,
+                                      perms=perms)
 
       # The randomization used in Owen (2017) does not leave 0 invariant. While
       # we have accounted for the randomization of the first `max_size_by_axes`
@@ -320,9 +321,142 @@ def sample(dim: int,
       return base_values + zero_correction, HaltonParams(perms, zero_correction)
 
 
-def _randomize(coeffs, radixes, seed, perms=None):
-  """Applies the Owen (2017) randomization to the coefficients."""
+class HaltonSampler:
+  """Streaming sampler of the Halton sequence.
+
+  Successive calls to `next_block` return consecutive blocks of `block_size`
+  elements of the (optionally randomized) Halton sequence, so that long
+  sequences can be sampled in fixed memory. The randomization parameters are
+  drawn once and shared by all the blocks, so that the concatenated blocks are
+  the elements of a single randomized sequence. Distinct workers can sample
+  non-overlapping parts of the same sequence by sharing the
+  `randomization_params` (or the `seed`) and using different `skip` values.
+
+  #### Examples
+
+  ```python
+  import tf_quant_finance as tff
+
+  # Sample the first 10,000 elements of the randomized 100-dimensional
+  # sequence in blocks of 1,000 elements.
+  sampler = tff.math.random.halton.HaltonSampler(
+      dim=100, block_size=1000, seed=127, dtype=tf.float64)
+  for _ in range(10):
+    points = sampler.next_block()  # shape: [1000, 100]
+  ```
+  """
+
+  def __init__(self,
+               dim: int,
+               block_size: int,
+               skip: int = 0,
+               randomized: bool = True,
+               randomization_params: HaltonParams = None,
+               seed: int = None,
+               dtype: tf.DType = None,
+               name: str = None):
+    """Initializes the sampler.
+
+    Args:
+      dim: Positive Python `int` representing each sample's `event_size.` Must
+        not be greater than 1000.
+      block_size: Positive Python `int`. The number of elements returned by
+        each call to `next_block`.
+      skip: Non-negative Python `int`. The index of the first element to
+        sample.
+        Default value: 0.
+      randomized: Python `bool` indicating whether to produce a randomized
+        Halton sequence. See `sample` for details.
+        Default value: `True`.
+      randomization_params: Optional instance of `HaltonParams`. If not
+        supplied and `randomized` is True, the parameters are drawn with the
+        first block.
+        Default value: `None`.
+      seed: Optional Python integer to seed the random number generator. See
+        `sample` for details.
+        Default value: `None`.
+      dtype: Optional `dtype`. The dtype of the output `Tensor` (either
+        `float32` or `float64`).
+        Default value: `None` which maps to the `float32`.
+      name: Python `str` name prefixed to ops created by this class.
+        Default value: `None` which maps to `halton_sampler`.
+
+    Raises:
+      ValueError: If `dim` is not in `[1, 1000]`, if `block_size` is not
+        positive or if `skip` is negative.
+    """
+    if not 0 < dim <= _MAX_DIMENSION:
+      raise ValueError(
+          f'dim must be in [1, {_MAX_DIMENSION}], got {dim}')
+    if block_size < 1:
+      raise ValueError(f'block_size must be positive, got {block_size}')
+    if skip < 0:
+      raise ValueError(f'skip must be non-negative, got {skip}')
+    self._dim = dim
+    self._block_size = block_size
+    self._position = skip
+    self._randomized = randomized
+    self._randomization_params = randomization_params
+    self._seed = seed
+    self._dtype = dtype or tf.float32
+    self._name = name or 'halton_sampler'
+
+  @property
+  def position(self) -> int:
+    """The index of the next element to sample."""
+    return self._position
+
+  @property
+  def randomization_params(self) -> HaltonParams:
+    """The randomization parameters shared by the blocks."""
+    return self._randomization_params
+
+  def skip_ahead(self, num_results: int):
+    """Advances the position of the sampler by `num_results` elements."""
+    if num_results < 0:
+      raise ValueError(f'num_results must be non-negative, got {num_results}')
+    self._position += num_results
+
+  def next_block(self) -> types.RealTensor:
+    """Returns the next `block_size` elements and advances the position.
+
+    Returns:
+      A `Tensor` of shape `[block_size, dim]`.
+    """
+    with tf.name_scope(self._name):
+      points, params = sample(
+          self._dim,
+          sequence_indices=tf.range(self._position,
+                                    self._position + self._block_size),
+          randomized=self._randomized,
+          randomization_params=self._randomization_params,
+          seed=self._seed,
+          dtype=self._dtype)
+    if self._randomized:
+      self._randomization_params = params
+    self._position += self._block_size
+    return points
+
+
+def _randomize(coeffs, radixes, scales, seed, perms=None):
+  """Applies the Owen (2017) randomization to the coefficients.
+
+  Args:
+    coeffs: A `Tensor` of shape `[n, dim, num_digits]`. The leading digits of
+      the indices in each base. The remaining digits are zero.
+    radixes: A `Tensor` of shape `[dim, 1]`. The bases.
+    scales: A `Tensor` of shape `[dim, max_size]`. The scales of the digits in
+      the radical inverse.
+    seed: (Optional) Python integer to seed the random number generator.
+    perms: (Optional) The flattened permutations as returned by
+      `_get_permutations`.
+
+  Returns:
+    A tuple of the randomized radical inverses of shape `[n, dim]` and of the
+    flattened permutations.
+  """
   given_dtype = coeffs.dtype
+  num_digits = tf.shape(coeffs)[-1]
   coeffs = tf.cast(coeffs, dtype=tf.int32)
   num_coeffs = _NUM_COEFFS_BY_DTYPE[given_dtype]
   radixes = tf.reshape(tf.cast(radixes, dtype=tf.int32), shape=[-1])
@@ -331,9 +465,18 @@ def _randomize(coeffs, radixes, seed, perms=None):
     perms = tf.reshape(perms, shape=[-1])
   radix_sum = tf.reduce_sum(input_tensor=radixes)
   radix_offsets = tf.reshape(tf.cumsum(radixes, exclusive=True), shape=[-1, 1])
-  offsets = radix_offsets + tf.range(num_coeffs) * radix_sum
-  permuted_coeffs = tf.gather(perms, coeffs + offsets)
-  return tf.cast(permuted_coeffs, dtype=given_dtype), perms
+  # Shape [dim, max_size].
+  offsets = radix_offsets + tf.range(tf.shape(scales)[-1]) * radix_sum
+  permuted_coeffs = tf.gather(perms, coeffs + offsets[:, :num_digits])
+  leading_values = tf.reduce_sum(
+      tf.cast(permuted_coeffs, dtype=given_dtype) * scales[:, :num_digits],
+      axis=-1)
+  # The trailing digits are zero for all the indices so that their
+  # contribution is the same for all the samples.
+  trailing_values = tf.reduce_sum(
+      tf.cast(tf.gather(perms, offsets[:, num_digits:]), dtype=given_dtype)
+      * scales[:, num_digits:], axis=-1)
+  return leading_values + trailing_values, perms
 
 
 def _get_permutations(num_results, dims, seed):
@@ -347,6 +490,9 @@ def _get_permutations(num_results, dims, seed):
   [1, 0, 2, 0, 1]. The first two elements are a permutation over 2 elements
   while the next three are a permutation over 3 elements.
 
+  All the permutations are drawn at once by sorting uniform keys offset by the
+  index of their group, so that each group is shuffled in place.
+
   Args:
     num_results: A positive scalar `Tensor` of integer type. The number of
       draws from the discrete uniform distribution over the permutation groups.
@@ -358,21 +504,20 @@ def _get_permutations(num_results, dims, seed):
     permutations: A `Tensor` of shape `[num_results, sum(dims)]` and the same
     dtype as `dims`.
   """
-  sample_range = tf.range(num_results)
-
-  def generate_one(d):
-
-    def fn(i):
-      if seed is None:
-        return tf.random.shuffle(tf.range(d))
-      else:
-        return stateless.stateless_random_shuffle(tf.range(d),
-                                                  seed=(seed + i, d))
-
-    return tf.map_fn(
-        fn, sample_range, parallel_iterations=1 if seed is not None else 10)
-
-  return tf.concat([generate_one(d) for d in tf.unstack(dims)], axis=-1)
+  # The group index and the position of the first element of the group for
+  # each element of the packed permutations. Shape [sum(dims)].
+  group_indices = tf.repeat(tf.range(tf.size(dims), dtype=dims.dtype), dims)
+  group_offsets = tf.repeat(tf.cumsum(dims, exclusive=True), dims)
+  shape = tf.stack([num_results, tf.reduce_sum(dims)])
+  if seed is None:
+    uniforms = tf.random.uniform(shape, dtype=tf.float64)
+  else:
+    uniforms = tf.random.stateless_uniform(
+        shape, seed=(seed, num_results), dtype=tf.float64)
+  # The keys of the `i`-th group lie in `[i, i + 1)` so that sorting them
+  # shuffles each group without mixing the groups.
+  keys = tf.cast(group_indices, tf.float64) + uniforms
+  return tf.argsort(keys, axis=-1, stable=True) - group_offsets
 
 
 def _get_indices(num_results, sequence_indices, dtype, name=None):
@@ -416,6 +561,39 @@ def _get_indices(num_results, sequence_indices, dtype, name=None):
     return tf.reshape(indices, [-1, 1, 1])
 
 
+@functools.lru_cache(maxsize=None)
+def _radical_inverse_tables(dim, dtype):
+  """Returns the place values and radical inverse scales of the first bases.
+
+  The digit `a_j` of the base `b` expansion of an index contributes
+  `a_j / b^(j + 1)` to the radical inverse. The digits beyond the maximum
+  expansion size of a base for the given dtype are irrelevant: their place value
+  is set to 1 (which avoids raising large bases to large powers) and their scale
+  to 0.
+
+  Args:
+    dim: Positive Python `int`. The number of bases.
+    dtype: Numpy dtype. One of `float32` or `float64`.
+
+  Returns:
+    A tuple of read-only numpy arrays of shape `[dim, max_size]` where
+    `max_size` is the maximum expansion size of the bases: the place values and
+    the scales of the digits.
+  """
+  radixes = _PRIMES[:dim].astype(np.float64).reshape([dim, 1])
+  max_sizes_by_axes = _MAX_SIZES_BY_AXES[dtype][:dim]
+  exponents = np.arange(np.max(max_sizes_by_axes), dtype=np.float64)
+  is_relevant = exponents < max_sizes_by_axes
+  weights = np.where(is_relevant,
+                     np.round(radixes**np.where(is_relevant, exponents, 0)), 1)
+  scales = np.where(is_relevant, 1 / (radixes * weights), 0)
+  weights = weights.astype(dtype)
+  scales = scales.astype(dtype)
+  weights.flags.writeable = False
+  scales.flags.writeable = False
+  return weights, scales
+
+
 def _base_expansion_size(num, bases):
   """Computes the number of terms in the place value expansion.
 
@@ -302,6 +302,43 @@ class HaltonSequenceTest(tf.test.TestCase):
         atol=0.,
         rtol=1e-6)
 
+  def test_sampler_blocks_same_as_one_big_batch(self):
+    dim = 50
+    block_size = 30
+    seed = 1925
+    sampler = random.halton.HaltonSampler(
+        dim, block_size, skip=7, seed=seed, dtype=tf.float64)
+    blocks = [sampler.next_block() for _ in range(3)]
+    expected, _ = random.halton.sample(
+        dim, sequence_indices=tf.range(7, 7 + 3 * block_size),
+        randomization_params=sampler.randomization_params, dtype=tf.float64)
+    with self.subTest('Values'):
+      self.assertAllClose(
+          self.evaluate(tf.concat(blocks, axis=0)), self.evaluate(expected),
+          atol=0., rtol=1e-12)
+    with self.subTest('Position'):
+      self.assertEqual(sampler.position, 7 + 3 * block_size)
+
+  def test_sampler_skip_ahead_not_randomized(self):
+    dim = 3
+    sampler = random.halton.HaltonSampler(dim, 5, randomized=False)
+    sampler.skip_ahead(5)
+    expected, _ = random.halton.sample(dim, num_results=10, randomized=False)
+    self.assertAllClose(
+        self.evaluate(sampler.next_block()), self.evaluate(expected)[5:],
+        rtol=1e-6)
+
+  def test_randomized_high_dimension_is_stratified(self):
+    # With randomization, each coordinate of the first `b` elements in base `b`
+    # takes exactly one value in each interval `[k / b, (k + 1) / b)`.
+    dim = 100
+    base = 541  # The 100-th prime.
+    sample, _ = random.halton.sample(
+        dim, num_results=base, seed=11,
+        dtype=tf.float64)
+    strata = np.floor(self.evaluate(sample)[:, -1] * base)
+    self.assertAllEqual(np.sort(strata), np.arange(base))
+
 
 if __name__ == "__main__":
   tf.test.main()
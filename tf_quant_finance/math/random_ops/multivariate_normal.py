@@ -245,6 +245,231 @@ def multivariate_normal(sample_shape,
           'supported. Supplied: {}'. format(random_type))
 
 
+class MultivariateNormalSampler:
+  """Streaming sampler of a multivariate Normal distribution.
+
+  Unlike `multivariate_normal`, the factorization of the covariance matrix is
+  computed once when the sampler is created and reused by all the subsequent
+  draws. The draws are produced on demand with `sample` or in fixed-size chunks
+  with `next_chunk`, so that large numbers of draws can be consumed in fixed
+  memory. Successive draws are the continuation of the same stream: the
+  low-discrepancy sequences are advanced past the points already used, the
+  seed of the stateless generators is folded with the index of the draw and
+  the randomization of the Halton sequence is shared.
+
+  For large dimensions, the covariance matrix can be approximated by its
+  `num_factors` leading principal components. The draws are then generated in
+  dimension `num_factors` only, which reduces both the number of normal draws
+  and the cost of applying the factor.
+
+  #### Example
+
+  ```python
+  covariance = [[1.0, 0.5, 0.2], [0.5, 1.0, 0.4], [0.2, 0.4, 1.0]]
+  sampler = tff.math.random.MultivariateNormalSampler(
+      covariance_matrix=covariance,
+      random_type=tff.math.random.RandomType.SOBOL,
+      chunk_size=1000,
+      dtype=tf.float64)
+  # 100 chunks of 1000 draws from the same Sobol sequence, the Cholesky
+  # factor is computed once.
+  for _ in range(100):
+    draws = sampler.next_chunk()  # Shape [1000, 3]
+  ```
+  """
+
+  def __init__(self,
+               mean=None,
+               covariance_matrix=None,
+               scale_matrix=None,
+               random_type=None,
+               chunk_size=None,
+               num_factors=None,
+               skip=0,
+               seed=None,
+               randomization_params=None,
+               validate_args=False,
+               dtype=None,
+               name=None):
+    """Initializes the sampler and computes the factorization.
+
+    Args:
+      mean: Real `Tensor` of rank at least 1 or None. The shape of the `Tensor`
+        is interpreted as `batch_shape + [k]` where `k` is the dimension of
+        domain. The mean value(s) of the distribution(s) to draw from.
+        Default value: None which is mapped to a zero mean vector.
+      covariance_matrix: Real `Tensor` of rank at least 2 or None. Symmetric
+        positive definite `Tensor` of  same `dtype` as `mean` of shape
+        `batch_shape + [k, k]`.
+        Default value: None which is mapped to the identity covariance.
+      scale_matrix: Real `Tensor` of rank at least 2 or None. If supplied, it
+        should be positive definite `Tensor` of same `dtype` as `mean`. The
+        covariance matrix is related to the scale matrix by `covariance =
+        scale_matrix * Transpose(scale_matrix)`.
+        Default value: None which corresponds to an identity covariance matrix.
+      random_type: Enum value of `RandomType`. The type of draw to generate.
+        Default value: None which is mapped to `RandomType.PSEUDO`.
+      chunk_size: Optional positive Python `int`. The number of draws returned
+        by `next_chunk`. Should be even for the antithetic random types.
+        Default value: None which means that only `sample` can be used.
+      num_factors: Optional positive Python `int`. If supplied, the covariance
+        matrix is approximated by its `num_factors` principal components with
+        the largest eigenvalues.
+        Default value: None which means that the Cholesky factor of the
+        covariance matrix (or the `scale_matrix`) is used.
+      skip: Python `int`. The number of initial points of the Sobol or Halton
+        sequence to skip. Used only when `random_type` is 'SOBOL', 'HALTON',
+        or 'HALTON_RANDOMIZED', otherwise ignored.
+        Default value: 0.
+      seed: Seed for the random number generator. See `multivariate_normal`
+        for details.
+        Default value: `None` which means no seed is set.
+      randomization_params: An optional instance of
+        `tff.math.random.HaltonParams` used when `random_type` is
+        'HALTON_RANDOMIZED'.
+        Default value: `None` which means that the parameters are computed
+        from the `seed` once and shared by all the draws.
+      validate_args: Python `bool`. When `True`, distribution parameters are
+        checked for validity despite possibly degrading runtime performance.
+        Default value: False.
+      dtype: Optional `dtype`. The dtype of the input and output tensors.
+        Default value: None which maps to the default dtype inferred by
+        TensorFlow.
+      name: Python `str` name prefixed to Ops created by this class.
+        Default value: None which is mapped to the default name
+          'multivariate_normal_sampler'.
+
+    The batch shape and the number of factors should be known statically
+    for the low-discrepancy random types.
+
+    Raises:
+      ValueError:
+        (a) If all of `mean`, `covariance_matrix` and `scale_matrix` are None.
+        (b) If both `covariance_matrix` and `scale_matrix` are specified.
+    """
+    if mean is None and covariance_matrix is None and scale_matrix is None:
+      raise ValueError('At least one of mean, covariance_matrix or scale_matrix'
+                       ' must be specified.')
+    if covariance_matrix is not None and scale_matrix is not None:
+      raise ValueError('Only one of covariance matrix or scale matrix'
+                       ' must be specified')
+    self._random_type = (RandomType.PSEUDO if random_type is None
+                         else random_type)
+    self._chunk_size = chunk_size
+    self._position = skip
+    self._num_draws = 0
+    self._seed = seed
+    self._validate_args = validate_args
+    self._name = name or 'multivariate_normal_sampler'
+    with tf.name_scope(self._name):
+      if mean is not None:
+        mean = tf.convert_to_tensor(mean, dtype=dtype, name='mean')
+        dtype = mean.dtype
+      if num_factors is not None:
+        if covariance_matrix is None:
+          scale_matrix = tf.convert_to_tensor(scale_matrix, dtype=dtype,
+                                              name='scale_matrix')
+          covariance_matrix = tf.linalg.matmul(scale_matrix, scale_matrix,
+                                               transpose_b=True)
+        covariance_matrix = tf.convert_to_tensor(
+            covariance_matrix, dtype=dtype, name='covariance_matrix')
+        eigenvalues, eigenvectors = tf.linalg.eigh(covariance_matrix)
+        # `eigh` sorts the eigenvalues in the ascending order.
+        eigenvalues = tf.reverse(eigenvalues, axis=[-1])[..., :num_factors]
+        eigenvectors = tf.reverse(eigenvectors, axis=[-1])[..., :num_factors]
+        scale_matrix = eigenvectors * tf.expand_dims(
+            tf.math.sqrt(tf.math.maximum(eigenvalues, 0)), axis=-2)
+        covariance_matrix = None
+      mean, scale_matrix, _, _, dtype = _process_mean_scale(
+          mean, scale_matrix, covariance_matrix, dtype)
+      self._mean = mean
+      self._scale_matrix = scale_matrix
+      # Zero mean of the standard normal draws. Shape
+      # `batch_shape + [num_factors]`.
+      if scale_matrix is None:
+        self._draws_mean = tf.zeros_like(mean)
+      else:
+        batch_shape = tf.shape(scale_matrix)[:-2]
+        if isinstance(mean, tf.Tensor):
+          batch_shape = tf.broadcast_dynamic_shape(batch_shape,
+                                                   tf.shape(mean)[:-1])
+        self._draws_mean = tf.zeros(
+            tf.concat([batch_shape, tf.shape(scale_matrix)[-1:]], axis=0),
+            dtype=dtype)
+      self._randomization_params = randomization_params
+      if (self._random_type == RandomType.HALTON_RANDOMIZED
+          and randomization_params is None):
+        dim = _get_static_dim(self._draws_mean)
+        _, self._randomization_params = halton.sample(
+            dim=dim, sequence_indices=[0], randomized=True, seed=seed,
+            dtype=dtype)
+
+  @property
+  def scale_matrix(self):
+    """The cached factor of the covariance matrix.
+
+    A `Tensor` of shape `batch_shape + [k, num_factors]` or `None` for the
+    identity covariance.
+    """
+    return self._scale_matrix
+
+  @property
+  def position(self):
+    """The number of points of the low-discrepancy sequence used so far."""
+    return self._position
+
+  def sample(self, sample_shape):
+    """Returns the next draws of shape `sample_shape + batch_shape + [k]`.
+
+    Args:
+      sample_shape: Rank 1 Python list or numpy array of positive integers.
+        The shape of the samples to be drawn.
+
+    Returns:
+      A `Tensor` of shape `sample_shape + batch_shape + [k]`.
+    """
+    sample_shape = np.asarray(sample_shape, dtype=np.int32)
+    with tf.name_scope(self._name):
+      seed = self._seed
+      if (self._random_type in (RandomType.STATELESS,
+                                RandomType.STATELESS_ANTITHETIC)
+          and seed is not None):
+        # Independent draws for each call of the stateless generator.
+        seed = tf.random.experimental.stateless_fold_in(
+            tf.convert_to_tensor(seed, dtype=tf.int64), self._num_draws)
+      draws = multivariate_normal(
+          sample_shape,
+          mean=self._draws_mean,
+          random_type=self._random_type,
+          validate_args=self._validate_args,
+          seed=seed,
+          skip=self._position,
+          randomization_params=self._randomization_params)
+      self._num_draws += 1
+      if self._random_type in (RandomType.SOBOL, RandomType.HALTON,
+                               RandomType.HALTON_RANDOMIZED):
+        # Each batch element and each sample consumes one point.
+        num_points = np.prod(self._draws_mean.shape.as_list()[:-1],
+                             dtype=np.int64)
+        self._position += int(np.prod(sample_shape)) * int(num_points)
+      if self._scale_matrix is None:
+        return self._mean + draws
+      return self._mean + tf.linalg.matvec(self._scale_matrix, draws)
+
+  def next_chunk(self):
+    """Returns the next `chunk_size` draws.
+
+    Returns:
+      A `Tensor` of shape `[chunk_size] + batch_shape + [k]`.
+
+    Raises:
+      ValueError: If `chunk_size` was not supplied.
+    """
+    if self._chunk_size is None:
+      raise ValueError('`chunk_size` should be supplied to use `next_chunk`.')
+    return self.sample([self._chunk_size])
+
+
 def _mvnormal_pseudo(sample_shape,
                      mean,
                      covariance_matrix=None,
@@ -379,5 +379,60 @@ class RandomTest(parameterized.TestCase, tf.test.TestCase):
 
     np.testing.assert_array_almost_equal(sample1, sample2[:size], decimal=6)
 
+  def test_sampler_chunks_sobol(self):
+    """Tests that the chunks continue the same Sobol sequence."""
+    mean = np.array([1.0, -0.5], dtype=np.float64)
+    covar = np.array([[1.0, 0.3], [0.3, 0.5]], dtype=np.float64)
+    sampler = tff_rnd.MultivariateNormalSampler(
+        mean=mean, covariance_matrix=covar,
+        random_type=tff_rnd.RandomType.SOBOL, chunk_size=100, skip=10)
+    chunks = [sampler.next_chunk() for _ in range(3)]
+    with self.subTest("Position"):
+      self.assertEqual(sampler.position, 310)
+    expected = tff_rnd.mv_normal_sample(
+        [300], mean=mean, covariance_matrix=covar,
+        random_type=tff_rnd.RandomType.SOBOL, skip=10)
+    with self.subTest("Draws"):
+      self.assertAllClose(self.evaluate(tf.concat(chunks, axis=0)),
+                          self.evaluate(expected))
+
+  def test_sampler_num_factors(self):
+    """Tests the principal components approximation of the covariance."""
+    dim = 10
+    # Covariance matrix of exponentially decaying correlation
+    times = np.arange(dim, dtype=np.float64)
+    covar = np.exp(-0.1 * np.abs(times[:, None] - times[None, :]))
+    num_factors = 4
+    sampler = tff_rnd.MultivariateNormalSampler(
+        covariance_matrix=covar, num_factors=num_factors,
+        random_type=tff_rnd.RandomType.HALTON_RANDOMIZED, seed=42)
+    eigenvalues, eigenvectors = np.linalg.eigh(covar)
+    factor = eigenvectors[:, -num_factors:] * np.sqrt(
+        eigenvalues[-num_factors:])
+    expected_covar = np.matmul(factor, factor.transpose())
+    scale_matrix, sample = self.evaluate(
+        [sampler.scale_matrix, sampler.sample([20000])])
+    with self.subTest("ScaleShape"):
+      self.assertAllEqual(scale_matrix.shape, [dim, num_factors])
+    with self.subTest("Covariance"):
+      self.assertAllClose(np.cov(sample, rowvar=False), expected_covar,
+                          atol=3e-2)
+
+  def test_sampler_stateless_repeatable(self):
+    """Tests that the stateless draws are repeatable and independent."""
+    covar = np.array([[1.0, 0.1], [0.1, 1.0]], dtype=np.float32)
+
+    def draws():
+      sampler = tff_rnd.MultivariateNormalSampler(
+          covariance_matrix=covar, random_type=tff_rnd.RandomType.STATELESS,
+          seed=[1, 2], chunk_size=5)
+      return [sampler.next_chunk(), sampler.next_chunk()]
+
+    first, second = self.evaluate(draws()), self.evaluate(draws())
+    with self.subTest("Repeatable"):
+      self.assertAllClose(first, second)
+    with self.subTest("Independent"):
+      self.assertNotAllClose(first[0], first[1])
+
 if __name__ == "__main__":
   tf.test.main()
@@ -16,12 +16,14 @@
 
 from tf_quant_finance.math.root_search.brent import brentq
 from tf_quant_finance.math.root_search.newton import root_finder as newton_root
+from tf_quant_finance.math.root_search.newton import safeguarded_root_finder as safeguarded_newton_root
 
 from tensorflow.python.util.all_util import remove_undocumented  # pylint: disable=g-direct-tensorflow-import
 
 _allowed_symbols = [
     'brentq',
     'newton_root',
+    'safeguarded_newton_root',
 ]
 
 remove_undocumented(__name__, _allowed_symbols)
@@ -488,6 +488,62 @@ def _prepare_brent_args(objective_fn,
           _BrentSearchConstants(false=false, zero=zero, zero_value=zero_value))
 
 
+def _brent_active_set_loop(state, params, compaction_interval):
+  """Runs the Brent search iterating only over the unfinished elements.
+
+  The search proceeds in rounds. At the start of each round, the elements of
+  `state` for which the search is not finished are gathered into smaller
+  `Tensor`s, `compaction_interval` iterations are performed on them, and the
+  results are scattered back into the full state.
+
+  Args:
+    state: A Python `_BrentSearchState` namedtuple of rank 1 `Tensor`s.
+    params: A Python `_BrentSearchParams` namedtuple. The `objective_fn` should
+      be a callable of two rank 1 `Tensor`s, the estimates and their positions
+      in `state`. Tolerances and `max_iterations` should have the same shape
+      as the elements of `state`.
+    compaction_interval: Positive Python integer. The number of iterations
+      performed between consecutive compactions of the search state.
+
+  Returns:
+    The final `_BrentSearchState`.
+  """
+
+  def _round(state):
+    active = tf.reshape(
+        tf.where(~state.finished, name='active_indices'), [-1, 1])
+    active_flat = tf.cast(tf.reshape(active, [-1]), dtype=tf.int32)
+    active_state = tf.nest.map_structure(
+        lambda x: tf.gather_nd(x, active), state)
+    active_params = _BrentSearchParams(
+        objective_fn=lambda x: params.objective_fn(x, active_flat),
+        max_iterations=tf.gather_nd(params.max_iterations, active),
+        absolute_root_tolerance=tf.gather_nd(params.absolute_root_tolerance,
+                                             active),
+        relative_root_tolerance=tf.gather_nd(params.relative_root_tolerance,
+                                             active),
+        function_tolerance=tf.gather_nd(params.function_tolerance, active),
+        stopping_policy_fn=params.stopping_policy_fn)
+    active_constants = _BrentSearchConstants(
+        false=tf.zeros_like(active_state.finished),
+        zero=tf.zeros_like(active_state.best_estimate),
+        zero_value=tf.zeros_like(active_state.value_at_best_estimate))
+    active_state = tf.while_loop(
+        lambda state: ~tf.reduce_all(state.finished),
+        lambda state: _brent_loop_body(state, active_params, active_constants),
+        loop_vars=[active_state],
+        maximum_iterations=compaction_interval)[0]
+    return [tf.nest.map_structure(
+        lambda x, y: tf.tensor_scatter_nd_update(x, active, y),
+        state, active_state)]
+
+  # The stopping policy is only checked between the rounds.
+  return tf.while_loop(
+      lambda state: ~_should_stop(state, params.stopping_policy_fn),
+      _round,
+      loop_vars=[state])[0]
+
+
 # `_brent` currently only support inverse quadratic extrapolation.
 # This will be fixed when adding the `brenth` variant.
 def _brent(objective_fn,
@@ -501,6 +557,7 @@ def _brent(objective_fn,
            max_iterations=100,
            stopping_policy_fn=None,
            validate_args=False,
+           compaction_interval=None,
            name=None):
   r"""Finds root(s) of a function of a single variable using Brent's method.
 
@@ -576,6 +633,20 @@ def _brent(objective_fn,
       as `left_bracket`, `right_bracket`, `absolute_root_tolerance`,
       `relative_root_tolerance`, `function_tolerance`, and `max_iterations`.
       Default value: `False`.
+    compaction_interval: Optional positive Python integer. If supplied, the
+      search is performed in the active-set mode: every `compaction_interval`
+      iterations the unfinished elements are gathered into smaller `Tensor`s
+      and only those are iterated on, so that a few slowly converging elements
+      do not keep the whole batch computing. In this mode `objective_fn` must
+      be elementwise and is called as `objective_fn(x, indices)` where `x` is a
+      rank 1 `Tensor` of estimates and `indices` is an int32 `Tensor` of the
+      same shape containing the positions of `x` in the flattened
+      `left_bracket`. `indices` can be used to gather per-element parameters
+      of the objective function. `stopping_policy_fn` is checked every
+      `compaction_interval` iterations. The shape of `left_bracket` must be
+      fully defined.
+      Default value: `None` which means that all elements are iterated on
+        until the search stops.
     name: Python `str` name prefixed to ops created by this function.
 
   Returns:
@@ -594,10 +665,45 @@ def _brent(objective_fn,
         shape as `estimated_root`.
 
   Raises:
-    ValueError: if the `stopping_policy_fn` is not callable.
+    ValueError: if the `stopping_policy_fn` is not callable or if
+      `compaction_interval` is not positive.
   """
 
   with tf.name_scope(name or 'brent_root'):
+    if compaction_interval is not None:
+      if compaction_interval < 1:
+        raise ValueError('compaction_interval must be positive')
+      # The search is performed on flattened `Tensor`s so that the unfinished
+      # elements can be gathered in the active-set loop.
+      left_bracket = tf.convert_to_tensor(left_bracket, name='left_bracket')
+      dtype = left_bracket.dtype
+      batch_shape = left_bracket.shape
+      if relative_root_tolerance is None:
+        relative_root_tolerance = utils.default_relative_root_tolerance(dtype)
+      def _flatten(x, dtype=dtype):
+        if x is None:
+          return None
+        return tf.reshape(
+            tf.broadcast_to(tf.convert_to_tensor(x, dtype=dtype), batch_shape),
+            [-1])
+      (left_bracket, right_bracket, value_at_left_bracket,
+       value_at_right_bracket, absolute_root_tolerance,
+       relative_root_tolerance, function_tolerance) = [
+           _flatten(x) for x in (left_bracket, right_bracket,
+                                 value_at_left_bracket, value_at_right_bracket,
+                                 absolute_root_tolerance,
+                                 relative_root_tolerance, function_tolerance)]
+      max_iterations = _flatten(
+          max_iterations, tf.convert_to_tensor(max_iterations).dtype)
+      elementwise_objective_fn = objective_fn
+      all_indices = tf.range(batch_shape.num_elements(), dtype=tf.int32)
+      objective_fn = lambda x: elementwise_objective_fn(x, all_indices)
+      user_stopping_policy_fn = stopping_policy_fn or tf.reduce_all
+      if not callable(user_stopping_policy_fn):
+        raise ValueError('stopping_policy_fn must be callable')
+      stopping_policy_fn = lambda finished: user_stopping_policy_fn(  # pylint: disable=g-long-lambda
+          tf.reshape(finished, batch_shape))
+
     state, params, constants = _prepare_brent_args(
         objective_fn, left_bracket, right_bracket, value_at_left_bracket,
         value_at_right_bracket, absolute_root_tolerance,
@@ -627,16 +733,30 @@ def _brent(objective_fn,
       ]
 
     with tf.compat.v1.control_dependencies(assertions):
-      result = tf.while_loop(
-          # Negate `_should_stop` to determine if the search should continue.
-          # This means, in particular, that tf.reduce_*all* will return only
-          # when the search is finished for *all* starting points.
-          lambda loop_vars: ~_should_stop(loop_vars, params.stopping_policy_fn),
-          lambda state: _brent_loop_body(state, params, constants),
-          loop_vars=[state],
-          maximum_iterations=max_iterations)
-
-  state = result[0]
+      if compaction_interval is not None:
+        params = _BrentSearchParams(
+            objective_fn=elementwise_objective_fn,
+            max_iterations=params.max_iterations,
+            absolute_root_tolerance=params.absolute_root_tolerance,
+            relative_root_tolerance=params.relative_root_tolerance,
+            function_tolerance=params.function_tolerance,
+            stopping_policy_fn=params.stopping_policy_fn)
+        state = _brent_active_set_loop(state, params, compaction_interval)
+        state = tf.nest.map_structure(
+            lambda x: tf.reshape(x, batch_shape), state)
+        function_tolerance = tf.reshape(function_tolerance, batch_shape)
+      else:
+        result = tf.while_loop(
+            # Negate `_should_stop` to determine if the search should continue.
+            # This means, in particular, that tf.reduce_*all* will return only
+            # when the search is finished for *all* starting points.
+            lambda loop_vars: ~_should_stop(loop_vars,
+                                            params.stopping_policy_fn),
+            lambda state: _brent_loop_body(state, params, constants),
+            loop_vars=[state],
+            maximum_iterations=max_iterations)
+        state = result[0]
+
   converged = tf.math.abs(state.value_at_best_estimate) <= function_tolerance
 
   return BrentResults(
@@ -658,6 +778,7 @@ def brentq(
     max_iterations: types.IntTensor = 100,
     stopping_policy_fn: Callable[[types.BoolTensor], types.BoolTensor] = None,
     validate_args: bool = False,
+    compaction_interval: int = None,
     name: str = None) -> BrentResults:
   r"""Finds root(s) of a function of single variable using Brent's method.
 
@@ -808,6 +929,20 @@ def brentq(
       as `left_bracket`, `right_bracket`, `absolute_root_tolerance`,
       `relative_root_tolerance`, `function_tolerance`, and `max_iterations`.
       Default value: `False`.
+    compaction_interval: Optional positive Python integer. If supplied, the
+      search is performed in the active-set mode: every `compaction_interval`
+      iterations the unfinished elements are gathered into smaller `Tensor`s
+      and only those are iterated on, so that a few slowly converging elements
+      do not keep the whole batch computing. In this mode `objective_fn` must
+      be elementwise and is called as `objective_fn(x, indices)` where `x` is a
+      rank 1 `Tensor` of estimates and `indices` is an int32 `Tensor` of the
+      same shape containing the positions of `x` in the flattened
+      `left_bracket`. `indices` can be used to gather per-element parameters
+      of the objective function. `stopping_policy_fn` is checked every
+      `compaction_interval` iterations. The shape of `left_bracket` must be
+      fully defined.
+      Default value: `None` which means that all elements are iterated on
+        until the search stops.
     name: Python `str` name prefixed to ops created by this function.
 
   Returns:
@@ -826,7 +961,8 @@ def brentq(
         shape as `estimated_root`.
 
   Raises:
-    ValueError: if the `stopping_policy_fn` is not callable.
+    ValueError: if the `stopping_policy_fn` is not callable or if
+      `compaction_interval` is not positive.
   """
 
   return _brent(
@@ -841,4 +977,5 @@ def brentq(
       max_iterations=max_iterations,
       stopping_policy_fn=stopping_policy_fn,
       validate_args=validate_args,
+      compaction_interval=compaction_interval,
       name=name)
@@ -356,6 +356,48 @@ class BrentqTest(tf.test.TestCase):
               max_iterations=-1,
               validate_args=True))
 
+  @test_util.run_in_graph_and_eager_modes
+  def testActiveSetMatchesFullBatch(self):
+    # Per-element shifts of the polynomial roots. The active-set search uses
+    # the indices to gather the parameters of the unfinished elements.
+    shifts = tf.constant([[0., 1., -2.], [0.5, 3., -1.]], dtype=tf.float64)
+    left_bracket = tf.constant([[-10, 1, -3], [-5, 2, -4]], dtype=tf.float64)
+    right_bracket = tf.constant([[10, -1, 5], [6, 8, 1]], dtype=tf.float64)
+    full = brentq(lambda x: polynomial5(x - shifts), left_bracket,
+                  right_bracket)
+
+    def elementwise_fn(x, indices):
+      return polynomial5(x - tf.gather(tf.reshape(shifts, [-1]), indices))
+
+    for compaction_interval in (1, 3, 100):
+      with self.subTest("CompactionInterval{}".format(compaction_interval)):
+        active_set = brentq(elementwise_fn, left_bracket, right_bracket,
+                            compaction_interval=compaction_interval)
+        full_result, active_set_result = self.evaluate([full, active_set])
+        self.assertAllEqual(active_set_result.estimated_root.shape, [2, 3])
+        self.assertAllClose(active_set_result.estimated_root,
+                            full_result.estimated_root, rtol=0, atol=0)
+        self.assertAllEqual(active_set_result.num_iterations,
+                            full_result.num_iterations)
+        self.assertAllEqual(active_set_result.converged,
+                            full_result.converged)
+
+  @test_util.run_in_graph_and_eager_modes
+  def testActiveSetWithNoIteration(self):
+    result = self.evaluate(
+        brentq(lambda x, _: polynomial5(x),
+               tf.constant([-10, 1], dtype=tf.float64),
+               tf.constant([10, -1], dtype=tf.float64),
+               max_iterations=0,
+               compaction_interval=2))
+    self.assertAllEqual(result.estimated_root, [-10, -1])
+    self.assertAllEqual(result.num_iterations, [0, 0])
+
+  def testActiveSetWithInvalidCompactionInterval(self):
+    with self.assertRaises(ValueError):
+      brentq(lambda x, _: x, tf.constant([-1.]), tf.constant([1.]),
+             compaction_interval=0)
+
 
 if __name__ == "__main__":
   tf.test.main()
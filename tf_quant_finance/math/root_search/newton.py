@@ -15,6 +15,7 @@
 
 import tensorflow.compat.v2 as tf
 
+from tf_quant_finance.math.root_search import brent
 from tf_quant_finance.math.root_search import utils
 
 
@@ -138,3 +139,220 @@ def root_finder(value_and_grad_func,
     return tf.while_loop(_condition, _updater, starting_position,
                          maximum_iterations=max_iterations)[1:]
 
+
+def safeguarded_root_finder(value_and_derivatives_fn,
+                            left_bracket,
+                            right_bracket,
+                            initial_values=None,
+                            absolute_root_tolerance=2e-7,
+                            relative_root_tolerance=None,
+                            function_tolerance=2e-7,
+                            max_iterations=50,
+                            dtype=None,
+                            name=None):
+  """Finds roots of a scalar function using safeguarded Newton's method.
+
+  The method combines Newton's (or Halley's) iterations with bisection. The
+  root is kept within a bracket `[a_n, b_n]` such that `f(a_n) f(b_n) <= 0`.
+  At each iteration, the Newton update
+
+    `x_{n+1} = x_n - f(x_n) / f'(x_n)`
+
+  is accepted if it stays within the bracket and reduces the step size fast
+  enough. Otherwise, the bisection step `x_{n+1} = (a_n + b_n) / 2` is taken
+  (see, e.g., function `rtsafe` in [1]). The bracket is then updated with the
+  new point. This guarantees convergence for any continuous function while
+  retaining the quadratic convergence of Newton's method close to the root.
+
+  If `value_and_derivatives_fn` also returns the second derivative, Halley's
+  update
+
+    `x_{n+1} = x_n - 2 f(x_n) f'(x_n) / (2 f'(x_n)^2 - f(x_n) f''(x_n))`
+
+  is used instead of Newton's, which converges cubically close to the root.
+
+  The implementation accepts array-like arguments and assumes that each cell
+  corresponds to an independent scalar function.
+
+  #### Examples
+  ```python
+  # Find the square roots of three numbers with Halley's method.
+  constants = np.array([4.0, 9.0, 16.0])
+  def value_and_derivatives(values):
+    return values**2 - constants, 2.0 * values, 2.0 * tf.ones_like(values)
+
+  results = tff.math.root_search.safeguarded_newton_root(
+      value_and_derivatives, left_bracket=[0., 0., 0.],
+      right_bracket=[10., 10., 10.], dtype=tf.float64)
+  print(results.estimated_root)  # Expected output: [ 2.  3.  4.]
+  print(results.converged)  # Expected output: [ True  True  True]
+  ```
+
+  #### References
+  [1] W. H. Press, S. A. Teukolsky, W. T. Vetterling, B. P. Flannery.
+    Numerical Recipes: The Art of Scientific Computing. Third Edition.
+    Section 9.4. Cambridge University Press, 2007.
+
+  Args:
+    value_and_derivatives_fn: A python callable that takes a `Tensor` of the
+      same shape and dtype as the `left_bracket` and which returns either a
+      two-`tuple` of `Tensors`, namely the objective function and its
+      derivative evaluated at the passed parameters, or a three-`tuple` with
+      the second derivative appended. In the latter case Halley's method is
+      used.
+    left_bracket: A real `Tensor` of any shape. The left ends of the brackets
+      containing the roots.
+    right_bracket: A real `Tensor` of the same shape and dtype as
+      `left_bracket`. The right ends of the brackets. The objective function
+      should have opposite signs (or vanish) at the ends of each bracket,
+      otherwise the search is not performed and the root is reported as not
+      converged, unless the objective vanishes at the initial value.
+    initial_values: Optional real `Tensor` of the same shape and dtype as
+      `left_bracket`. The starting points of the search. Should be within the
+      brackets.
+      Default value: `None` which maps to the midpoints of the brackets.
+    absolute_root_tolerance: Optional `Tensor` representing the absolute
+      tolerance for estimated roots, with the total tolerance being calculated
+      as `absolute_root_tolerance + relative_root_tolerance * |root|`. The
+      search is stopped once the last step or the bracket width is below the
+      total tolerance.
+      Default value: `2e-7`.
+    relative_root_tolerance: Optional `Tensor` representing the relative
+      tolerance for estimated roots.
+      Default value: `None` which translates to `4 *
+        numpy.finfo(dtype.as_numpy_dtype).eps`.
+    function_tolerance: Optional `Tensor` representing the tolerance used to
+      check for roots. If the absolute value of the objective function is
+      smaller than or equal to `function_tolerance` at a given estimate, then
+      that estimate is considered a root for the function.
+      Default value: `2e-7`.
+    max_iterations: Positive Python integer. The maximum number of iterations.
+      Default value: 50.
+    dtype: optional `tf.DType`. If supplied the input `Tensor`s will be
+      coerced to this data type.
+      Default value: None.
+    name: `str`, to be prefixed to the name of TensorFlow ops created by this
+      function.
+      Default value: `None` which maps to 'safeguarded_root_finder'.
+
+  Returns:
+    A `BrentResults` object with the following attributes, each of the same
+    shape as `left_bracket`:
+      estimated_root: The best estimate of the roots.
+      objective_at_estimated_root: The value of the objective function at
+        `estimated_root`.
+      num_iterations: The number of iterations performed for each element.
+      converged: A boolean `Tensor` indicating whether the search has stopped
+        within the tolerance for each element.
+  """
+  with tf.name_scope(name or 'safeguarded_root_finder'):
+    left_bracket = tf.convert_to_tensor(
+        left_bracket, dtype=dtype, name='left_bracket')
+    dtype = left_bracket.dtype
+    right_bracket = tf.convert_to_tensor(
+        right_bracket, dtype=dtype, name='right_bracket')
+    if initial_values is None:
+      initial_values = (left_bracket + right_bracket) / 2
+    initial_values = tf.convert_to_tensor(
+        initial_values, dtype=dtype, name='initial_values')
+    if relative_root_tolerance is None:
+      relative_root_tolerance = utils.default_relative_root_tolerance(dtype)
+    absolute_root_tolerance = tf.convert_to_tensor(
+        absolute_root_tolerance, dtype=dtype, name='absolute_root_tolerance')
+    relative_root_tolerance = tf.convert_to_tensor(
+        relative_root_tolerance, dtype=dtype, name='relative_root_tolerance')
+    function_tolerance = tf.convert_to_tensor(
+        function_tolerance, dtype=dtype, name='function_tolerance')
+
+    def _evaluate(x):
+      values_and_derivatives = value_and_derivatives_fn(x)
+      value, derivative = values_and_derivatives[:2]
+      if len(values_and_derivatives) > 2:
+        second_derivative = values_and_derivatives[2]
+      else:
+        second_derivative = None
+      return value, derivative, second_derivative
+
+    # Orient the brackets so that the function is negative at `lower` and
+    # positive at `upper`.
+    value_at_left = _evaluate(left_bracket)[0]
+    value_at_right = _evaluate(right_bracket)[0]
+    swap = value_at_left > 0
+    lower = tf.where(swap, right_bracket, left_bracket)
+    upper = tf.where(swap, left_bracket, right_bracket)
+    # Start from the bracket ends if those are roots already.
+    initial_values = tf.where(
+        tf.math.abs(value_at_left) <= function_tolerance, left_bracket,
+        tf.where(tf.math.abs(value_at_right) <= function_tolerance,
+                 right_bracket, initial_values))
+    # Brackets without a change of sign of the objective are not searched.
+    valid_bracket = ((value_at_left * value_at_right <= 0)
+                     | (tf.math.abs(value_at_left) <= function_tolerance)
+                     | (tf.math.abs(value_at_right) <= function_tolerance))
+    value, derivative, second_derivative = _evaluate(initial_values)
+    use_halley = second_derivative is not None
+    if not use_halley:
+      second_derivative = tf.zeros_like(value)
+
+    def _condition(counter, state):
+      return (counter < max_iterations) & ~tf.reduce_all(state[-1])
+
+    def _updater(counter, state):
+      """Performs one step of the safeguarded search."""
+      (x, value, derivative, second_derivative, lower, upper, last_step,
+       step_before_last, num_iterations, finished) = state
+      if use_halley:
+        step = tf.math.divide(
+            2 * value * derivative,
+            2 * derivative**2 - value * second_derivative)
+      else:
+        step = tf.math.divide(value, derivative)
+      newton_estimate = x - step
+      bisection_estimate = (lower + upper) / 2
+      # Use bisection if Newton's estimate is not strictly inside the bracket,
+      # is not finite, the derivative vanishes or if the step size does not
+      # decrease fast enough.
+      use_bisection = (
+          ~tf.math.is_finite(newton_estimate) | tf.equal(derivative, 0)
+          | ((newton_estimate - lower) * (newton_estimate - upper) >= 0)
+          | (tf.math.abs(2 * step) > tf.math.abs(step_before_last)))
+      new_x = tf.where(use_bisection, bisection_estimate, newton_estimate)
+      new_x = tf.where(finished, x, new_x)
+      new_step = x - new_x
+      new_value, new_derivative, new_second_derivative = _evaluate(new_x)
+      if not use_halley:
+        new_second_derivative = second_derivative
+      # Shrink the bracket.
+      lower = tf.where(~finished & (new_value < 0), new_x, lower)
+      upper = tf.where(~finished & (new_value > 0), new_x, upper)
+      root_tolerance = (absolute_root_tolerance +
+                        relative_root_tolerance * tf.math.abs(new_x))
+      num_iterations = tf.where(finished, num_iterations, num_iterations + 1)
+      finished |= ((tf.math.abs(new_value) <= function_tolerance)
+                   | (tf.math.abs(new_step) < root_tolerance)
+                   | (tf.math.abs(upper - lower) < root_tolerance))
+      state = (new_x, new_value, new_derivative, new_second_derivative,
+               lower, upper,
+               tf.where(finished, last_step, new_step),
+               tf.where(finished, step_before_last, last_step),
+               num_iterations, finished)
+      return counter + 1, state
+
+    # The initial step sizes are set to the bracket width.
+    width = tf.math.abs(upper - lower)
+    finished = (tf.math.abs(value) <= function_tolerance) | ~valid_bracket
+    initial_state = (initial_values, value, derivative, second_derivative,
+                     lower, upper, width, width,
+                     tf.zeros_like(value, dtype=tf.int32), finished)
+
+    _, final_state = tf.while_loop(
+        _condition, _updater, (0, initial_state),
+        maximum_iterations=max_iterations)
+    estimated_root, value = final_state[:2]
+    converged = final_state[-1] & (
+        valid_bracket | (tf.math.abs(value) <= function_tolerance))
+    return brent.BrentResults(
+        estimated_root=estimated_root,
+        objective_at_estimated_root=value,
+        num_iterations=final_state[-2],
+        converged=converged)
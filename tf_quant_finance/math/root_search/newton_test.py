@@ -24,6 +24,7 @@ import tf_quant_finance as tff
 from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
 
 newton_root = tff.math.root_search.newton_root
+safeguarded_newton_root = tff.math.root_search.safeguarded_newton_root
 
 
 # TODO(b/179452351): Implement more unit tests for newton method as for brent.
@@ -115,6 +116,88 @@ class RootFinderNewtonTest(parameterized.TestCase, tf.test.TestCase):
     np.testing.assert_array_equal(converged, converged_bench)
     np.testing.assert_array_equal(failed, failed_bench)
 
+  @parameterized.named_parameters(
+      ('Newton', False),
+      ('Halley', True))
+  def test_safeguarded_newton_root(self, use_second_derivative):
+    """Tests the safeguarded root finder on a square root example."""
+    constants = np.array([4.0, 9.0, 16.0, 0.25])
+
+    def objective_and_derivatives(values):
+      objective = values**2 - constants
+      gradient = 2.0 * values
+      if use_second_derivative:
+        return objective, gradient, 2.0 * tf.ones_like(values)
+      return objective, gradient
+
+    # The brackets are given in an arbitrary order and the initial values at
+    # the origin would make the plain Newton's method fail.
+    results = self.evaluate(
+        safeguarded_newton_root(
+            objective_and_derivatives,
+            left_bracket=[0.0, 10.0, 0.0, 1.0],
+            right_bracket=[10.0, 0.0, 4.0, 0.0],
+            initial_values=[0.0, 0.0, 4.0, 0.0],
+            dtype=tf.float64))
+    np.testing.assert_array_equal(results.converged, [True] * 4)
+    np.testing.assert_almost_equal(
+        results.estimated_root, [2.0, 3.0, 4.0, 0.5], decimal=7)
+    np.testing.assert_almost_equal(
+        results.objective_at_estimated_root, [0.0] * 4, decimal=7)
+
+  def test_safeguarded_newton_root_halley_is_faster(self):
+    """Halley's method requires fewer iterations than Newton's method."""
+    constants = np.array([2.0, 5.0, 7.0])
+    left_bracket = np.zeros(3)
+    right_bracket = np.full(3, 5.0)
+    newton_results = safeguarded_newton_root(
+        lambda x: (tf.math.exp(x) - constants, tf.math.exp(x)),
+        left_bracket, right_bracket, function_tolerance=1e-12,
+        dtype=tf.float64)
+    halley_results = safeguarded_newton_root(
+        lambda x: (tf.math.exp(x) - constants, tf.math.exp(x), tf.math.exp(x)),
+        left_bracket, right_bracket, function_tolerance=1e-12,
+        dtype=tf.float64)
+    newton_results, halley_results = self.evaluate(
+        [newton_results, halley_results])
+    np.testing.assert_almost_equal(
+        newton_results.estimated_root, np.log(constants), decimal=10)
+    np.testing.assert_almost_equal(
+        halley_results.estimated_root, np.log(constants), decimal=10)
+    self.assertTrue(np.all(
+        halley_results.num_iterations <= newton_results.num_iterations))
+    self.assertLess(np.sum(halley_results.num_iterations),
+                    np.sum(newton_results.num_iterations))
+
+  def test_safeguarded_newton_root_falls_back_to_bisection(self):
+    """Tests convergence where Newton's method cycles."""
+    # Newton's method started at 0 cycles between 0 and 1 for this function.
+    def objective_and_gradient(x):
+      return x**3 - 2 * x + 2, 3 * x**2 - 2
+
+    results = self.evaluate(
+        safeguarded_newton_root(
+            objective_and_gradient, left_bracket=[-3.0], right_bracket=[1.0],
+            initial_values=[0.0], dtype=tf.float64))
+    self.assertTrue(results.converged[0])
+    np.testing.assert_almost_equal(
+        results.estimated_root, [-1.76929235423863], decimal=7)
+
+  def test_safeguarded_newton_root_invalid_bracket(self):
+    """Brackets without a sign change are reported as not converged."""
+    constants = np.array([4.0, 9.0])
+
+    def objective_and_gradient(values):
+      return values**2 - constants, 2.0 * values
+
+    results = self.evaluate(
+        safeguarded_newton_root(
+            objective_and_gradient, left_bracket=[0.0, 4.0],
+            right_bracket=[4.0, 10.0], dtype=tf.float64))
+    np.testing.assert_array_equal(results.converged, [True, False])
+    np.testing.assert_array_equal(results.num_iterations[1], 0)
+    np.testing.assert_almost_equal(results.estimated_root[0], 2.0, decimal=7)
+
 
 if __name__ == '__main__':
   tf.test.main()
@@ -15,18 +15,24 @@
 
 from tf_quant_finance.models import cir
 from tf_quant_finance.models import euler_sampling
+from tf_quant_finance.models import exact_sampling
 from tf_quant_finance.models import heston
 from tf_quant_finance.models import hjm
 from tf_quant_finance.models import hull_white
 from tf_quant_finance.models import longstaff_schwartz
 from tf_quant_finance.models import milstein_sampling
+from tf_quant_finance.models import monte_carlo_estimators
+from tf_quant_finance.models import multilevel_monte_carlo
+from tf_quant_finance.models import path_reducers
 from tf_quant_finance.models import sabr
+from tf_quant_finance.models import sharded_monte_carlo
 from tf_quant_finance.models.generic_ito_process import GenericItoProcess
 from tf_quant_finance.models.geometric_brownian_motion.multivariate_geometric_brownian_motion import MultivariateGeometricBrownianMotion
 from tf_quant_finance.models.geometric_brownian_motion.univariate_geometric_brownian_motion import GeometricBrownianMotion
 from tf_quant_finance.models.heston import HestonModel
 from tf_quant_finance.models.ito_process import ItoProcess
 from tf_quant_finance.models.joined_ito_process import JoinedItoProcess
+from tf_quant_finance.models.path_construction import PathConstruction
 from tf_quant_finance.models.realized_volatility import PathScale
 from tf_quant_finance.models.realized_volatility import realized_volatility
 from tf_quant_finance.models.realized_volatility import ReturnsType
@@ -36,19 +42,25 @@ from tensorflow.python.util.all_util import remove_undocumented  # pylint: disab
 
 _allowed_symbols = [
     'euler_sampling',
+    'exact_sampling',
     'heston',
     'HestonModel',
     'hjm',
     'hull_white',
     'milstein_sampling',
+    'monte_carlo_estimators',
+    'multilevel_monte_carlo',
+    'path_reducers',
     'longstaff_schwartz',
     'GenericItoProcess',
     'MultivariateGeometricBrownianMotion',
     'GeometricBrownianMotion',
     'ItoProcess',
     'JoinedItoProcess',
+    'PathConstruction',
     'sabr',
     'SabrModel',
+    'sharded_monte_carlo',
     'PathScale',
     'realized_volatility',
     'ReturnsType',
@@ -126,7 +126,24 @@ class CirModel(generic_ito_process.GenericItoProcess):
                    name: Optional[str] = None) -> types.RealTensor:
     """Returns a sample of paths from the process.
 
-    Using exact simulation method from [1].
+    Using exact simulation method from [1]. Conditionally on `X(s)`, the value
+    `X(t)` at `t > s` is a scaled noncentral chi-square random variable
+
+    ```None
+      X(t) = chi2(4 a / sigma**2, c exp(-k (t - s)) X(s)) / c,
+      c = 4 k / (sigma**2 (1 - exp(-k (t - s)))),
+    ```
+
+    which is sampled as a Poisson mixture of Gamma random variables
+
+    ```None
+      N ~ Poisson(c exp(-k (t - s)) X(s) / 2),
+      X(t) ~ Gamma(N + 2 a / sigma**2, rate=c / 2).
+    ```
+
+    Hence the paths are sampled exactly at `times` with a single step between
+    consecutive `times`, irrespective of their distance, and there is no
+    discretization bias.
 
     Args:
       times: Rank 1 `Tensor` of positive real values. The times at which the
@@ -298,6 +298,40 @@ class CirTest(parameterized.TestCase, tf.test.TestCase):
     with self.subTest("GreaterEqualThanZero"):
       self.assertAllGreaterEqual(samples, 0.0)
 
+  @parameterized.named_parameters(
+      {
+          "testcase_name": "SparseTimes",
+          "times": np.array([0.5, 5.0, 30.0]),
+      }, {
+          "testcase_name": "SingleLongHorizon",
+          "times": np.array([30.0]),
+      })
+  def test_sample_paths_exact_moments(self, times):
+    """Samples have the exact conditional moments at long horizons."""
+    (theta, mean_reversion, sigma, _, num_samples, _, random_type, seed,
+     dtype) = self.get_default_params()
+    initial_state = 0.1
+    num_samples = 50_000
+    process = tff.models.cir.CirModel(
+        theta=theta, mean_reversion=mean_reversion, sigma=sigma, dtype=dtype)
+    samples = process.sample_paths(
+        times=times,
+        initial_state=initial_state,
+        num_samples=num_samples,
+        random_type=random_type,
+        seed=seed)
+    mean, var = self.get_mean_and_var(samples, axis=-2)
+    decay = np.exp(-mean_reversion * times)
+    long_term_mean = theta / mean_reversion
+    expected_mean = initial_state * decay + long_term_mean * (1 - decay)
+    expected_var = (initial_state * sigma**2 * decay * (1 - decay) /
+                    mean_reversion + long_term_mean * sigma**2 *
+                    (1 - decay)**2 / (2 * mean_reversion))
+    with self.subTest("Mean"):
+      self.assertAllClose(expected_mean, mean, rtol=1e-2, atol=0)
+    with self.subTest("Var"):
+      self.assertAllClose(expected_var, var, rtol=5e-2, atol=0)
+
   @parameterized.named_parameters(
       {
           "testcase_name": "dtype=float64",
@@ -13,7 +13,8 @@
 # limitations under the License.
 """The Euler sampling method for ito processes."""
 
-from typing import Callable, List, Optional
+import functools
+from typing import Callable, List, Optional, Union
 
 import tensorflow.compat.v2 as tf
 
@@ -21,6 +22,7 @@ from tf_quant_finance import types
 from tf_quant_finance import utils as tff_utils
 from tf_quant_finance.math import custom_loops
 from tf_quant_finance.math import random
+from tf_quant_finance.models import path_reducers
 from tf_quant_finance.models import utils
 
 
@@ -43,8 +45,15 @@ def sample(
     watch_params: Optional[List[types.RealTensor]] = None,
     validate_args: bool = False,
     tolerance: Optional[types.RealTensor] = None,
+    path_construction: Optional[utils.PathConstruction] = None,
+    path_reducer: Optional[path_reducers.PathReducer] = None,
+    block_size: Optional[int] = None,
+    record_components: Optional[types.IntTensor] = None,
+    record_time_indices: Optional[types.IntTensor] = None,
+    record_dtype: Optional[tf.DType] = None,
     dtype: Optional[tf.DType] = None,
-    name: Optional[str] = None) -> types.RealTensor:
+    name: Optional[str] = None
+) -> Union[types.RealTensor, path_reducers.MonteCarloStatistics]:
   """Returns a sample paths from the process using Euler method.
 
   For an Ito process,
@@ -107,6 +116,54 @@ def sample(
   # Expected: paths.shape = [10000, 3, 2]
   ```
 
+  When only an expectation over the paths is needed, a `path_reducer` folds the
+  states of each path at `times` into per-path values as the paths are
+  generated and only the statistics of these values are returned. The paths
+  are then never stored and the samples are generated in blocks of
+  `block_size` paths, so that the memory does not grow with `num_samples`.
+
+  ```python
+  # Expected value of the running maximum of the first component
+  statistics = tff.models.euler_sampling.sample(
+            dim=dim,
+            drift_fn=drift_fn,
+            volatility_fn=vol_fn,
+            times=times,
+            num_samples=1000000,
+            initial_state=x0,
+            time_step=0.01,
+            path_reducer=tff.models.path_reducers.path_maximum(
+                payoff_fn=lambda x: x[..., 0]),
+            block_size=num_samples,
+            seed=42,
+            dtype=dtype)
+  # Expected: statistics.mean.shape = [], statistics.variance.shape = []
+  ```
+
+  When the paths are needed only at some of the `times` (e.g., the exercise
+  dates of a Bermudan option while `times` also contains the coupon dates) or
+  only for some components of the state, `record_time_indices` and
+  `record_components` restrict the recorded states and `record_dtype` lowers
+  their precision. The simulation itself is unchanged.
+
+  ```python
+  # Record the first component at times 1.0 and 2.0 in single precision
+  paths = tff.models.euler_sampling.sample(
+            dim=dim,
+            drift_fn=drift_fn,
+            volatility_fn=vol_fn,
+            times=times,
+            num_samples=num_samples,
+            initial_state=x0,
+            time_step=0.01,
+            record_components=[0],
+            record_time_indices=[1, 2],
+            record_dtype=tf.float32,
+            seed=42,
+            dtype=dtype)
+  # Expected: paths.shape = [10000, 2, 1] and paths.dtype = tf.float32
+  ```
+
   #### References
   [1]: Wikipedia. Euler-Maruyama method:
   https://en.wikipedia.org/wiki/Euler-Maruyama_method
@@ -211,6 +268,42 @@ def sample(
       tolerance are perceived to be the same.
       Default value: `None` which maps to `1-e6` if the for single precision
         `dtype` and `1e-10` for double precision `dtype`.
+    path_construction: An optional instance of `PathConstruction`. The
+      construction of the Brownian paths from the normal draws generated by
+      the algorithm. With `BROWNIAN_BRIDGE` or `PCA`, the leading dimensions
+      of the `SOBOL` and `HALTON` sequences drive the largest scale features
+      of the paths, which usually improves the convergence of quasi-Monte
+      Carlo estimates. `BROWNIAN_BRIDGE` requires a statically known number of
+      time steps. Ignored if `normal_draws` are supplied or if the draws are
+      not precomputed.
+      Default value: `None` which maps to `PathConstruction.INCREMENTAL`.
+    path_reducer: An optional instance of `tff.models.path_reducers.
+      PathReducer`. If supplied, the states of the paths at `times` are reduced
+      to per-path values as the paths are generated and the statistics of these
+      values are returned instead of the paths. Not supported together with
+      `watch_params`.
+      Default value: `None` which means that the paths are returned.
+    block_size: An optional positive Python `int`. The number of paths
+      generated at once when `path_reducer` is supplied. `num_samples` should
+      be divisible by `block_size`. The normal draws are precomputed only for a
+      block of paths at a time; for the `SOBOL` and `HALTON` random types the
+      blocks are consecutive parts of the same sequence and for the `STATELESS`
+      random types the seed is folded with the index of the block. Ignored if
+      `normal_draws` are supplied.
+      Default value: `None` which means that all the paths are generated in a
+      single block.
+    record_components: An optional rank 1 integer `Tensor`. The indices of the
+      components of the state which are recorded.
+      Default value: `None` which means that all the components are recorded.
+    record_time_indices: An optional rank 1 integer `Tensor` of increasing
+      distinct values. The indices of the `times` at which the states are
+      recorded. The simulation stops at the last of these times.
+      Default value: `None` which means that the states are recorded at all
+      `times`.
+    record_dtype: An optional `tf.DType`. The dtype of the recorded states,
+      e.g., `tf.float32` for a simulation in double precision.
+      Default value: `None` which means that the states are recorded in
+      `dtype`.
     dtype: `tf.Dtype`. If supplied the dtype for the input and output `Tensor`s.
       Default value: None which means that the dtype implied by `times` is
       used.
@@ -219,13 +312,21 @@ def sample(
 
   Returns:
    A real `Tensor` of shape batch_shape_process + [num_samples, k, n] where `k`
-     is the size of the `times`, `n` is the dimension of the process.
+     is the size of the `times`, `n` is the dimension of the process. If
+     `record_time_indices` or `record_components` are supplied, `k` and `n`
+     are their sizes instead.
+   If `path_reducer` is supplied, an instance of
+     `tff.models.path_reducers.MonteCarloStatistics` of the per-path values
+     instead.
 
   Raises:
     ValueError:
       (a) When `times_grid` is not supplied, and neither `num_time_steps` nor
         `time_step` are supplied or if both are supplied.
       (b) If `normal_draws` is supplied and `dim` is mismatched.
+      (c) If `path_reducer` is supplied together with `watch_params` or with
+        any of the `record_*` arguments, or if `num_samples` is not divisible
+        by `block_size`.
     tf.errors.InvalidArgumentError: If `normal_draws` is supplied and
       `num_time_steps` is mismatched.
   """
@@ -311,6 +412,51 @@ def sample(
     if watch_params is not None:
       watch_params = [tf.convert_to_tensor(param, dtype=dtype)
                       for param in watch_params]
+    if path_reducer is not None:
+      if watch_params is not None:
+        raise ValueError('`watch_params` are not supported with '
+                         '`path_reducer`.')
+      if (record_components is not None or record_time_indices is not None
+          or record_dtype is not None):
+        raise ValueError('The `record_*` arguments are not supported with '
+                         '`path_reducer`.')
+      if normal_draws is not None or block_size is None:
+        block_size = num_samples
+      elif (isinstance(num_samples, int) and num_samples % block_size):
+        raise ValueError('`num_samples` should be divisible by `block_size`. '
+                         'Supplied: {0} and {1}'.format(num_samples,
+                                                        block_size))
+      return _reduce_paths(
+          dim=dim,
+          drift_fn=drift_fn,
+          volatility_fn=volatility_fn,
+          times=times,
+          keep_mask=keep_mask,
+          num_requested_times=num_requested_times,
+          num_samples=num_samples,
+          block_size=block_size,
+          initial_state=initial_state,
+          batch_shape=batch_shape,
+          random_type=random_type,
+          seed=seed,
+          swap_memory=swap_memory,
+          skip=skip,
+          precompute_normal_draws=precompute_normal_draws,
+          normal_draws=normal_draws,
+          path_construction=path_construction,
+          path_reducer=path_reducer,
+          dtype=dtype)
+    if record_components is not None:
+      record_components = tf.convert_to_tensor(
+          record_components, dtype=tf.int32, name='record_components')
+    record_slots = None
+    num_recorded_times = num_requested_times
+    if record_time_indices is not None:
+      record_time_indices = tf.convert_to_tensor(
+          record_time_indices, dtype=tf.int32, name='record_time_indices')
+      num_recorded_times = tff_utils.get_shape(record_time_indices)[0]
+      record_slots = _record_slots(keep_mask, record_time_indices,
+                                   num_requested_times)
     return _sample(
         dim=dim,
         batch_shape=batch_shape,
@@ -329,9 +475,40 @@ def sample(
         normal_draws=normal_draws,
         watch_params=watch_params,
         time_indices=time_indices,
+        path_construction=path_construction,
+        record_components=record_components,
+        record_time_indices=record_time_indices,
+        record_slots=record_slots,
+        num_recorded_times=num_recorded_times,
+        record_dtype=record_dtype,
         dtype=dtype)
 
 
+def _record_slots(keep_mask, record_time_indices, num_requested_times):
+  """Maps the points of the time grid to the slots of the recorded states."""
+  # Index of the requested time at the points of the grid where `keep_mask` is
+  # `True`
+  time_indices = tf.math.maximum(
+      tf.math.cumsum(tf.cast(keep_mask, dtype=tf.int32)) - 1, 0)
+  is_recorded = tf.scatter_nd(
+      tf.expand_dims(record_time_indices, axis=-1),
+      tf.ones_like(record_time_indices), [num_requested_times]) > 0
+  is_recorded = tf.math.logical_and(
+      keep_mask, tf.gather(is_recorded, time_indices))
+  # The state at a point of the grid is written to the slot of the next
+  # recorded time and is overwritten unless the point is a recorded time.
+  return tf.math.cumsum(tf.cast(is_recorded, dtype=tf.int32), exclusive=True)
+
+
+def _record_state(state, record_components, record_dtype):
+  """Selects the recorded components of the state and casts them."""
+  if record_components is not None:
+    state = tf.gather(state, record_components, axis=-1)
+  if record_dtype is not None:
+    state = tf.cast(state, record_dtype)
+  return state
+
+
 def _sample(*,
             dim,
             batch_shape,
@@ -349,6 +526,12 @@ def _sample(*,
             watch_params,
             time_indices,
             normal_draws,
+            path_construction,
+            record_components,
+            record_time_indices,
+            record_slots,
+            num_recorded_times,
+            record_dtype,
             dtype):
   """Returns a sample of paths from the process using Euler method."""
   dt = times[1:] - times[:-1]
@@ -371,14 +554,21 @@ def _sample(*,
       normal_draws = utils.generate_mc_normal_draws(
           num_normal_draws=dim, num_time_steps=steps_num,
           num_sample_paths=num_samples, batch_shape=batch_shape,
-          random_type=random_type, dtype=dtype, seed=seed, skip=skip)
+          random_type=random_type, dtype=dtype, seed=seed, skip=skip,
+          path_construction=path_construction, time_step_sizes=dt)
       wiener_mean = None
     else:
       # If pseudo or anthithetic sampling is used, proceed with random sampling
       # at each step.
       wiener_mean = tf.zeros((dim,), dtype=dtype, name='wiener_mean')
       normal_draws = None
+  record_fn = functools.partial(_record_state,
+                                record_components=record_components,
+                                record_dtype=record_dtype)
   if watch_params is None:
+    if record_time_indices is not None:
+      # There is no need to simulate past the last recorded time.
+      num_requested_times = tf.math.reduce_max(record_time_indices) + 1
     # Use while_loop if `watch_params` is not passed
     return  _while_loop(
         steps_num=steps_num,
@@ -387,12 +577,13 @@ def _sample(*,
         num_samples=num_samples, times=times,
         dt=dt, sqrt_dt=sqrt_dt, keep_mask=keep_mask,
         num_requested_times=num_requested_times,
+        record_fn=record_fn, record_slots=record_slots,
+        num_recorded_times=num_recorded_times,
         swap_memory=swap_memory,
-        random_type=random_type, seed=seed, normal_draws=normal_draws,
-        dtype=dtype)
+        random_type=random_type, seed=seed, normal_draws=normal_draws)
   else:
     # Use custom for_loop if `watch_params` is specified
-    return _for_loop(
+    paths = _for_loop(
         batch_shape=batch_shape, steps_num=steps_num,
         current_state=current_state,
         drift_fn=drift_fn, volatility_fn=volatility_fn, wiener_mean=wiener_mean,
@@ -400,27 +591,118 @@ def _sample(*,
         dt=dt, sqrt_dt=sqrt_dt, time_indices=time_indices,
         keep_mask=keep_mask, watch_params=watch_params,
         random_type=random_type, seed=seed, normal_draws=normal_draws)
+    if record_time_indices is not None:
+      paths = tf.gather(paths, record_time_indices, axis=-2)
+    return record_fn(paths)
+
+
+def _reduce_paths(*, dim, drift_fn, volatility_fn, times, keep_mask,
+                  num_requested_times, num_samples, block_size, initial_state,
+                  batch_shape, random_type, seed, swap_memory, skip,
+                  precompute_normal_draws, normal_draws, path_construction,
+                  path_reducer, dtype):
+  """Returns the statistics of the reduced paths generated in blocks."""
+  dt = times[1:] - times[:-1]
+  sqrt_dt = tf.sqrt(dt)
+  steps_num = tff_utils.get_shape(dt)[-1]
+  precompute = normal_draws is None and (
+      precompute_normal_draws or random_type in (
+          random.RandomType.SOBOL,
+          random.RandomType.HALTON,
+          random.RandomType.HALTON_RANDOMIZED,
+          random.RandomType.STATELESS,
+          random.RandomType.STATELESS_ANTITHETIC))
+  # Shape batch_shape + [block_size, dim]
+  block_initial_state = initial_state + tf.zeros([block_size, dim],
+                                                 dtype=dtype)
+  sample_axis = block_initial_state.shape.rank - 2
+
+  def block_values(block, block_seed):
+    """Returns the per-path values of a block of paths."""
+    wiener_mean = None
+    draws = normal_draws
+    if precompute:
+      # Only the draws of the current block are stored.
+      draws = utils.generate_mc_normal_draws(
+          num_normal_draws=dim, num_time_steps=steps_num,
+          num_sample_paths=block_size, batch_shape=batch_shape,
+          random_type=random_type, dtype=dtype, seed=block_seed,
+          skip=skip + block * block_size,
+          path_construction=path_construction, time_step_sizes=dt)
+    elif normal_draws is None:
+      wiener_mean = tf.zeros((dim,), dtype=dtype, name='wiener_mean')
+    accumulator = path_reducers.update(
+        path_reducer, path_reducer.initial_fn(block_initial_state),
+        keep_mask[0], times[0], block_initial_state)
+    written_count = tf.cast(keep_mask[0], dtype=tf.int32)
+
+    def cond_fn(i, written_count, *args):
+      del args
+      return tf.math.logical_and(i < steps_num,
+                                 written_count < num_requested_times)
+
+    def step_fn(i, written_count, current_state, accumulator):
+      next_i, written_count, next_state, _ = _euler_step(
+          i=i,
+          written_count=written_count,
+          current_state=current_state,
+          result=current_state,
+          drift_fn=drift_fn,
+          volatility_fn=volatility_fn,
+          wiener_mean=wiener_mean,
+          num_samples=block_size,
+          times=times,
+          dt=dt,
+          sqrt_dt=sqrt_dt,
+          keep_mask=keep_mask,
+          random_type=random_type,
+          seed=block_seed,
+          normal_draws=draws,
+          record_fn=None,
+          record_slots=None,
+          record_samples=False)
+      accumulator = path_reducers.update(
+          path_reducer, accumulator, keep_mask[i + 1], times[i + 1],
+          next_state)
+      return next_i, written_count, next_state, accumulator
+
+    _, _, _, accumulator = tf.while_loop(
+        cond_fn, step_fn,
+        (0, written_count, block_initial_state, accumulator),
+        maximum_iterations=steps_num,
+        swap_memory=swap_memory)
+    return path_reducer.result_fn(accumulator)
+
+  return path_reducers.reduce_in_blocks(
+      block_values, num_blocks=num_samples // block_size,
+      sample_axis=sample_axis, random_type=random_type, seed=seed,
+      swap_memory=swap_memory)
 
 
 def _while_loop(*, steps_num, current_state,
                 drift_fn, volatility_fn, wiener_mean,
                 num_samples, times, dt, sqrt_dt, num_requested_times,
-                keep_mask, swap_memory, random_type, seed, normal_draws, dtype):
+                record_fn, record_slots, num_recorded_times,
+                keep_mask, swap_memory, random_type, seed, normal_draws):
   """Sample paths using tf.while_loop."""
   written_count = 0
-  if isinstance(num_requested_times, int) and num_requested_times == 1:
+  if (record_slots is None and isinstance(num_requested_times, int)
+      and num_requested_times == 1):
     record_samples = False
     result = current_state
   else:
     # If more than one sample has to be recorded, create a TensorArray
     record_samples = True
-    element_shape = current_state.shape
-    result = tf.TensorArray(dtype=dtype,
-                            size=num_requested_times,
-                            element_shape=element_shape,
+    initial_record = record_fn(current_state)
+    # The states after the last recorded time are written to an extra slot
+    size = (num_recorded_times if record_slots is None
+            else num_recorded_times + 1)
+    result = tf.TensorArray(dtype=initial_record.dtype,
+                            size=size,
+                            element_shape=initial_record.shape,
                             clear_after_read=False)
     # Include initial state, if necessary
-    result = result.write(written_count, current_state)
+    result = result.write(written_count, initial_record)
   written_count += tf.cast(keep_mask[0], dtype=tf.int32)
   # Define sampling while_loop body function
   def cond_fn(i, written_count, *args):
@@ -447,6 +729,8 @@ def _while_loop(*, steps_num, current_state,
         random_type=random_type,
         seed=seed,
         normal_draws=normal_draws,
+        record_fn=record_fn,
+        record_slots=record_slots,
         record_samples=record_samples)
   # Sample paths
   _, _, _, result = tf.while_loop(
@@ -455,9 +739,11 @@ def _while_loop(*, steps_num, current_state,
       swap_memory=swap_memory)
   if not record_samples:
     # shape batch_shape + [num_samples, 1, dim]
-    return tf.expand_dims(result, axis=-2)
+    return tf.expand_dims(record_fn(result), axis=-2)
   # Shape [num_time_points] + batch_shape + [num_samples, dim]
   result = result.stack()
+  if record_slots is not None:
+    result = result[:num_recorded_times]
   # transpose to shape batch_shape + [num_samples, num_time_points, dim]
   n = result.shape.rank
   perm = list(range(1, n-1)) + [0, n - 1]
@@ -494,6 +780,8 @@ def _for_loop(*, batch_shape, steps_num, current_state,
         random_type=random_type,
         seed=seed,
         normal_draws=normal_draws,
+        record_fn=None,
+        record_slots=None,
         record_samples=False)
     return [next_state]
   result = custom_loops.for_loop(
@@ -514,7 +802,7 @@ def _euler_step(*, i, written_count, current_state,
                 drift_fn, volatility_fn, wiener_mean,
                 num_samples, times, dt, sqrt_dt, keep_mask,
                 random_type, seed, normal_draws, result,
-                record_samples):
+                record_fn, record_slots, record_samples):
   """Performs one step of Euler scheme."""
   current_time = times[i + 1]
   written_count = tf.cast(written_count, tf.int32)
@@ -529,7 +817,8 @@ def _euler_step(*, i, written_count, current_state,
   dw_inc = tf.linalg.matvec(volatility_fn(current_time, current_state), dw)  # pylint: disable=not-callable
   next_state = current_state + dt_inc + dw_inc
   if record_samples:
-    result = result.write(written_count, next_state)
+    write_index = written_count if record_slots is None else record_slots[i + 1]
+    result = result.write(write_index, record_fn(next_state))
   else:
     result = next_state
   written_count += tf.cast(keep_mask[i + 1], dtype=tf.int32)
@@ -481,6 +481,231 @@ class EulerSamplingTest(tf.test.TestCase, parameterized.TestCase):
     # estimate with the `PSEUDO` random type
     self.assertAllClose(means, expected_means, rtol=5e-3, atol=5e-3)
 
+  @parameterized.named_parameters(
+      {
+          'testcase_name': 'BrownianBridge',
+          'path_construction': tff.models.PathConstruction.BROWNIAN_BRIDGE,
+      }, {
+          'testcase_name': 'PCA',
+          'path_construction': tff.models.PathConstruction.PCA,
+      })
+  def test_sobol_path_construction(self, path_construction):
+    """Estimates the variance of the average of a Brownian motion."""
+    dtype = np.float64
+    num_time_steps = 32
+    times = np.linspace(1.0 / num_time_steps, 1.0, num_time_steps)
+    expected_variance = np.mean(np.minimum.outer(times, times))
+    def estimate_variance(path_construction):
+      paths = euler_sampling.sample(
+          dim=1,
+          drift_fn=lambda t, x: tf.zeros_like(x),
+          volatility_fn=lambda t, x: tf.ones([1, 1], dtype=dtype),
+          times=times,
+          num_samples=1024,
+          num_time_steps=num_time_steps,
+          random_type=tff.math.random.RandomType.SOBOL,
+          path_construction=path_construction,
+          dtype=dtype)
+      averages = tf.math.reduce_mean(paths[..., 0], axis=-1)
+      return tf.math.reduce_mean(averages**2)
+    incremental_variance, variance = self.evaluate(
+        [estimate_variance(None), estimate_variance(path_construction)])
+    # The error is reduced by more than a factor 4 compared to the incremental
+    # construction.
+    self.assertLess(np.abs(variance - expected_variance),
+                    0.25 * np.abs(incremental_variance - expected_variance))
+
+  @parameterized.named_parameters(
+      {
+          'testcase_name': 'TerminalValue',
+          'reducer': tff.models.path_reducers.terminal_value,
+          'reduce_fn': lambda paths: paths[..., -1, :],
+      }, {
+          'testcase_name': 'PathAverage',
+          'reducer': tff.models.path_reducers.path_average,
+          'reduce_fn': lambda paths: np.mean(paths, axis=-2),
+      }, {
+          'testcase_name': 'PathMaximum',
+          'reducer': tff.models.path_reducers.path_maximum,
+          'reduce_fn': lambda paths: np.max(paths, axis=-2),
+      }, {
+          'testcase_name': 'PathMinimum',
+          'reducer': tff.models.path_reducers.path_minimum,
+          'reduce_fn': lambda paths: np.min(paths, axis=-2),
+      })
+  def test_path_reducer(self, reducer, reduce_fn):
+    """Reduced statistics match the statistics of the sampled paths."""
+    dtype = tf.float64
+    mu = np.array([0.2, 0.7])
+    s = np.array([[0.3, 0.1], [0.1, 0.3]])
+    def drift_fn(t, x):
+      return mu * tf.sqrt(t) * tf.ones_like(x)
+    def vol_fn(t, x):
+      del t
+      return s * tf.ones_like(x)[..., tf.newaxis]
+    kwargs = dict(
+        dim=2, drift_fn=drift_fn, volatility_fn=vol_fn,
+        times=[0.0, 0.3, 0.5, 1.0], num_samples=256, initial_state=[0.1, -1.1],
+        num_time_steps=10, random_type=tff.math.random.RandomType.SOBOL,
+        dtype=dtype)
+    paths = self.evaluate(euler_sampling.sample(**kwargs))
+    statistics = self.evaluate(euler_sampling.sample(
+        path_reducer=reducer(payoff_fn=lambda x: x**2), block_size=64,
+        **kwargs))
+    values = reduce_fn(paths)**2
+    with self.subTest('Mean'):
+      self.assertAllClose(statistics.mean, np.mean(values, axis=0))
+    with self.subTest('Variance'):
+      self.assertAllClose(statistics.variance,
+                          np.var(values, axis=0, ddof=1))
+    with self.subTest('NumSamples'):
+      self.assertEqual(statistics.num_samples, 256)
+
+  @parameterized.named_parameters(
+      ('Stateless', tff.math.random.RandomType.STATELESS, [1, 2], True),
+      ('Pseudo', tff.math.random.RandomType.PSEUDO, 42, False))
+  def test_path_reducer_blocks(self, random_type, seed,
+                               precompute_normal_draws):
+    """Streaming estimate of the running maximum of a Brownian motion."""
+    dtype = tf.float64
+    num_samples = 8000
+    statistics = euler_sampling.sample(
+        dim=1,
+        drift_fn=lambda t, x: tf.zeros_like(x),
+        volatility_fn=lambda t, x: tf.ones_like(x)[..., tf.newaxis],
+        times=np.linspace(0.01, 1.0, 100),
+        num_samples=num_samples,
+        num_time_steps=100,
+        random_type=random_type,
+        seed=seed,
+        precompute_normal_draws=precompute_normal_draws,
+        path_reducer=tff.models.path_reducers.path_maximum(
+            payoff_fn=lambda x: x[..., 0]),
+        block_size=2000,
+        dtype=dtype)
+    mean, standard_error = self.evaluate(
+        [statistics.mean, statistics.standard_error()])
+    # Expected maximum of the Brownian motion monitored at 100 dates, see
+    # Broadie, Glasserman and Kou (1997).
+    expected_mean = (np.sqrt(2 / np.pi)
+                     - 0.5826 * np.sqrt(0.01))
+    self.assertAllClose(mean, expected_mean, atol=4 * standard_error)
+
+  @parameterized.named_parameters(
+      ('Pseudo', tff.math.random.RandomType.PSEUDO, 7, True),
+      ('PseudoNotPrecomputed', tff.math.random.RandomType.PSEUDO, 7, False),
+      ('Stateless', tff.math.random.RandomType.STATELESS, [1, 2], True))
+  def test_path_reducer_blocks_are_distinct(self, random_type, seed,
+                                            precompute_normal_draws):
+    """Blocks of paths generated under `tf.function` use distinct draws."""
+    dtype = tf.float64
+    block_size = 500
+
+    @tf.function
+    def block_means(num_blocks):
+      statistics = euler_sampling.sample(
+          dim=1,
+          drift_fn=lambda t, x: tf.zeros_like(x),
+          volatility_fn=lambda t, x: tf.ones_like(x)[..., tf.newaxis],
+          times=[1.0],
+          num_samples=num_blocks * block_size,
+          num_time_steps=2,
+          random_type=random_type,
+          seed=seed,
+          precompute_normal_draws=precompute_normal_draws,
+          path_reducer=tff.models.path_reducers.terminal_value(
+              payoff_fn=lambda x: x[..., 0]),
+          block_size=block_size,
+          dtype=dtype)
+      return statistics.mean, statistics.variance
+
+    mean_1, variance_1 = self.evaluate(block_means(1))
+    mean_2, variance_2 = self.evaluate(block_means(2))
+    with self.subTest('Mean'):
+      self.assertNotAllClose(mean_1, mean_2, rtol=0, atol=1e-6)
+    with self.subTest('Variance'):
+      # If the second block repeated the first one, the variance would only be
+      # rescaled by `(n - 1) n / (2n - 1) n`.
+      self.assertNotAllClose(variance_1 * 999 / 1998, variance_2,
+                             rtol=0, atol=1e-6)
+
+  @parameterized.named_parameters(
+      ('Sobol', tff.math.random.RandomType.SOBOL, None),
+      ('HaltonRandomized', tff.math.random.RandomType.HALTON_RANDOMIZED, 42))
+  def test_path_reducer_block_size_invariance(self, random_type, seed):
+    """Quasi-random blocks are consecutive parts of the same sequence."""
+    dtype = tf.float64
+    means = []
+    for block_size in [64, 32, 16]:
+      statistics = euler_sampling.sample(
+          dim=1,
+          drift_fn=lambda t, x: tf.zeros_like(x),
+          volatility_fn=lambda t, x: tf.ones_like(x)[..., tf.newaxis],
+          times=[1.0],
+          num_samples=64,
+          num_time_steps=2,
+          random_type=random_type,
+          seed=seed,
+          path_reducer=tff.models.path_reducers.terminal_value(
+              payoff_fn=lambda x: x[..., 0]),
+          block_size=block_size,
+          dtype=dtype)
+      means.append(self.evaluate(statistics.mean))
+    self.assertAllClose(means[1], means[0], rtol=1e-10, atol=1e-10)
+    self.assertAllClose(means[2], means[0], rtol=1e-10, atol=1e-10)
+
+  @parameterized.named_parameters(
+      ('Components', [1], None, None, False),
+      ('TimeIndices', None, [1, 3], None, False),
+      ('LastTimeIndex', None, [0, 2], None, False),
+      ('SingleTimeIndex', None, [2], None, False),
+      ('Float32', [0], [1, 2, 3], tf.float32, False),
+      ('WatchParams', [1], [1, 3], tf.float32, True))
+  def test_record(self, record_components, record_time_indices, record_dtype,
+                  use_watch_params):
+    """Recorded states are the selected parts of the full paths."""
+    dtype = tf.float64
+    mu = tf.constant([0.2, 0.7], dtype=dtype)
+    s = np.array([[0.3, 0.1], [0.1, 0.3]])
+    def drift_fn(t, x):
+      return mu * tf.sqrt(t) * tf.ones_like(x)
+    def vol_fn(t, x):
+      del t
+      return s * tf.ones_like(x)[..., tf.newaxis]
+    kwargs = dict(
+        dim=2, drift_fn=drift_fn, volatility_fn=vol_fn,
+        times=[0.0, 0.3, 0.5, 1.0], num_samples=100, initial_state=[0.1, -1.1],
+        num_time_steps=10, random_type=tff.math.random.RandomType.STATELESS,
+        seed=[1, 2], watch_params=[mu] if use_watch_params else None,
+        dtype=dtype)
+    paths = self.evaluate(euler_sampling.sample(**kwargs))
+    recorded = euler_sampling.sample(
+        record_components=record_components,
+        record_time_indices=record_time_indices,
+        record_dtype=record_dtype, **kwargs)
+    with self.subTest('Dtype'):
+      self.assertEqual(recorded.dtype, record_dtype or dtype)
+    if record_time_indices is not None:
+      paths = paths[:, record_time_indices, :]
+    if record_components is not None:
+      paths = paths[..., record_components]
+    with self.subTest('Values'):
+      self.assertAllClose(self.evaluate(recorded), paths, rtol=1e-6, atol=1e-6)
+
+  def test_path_reducer_indivisible_block_size(self):
+    """Error is raised if the number of samples is not divisible."""
+    with self.assertRaises(ValueError):
+      euler_sampling.sample(
+          dim=1,
+          drift_fn=lambda t, x: tf.zeros_like(x),
+          volatility_fn=lambda t, x: tf.ones_like(x)[..., tf.newaxis],
+          times=[1.0],
+          num_samples=100,
+          num_time_steps=10,
+          path_reducer=tff.models.path_reducers.terminal_value(),
+          block_size=30,
+          dtype=tf.float64)
+
   def test_sample_paths_dtypes(self):
     """Sampled paths have the expected dtypes."""
     for dtype in [np.float32, np.float64]:
@@ -0,0 +1,204 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Exact sampling of Ito processes with Gaussian transitions."""
+
+from typing import Callable, Optional, Tuple
+
+import tensorflow.compat.v2 as tf
+
+from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
+from tf_quant_finance.math import random
+from tf_quant_finance.models import utils
+
+
+def sample(
+    dim: int,
+    transition_fn: Callable[..., Tuple[types.RealTensor, types.RealTensor]],
+    times: types.RealTensor,
+    num_samples: types.IntTensor = 1,
+    initial_state: Optional[types.RealTensor] = None,
+    random_type: Optional[random.RandomType] = None,
+    seed: Optional[types.IntTensor] = None,
+    swap_memory: bool = True,
+    skip: types.IntTensor = 0,
+    normal_draws: Optional[types.RealTensor] = None,
+    dtype: Optional[tf.DType] = None,
+    name: Optional[str] = None) -> types.RealTensor:
+  """Returns sample paths of a process from its exact Gaussian transitions.
+
+  For an Ito process whose transitions are Gaussian,
+
+  ```None
+    X_t | X_s ~ N(m(s, t, X_s), C(s, t, X_s))
+  ```
+
+  the paths are sampled exactly at `times` as
+
+  ```None
+    X_{t_{n+1}} = m(t_n, t_{n+1}, X_{t_n}) + L_n Z_n,
+    X_{t_0} = x0
+  ```
+
+  where `t_0 = 0`, `L_n` is the Cholesky factor of `C(t_n, t_{n+1}, X_{t_n})`
+  and `Z_n` are independent standard normal vectors. One step is performed
+  between consecutive `times`, irrespective of their distance.
+
+  #### Example
+  Sampling from the 1-dimensional Ornstein-Uhlenbeck process
+
+  ```None
+    dX = theta (mu - X) dt + sigma dW
+  ```
+
+  ```python
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  theta, mu, sigma = 0.5, 0.02, 0.01
+  dtype = tf.float64
+
+  def transition_fn(s, t, x):
+    decay = tf.math.exp(-theta * (t - s))
+    mean = mu + (x - mu) * decay
+    variance = sigma**2 * (1 - decay**2) / (2 * theta)
+    return mean, variance[..., tf.newaxis, tf.newaxis]
+
+  paths = tff.models.exact_sampling.sample(
+      dim=1,
+      transition_fn=transition_fn,
+      times=[1.0, 5.0, 10.0],
+      num_samples=10000,
+      initial_state=[0.03],
+      random_type=tff.math.random.RandomType.STATELESS,
+      seed=[1, 2],
+      dtype=dtype)
+  # Expected: paths.shape = [10000, 3, 1]
+  ```
+
+  Args:
+    dim: Python int greater than or equal to 1. The dimension of the Ito
+      Process.
+    transition_fn: A Python callable which accepts the scalar start and end
+      times `s <= t` of a step and the value of the process `X_s` of shape
+      `batch_shape + [num_samples, dim]` and returns a tuple `(mean,
+      covariance)` of the conditional mean of `X_t` of shape
+      `batch_shape + [num_samples, dim]` and of its conditional covariance of
+      shape broadcastable to `batch_shape + [num_samples, dim, dim]`. The
+      covariance should be positive definite for `s < t`. See
+      `ItoProcess.transition_fn`.
+    times: Rank 1 `Tensor` of increasing non-negative real values. The times at
+      which the path points are to be evaluated.
+    num_samples: Positive scalar `int`. The number of paths to draw.
+      Default value: 1.
+    initial_state: `Tensor` of shape broadcastable with
+      `batch_shape + [num_samples, dim]`. The initial state of the process at
+      time zero. `batch_shape` represents the shape of the independent batches
+      of the stochastic process and is inferred from the `initial_state`.
+      Default value: None which maps to a zero initial state.
+    random_type: Enum value of `RandomType`. The type of (quasi)-random
+      number generator to use to generate the paths.
+      Default value: None which maps to the standard pseudo-random numbers.
+    seed: Seed for the random number generator. The seed is
+      only relevant if `random_type` is one of
+      `[STATELESS, PSEUDO, HALTON_RANDOMIZED, PSEUDO_ANTITHETIC,
+        STATELESS_ANTITHETIC]`. For `PSEUDO`, `PSEUDO_ANTITHETIC` and
+      `HALTON_RANDOMIZED` the seed should be a Python integer. For
+      `STATELESS` and  `STATELESS_ANTITHETIC `must be supplied as an integer
+      `Tensor` of shape `[2]`.
+      Default value: `None` which means no seed is set.
+    swap_memory: A Python bool. Whether GPU-CPU memory swap is enabled for this
+      op. See an equivalent flag in `tf.while_loop` documentation for more
+      details.
+      Default value: True.
+    skip: `int32` 0-d `Tensor`. The number of initial points of the Sobol or
+      Halton sequence to skip. Used only when `random_type` is 'SOBOL',
+      'HALTON', or 'HALTON_RANDOMIZED', otherwise ignored.
+      Default value: `0`.
+    normal_draws: A `Tensor` of shape broadcastable with
+      `batch_shape + [num_samples, num_times, dim]` and the same `dtype` as
+      `times`, where `num_times` is the size of `times`. The standard normal
+      draws `Z_n`. When supplied, `num_samples` argument is ignored and the
+      first dimensions of `normal_draws` is used instead.
+      Default value: `None` which means that the draws are generated by the
+      algorithm.
+    dtype: `tf.Dtype`. If supplied the dtype for the input and output `Tensor`s.
+      Default value: None which means that the dtype implied by `times` is
+      used.
+    name: Python string. The name to give this op.
+      Default value: `None` which maps to `exact_sample`.
+
+  Returns:
+   A real `Tensor` of shape batch_shape + [num_samples, k, n] where `k`
+     is the size of the `times`, `n` is the dimension of the process.
+
+  Raises:
+    ValueError: If `normal_draws` is supplied and `dim` is mismatched.
+  """
+  with tf.name_scope(name or 'exact_sample'):
+    times = tf.convert_to_tensor(times, dtype=dtype, name='times')
+    dtype = times.dtype
+    if initial_state is None:
+      initial_state = tf.zeros(dim, dtype=dtype)
+    initial_state = tf.convert_to_tensor(initial_state, dtype=dtype,
+                                         name='initial_state')
+    batch_shape = tff_utils.get_shape(initial_state)[:-2]
+    num_times = tff_utils.get_shape(times)[0]
+    start_times = tf.concat([tf.zeros([1], dtype=dtype), times[:-1]], axis=0)
+    if normal_draws is None:
+      # Shape [num_times] + batch_shape + [num_samples, dim]
+      normal_draws = utils.generate_mc_normal_draws(
+          num_normal_draws=dim, num_time_steps=num_times,
+          num_sample_paths=num_samples, batch_shape=batch_shape,
+          random_type=random_type, dtype=dtype, seed=seed, skip=skip)
+    else:
+      normal_draws = tf.convert_to_tensor(normal_draws, dtype=dtype,
+                                          name='normal_draws')
+      if normal_draws.shape[-1] != dim:
+        raise ValueError(
+            '`dim` should be equal to `normal_draws.shape[-1]` but are '
+            '{0} and {1} respectively'.format(dim, normal_draws.shape[-1]))
+      # Shape [num_times] + batch_shape + [num_samples, dim]
+      rank = normal_draws.shape.rank
+      normal_draws = tf.transpose(
+          normal_draws, [rank - 2] + list(range(rank - 2)) + [rank - 1])
+      num_samples = tf.shape(normal_draws)[-2]
+    current_state = initial_state + tf.zeros([num_samples, dim], dtype=dtype)
+    identity = tf.eye(dim, dtype=dtype)
+
+    def step_fn(i, current_state, result):
+      is_step = times[i] > start_times[i]
+      mean, covariance = transition_fn(start_times[i], times[i], current_state)
+      # The covariance vanishes for a zero step, e.g., if `times[0] = 0`.
+      scale = tf.linalg.cholesky(tf.where(is_step, covariance, identity))
+      next_state = mean + tf.where(
+          is_step, tf.linalg.matvec(scale, normal_draws[i]), 0)
+      return i + 1, next_state, result.write(i, next_state)
+
+    result = tf.TensorArray(dtype=dtype,
+                            size=num_times,
+                            element_shape=current_state.shape)
+    _, _, result = tf.while_loop(
+        lambda i, *args: i < num_times, step_fn, (0, current_state, result),
+        maximum_iterations=num_times,
+        swap_memory=swap_memory)
+    # Shape [num_times] + batch_shape + [num_samples, dim]
+    result = result.stack()
+    # Transpose to shape batch_shape + [num_samples, num_times, dim]
+    n = result.shape.rank
+    perm = list(range(1, n - 1)) + [0, n - 1]
+    return tf.transpose(result, perm)
+
+
+__all__ = ['sample']
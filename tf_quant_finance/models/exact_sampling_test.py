@@ -0,0 +1,108 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for methods in `exact_sampling`."""
+
+from absl.testing import parameterized
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
+
+exact_sampling = tff.models.exact_sampling
+
+
+def _ornstein_uhlenbeck_transition_fn(theta, mu, sigma):
+  """Transitions of `dX_i = theta_i (mu_i - X_i) dt + sigma_ij dW_j`."""
+  covariance_rate = np.matmul(sigma, sigma.T)
+  theta_sum = theta[:, np.newaxis] + theta[np.newaxis, :]
+
+  def transition_fn(s, t, x):
+    decay = tf.math.exp(-theta * (t - s))
+    mean = mu + (x - mu) * decay
+    covariance = covariance_rate * (
+        1 - tf.math.exp(-theta_sum * (t - s))) / theta_sum
+    return mean, covariance
+  return transition_fn
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class ExactSamplingTest(tf.test.TestCase, parameterized.TestCase):
+
+  @parameterized.named_parameters(
+      ('Stateless', tff.math.random.RandomType.STATELESS_ANTITHETIC, [1, 2],
+       [0.5, 2.0, 10.0]),
+      ('SobolWithZeroTime', tff.math.random.RandomType.SOBOL, None,
+       [0.0, 2.0, 10.0]))
+  def test_ornstein_uhlenbeck_moments(self, random_type, seed, times):
+    """Sample moments match the exact moments of a 2d OU process."""
+    dtype = tf.float64
+    theta = np.array([0.5, 0.1])
+    mu = np.array([0.02, 0.04])
+    sigma = np.array([[0.01, 0.0], [0.005, 0.02]])
+    x0 = np.array([0.03, 0.01])
+    num_samples = 20000
+    paths = self.evaluate(exact_sampling.sample(
+        dim=2,
+        transition_fn=_ornstein_uhlenbeck_transition_fn(theta, mu, sigma),
+        times=times,
+        num_samples=num_samples,
+        initial_state=x0,
+        random_type=random_type,
+        seed=seed,
+        dtype=dtype))
+    times = np.array(times)
+    with self.subTest('Shape'):
+      self.assertEqual(paths.shape, (num_samples, 3, 2))
+    expected_means = mu + (x0 - mu) * np.exp(-theta * times[:, np.newaxis])
+    with self.subTest('Means'):
+      self.assertAllClose(np.mean(paths, axis=0), expected_means,
+                          rtol=0, atol=1e-3)
+    # Covariance of the components at the last time
+    theta_sum = theta[:, np.newaxis] + theta[np.newaxis, :]
+    expected_covariance = np.matmul(sigma, sigma.T) * (
+        1 - np.exp(-theta_sum * times[-1])) / theta_sum
+    with self.subTest('Covariance'):
+      self.assertAllClose(np.cov(paths[:, -1, :], rowvar=False),
+                          expected_covariance, rtol=5e-2, atol=1e-6)
+
+  def test_normal_draws(self):
+    """Supplied draws give the transitions of the exact scheme."""
+    dtype = tf.float64
+    theta = np.array([0.5])
+    mu = np.array([0.02])
+    sigma = np.array([[0.01]])
+    times = np.array([1.0, 3.0])
+    normal_draws = np.random.RandomState(42).normal(size=[2, 100, 2, 1])
+    paths = self.evaluate(exact_sampling.sample(
+        dim=1,
+        transition_fn=_ornstein_uhlenbeck_transition_fn(theta, mu, sigma),
+        times=times,
+        initial_state=[[[0.03]], [[0.01]]],
+        normal_draws=normal_draws,
+        dtype=dtype))
+    expected = np.array([[[0.03]], [[0.01]]])
+    expected_paths = []
+    start_time = 0
+    for i, time in enumerate(times):
+      decay = np.exp(-theta * (time - start_time))
+      stddev = sigma[0] * np.sqrt((1 - decay**2) / (2 * theta))
+      expected = mu + (expected - mu) * decay + stddev * normal_draws[:, :, i]
+      expected_paths.append(expected)
+      start_time = time
+    self.assertAllClose(paths, np.stack(expected_paths, axis=-2))
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -13,21 +13,23 @@
 # limitations under the License.
 """Defines class to describe any Ito processes.
 
-Uses Euler scheme for sampling and ADI scheme for solving the associated
-Feynman-Kac equation.
+Uses Euler scheme (or the exact transitions, when known) for sampling and ADI
+scheme for solving the associated Feynman-Kac equation.
 """
 
 import tensorflow.compat.v2 as tf
 
 from tf_quant_finance.math.pde import fd_solvers
 from tf_quant_finance.models import euler_sampling
+from tf_quant_finance.models import exact_sampling
 from tf_quant_finance.models import ito_process
 
 
 class GenericItoProcess(ito_process.ItoProcess):
   """Generic Ito process defined from a drift and volatility function."""
 
-  def __init__(self, dim, drift_fn, volatility_fn, dtype=None, name=None):
+  def __init__(self, dim, drift_fn, volatility_fn, dtype=None, name=None,
+               transition_fn=None):
     """Initializes the Ito process with given drift and volatility functions.
 
     Represents a general Ito process:
@@ -117,6 +119,12 @@ class GenericItoProcess(ito_process.ItoProcess):
         class are nested.
         Default value: None which maps to the default name
           `generic_ito_process`.
+      transition_fn: An optional Python callable computing the exact Gaussian
+        transitions of the process (see `ItoProcess.transition_fn`). If
+        supplied, `sample_paths` samples the process exactly with one step
+        between consecutive sampling times.
+        Default value: None which means that the process is sampled with the
+          Euler scheme.
 
     Raises:
       ValueError if the dimension is less than 1, or if either `drift_fn`
@@ -129,6 +137,7 @@ class GenericItoProcess(ito_process.ItoProcess):
     self._dim = dim
     self._drift_fn = drift_fn
     self._volatility_fn = volatility_fn
+    self._transition_fn = transition_fn
     self._dtype = dtype
     self._name = name or 'generic_ito_process'
 
@@ -184,6 +193,16 @@ class GenericItoProcess(ito_process.ItoProcess):
     """
     return self._volatility_fn
 
+  def transition_fn(self):
+    """Python callable calculating the exact Gaussian transition of a step.
+
+    See `ItoProcess.transition_fn` for the signature of the callable.
+
+    Returns:
+      The transition callable or `None` if it was not supplied.
+    """
+    return self._transition_fn
+
   def sample_paths(self,
                    times,
                    num_samples=1,
@@ -203,7 +222,11 @@ class GenericItoProcess(ito_process.ItoProcess):
     """Returns a sample of paths from the process using Euler sampling.
 
     The default implementation uses the Euler scheme. However, for particular
-    types of Ito processes more efficient schemes can be used.
+    types of Ito processes more efficient schemes can be used. If the exact
+    transitions of the process are known (see `transition_fn`), the paths are
+    sampled exactly with `models.exact_sampling.sample` and `time_step`,
+    `num_time_steps`, `precompute_normal_draws`, `times_grid`, `watch_params`
+    and `validate_args` are ignored.
 
     Args:
       times: Rank 1 `Tensor` of increasing positive real values. The times at
@@ -269,6 +292,7 @@ class GenericItoProcess(ito_process.ItoProcess):
         shape of the independent batches of the stochastic process. When
         supplied, `num_sample`, `time_step` and `num_time_steps` arguments are
         ignored and the first dimensions of `normal_draws` are used instead.
+        For the exact sampling, `num_time_points` is the size of `times`.
       watch_params: An optional list of zero-dimensional `Tensor`s of the same
         `dtype` as `initial_state`. If provided, specifies `Tensor`s with
         respect to which the differentiation of the sampling function will
@@ -296,6 +320,21 @@ class GenericItoProcess(ito_process.ItoProcess):
     """
     name = name or (self._name + '_sample_path')
     with tf.name_scope(name):
+      transition_fn = self.transition_fn()
+      if transition_fn is not None:
+        return exact_sampling.sample(
+            dim=self._dim,
+            transition_fn=transition_fn,
+            times=times,
+            num_samples=num_samples,
+            initial_state=initial_state,
+            random_type=random_type,
+            seed=seed,
+            swap_memory=swap_memory,
+            skip=skip,
+            normal_draws=normal_draws,
+            dtype=self._dtype,
+            name=name)
       return euler_sampling.sample(
           dim=self._dim,
           drift_fn=self._drift_fn,
@@ -210,6 +210,36 @@ class GenericItoProcessTest(tf.test.TestCase, parameterized.TestCase):
         x0, [2] * batch_rank + [1, 2]) + (2.0 / 3.0) * mu * np.power(times, 1.5)
     self.assertAllClose(means, expected_means, rtol=1e-2, atol=1e-2)
 
+  def test_sample_paths_exact_transitions(self):
+    """Processes with known transitions are sampled without time steps."""
+    dtype = tf.float64
+    theta, mu, sigma = 0.5, 0.02, 0.01
+
+    def drift_fn(t, x):
+      del t
+      return theta * (mu - x)
+
+    def vol_fn(t, x):
+      del t
+      return sigma * tf.ones_like(x)[..., tf.newaxis]
+
+    def transition_fn(s, t, x):
+      decay = tf.math.exp(-theta * (t - s))
+      variance = sigma**2 * (1 - decay**2) / (2 * theta)
+      return mu + (x - mu) * decay, variance[..., tf.newaxis, tf.newaxis]
+
+    process = tff.models.GenericItoProcess(
+        dim=1, drift_fn=drift_fn, volatility_fn=vol_fn,
+        transition_fn=transition_fn, dtype=dtype)
+    times = np.array([1.0, 10.0])
+    kwargs = dict(
+        times=times, num_samples=1000, initial_state=[0.03],
+        random_type=tff.math.random.RandomType.STATELESS, seed=[4, 2])
+    paths = process.sample_paths(**kwargs)
+    expected_paths = tff.models.exact_sampling.sample(
+        dim=1, transition_fn=transition_fn, dtype=dtype, **kwargs)
+    self.assertAllClose(self.evaluate(paths), self.evaluate(expected_paths))
+
   def test_sample_paths_dtypes(self):
     """Sampled paths have the expected dtypes."""
     for dtype in [np.float32, np.float64]:
@@ -17,6 +17,7 @@ import numpy as np
 import tensorflow.compat.v2 as tf
 
 from tf_quant_finance import types
+from tf_quant_finance.math import fourier_pricing
 from tf_quant_finance.math import integration
 
 __all__ = [
@@ -43,6 +44,7 @@ def european_option_price(
     volvol: types.RealTensor,
     rho: types.RealTensor = None,
     integration_method: integration.IntegrationMethod = None,
+    fourier_method: fourier_pricing.FourierPricingMethod = None,
     dtype: tf.DType = None,
     name: str = None,
     **kwargs) -> types.RealTensor:
@@ -143,6 +145,16 @@ def european_option_price(
       `strikes`. The correlation between spot and variance.
     integration_method: An instance of `math.integration.IntegrationMethod`.
       Default value: `None` which maps to the Simpsons integration rule.
+    fourier_method: An optional instance of
+      `math.fourier_pricing.FourierPricingMethod`. If supplied, the prices are
+      computed with the COS or the Carr-Madan FFT method instead of Attari's
+      integral, and `integration_method` is ignored. The characteristic
+      function is evaluated once for each set of model parameters, so that
+      a whole strike grid per expiry (e.g., strikes of shape
+      `[num_expiries, num_strikes]` and parameters of shape
+      `[num_expiries, 1]`) is priced from one evaluation.
+      Default value: `None` which means that Attari's integral is computed
+      with `integration_method`.
     dtype: Optional `tf.DType`. If supplied, the dtype to be used for conversion
       of any supplied non-`Tensor` arguments to `Tensor`.
       Default value: None which maps to the default dtype inferred by
@@ -153,7 +165,8 @@ def european_option_price(
     **kwargs: Additional parameters for the underlying integration method.
       If not supplied and `integration_method` is Simpson, then uses
       `IntegrationMethod.COMPOSITE_SIMPSONS_RULE` with `num_points=1001`, and
-      bounds `lower=1e-9`, `upper=100`.
+      bounds `lower=1e-9`, `upper=100`. If `fourier_method` is supplied, these
+      are passed to `math.fourier_pricing.option_price` instead.
   Returns:
     A `Tensor` of the same shape as the input data which is the price of
     European options under the Heston model.
@@ -221,7 +234,8 @@ def european_option_price(
     variances_real = tf.expand_dims(variances_real, -1)
     if integration_method is None:
       integration_method = _COMPOSITE_SIMPSONS_RULE
-    if integration_method == _COMPOSITE_SIMPSONS_RULE:
+    if (fourier_method is None
+        and integration_method == _COMPOSITE_SIMPSONS_RULE):
       if 'num_points' not in kwargs:
         kwargs['num_points'] = 1001
       if 'lower' not in kwargs:
@@ -229,33 +243,25 @@ def european_option_price(
       if 'upper' not in kwargs:
         kwargs['upper'] = 100
     def char_fun(u):
-      # Using 'second formula' for the (first) characteristic function of
-      # log( spot_T / forwards )
-      # (noted 'phi_2' in 'The Little Heston Trap', (Albrecher))
-      u_real = tf.complex(u, tf.zeros_like(u))
-      u_imag = tf.complex(tf.zeros_like(u), u)
-      s = rho_real * volvol_real * u_imag
-      # TODO(b/156221007): investigate why
-      # s_mean_reversion = (s - mean_reversion_real)**2 leads to a wrong result
-      # in graph mode.
-      s_mean_reversion = ((s - mean_reversion_real) * s
-                          - (s - mean_reversion_real) * mean_reversion_real)
-      d = s_mean_reversion - volvol_real ** 2 * (-u_imag - u_real ** 2)
-      d = tf.math.sqrt(d)
-      g = (mean_reversion_real - s - d) / (mean_reversion_real - s + d)
-      a = mean_reversion_real * theta_real
-      h = g * tf.math.exp(-d * expiries_real)
-      m = 2 * tf.math.log((1 - h) / (1 - g))
-      c = (a / volvol_real ** 2) * ((mean_reversion_real - s - d)
-                                    * expiries_real - m)
-      e = (1 - tf.math.exp(-d * expiries_real))
-      d_new = (mean_reversion_real - s - d) / volvol_real ** 2 * (e / (1 - h))
-      return tf.math.exp(c + d_new * variances_real)
+      return _characteristic_function(
+          u, expiries_real, variances_real, mean_reversion_real, theta_real,
+          volvol_real, rho_real)
+
+    if fourier_method is not None:
+      return fourier_pricing.option_price(
+          characteristic_fn=char_fun,
+          strikes=strikes,
+          forwards=forwards,
+          discount_factors=discount_factors,
+          is_call_options=is_call_options,
+          method=fourier_method,
+          dtype=dtype,
+          **kwargs)
 
     def integrand_function(u, k):
       # Note that with [2], integrand is in 1 / u**2,
       # which converges faster than Heston 1993 (which is in 1 /u)
-      char_fun_complex = char_fun(u)
+      char_fun_complex = char_fun(tf.complex(u, tf.zeros_like(u)))
       char_fun_real_part = tf.math.real(char_fun_complex)
       char_fun_imag_part = tf.math.imag(char_fun_complex)
 
@@ -286,3 +292,28 @@ def european_option_price(
           undiscounted_call_prices,
           undiscounted_put_prices)
       return undiscount_prices * discount_factors
+
+
+def _characteristic_function(u, expiries, variances, mean_reversion, theta,
+                             volvol, rho):
+  """Characteristic function of `log(spot_T / forwards)` at complex `u`."""
+  # Using 'second formula' for the (first) characteristic function of
+  # log( spot_T / forwards )
+  # (noted 'phi_2' in 'The Little Heston Trap', (Albrecher))
+  u_imag = 1j * u
+  s = rho * volvol * u_imag
+  # TODO(b/156221007): investigate why
+  # s_mean_reversion = (s - mean_reversion)**2 leads to a wrong result
+  # in graph mode.
+  s_mean_reversion = ((s - mean_reversion) * s
+                      - (s - mean_reversion) * mean_reversion)
+  d = s_mean_reversion - volvol ** 2 * (-u_imag - u ** 2)
+  d = tf.math.sqrt(d)
+  g = (mean_reversion - s - d) / (mean_reversion - s + d)
+  a = mean_reversion * theta
+  h = g * tf.math.exp(-d * expiries)
+  m = 2 * tf.math.log((1 - h) / (1 - g))
+  c = (a / volvol ** 2) * ((mean_reversion - s - d) * expiries - m)
+  e = (1 - tf.math.exp(-d * expiries))
+  d_new = (mean_reversion - s - d) / volvol ** 2 * (e / (1 - h))
+  return tf.math.exp(c + d_new * variances)
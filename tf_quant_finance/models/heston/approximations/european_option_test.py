@@ -104,5 +104,46 @@ class HestonPriceTest(parameterized.TestCase, tf.test.TestCase):
         tff_prices,
         scipy_prices, rtol=1e-5, atol=1e-5)
 
+  @parameterized.named_parameters(
+      {
+          'testcase_name': 'Cos',
+          'fourier_method': tff.math.fourier_pricing.FourierPricingMethod.COS,
+          'tolerance': 1e-6,
+      },
+      {
+          'testcase_name': 'CarrMadan',
+          'fourier_method':
+              tff.math.fourier_pricing.FourierPricingMethod.CARR_MADAN,
+          'tolerance': 1e-3,
+      })
+  def test_heston_price_fourier_methods(self, fourier_method, tolerance):
+    """Strike grids per expiry priced from one characteristic function call."""
+    dtype = np.float64
+    # Shape [num_expiries, 1]
+    expiries = np.array([[0.5], [1.0], [2.0]], dtype=dtype)
+    discount_factors = np.exp(-0.02 * expiries)
+    # Shape [num_expiries, num_strikes]
+    strikes = np.array([[80.0, 90.0, 100.0, 110.0, 120.0]] * 3, dtype=dtype)
+    is_call_options = strikes >= 100.0
+    params = dict(
+        variances=0.04,
+        mean_reversion=1.5,
+        theta=0.06,
+        volvol=0.5,
+        rho=-0.7,
+        strikes=strikes,
+        expiries=expiries,
+        forwards=100.0,
+        discount_factors=discount_factors,
+        is_call_options=is_call_options,
+        dtype=dtype)
+    expected = tff.models.heston.approximations.european_option_price(
+        **params)
+    prices = tff.models.heston.approximations.european_option_price(
+        fourier_method=fourier_method, **params)
+    expected, prices = self.evaluate([expected, prices])
+    self.assertEqual(prices.shape, (3, 5))
+    self.assertAllClose(prices, expected, rtol=tolerance, atol=tolerance)
+
 if __name__ == '__main__':
   tf.test.main()
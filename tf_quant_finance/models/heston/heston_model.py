@@ -24,6 +24,7 @@ from tf_quant_finance import utils as tff_utils
 from tf_quant_finance.math import piecewise
 from tf_quant_finance.math import random_ops as random
 from tf_quant_finance.models import generic_ito_process
+from tf_quant_finance.models import path_reducers
 from tf_quant_finance.models import utils
 
 __all__ = [
@@ -187,13 +188,51 @@ class HestonModel(generic_ito_process.GenericItoProcess):
                    precompute_normal_draws: types.BoolTensor = True,
                    times_grid: Optional[types.RealTensor] = None,
                    normal_draws: Optional[types.RealTensor] = None,
-                   name: Optional[str] = None) -> types.RealTensor:
+                   martingale_correction: bool = False,
+                   path_reducer: Optional[path_reducers.PathReducer] = None,
+                   block_size: Optional[int] = None,
+                   name: Optional[str] = None
+                   ) -> Union[types.RealTensor,
+                              path_reducers.MonteCarloStatistics]:
     """Returns a sample of paths from the process.
 
     Using Quadratic-Exponential (QE) method described in [1] generates samples
     paths started at time zero and returns paths values at the specified time
     points.
 
+    With `martingale_correction=True` the QE-M variant of the scheme is used
+    (see Section 4.2 of [1]): the drift of the log-spot is adjusted at every
+    step so that the simulated spot `exp(X(t))` is an exact martingale, which
+    removes the bias of the forward and of the option prices for large time
+    steps.
+
+    When only an expectation over the paths is needed (e.g., the price of a
+    European or of a forward start option), a `path_reducer` folds the states
+    of each path at `times` into per-path values as the paths are generated and
+    only the statistics of these values are returned. The paths are never
+    stored and the samples are generated in blocks of `block_size` paths, so
+    that the memory does not grow with `num_samples` or with the number of
+    time steps.
+
+    ```python
+    # Undiscounted price of an at-the-money call with 10^6 paths simulated in
+    # blocks of 10^5 paths with daily steps
+    heston = tff.models.HestonModel(
+        mean_reversion=0.5, theta=0.04, volvol=1.0, rho=-0.9, dtype=tf.float64)
+    statistics = heston.sample_paths(
+        times=[1.0],
+        initial_state=[0.0, 0.04],
+        time_step=1 / 365,
+        num_samples=1000000,
+        random_type=tff.math.random.RandomType.STATELESS_ANTITHETIC,
+        seed=[1, 2],
+        martingale_correction=True,
+        path_reducer=tff.models.path_reducers.terminal_value(
+            payoff_fn=lambda x: tf.nn.relu(tf.math.exp(x[..., 0]) - 1.0)),
+        block_size=100000)
+    # statistics.mean is the estimate of the price
+    ```
+
     Args:
       times: Rank 1 `Tensor` of positive real values. The times at which the
         path points are to be evaluated.
@@ -245,6 +284,23 @@ class HestonModel(generic_ito_process.GenericItoProcess):
         Default value: `None` which means that the draws are generated by the
         algorithm. By default normal_draws for each model in the batch are
         independent.
+      martingale_correction: Python `bool`. Whether to use the martingale
+        corrected QE-M scheme.
+        Default value: `False`.
+      path_reducer: An optional instance of `tff.models.path_reducers.
+        PathReducer`. If supplied, the states of the paths at `times`, `Tensor`s
+        of shape `[num_samples, 2]`, are reduced to per-path values as the paths
+        are generated and the statistics of these values are returned instead
+        of the paths.
+        Default value: `None` which means that the paths are returned.
+      block_size: An optional positive Python `int`. The number of paths
+        generated at once when `path_reducer` is supplied. `num_samples` should
+        be divisible by `block_size`. For the `SOBOL` and `HALTON` random types
+        the blocks are consecutive parts of the same sequence and for the
+        `STATELESS` random types the seed is folded with the index of the
+        block. Ignored if `normal_draws` are supplied.
+        Default value: `None` which means that all the paths are generated in a
+        single block.
       name: Str. The name to give this op.
         Default value: `sample_paths`.
 
@@ -253,9 +309,13 @@ class HestonModel(generic_ito_process.GenericItoProcess):
       of the `times`. For each sample and time the first dimension represents
       the simulated log-state trajectories of the spot price `X(t)`, whereas the
       second one represents the simulated variance trajectories `V(t)`.
+      If `path_reducer` is supplied, an instance of
+      `tff.models.path_reducers.MonteCarloStatistics` of the per-path values
+      instead.
 
     Raises:
-      ValueError: If `time_step` is not supplied.
+      ValueError: If `time_step` is not supplied, or if `num_samples` is not
+        divisible by `block_size`.
 
     #### References:
       [1]: Leif Andersen. Efficient Simulation of the Heston Stochastic
@@ -275,12 +335,8 @@ class HestonModel(generic_ito_process.GenericItoProcess):
         perm = [1, 0, 2]
         normal_draws = tf.transpose(normal_draws, perm=perm)
         num_samples = tff_utils.get_shape(normal_draws)[-2]
-      current_log_spot = (
-          tf.convert_to_tensor(initial_state[..., 0], dtype=self._dtype)
-          + tf.zeros([num_samples], dtype=self._dtype))
-      current_vol = (
-          tf.convert_to_tensor(initial_state[..., 1], dtype=self._dtype)
-          + tf.zeros([num_samples], dtype=self._dtype))
+      initial_state = tf.convert_to_tensor(initial_state, dtype=self._dtype,
+                                           name='initial_state')
       num_requested_times = tff_utils.get_shape(times)[0]
       if times_grid is None:
         if time_step is None:
@@ -306,10 +362,16 @@ class HestonModel(generic_ito_process.GenericItoProcess):
           times, time_step, times.dtype, self._mean_reversion, self._theta,
           self._volvol, self._rho, num_time_steps=num_time_steps,
           times_grid=times_grid)
+      if path_reducer is not None:
+        if normal_draws is not None or block_size is None:
+          block_size = num_samples
+        elif isinstance(num_samples, int) and num_samples % block_size:
+          raise ValueError('`num_samples` should be divisible by `block_size`.'
+                           ' Supplied: {0} and {1}'.format(num_samples,
+                                                           block_size))
       return self._sample_paths(times=times,
                                 num_requested_times=num_requested_times,
-                                current_log_spot=current_log_spot,
-                                current_vol=current_vol,
+                                initial_state=initial_state,
                                 num_samples=num_samples,
                                 random_type=random_type,
                                 keep_mask=keep_mask,
@@ -317,13 +379,15 @@ class HestonModel(generic_ito_process.GenericItoProcess):
                                 skip=skip,
                                 tolerance=tolerance,
                                 precompute_normal_draws=precompute_normal_draws,
-                                normal_draws=normal_draws)
+                                normal_draws=normal_draws,
+                                martingale_correction=martingale_correction,
+                                path_reducer=path_reducer,
+                                block_size=block_size)
 
   def _sample_paths(self,
                     times,
                     num_requested_times,
-                    current_log_spot,
-                    current_vol,
+                    initial_state,
                     num_samples,
                     random_type,
                     keep_mask,
@@ -331,7 +395,10 @@ class HestonModel(generic_ito_process.GenericItoProcess):
                     skip,
                     tolerance,
                     precompute_normal_draws,
-                    normal_draws):
+                    normal_draws,
+                    martingale_correction,
+                    path_reducer,
+                    block_size):
     """Returns a sample of paths from the process."""
     # Note: all the notations below are the same as in [1].
     dt = times[1:] - times[:-1]
@@ -351,22 +418,56 @@ class HestonModel(generic_ito_process.GenericItoProcess):
         raise ValueError('Sobol sequence for Euler sampling is temporarily '
                          'unsupported when `time_step` or `times` have a '
                          'non-constant value')
-
-    if normal_draws is None:
-      if precompute_normal_draws or random_type in (
-          random.RandomType.SOBOL,
-          random.RandomType.HALTON,
-          random.RandomType.HALTON_RANDOMIZED,
-          random.RandomType.STATELESS,
-          random.RandomType.STATELESS_ANTITHETIC):
-        normal_draws = utils.generate_mc_normal_draws(
-            num_normal_draws=2, num_time_steps=steps_num,
-            num_sample_paths=num_samples, random_type=random_type,
-            dtype=self.dtype(), seed=seed, skip=skip)
+    precompute = normal_draws is None and (
+        precompute_normal_draws or random_type in (
+            random.RandomType.SOBOL,
+            random.RandomType.HALTON,
+            random.RandomType.HALTON_RANDOMIZED,
+            random.RandomType.STATELESS,
+            random.RandomType.STATELESS_ANTITHETIC))
+
+    def step_fn(i, current_vol, current_log_spot, draws, num_samples, seed):
+      """Simulates Heston process to the next time point."""
+      time_step = dt[i]
+      if draws is None:
+        normals = random.mv_normal_sample(
+            (num_samples,),
+            mean=tf.zeros([2], dtype=mean_reversion.dtype), seed=seed)
       else:
-        # If pseudo or anthithetic sampling is used, proceed with random
-        # sampling at each step.
-        normal_draws = None
+        normals = draws[i]
+      def _next_state_fn():
+        next_vol, qe_coefficients = _update_variance(
+            mean_reversion[i], theta[i], volvol[i], rho[i],
+            current_vol, time_step, normals[..., 0])
+        next_log_spot = _update_log_spot(
+            mean_reversion[i], theta[i], volvol[i], rho[i],
+            current_vol, next_vol, current_log_spot, time_step,
+            normals[..., 1],
+            qe_coefficients=qe_coefficients if martingale_correction else None)
+        return next_vol, next_log_spot
+      # Do not update state if `time_step > tolerance`
+      return tf.cond(time_step > tolerance,
+                     _next_state_fn,
+                     lambda: (current_vol, current_log_spot))
+
+    if path_reducer is not None:
+      return _reduce_paths(
+          step_fn=step_fn, times=times, keep_mask=keep_mask,
+          steps_num=steps_num, num_requested_times=num_requested_times,
+          initial_state=initial_state, num_samples=num_samples,
+          block_size=block_size, random_type=random_type, seed=seed,
+          skip=skip, precompute=precompute, normal_draws=normal_draws,
+          path_reducer=path_reducer)
+
+    if precompute:
+      normal_draws = utils.generate_mc_normal_draws(
+          num_normal_draws=2, num_time_steps=steps_num,
+          num_sample_paths=num_samples, random_type=random_type,
+          dtype=self.dtype(), seed=seed, skip=skip)
+    current_log_spot = initial_state[..., 0] + tf.zeros(
+        [num_samples], dtype=initial_state.dtype)
+    current_vol = initial_state[..., 1] + tf.zeros(
+        [num_samples], dtype=initial_state.dtype)
     # Prepare results format
     written_count = 0
     if isinstance(num_requested_times, int) and num_requested_times == 1:
@@ -402,32 +503,8 @@ class HestonModel(generic_ito_process.GenericItoProcess):
     def body_fn(i, written_count, current_vol, current_log_spot, vol_paths,
                 log_spot_paths):
       """Simulate Heston process to the next time point."""
-      time_step = dt[i]
-
-      if normal_draws is None:
-        normals = random.mv_normal_sample(
-            (num_samples,),
-            mean=tf.zeros([2], dtype=mean_reversion.dtype), seed=seed)
-      else:
-        normals = normal_draws[i]
-      def _next_vol_fn():
-        return _update_variance(
-            mean_reversion[i], theta[i], volvol[i], rho[i],
-            current_vol, time_step, normals[..., 0])
-      # Do not update variance if `time_step > tolerance`
-      next_vol = tf.cond(time_step > tolerance,
-                         _next_vol_fn,
-                         lambda: current_vol)
-      def _next_log_spot_fn():
-        return _update_log_spot(
-            mean_reversion[i], theta[i], volvol[i], rho[i],
-            current_vol, next_vol, current_log_spot, time_step,
-            normals[..., 1])
-      # Do not update state if `time_step > tolerance`
-      next_log_spot = tf.cond(time_step > tolerance,
-                              _next_log_spot_fn,
-                              lambda: current_log_spot)
-
+      next_vol, next_log_spot = step_fn(i, current_vol, current_log_spot,
+                                        normal_draws, num_samples, seed)
       if record_samples:
         # Update volatility paths
         vol_paths = vol_paths.write(written_count, next_vol)
@@ -519,10 +596,64 @@ def _get_parameters(times, *params):
   return result
 
 
+def _reduce_paths(*, step_fn, times, keep_mask, steps_num, num_requested_times,
+                  initial_state, num_samples, block_size, random_type, seed,
+                  skip, precompute, normal_draws, path_reducer):
+  """Returns the statistics of the reduced paths generated in blocks."""
+  dtype = initial_state.dtype
+  block_log_spot = initial_state[..., 0] + tf.zeros([block_size], dtype=dtype)
+  block_vol = initial_state[..., 1] + tf.zeros([block_size], dtype=dtype)
+
+  def block_values(block, block_seed):
+    """Returns the per-path values of a block of paths."""
+    draws = normal_draws
+    if precompute:
+      # Only the draws of the current block are stored.
+      draws = utils.generate_mc_normal_draws(
+          num_normal_draws=2, num_time_steps=steps_num,
+          num_sample_paths=block_size, random_type=random_type,
+          dtype=dtype, seed=block_seed, skip=skip + block * block_size)
+    initial_block_state = tf.stack([block_log_spot, block_vol], axis=-1)
+    accumulator = path_reducers.update(
+        path_reducer, path_reducer.initial_fn(initial_block_state),
+        keep_mask[0], times[0], initial_block_state)
+
+    def cond_fn(i, written_count, *args):
+      del args
+      return tf.math.logical_and(i < steps_num,
+                                 written_count < num_requested_times)
+
+    def body_fn(i, written_count, current_vol, current_log_spot, accumulator):
+      next_vol, next_log_spot = step_fn(i, current_vol, current_log_spot,
+                                        draws, block_size, block_seed)
+      accumulator = path_reducers.update(
+          path_reducer, accumulator, keep_mask[i + 1], times[i + 1],
+          tf.stack([next_log_spot, next_vol], axis=-1))
+      written_count += tf.cast(keep_mask[i + 1], dtype=tf.int32)
+      return i + 1, written_count, next_vol, next_log_spot, accumulator
+
+    _, _, _, _, accumulator = tf.while_loop(
+        cond_fn, body_fn,
+        (0, tf.cast(keep_mask[0], dtype=tf.int32), block_vol, block_log_spot,
+         accumulator),
+        maximum_iterations=steps_num)
+    return path_reducer.result_fn(accumulator)
+
+  return path_reducers.reduce_in_blocks(
+      block_values, num_blocks=num_samples // block_size, sample_axis=0,
+      random_type=random_type, seed=seed)
+
+
 def _update_variance(
     mean_reversion, theta, volvol, rho,
     current_vol, time_step, normals, psi_c=1.5):
-  """Updates variance value."""
+  """Updates variance value.
+
+  Returns:
+    A tuple of the next variance and of the coefficients
+    `(is_quadratic, b_squared, a, p, beta)` of the QE scheme used by the
+    martingale correction of the log-spot.
+  """
   del rho
   psi_c = tf.convert_to_tensor(psi_c, dtype=mean_reversion.dtype)
   scaled_time = tf.exp(-mean_reversion * time_step)
@@ -548,14 +679,21 @@ def _update_variance(
                             tf.math.log(1 - p) - tf.math.log(1 - uniforms),
                             tf.zeros_like(uniforms)) / beta
   next_var = tf.where(cond, next_var_true, next_var_false)
-  return next_var
+  return next_var, (cond, b_squared, a, p, beta)
 
 
 def _update_log_spot(
     mean_reversion, theta, volvol, rho,
     current_vol, next_vol, current_log_spot, time_step, normals,
-    gamma_1=0.5, gamma_2=0.5):
-  """Updates log-spot value."""
+    gamma_1=0.5, gamma_2=0.5, qe_coefficients=None):
+  """Updates log-spot value.
+
+  If the coefficients of the QE scheme of the variance are supplied, `k_0` is
+  replaced by the martingale corrected `K_0^*` of Section 4.2 of Andersen
+  (2006) so that `E[exp(X(t + dt)) | X(t)] = exp(X(t))`. When the moment
+  generating function of the next variance does not exist for the step, `k_0`
+  is not corrected.
+  """
   k_0 = - rho * mean_reversion * theta / volvol * time_step
   k_1 = (gamma_1 * time_step
          * (mean_reversion * rho / volvol - 0.5)
@@ -565,6 +703,21 @@ def _update_log_spot(
          + rho / volvol)
   k_3 = gamma_1 * time_step * (1 - rho**2)
   k_4 = gamma_2 * time_step * (1 - rho**2)
+  if qe_coefficients is not None:
+    is_quadratic, b_squared, a, p, beta = qe_coefficients
+    big_a = k_2 + k_4 / 2
+    # Logarithm of E[exp(big_a * V(t + dt))] for the quadratic and exponential
+    # branches of the QE scheme
+    quadratic_scale = 1 - 2 * big_a * a
+    log_mgf = tf.where(
+        is_quadratic,
+        big_a * b_squared * a / quadratic_scale
+        - tf.math.log(quadratic_scale) / 2,
+        tf.math.log(p + beta * (1 - p) / (beta - big_a)))
+    is_finite = tf.where(is_quadratic, quadratic_scale > 0, big_a < beta)
+    k_0 = tf.where(is_finite,
+                   -log_mgf - (k_1 + k_3 / 2) * current_vol,
+                   k_0)
 
   next_log_spot = (
       current_log_spot + k_0 + k_1 * current_vol + k_2 * next_vol
@@ -379,5 +379,77 @@ class HestonModelTest(parameterized.TestCase, tf.test.TestCase):
     self.assertAllClose(
         monte_carlo_price, european_option_price, atol=0.1, rtol=0.1)
 
+  @parameterized.named_parameters(
+      ('QuadraticBranch', 0.3, -0.5),
+      ('ExponentialBranch', 1.0, -0.9))
+  def test_martingale_correction(self, volvol, rho):
+    """The simulated spot is a martingale with large time steps."""
+    dtype = tf.float64
+    heston = HestonModel(mean_reversion=0.5, theta=0.04, volvol=volvol,
+                         rho=rho, dtype=dtype)
+    samples = heston.sample_paths(
+        times=[1.0, 5.0],
+        initial_state=np.array([0.0, 0.04]),
+        time_step=1.0,
+        num_samples=100000,
+        random_type=tff.math.random.RandomType.STATELESS_ANTITHETIC,
+        seed=[1, 2],
+        martingale_correction=True)
+    spots = self.evaluate(tf.math.exp(samples[..., 0]))
+    standard_errors = np.std(spots, axis=0) / np.sqrt(spots.shape[0])
+    self.assertAllClose(np.mean(spots, axis=0), [1.0, 1.0],
+                        atol=4 * np.max(standard_errors), rtol=0)
+
+  def test_path_reducer(self):
+    """Reduced statistics match the statistics of the sampled paths."""
+    dtype = tf.float64
+    heston = HestonModel(mean_reversion=0.5, theta=0.04, volvol=1.0,
+                         rho=-0.9, dtype=dtype)
+    kwargs = dict(
+        times=[0.5, 1.0], initial_state=np.array([0.0, 0.04]),
+        num_time_steps=10, num_samples=256,
+        random_type=tff.math.random.RandomType.SOBOL,
+        martingale_correction=True)
+    paths = self.evaluate(heston.sample_paths(**kwargs))
+    # Payoff of a forward start option
+    reducer = tff.models.path_reducers.PathReducer(
+        initial_fn=lambda state: (state[..., 0], state[..., 0]),
+        update_fn=lambda accumulator, time, state: (accumulator[1],  # pylint: disable=g-long-lambda
+                                                    state[..., 0]),
+        result_fn=lambda accumulator: tf.nn.relu(  # pylint: disable=g-long-lambda
+            tf.math.exp(accumulator[1]) - tf.math.exp(accumulator[0])))
+    statistics = self.evaluate(heston.sample_paths(
+        path_reducer=reducer, block_size=64, **kwargs))
+    values = np.maximum(np.exp(paths[:, 1, 0]) - np.exp(paths[:, 0, 0]), 0)
+    with self.subTest('Mean'):
+      self.assertAllClose(statistics.mean, np.mean(values))
+    with self.subTest('Variance'):
+      self.assertAllClose(statistics.variance, np.var(values, ddof=1))
+    with self.subTest('NumSamples'):
+      self.assertEqual(statistics.num_samples, 256)
+
+  def test_path_reducer_blocks_are_distinct(self):
+    """Blocks of paths generated under `tf.function` use distinct draws."""
+    dtype = tf.float64
+    block_size = 500
+
+    @tf.function
+    def terminal_spot_mean(num_blocks):
+      heston = HestonModel(mean_reversion=0.5, theta=0.04, volvol=1.0,
+                           rho=-0.9, dtype=dtype)
+      statistics = heston.sample_paths(
+          times=[1.0], initial_state=np.array([0.0, 0.04]),
+          num_time_steps=2, num_samples=num_blocks * block_size,
+          random_type=tff.math.random.RandomType.PSEUDO, seed=7,
+          path_reducer=tff.models.path_reducers.terminal_value(
+              payoff_fn=lambda state: tf.math.exp(state[..., 0])),
+          block_size=block_size)
+      return statistics.mean
+
+    mean_1, mean_2 = self.evaluate(
+        [terminal_spot_mean(1), terminal_spot_mean(2)])
+    self.assertNotAllClose(mean_1, mean_2, rtol=0, atol=1e-6)
+
+
 if __name__ == '__main__':
   tf.test.main()
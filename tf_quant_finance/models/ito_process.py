@@ -108,6 +108,28 @@ class ItoProcess(object):
     """
     pass
 
+  def transition_fn(self):
+    """Python callable calculating the exact Gaussian transition of a step.
+
+    Processes whose transitions over a finite step are Gaussian, e.g., the
+    Ornstein-Uhlenbeck and Hull-White processes, can be sampled exactly with
+    one step between consecutive sampling times instead of many small Euler
+    steps.
+
+    The callable should accept three real `Tensor` arguments of the same dtype.
+    The first two arguments are the scalar start and end times `s <= t` of the
+    step, the third argument is the value of Ito process X_s - `Tensor` of
+    shape `batch_shape + [dim]`. The result is a tuple `(mean, covariance)` of
+    the conditional mean `E[X_t | X_s]` of shape `batch_shape + [dim]` and of
+    the conditional covariance `Cov[X_t | X_s]` of shape broadcastable to
+    `batch_shape + [dim, dim]`, which should be positive definite for `s < t`.
+
+    Returns:
+      The transition callable or `None` if the transitions of the process are
+      not known in closed form, which is the default.
+    """
+    return None
+
   @abc.abstractmethod
   def sample_paths(self,
                    times,
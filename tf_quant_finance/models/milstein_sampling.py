@@ -48,8 +48,12 @@ def sample(
     swap_memory: bool = True,
     skip: types.IntTensor = 0,
     precompute_normal_draws: bool = True,
+    times_grid: Optional[types.RealTensor] = None,
+    normal_draws: Optional[types.RealTensor] = None,
     watch_params: Optional[List[types.RealTensor]] = None,
     stratonovich_order: int = 5,
+    finite_difference_step: Optional[types.RealTensor] = None,
+    commutative_noise: bool = False,
     dtype: Optional[tf.DType] = None,
     name: Optional[str] = None) -> types.RealTensor:
   r"""Returns a sample paths from the process using the Milstein method.
@@ -86,6 +90,18 @@ def sample(
 
   See [1] and [2] for details.
 
+  The gradient of the volatility is the most expensive part of the scheme. By
+  default it is computed with forward mode automatic differentiation, i.e.,
+  with `dim` additional differentiated evaluations of `volatility_fn` at every
+  time step. With `finite_difference_step`, it is approximated by forward
+  differences which cost `dim` plain evaluations of `volatility_fn`. For a
+  commutative noise, e.g., a diagonal volatility whose `i`-th diagonal element
+  depends only on `X[i]` as for a vector of CIR processes, the cross terms
+  `I(j_1, j_2) + I(j_2, j_1) = dW_n[j_1] dW_n[j_2]` are known exactly (see
+  Section 10.3 of [2]) and `commutative_noise=True` removes the approximation
+  of the Stratonovich integrals and its `3 * dim * stratonovich_order`
+  auxiliary normal draws per time step.
+
   #### References
   [1]: Wikipedia. Milstein method:
   https://en.wikipedia.org/wiki/Milstein_method
@@ -161,6 +177,20 @@ def sample(
       random types the increments are always precomputed. While the resulting
       graph consumes more memory, the performance gains might be significant.
       Default value: `True`.
+    times_grid: An optional rank 1 `Tensor` representing time discretization
+      grid. If `times` are not on the grid, then the nearest points from the
+      grid are used. When supplied, `num_time_steps` and `time_step` are
+      ignored.
+      Default value: `None`, which means that times grid is computed using
+      `time_step` and `num_time_steps`.
+    normal_draws: A `Tensor` of shape `[num_samples, num_time_points, dim]`
+      and the same `dtype` as `times`. Represents random normal draws to
+      compute increments `N(0, t_{n+1}) - N(0, t_n)`. When supplied,
+      `num_samples` argument is ignored and the first dimensions of
+      `normal_draws` is used instead. The auxiliary draws of the multivariate
+      scheme are still generated by the algorithm.
+      Default value: `None` which means that the draws are generated by the
+      algorithm.
     watch_params: An optional list of zero-dimensional `Tensor`s of the same
       `dtype` as `initial_state`. If provided, specifies `Tensor`s with respect
       to which the differentiation of the sampling function will happen. A more
@@ -175,10 +205,32 @@ def sample(
       convenient approximation scheme for calculating cross terms involving
       different components of the Wiener process. See Eq. 8.10 in Section 5.8 of
       [2]. Default value: `5`.
+    finite_difference_step: An optional positive scalar real `Tensor`. If
+      supplied and `grad_volatility_fn` is `None`, the gradient of the
+      volatility is approximated by the forward differences
+      `(b(t, X + h e_i) - b(t, X)) / h` with the step `h`.
+      Default value: `None` which means that the gradient is computed by
+      automatic differentiation.
+    commutative_noise: Python `bool`. Whether the noise of the process is
+      commutative, i.e., whether `L_{j_1} b[k, j_2] = L_{j_2} b[k, j_1]` for
+      all `k, j_1, j_2`. If `True`, the exact Milstein scheme for commutative
+      noise is used and `stratonovich_order` is ignored. The paths are
+      incorrect if the noise is not commutative.
+      Default value: `False`.
     dtype: `tf.Dtype`. If supplied the dtype for the input and output `Tensor`s.
       Default value: None which means that the dtype implied by `times` is used.
     name: Python string. The name to give this op.
       Default value: `None` which maps to `milstein_sample`.
+
+  Returns:
+   A real `Tensor` of shape [num_samples, k, n] where `k` is the size of the
+     `times`, `n` is the dimension of the process.
+
+  Raises:
+    ValueError:
+      (a) When `times_grid` is not supplied, and neither `num_time_steps` nor
+        `time_step` are supplied or if both are supplied.
+      (b) If `normal_draws` is supplied and `dim` is mismatched.
   """
   name = name or 'milstein_sample'
   with tf.name_scope(name):
@@ -196,34 +248,69 @@ def sample(
     if num_time_steps is not None and time_step is not None:
       raise ValueError('Only one of either `num_time_steps` or `time_step` '
                        'should be defined but not both')
-    if time_step is None:
-      if num_time_steps is None:
-        raise ValueError('Either `num_time_steps` or `time_step` should be '
-                         'defined.')
-      num_time_steps = tf.convert_to_tensor(
-          num_time_steps, dtype=tf.int32, name='num_time_steps')
-      time_step = times[-1] / tf.cast(num_time_steps, dtype=dtype)
+    if times_grid is None:
+      if time_step is None:
+        if num_time_steps is None:
+          raise ValueError('Either `num_time_steps` or `time_step` should be '
+                           'defined.')
+        num_time_steps = tf.convert_to_tensor(
+            num_time_steps, dtype=tf.int32, name='num_time_steps')
+        time_step = times[-1] / tf.cast(num_time_steps, dtype=dtype)
+      else:
+        time_step = tf.convert_to_tensor(time_step, dtype=dtype,
+                                         name='time_step')
     else:
-      time_step = tf.convert_to_tensor(time_step, dtype=dtype,
-                                       name='time_step')
+      times_grid = tf.convert_to_tensor(times_grid, dtype=dtype,
+                                        name='times_grid')
     times, keep_mask, time_indices = utils.prepare_grid(
         times=times, time_step=time_step, num_time_steps=num_time_steps,
-        dtype=dtype)
+        times_grid=times_grid, dtype=dtype)
+    if normal_draws is not None:
+      normal_draws = tf.convert_to_tensor(normal_draws, dtype=dtype,
+                                          name='normal_draws')
+      # Shape [num_time_points, num_samples, dim]
+      normal_draws = tf.transpose(normal_draws, [1, 0, 2])
+      num_samples = tf.shape(normal_draws)[1]
+      draws_dim = normal_draws.shape[-1]
+      if dim != draws_dim:
+        raise ValueError(
+            '`dim` should be equal to `normal_draws.shape[2]` but are '
+            '{0} and {1} respectively'.format(dim, draws_dim))
     if watch_params is not None:
       watch_params = [
           tf.convert_to_tensor(param, dtype=dtype) for param in watch_params
       ]
-    if grad_volatility_fn is None:
+    # The gradient callables also accept the volatility at `current_state`
+    # which is reused by the forward differences.
+    if grad_volatility_fn is not None:
+      user_grad_volatility_fn = grad_volatility_fn
+
+      def _grad_volatility_fn(current_time, current_state, input_gradients,
+                              vol):
+        del vol
+        return user_grad_volatility_fn(current_time, current_state,
+                                       input_gradients)
+    elif finite_difference_step is not None:
+      finite_difference_step = tf.convert_to_tensor(
+          finite_difference_step, dtype=dtype, name='finite_difference_step')
+
+      def _grad_volatility_fn(current_time, current_state, input_gradients,
+                              vol):
+        shifted_vol = volatility_fn(
+            current_time,
+            current_state + finite_difference_step * input_gradients)
+        return (shifted_vol - vol) / finite_difference_step
+    else:
 
-      def _grad_volatility_fn(current_time, current_state, input_gradients):
+      def _grad_volatility_fn(current_time, current_state, input_gradients,
+                              vol):
+        del vol
         return gradient.fwd_gradient(
             functools.partial(volatility_fn, current_time),
             current_state,
             input_gradients=input_gradients,
             unconnected_gradients=tf.UnconnectedGradients.ZERO)
 
-      grad_volatility_fn = _grad_volatility_fn
-
     input_gradients = None
     if dim > 1:
       input_gradients = tf.unstack(tf.eye(dim, dtype=dtype))
@@ -236,9 +323,8 @@ def sample(
         dim=dim,
         drift_fn=drift_fn,
         volatility_fn=volatility_fn,
-        grad_volatility_fn=grad_volatility_fn,
+        grad_volatility_fn=_grad_volatility_fn,
         times=times,
-        time_step=time_step,
         keep_mask=keep_mask,
         num_requested_times=num_requested_times,
         num_samples=num_samples,
@@ -248,18 +334,20 @@ def sample(
         swap_memory=swap_memory,
         skip=skip,
         precompute_normal_draws=precompute_normal_draws,
+        normal_draws=normal_draws,
         watch_params=watch_params,
         time_indices=time_indices,
         input_gradients=input_gradients,
         stratonovich_order=stratonovich_order,
+        commutative_noise=commutative_noise,
         dtype=dtype)
 
 
 def _sample(*, dim, drift_fn, volatility_fn, grad_volatility_fn, times,
-            time_step, keep_mask, num_requested_times, num_samples,
+            keep_mask, num_requested_times, num_samples,
             initial_state, random_type, seed, swap_memory, skip,
-            precompute_normal_draws, watch_params, time_indices,
-            input_gradients, stratonovich_order, dtype):
+            precompute_normal_draws, normal_draws, watch_params, time_indices,
+            input_gradients, stratonovich_order, commutative_noise, dtype):
   """Returns a sample of paths from the process using the Milstein method."""
   dt = times[1:] - times[:-1]
   sqrt_dt = tf.sqrt(dt)
@@ -269,18 +357,37 @@ def _sample(*, dim, drift_fn, volatility_fn, grad_volatility_fn, times,
     steps_num = dt.shape.as_list()[-1]
   else:
     steps_num = tf.shape(dt)[-1]
+  # The Stratonovich integrals are approximated only for a non-commutative
+  # multidimensional noise.
+  num_aux_draws = (0 if dim == 1 or commutative_noise
+                   else 3 * dim * stratonovich_order)
   # In order to use low-discrepancy random_type we need to generate the sequence
   # of independent random normals upfront. We also precompute random numbers
   # for stateless random type in order to ensure independent samples for
   # multiple function calls with different seeds.
-  if precompute_normal_draws or random_type in (
+  if normal_draws is not None:
+    wiener_mean = None
+    aux_normal_draws = None
+    if num_aux_draws:
+      # Auxiliary normal draws for use with the stratonovich integral
+      # approximation.
+      all_aux_normal_draws = utils.generate_mc_normal_draws(
+          num_normal_draws=num_aux_draws,
+          num_time_steps=steps_num,
+          num_sample_paths=num_samples,
+          random_type=random_type,
+          dtype=dtype,
+          seed=seed,
+          skip=skip)
+      aux_normal_draws = tf.split(all_aux_normal_draws, 3, axis=-1)
+  elif precompute_normal_draws or random_type in (
       random.RandomType.SOBOL, random.RandomType.HALTON,
       random.RandomType.HALTON_RANDOMIZED, random.RandomType.STATELESS,
       random.RandomType.STATELESS_ANTITHETIC):
     # Process dimension plus auxiliary random variables for stratonovich
     # integral computation.
     all_normal_draws = utils.generate_mc_normal_draws(
-        num_normal_draws=dim + 3 * dim * stratonovich_order,
+        num_normal_draws=dim + num_aux_draws,
         num_time_steps=steps_num,
         num_sample_paths=num_samples,
         random_type=random_type,
@@ -289,14 +396,11 @@ def _sample(*, dim, drift_fn, volatility_fn, grad_volatility_fn, times,
         skip=skip)
     normal_draws = all_normal_draws[:, :, :dim]
     wiener_mean = None
-    # Auxiliary normal draws for use with the stratonovich integral
-    # approximation.
-    aux_normal_draws = []
-    start = dim
-    for _ in range(3):
-      end = start + dim * stratonovich_order
-      aux_normal_draws.append(all_normal_draws[:, :, start:end])
-      start = end
+    aux_normal_draws = None
+    if num_aux_draws:
+      # Auxiliary normal draws for use with the stratonovich integral
+      # approximation.
+      aux_normal_draws = tf.split(all_normal_draws[:, :, dim:], 3, axis=-1)
   else:
     # If pseudo or anthithetic sampling is used, proceed with random sampling
     # at each step.
@@ -317,7 +421,6 @@ def _sample(*, dim, drift_fn, volatility_fn, grad_volatility_fn, times,
         times=times,
         dt=dt,
         sqrt_dt=sqrt_dt,
-        time_step=time_step,
         keep_mask=keep_mask,
         num_requested_times=num_requested_times,
         swap_memory=swap_memory,
@@ -326,6 +429,7 @@ def _sample(*, dim, drift_fn, volatility_fn, grad_volatility_fn, times,
         normal_draws=normal_draws,
         input_gradients=input_gradients,
         stratonovich_order=stratonovich_order,
+        commutative_noise=commutative_noise,
         aux_normal_draws=aux_normal_draws,
         dtype=dtype)
   else:
@@ -350,14 +454,16 @@ def _sample(*, dim, drift_fn, volatility_fn, grad_volatility_fn, times,
         normal_draws=normal_draws,
         input_gradients=input_gradients,
         stratonovich_order=stratonovich_order,
+        commutative_noise=commutative_noise,
         aux_normal_draws=aux_normal_draws)
 
 
 def _while_loop(*, dim, steps_num, current_state, drift_fn, volatility_fn,
                 grad_volatility_fn, wiener_mean, num_samples, times, dt,
-                sqrt_dt, time_step, num_requested_times, keep_mask, swap_memory,
+                sqrt_dt, num_requested_times, keep_mask, swap_memory,
                 random_type, seed, normal_draws, input_gradients,
-                stratonovich_order, aux_normal_draws, dtype):
+                stratonovich_order, commutative_noise, aux_normal_draws,
+                dtype):
   """Sample paths using tf.while_loop."""
   written_count = 0
   if isinstance(num_requested_times, int) and num_requested_times == 1:
@@ -402,16 +508,15 @@ def _while_loop(*, dim, steps_num, current_state, drift_fn, volatility_fn,
         normal_draws=normal_draws,
         input_gradients=input_gradients,
         stratonovich_order=stratonovich_order,
+        commutative_noise=commutative_noise,
         aux_normal_draws=aux_normal_draws,
         record_samples=record_samples)
 
-  maximum_iterations = (
-      tf.cast(1. / time_step, dtype=tf.int32) + tf.size(times))
   # Sample paths
   _, _, _, result = tf.while_loop(
       cond_fn,
       step_fn, (0, written_count, current_state, result),
-      maximum_iterations=maximum_iterations,
+      maximum_iterations=steps_num,
       swap_memory=swap_memory)
   if not record_samples:
     # shape [num_samples, 1, dim]
@@ -428,7 +533,7 @@ def _for_loop(*, dim, steps_num, current_state, drift_fn, volatility_fn,
               grad_volatility_fn, wiener_mean, watch_params, num_samples, times,
               dt, sqrt_dt, time_indices, keep_mask, random_type, seed,
               normal_draws, input_gradients, stratonovich_order,
-              aux_normal_draws):
+              commutative_noise, aux_normal_draws):
   """Sample paths using custom for_loop."""
   num_time_points = time_indices.shape.as_list()[-1]
   if num_time_points == 1:
@@ -459,6 +564,7 @@ def _for_loop(*, dim, steps_num, current_state, drift_fn, volatility_fn,
         normal_draws=normal_draws,
         input_gradients=input_gradients,
         stratonovich_order=stratonovich_order,
+        commutative_noise=commutative_noise,
         aux_normal_draws=aux_normal_draws,
         record_samples=False)
     return [next_state]
@@ -515,7 +621,7 @@ def _stratonovich_integral(dim, dt, sqrt_dt, dw, stratonovich_draws, order):
   # See Eq 3.7 of section 10.3 in [2]
   # First term scaled by dt.
   value = dt * (
-      _outer_prod(dw, dw) / 2 + sqrt_rho_p *
+      _outer_prod(xi, xi) / 2 + sqrt_rho_p *
       (_outer_prod(mu[..., p], xi) - _outer_prod(xi, mu[..., p])))
 
   # Vectorized sum over r scaled by dt / 2 / pi.
@@ -528,16 +634,21 @@ def _stratonovich_integral(dim, dt, sqrt_dt, dw, stratonovich_draws, order):
 def _milstein_hot(dim, vol, grad_vol, dt, sqrt_dt, dw, stratonovich_draws,
                   stratonovich_order):
   """Higher order terms for Milstein update."""
-  # Generate approximate Stratonovich integrals J(i,j) then replace the diagonal
-  # with exact values.
-  offdiag = _stratonovich_integral(
-      dim=dim,
-      dt=dt,
-      sqrt_dt=sqrt_dt,
-      dw=dw,
-      stratonovich_draws=stratonovich_draws,
-      order=stratonovich_order)
-  stratonovich_integrals = tf.linalg.set_diag(offdiag, dw * dw / 2)
+  if stratonovich_draws is None:
+    # For a commutative noise only the symmetric part of the Stratonovich
+    # integrals contributes and J(i,j) + J(j,i) = dW_i dW_j.
+    stratonovich_integrals = _outer_prod(dw, dw) / 2
+  else:
+    # Generate approximate Stratonovich integrals J(i,j) then replace the
+    # diagonal with exact values.
+    offdiag = _stratonovich_integral(
+        dim=dim,
+        dt=dt,
+        sqrt_dt=sqrt_dt,
+        dw=dw,
+        stratonovich_draws=stratonovich_draws,
+        order=stratonovich_order)
+    stratonovich_integrals = tf.linalg.set_diag(offdiag, dw * dw / 2)
 
   # Compute L_bar^{j1} b^{k, j2} J(j1, j2)
   # See Eq 3.4 of section 10.3 in [2]
@@ -547,7 +658,8 @@ def _milstein_hot(dim, vol, grad_vol, dt, sqrt_dt, dw, stratonovich_draws,
         tf.transpose(
             tf.stack([x[..., state_ix, :] for x in grad_vol], -1), [0, 2, 1]))
   stacked_grad_vol = tf.stack(stacked_grad_vol, 0)
-  lbar = tf.matmul(stacked_grad_vol, vol)
+  # lbar[k, j1, j2] = sum_i b[i, j1] d b[k, j2] / d x_i
+  lbar = tf.matmul(vol, stacked_grad_vol, transpose_a=True)
   return tf.transpose(
       tf.reduce_sum(tf.multiply(lbar, stratonovich_integrals), [-2, -1]))
 
@@ -559,7 +671,7 @@ def _stratonovich_drift_update(num_samples, vol, grad_vol):
   vol = tf.reshape(vol, [num_samples, -1])
   grad_vol = tf.concat(grad_vol, 2)
   # A tensor of shape [num_samples, dim].
-  return tf.linalg.matvec(grad_vol, vol)
+  return tf.linalg.matvec(grad_vol, vol) / 2
 
 
 def _milstein_1d(dw, dt, sqrt_dt, current_state, drift, vol, grad_vol):
@@ -597,7 +709,7 @@ def _milstein_step(*, dim, i, written_count, current_state, result, drift_fn,
                    volatility_fn, grad_volatility_fn, wiener_mean, num_samples,
                    times, dt, sqrt_dt, keep_mask, random_type, seed,
                    normal_draws, input_gradients, stratonovich_order,
-                   aux_normal_draws, record_samples):
+                   commutative_noise, aux_normal_draws, record_samples):
   """Performs one step of Milstein scheme."""
   current_time = times[i + 1]
   written_count = tf.cast(written_count, tf.int32)
@@ -608,7 +720,9 @@ def _milstein_step(*, dim, i, written_count, current_state, result, drift_fn,
                                  mean=wiener_mean,
                                  random_type=random_type,
                                  seed=seed)
-  if aux_normal_draws is not None:
+  if dim == 1 or commutative_noise:
+    stratonovich_draws = None
+  elif aux_normal_draws is not None:
     stratonovich_draws = []
     for j in range(3):
       stratonovich_draws.append(
@@ -631,7 +745,7 @@ def _milstein_step(*, dim, i, written_count, current_state, result, drift_fn,
     drift = drift_fn(current_time, current_state)
     vol = volatility_fn(current_time, current_state)
     grad_vol = grad_volatility_fn(current_time, current_state,
-                                  tf.ones_like(current_state))
+                                  tf.ones_like(current_state), vol)
     next_state = _milstein_1d(
         dw=dw,
         dt=dt[i],
@@ -648,7 +762,7 @@ def _milstein_step(*, dim, i, written_count, current_state, result, drift_fn,
     # the gradient of the volatility function. In our case, the dimension of the
     # wiener process `wiener_dim` is equal to the state dimension `dim`.
     grad_vol = [
-        grad_volatility_fn(current_time, current_state, start)
+        grad_volatility_fn(current_time, current_state, start, vol)
         for start in input_gradients
     ]
     next_state = _milstein_nd(
@@ -322,6 +322,73 @@ class MilsteinSamplingTest(tf.test.TestCase, parameterized.TestCase):
                         rtol=0.05,
                         atol=0.05)
 
+  def test_normal_draws_and_times_grid(self):
+    """With additive noise, Milstein paths match Euler on the same draws."""
+    dtype = tf.float64
+    mu = np.array([0.2, 0.7])
+    s = np.array([[0.3, 0.1], [0.1, 0.3]])
+    times = [0.5, 1.0]
+    times_grid = np.linspace(0.0, 1.0, 9)
+    normal_draws = tf.random.stateless_normal([100, 8, 2], seed=[1, 2],
+                                              dtype=dtype)
+    kwargs = dict(
+        dim=2,
+        drift_fn=lambda t, x: mu * tf.sqrt(t) * tf.ones_like(x),
+        volatility_fn=lambda t, x: s * tf.ones_like(x)[..., tf.newaxis],
+        times=times,
+        times_grid=times_grid,
+        normal_draws=normal_draws,
+        initial_state=[0.1, -1.1],
+        dtype=dtype)
+    milstein_paths, euler_paths = self.evaluate(
+        [milstein_sampling.sample(**kwargs), euler_sampling.sample(**kwargs)])
+    with self.subTest('Shape'):
+      self.assertAllEqual(milstein_paths.shape, [100, 2, 2])
+    with self.subTest('Paths'):
+      self.assertAllClose(milstein_paths, euler_paths)
+
+  @parameterized.named_parameters(
+      ('AutoDiff', None, False),
+      ('FiniteDifference', 1e-7, False),
+      ('CommutativeNoise', None, True),
+      ('FiniteDifferenceCommutativeNoise', 1e-7, True))
+  def test_diagonal_gbm_strong_error(self, finite_difference_step,
+                                     commutative_noise):
+    """Paths of a diagonal 2d GBM are close to the exact solution."""
+    dtype = tf.float64
+    mu = np.array([0.05, 0.1])
+    sigma = np.array([0.2, 0.4])
+
+    def drift_fn(t, x):
+      del t
+      return mu * x
+
+    def vol_fn(t, x):
+      del t
+      return tf.linalg.diag(sigma * x)
+
+    num_time_steps = 100
+    normal_draws = np.random.RandomState(42).normal(
+        size=[1000, num_time_steps, 2])
+    paths = self.evaluate(milstein_sampling.sample(
+        dim=2,
+        drift_fn=drift_fn,
+        volatility_fn=vol_fn,
+        times=[1.0],
+        num_time_steps=num_time_steps,
+        initial_state=[1.0, 1.0],
+        normal_draws=normal_draws,
+        seed=[1, 2],
+        random_type=tff.math.random.RandomType.STATELESS,
+        finite_difference_step=finite_difference_step,
+        commutative_noise=commutative_noise,
+        dtype=dtype))
+    terminal_brownian = np.sum(normal_draws, axis=1) / np.sqrt(num_time_steps)
+    expected = np.exp(mu - sigma**2 / 2 + sigma * terminal_brownian)
+    # The strong error of the Milstein scheme is O(dt) while it is O(sqrt(dt))
+    # for the Euler scheme.
+    self.assertLess(np.mean(np.abs(paths[:, -1, :] - expected)), 2e-3)
+
   def test_sample_paths_dtypes(self):
     """Tests that sampled paths have the expected dtypes."""
     r = 0.5
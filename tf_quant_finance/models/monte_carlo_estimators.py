@@ -0,0 +1,227 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Variance reduced Monte Carlo estimators of expected payoffs."""
+
+from typing import Optional
+
+import tensorflow.compat.v2 as tf
+
+from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
+
+__all__ = [
+    'MonteCarloEstimate',
+    'antithetic_estimate',
+    'control_variate_estimate',
+]
+
+
+@tff_utils.dataclass
+class MonteCarloEstimate:
+  """Monte Carlo estimate of an expectation.
+
+  Attributes:
+    mean: A real `Tensor` of shape `batch_shape`. The estimate of the
+      expectation.
+    standard_error: A real `Tensor` of shape `batch_shape`. The estimated
+      standard deviation of `mean`.
+    coefficients: A real `Tensor` of shape `batch_shape + [num_controls]`. The
+      coefficients of the control variates, with `num_controls = 0` if no
+      control variates are used.
+  """
+  mean: types.RealTensor
+  standard_error: types.RealTensor
+  coefficients: types.RealTensor
+
+
+def antithetic_estimate(
+    payoffs: types.RealTensor,
+    dtype: Optional[tf.DType] = None,
+    name: Optional[str] = None) -> MonteCarloEstimate:
+  """Estimates an expected payoff from antithetic samples.
+
+  The samples generated with the `PSEUDO_ANTITHETIC` and `STATELESS_ANTITHETIC`
+  random types are made of `num_samples / 2` independent samples followed by
+  their antithetic counterparts. The payoffs of the sample `i` and of its
+  antithetic counterpart `i + num_samples / 2` are averaged and the standard
+  error is computed from the `num_samples / 2` independent averages, which
+  accounts for the negative correlation of the pairs.
+
+  #### Example
+
+  ```python
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  process = tff.models.GeometricBrownianMotion(0.05, 0.2, dtype=tf.float64)
+  paths = process.sample_paths(
+      times=[1.0], initial_state=1.0, num_samples=100000, seed=[1, 2],
+      random_type=tff.math.random.RandomType.STATELESS_ANTITHETIC)
+  payoffs = tf.nn.relu(paths[:, -1, 0] - 1.0)
+  estimate = tff.models.monte_carlo_estimators.antithetic_estimate(payoffs)
+  ```
+
+  Args:
+    payoffs: A real `Tensor` of shape `[num_samples] + batch_shape` with an
+      even `num_samples`. The payoffs of the samples followed by the payoffs
+      of their antithetic counterparts.
+    dtype: Optional `tf.DType`. If supplied, the dtype of the input and output
+      `Tensor`s.
+      Default value: `None` which maps to the dtype inferred by TensorFlow.
+    name: Python string. The name to give this op.
+      Default value: `None` which maps to `antithetic_estimate`.
+
+  Returns:
+    An instance of `MonteCarloEstimate` with empty `coefficients`.
+  """
+  with tf.name_scope(name or 'antithetic_estimate'):
+    payoffs = tf.convert_to_tensor(payoffs, dtype=dtype, name='payoffs')
+    payoffs = _pair_average(payoffs)
+    num_pairs = tf.cast(tf.shape(payoffs)[0], payoffs.dtype)
+    mean = tf.math.reduce_mean(payoffs, axis=0)
+    variance = tf.math.reduce_sum((payoffs - mean)**2, axis=0) / (
+        num_pairs - 1)
+    return MonteCarloEstimate(
+        mean=mean,
+        standard_error=tf.math.sqrt(variance / num_pairs),
+        coefficients=tf.zeros(tf.concat([tf.shape(mean), [0]], axis=0),
+                              dtype=payoffs.dtype))
+
+
+def control_variate_estimate(
+    payoffs: types.RealTensor,
+    control_variates: types.RealTensor,
+    control_means: types.RealTensor,
+    coefficients: Optional[types.RealTensor] = None,
+    antithetic: bool = False,
+    dtype: Optional[tf.DType] = None,
+    name: Optional[str] = None) -> MonteCarloEstimate:
+  """Estimates an expected payoff with control variates.
+
+  Given samples of a payoff `Y` and of control variates `C` with known
+  expectations `E[C]`, the estimator
+
+  ```None
+  mean(Y) - b^T (mean(C) - E[C])
+  ```
+
+  is unbiased for any coefficients `b`. Its variance is minimal for
+  `b = Cov(C, C)^{-1} Cov(C, Y)` which are estimated from the samples, i.e.,
+  the estimate is the intercept of the least-squares regression of `Y` on
+  `C - E[C]` (see Section 4.1 of [1]). The variance of the estimate is reduced
+  by the factor `1 - R^2` where `R^2` is the squared multiple correlation of
+  `Y` and `C`. Good control variates are quantities with known expectations
+  which are correlated with the payoff, e.g., the discounted terminal value
+  of the underlying or the discount factors from a short rate model.
+
+  #### Example
+
+  ```python
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  process = tff.models.GeometricBrownianMotion(0.05, 0.2, dtype=tf.float64)
+  paths = process.sample_paths(
+      times=[1.0], initial_state=1.0, num_samples=100000, seed=[1, 2],
+      random_type=tff.math.random.RandomType.STATELESS)
+  terminal_values = paths[:, -1, :]  # Shape [100000, 1]
+  payoffs = tf.nn.relu(terminal_values[:, 0] - 1.0)
+  # The terminal value is a control variate with the expectation exp(0.05).
+  estimate = tff.models.monte_carlo_estimators.control_variate_estimate(
+      payoffs, control_variates=terminal_values,
+      control_means=[tf.math.exp(0.05)])
+  ```
+
+  #### References
+  [1] Paul Glasserman. Monte Carlo Methods in Financial Engineering. Springer,
+    2003.
+
+  Args:
+    payoffs: A real `Tensor` of shape `[num_samples] + batch_shape`. The
+      payoffs of the samples.
+    control_variates: A real `Tensor` of the same dtype as `payoffs` and of
+      shape `[num_samples] + batch_shape + [num_controls]`. The control
+      variates of the samples.
+    control_means: A real `Tensor` of the same dtype as `payoffs` and of shape
+      broadcastable to `batch_shape + [num_controls]`. The expectations of the
+      control variates.
+    coefficients: An optional real `Tensor` of the same dtype as `payoffs`
+      and of shape broadcastable to `batch_shape + [num_controls]`. The
+      coefficients of the control variates, e.g., fitted on an independent
+      pilot sample which makes the estimate unbiased for a finite sample.
+      Default value: `None` which means that the optimal coefficients are
+      estimated from the samples.
+    antithetic: Python `bool`. Whether the samples are made of independent
+      samples followed by their antithetic counterparts, as generated by the
+      `PSEUDO_ANTITHETIC` and `STATELESS_ANTITHETIC` random types. If `True`,
+      the payoffs and the control variates of the antithetic pairs are
+      averaged first (see `antithetic_estimate`).
+      Default value: `False`.
+    dtype: Optional `tf.DType`. If supplied, the dtype of the input and output
+      `Tensor`s.
+      Default value: `None` which maps to the dtype inferred by TensorFlow.
+    name: Python string. The name to give this op.
+      Default value: `None` which maps to `control_variate_estimate`.
+
+  Returns:
+    An instance of `MonteCarloEstimate`.
+  """
+  with tf.name_scope(name or 'control_variate_estimate'):
+    payoffs = tf.convert_to_tensor(payoffs, dtype=dtype, name='payoffs')
+    dtype = payoffs.dtype
+    control_variates = tf.convert_to_tensor(
+        control_variates, dtype=dtype, name='control_variates')
+    control_means = tf.convert_to_tensor(control_means, dtype=dtype,
+                                         name='control_means')
+    if antithetic:
+      payoffs = _pair_average(payoffs)
+      control_variates = _pair_average(control_variates)
+    num_samples = tf.cast(tf.shape(payoffs)[0], dtype)
+    payoff_mean = tf.math.reduce_mean(payoffs, axis=0)
+    control_sample_means = tf.math.reduce_mean(control_variates, axis=0)
+    centered_payoffs = payoffs - payoff_mean
+    centered_controls = control_variates - control_sample_means
+    if coefficients is None:
+      # The covariances are scaled by `num_samples - 1` which cancels out.
+      # Shape batch_shape + [num_controls, num_controls]
+      controls_covariance = tf.einsum('n...i,n...j->...ij',
+                                      centered_controls, centered_controls)
+      # Shape batch_shape + [num_controls]
+      cross_covariance = tf.einsum('n...i,n...->...i',
+                                   centered_controls, centered_payoffs)
+      coefficients = tf.linalg.solve(
+          controls_covariance, tf.expand_dims(cross_covariance, axis=-1))
+      coefficients = tf.squeeze(coefficients, axis=-1)
+      num_fitted = tf.cast(tf.shape(control_variates)[-1], dtype)
+    else:
+      coefficients = tf.convert_to_tensor(coefficients, dtype=dtype,
+                                          name='coefficients')
+      num_fitted = 0
+    mean = payoff_mean - tf.math.reduce_sum(
+        coefficients * (control_sample_means - control_means), axis=-1)
+    residuals = centered_payoffs - tf.math.reduce_sum(
+        centered_controls * coefficients, axis=-1)
+    # Unbiased estimate of the residual variance of the regression.
+    variance = tf.math.reduce_sum(residuals**2, axis=0) / (
+        num_samples - 1 - num_fitted)
+    return MonteCarloEstimate(
+        mean=mean,
+        standard_error=tf.math.sqrt(variance / num_samples),
+        coefficients=coefficients)
+
+
+def _pair_average(values):
+  """Averages the samples with their antithetic counterparts."""
+  samples, antithetic_samples = tf.split(values, 2, axis=0)
+  return (samples + antithetic_samples) / 2
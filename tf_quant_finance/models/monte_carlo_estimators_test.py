@@ -0,0 +1,112 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for methods in `monte_carlo_estimators`."""
+
+import math
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+
+from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
+
+monte_carlo_estimators = tff.models.monte_carlo_estimators
+random = tff.math.random
+
+
+def _terminal_values(random_type, num_samples=20000):
+  """Terminal values of a geometric Brownian motion."""
+  process = tff.models.GeometricBrownianMotion(0.05, 0.2, dtype=tf.float64)
+  paths = process.sample_paths(
+      times=[1.0], initial_state=1.0, num_samples=num_samples, seed=[4, 2],
+      random_type=random_type)
+  return paths[:, -1, :]
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class MonteCarloEstimatorsTest(tf.test.TestCase):
+
+  def test_control_variate_call_option(self):
+    """Estimates a call option price with the terminal value as control."""
+    terminal_values = _terminal_values(random.RandomType.STATELESS)
+    payoffs = tf.nn.relu(terminal_values[:, 0] - 1.0)
+    estimate = monte_carlo_estimators.control_variate_estimate(
+        payoffs, control_variates=terminal_values,
+        control_means=[np.exp(0.05)])
+    plain_estimate = monte_carlo_estimators.control_variate_estimate(
+        payoffs, control_variates=terminal_values,
+        control_means=[np.exp(0.05)], coefficients=[0.0])
+    estimate, plain_estimate = self.evaluate([estimate, plain_estimate])
+    # Undiscounted Black-Scholes price with d1 = 0.35 and d2 = 0.15.
+    normal_cdf = lambda x: 0.5 * (1 + math.erf(x / math.sqrt(2)))
+    expected_price = np.exp(0.05) * normal_cdf(0.35) - normal_cdf(0.15)
+    with self.subTest('StandardErrorReduction'):
+      self.assertLess(estimate.standard_error,
+                      0.4 * plain_estimate.standard_error)
+    with self.subTest('PlainEstimate'):
+      self.assertAllClose(plain_estimate.mean, np.mean(
+          self.evaluate(payoffs)))
+    with self.subTest('Price'):
+      self.assertAllClose(estimate.mean, expected_price,
+                          atol=4 * estimate.standard_error)
+
+  def test_control_variate_regression(self):
+    """The estimate is the intercept of the least-squares regression."""
+    np.random.seed(42)
+    num_samples, batch_size, num_controls = 1000, 3, 2
+    controls = np.random.normal(size=[num_samples, batch_size, num_controls])
+    payoffs = (1.0 + np.sum(controls * [0.5, -1.0], axis=-1)
+               + 0.1 * np.random.normal(size=[num_samples, batch_size]))
+    control_means = np.array([0.1, -0.2])
+    estimate = self.evaluate(monte_carlo_estimators.control_variate_estimate(
+        payoffs, controls, control_means))
+    for b in range(batch_size):
+      design = np.concatenate(
+          [np.ones([num_samples, 1]), controls[:, b] - control_means],
+          axis=-1)
+      solution, residuals, _, _ = np.linalg.lstsq(design, payoffs[:, b],
+                                                  rcond=None)
+      with self.subTest('Mean'):
+        self.assertAllClose(estimate.mean[b], solution[0])
+      with self.subTest('Coefficients'):
+        self.assertAllClose(estimate.coefficients[b], solution[1:])
+      with self.subTest('StandardError'):
+        self.assertAllClose(
+            estimate.standard_error[b],
+            np.sqrt(residuals[0] / (num_samples - 1 - num_controls)
+                    / num_samples))
+
+  def test_antithetic(self):
+    """Antithetic estimate accounts for the correlation of the pairs."""
+    terminal_values = _terminal_values(random.RandomType.STATELESS_ANTITHETIC)
+    payoffs = tf.nn.relu(terminal_values[:, 0] - 1.0)
+    estimate = monte_carlo_estimators.antithetic_estimate(payoffs)
+    cv_estimate = monte_carlo_estimators.control_variate_estimate(
+        payoffs, control_variates=terminal_values,
+        control_means=[np.exp(0.05)], antithetic=True)
+    estimate, cv_estimate, payoffs = self.evaluate(
+        [estimate, cv_estimate, payoffs])
+    naive_standard_error = np.std(payoffs, ddof=1) / np.sqrt(payoffs.size)
+    with self.subTest('Mean'):
+      self.assertAllClose(estimate.mean, np.mean(payoffs))
+    with self.subTest('StandardError'):
+      self.assertLess(estimate.standard_error, 0.8 * naive_standard_error)
+    with self.subTest('ControlVariate'):
+      self.assertLess(cv_estimate.standard_error,
+                      0.5 * estimate.standard_error)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -0,0 +1,320 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Multilevel Monte Carlo estimation of expectations of Ito processes."""
+
+from typing import Callable, List, Optional
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
+from tf_quant_finance.math import random
+from tf_quant_finance.models import euler_sampling
+from tf_quant_finance.models import path_reducers
+from tf_quant_finance.models import utils
+
+__all__ = [
+    'MultilevelEstimate',
+    'estimate',
+]
+
+
+@tff_utils.dataclass
+class MultilevelEstimate:
+  """Multilevel Monte Carlo estimate of an expectation.
+
+  Attributes:
+    mean: A scalar real `Tensor`. The estimate of the expectation, i.e., the
+      sum of the `level_means`.
+    variance: A scalar real `Tensor`. The estimated variance of `mean`.
+    level_means: A real `Tensor` of shape `[num_levels]`. The sample means of
+      the payoff on the coarsest level and of the differences of the payoffs
+      on the fine and the coarse grids on the other levels.
+    level_variances: A real `Tensor` of shape `[num_levels]`. The sample
+      variances of the payoffs or payoff differences on each level.
+    num_samples: An integer `Tensor` of shape `[num_levels]`. The number of
+      samples used on each level.
+  """
+  mean: types.RealTensor
+  variance: types.RealTensor
+  level_means: types.RealTensor
+  level_variances: types.RealTensor
+  num_samples: types.IntTensor
+
+
+def estimate(
+    *,
+    dim: int,
+    drift_fn: Callable[..., types.RealTensor],
+    volatility_fn: Callable[..., types.RealTensor],
+    times: types.RealTensor,
+    payoff_fn: Callable[..., types.RealTensor],
+    num_levels: int,
+    base_num_time_steps: int = 1,
+    refinement_factor: int = 2,
+    initial_state: Optional[types.RealTensor] = None,
+    sampling_fn: Optional[Callable[..., types.RealTensor]] = None,
+    num_samples: Optional[List[int]] = None,
+    tolerance: Optional[types.RealTensor] = None,
+    num_pilot_samples: int = 1000,
+    random_type: Optional[random.RandomType] = None,
+    seed: Optional[types.IntTensor] = None,
+    dtype: Optional[tf.DType] = None,
+    name: Optional[str] = None) -> MultilevelEstimate:
+  """Estimates the expectation of a payoff of an Ito process with MLMC.
+
+  The multilevel Monte Carlo (MLMC) method of [1] writes the expectation of the
+  payoff `P_L` computed on the finest time grid with
+  `base_num_time_steps * refinement_factor**L` uniform steps as the telescoping
+  sum
+
+  ```None
+  E[P_L] = E[P_0] + sum_{l=1}^{L} E[P_l - P_{l-1}]
+  ```
+
+  and estimates each term independently. The paths on the fine and the coarse
+  grids of a level are driven by the same Brownian motion: the normal draws of
+  each coarse step are the normalized sums of the draws of the
+  `refinement_factor` fine steps it contains. The differences `P_l - P_{l-1}`
+  then have a small variance, so that most of the samples are spent on the
+  cheap coarse levels.
+
+  If `tolerance` is supplied, the variances of the levels are estimated from
+  `num_pilot_samples` samples and the number of samples on each level is then
+  chosen to minimize the cost for a variance of the estimator of
+  `tolerance**2 / 2` (see Section 2 of [1]). The remaining half of the mean
+  squared error budget is left to the discretization bias of the finest level,
+  which is controlled by `num_levels`.
+
+  #### Example
+
+  ```python
+  import functools
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  # Expected payoff of an Asian call option under geometric Brownian motion.
+  mu, sigma, strike = 0.05, 0.2, 1.0
+  times = [0.25, 0.5, 0.75, 1.0]
+
+  def payoff_fn(paths):
+    return tf.nn.relu(tf.math.reduce_mean(paths[..., 0], axis=-1) - strike)
+
+  result = tff.models.multilevel_monte_carlo.estimate(
+      dim=1,
+      drift_fn=lambda t, x: mu * x,
+      volatility_fn=lambda t, x: sigma * x[..., tf.newaxis],
+      times=times,
+      payoff_fn=payoff_fn,
+      initial_state=[1.0],
+      num_levels=6,
+      base_num_time_steps=4,
+      tolerance=1e-3,
+      random_type=tff.math.random.RandomType.STATELESS,
+      seed=[1, 2],
+      dtype=tf.float64)
+  # result.mean is the estimate, result.num_samples are the number of samples
+  # on each level.
+  ```
+
+  #### References
+  [1]: Michael B. Giles. Multilevel Monte Carlo path simulation. Operations
+    Research, 56(3):607-617, 2008.
+
+  Args:
+    dim: Python int greater than or equal to 1. The dimension of the Ito
+      Process.
+    drift_fn: A Python callable to compute the drift of the process. See
+      `tff.models.euler_sampling.sample` for details.
+    volatility_fn: A Python callable to compute the volatility of the process.
+      See `tff.models.euler_sampling.sample` for details.
+    times: Rank 1 `Tensor` of increasing positive real values. The times at
+      which the path points are evaluated for the payoff. Should be on the
+      coarsest time grid, otherwise the nearest points of each grid are used.
+    payoff_fn: A Python callable which maps the paths, a real `Tensor` of shape
+      `[num_samples, k, dim]` where `k` is the size of `times`, to the payoffs,
+      a real `Tensor` of shape `[num_samples]`.
+    num_levels: A positive Python `int`. The number of levels `L + 1`.
+    base_num_time_steps: A positive Python `int`. The number of time steps of
+      the coarsest grid.
+      Default value: 1.
+    refinement_factor: A Python `int` greater than 1. The ratio of the numbers
+      of time steps of consecutive levels.
+      Default value: 2.
+    initial_state: `Tensor` of shape `[dim]`. The initial state of the process.
+      Default value: None which maps to a zero initial state.
+    sampling_fn: A Python callable with the signature of
+      `tff.models.euler_sampling.sample` which samples the paths given the
+      `times_grid` and the `normal_draws`, e.g.,
+      `tff.models.milstein_sampling.sample` or a `functools.partial` of it
+      with additional arguments.
+      Default value: `None` which maps to `tff.models.euler_sampling.sample`.
+    num_samples: An optional list of `num_levels` positive Python `int`s. The
+      number of samples on each level. For the antithetic random types, odd
+      numbers are rounded up to the next even number, which also holds for
+      `num_pilot_samples` and for the numbers of samples chosen for the
+      `tolerance`.
+      Either this or `tolerance` should be supplied.
+      Default value: `None`.
+    tolerance: An optional positive scalar real `Tensor`. The target root mean
+      squared error of the estimate.
+      Either this or `num_samples` should be supplied.
+      Default value: `None`.
+    num_pilot_samples: A positive Python `int`. The number of samples on each
+      level used to estimate the variances when `tolerance` is supplied.
+      Default value: 1000.
+    random_type: Enum value of `RandomType`. The type of (quasi)-random number
+      generator to use to generate the paths. The `SOBOL` and `HALTON` types
+      are not supported since the estimates of the levels should be
+      independent, use `HALTON_RANDOMIZED` instead whose levels are randomized
+      independently.
+      Default value: None which maps to the standard pseudo-random numbers.
+    seed: Seed for the random number generator. For the `STATELESS` random
+      types, the seed of each batch of draws is folded with the index of the
+      batch, and for the other random types the index is added to the seed.
+      Default value: `None` which means no seed is set.
+    dtype: `tf.Dtype`. If supplied the dtype for the input and output
+      `Tensor`s.
+      Default value: None which means that the dtype implied by `times` is
+      used.
+    name: Python string. The name to give this op.
+      Default value: `None` which maps to `multilevel_monte_carlo_estimate`.
+
+  Returns:
+    An instance of `MultilevelEstimate`.
+
+  Raises:
+    ValueError: If not exactly one of `num_samples` and `tolerance` is
+      supplied, if `num_samples` does not have `num_levels` elements or if
+      `random_type` is `SOBOL` or `HALTON`.
+  """
+  if (num_samples is None) == (tolerance is None):
+    raise ValueError('Exactly one of `num_samples` or `tolerance` should be '
+                     'supplied.')
+  if num_samples is not None and len(num_samples) != num_levels:
+    raise ValueError('`num_samples` should have {0} elements. Supplied: {1}'
+                     .format(num_levels, len(num_samples)))
+  if random_type in (random.RandomType.SOBOL, random.RandomType.HALTON):
+    raise ValueError('The levels should be sampled independently, which is not '
+                     'supported by `random_type` {}.'.format(random_type))
+  if random_type in (random.RandomType.PSEUDO_ANTITHETIC,
+                     random.RandomType.STATELESS_ANTITHETIC):
+    # The antithetic draws come in pairs.
+    round_up = lambda n: n + n % 2
+  else:
+    round_up = lambda n: n
+  if num_samples is not None:
+    num_samples = [round_up(n) for n in num_samples]
+  num_pilot_samples = round_up(num_pilot_samples)
+  sampling_fn = sampling_fn or euler_sampling.sample
+  with tf.name_scope(name or 'multilevel_monte_carlo_estimate'):
+    times = tf.convert_to_tensor(times, dtype=dtype, name='times')
+    dtype = times.dtype
+    if initial_state is None:
+      initial_state = tf.zeros([dim], dtype=dtype)
+    initial_state = tf.convert_to_tensor(initial_state, dtype=dtype,
+                                         name='initial_state')
+
+    def level_statistics(level, level_num_samples, batch_index, skip):
+      """Returns the `MonteCarloStatistics` of the level payoffs."""
+      num_fine_steps = base_num_time_steps * refinement_factor**level
+      # Shape [num_fine_steps, num_samples, dim]
+      draws = utils.generate_mc_normal_draws(
+          num_normal_draws=dim, num_time_steps=num_fine_steps,
+          num_sample_paths=level_num_samples, random_type=random_type,
+          seed=_batch_seed(seed, random_type, batch_index), skip=skip,
+          dtype=dtype)
+      # Shape [num_samples, num_fine_steps, dim]
+      draws = tf.transpose(draws, [1, 0, 2])
+
+      def level_payoff(num_steps, normal_draws):
+        paths = sampling_fn(
+            dim=dim,
+            drift_fn=drift_fn,
+            volatility_fn=volatility_fn,
+            times=times,
+            times_grid=tf.linspace(tf.zeros([], dtype=dtype), times[-1],
+                                   num_steps + 1),
+            normal_draws=normal_draws,
+            initial_state=initial_state,
+            random_type=random_type,
+            seed=seed,
+            dtype=dtype)
+        return payoff_fn(paths)
+
+      values = level_payoff(num_fine_steps, draws)
+      if level > 0:
+        num_coarse_steps = num_fine_steps // refinement_factor
+        coarse_draws = tf.math.reduce_sum(
+            tf.reshape(draws, [-1, num_coarse_steps, refinement_factor, dim]),
+            axis=-2) / np.sqrt(refinement_factor)
+        values -= level_payoff(num_coarse_steps, coarse_draws)
+      return path_reducers.statistics(values, sample_axis=0)
+
+    if tolerance is None:
+      statistics = [level_statistics(level, n, level, 0)
+                    for level, n in enumerate(num_samples)]
+    else:
+      tolerance = tf.convert_to_tensor(tolerance, dtype=dtype,
+                                       name='tolerance')
+      pilot_statistics = [level_statistics(level, num_pilot_samples, level, 0)
+                    for level in range(num_levels)]
+      pilot_variances = _stack(pilot_statistics).variance
+      # Cost of a sample on each level: the fine and the coarse steps.
+      costs = np.array(
+          [base_num_time_steps * refinement_factor**level
+           * (1 + (1 / refinement_factor if level > 0 else 0))
+           for level in range(num_levels)])
+      costs = tf.constant(costs, dtype=dtype)
+      optimal_num_samples = tf.math.ceil(
+          2 / tolerance**2 * tf.math.sqrt(pilot_variances / costs)
+          * tf.math.reduce_sum(tf.math.sqrt(pilot_variances * costs)))
+      num_extra_samples = round_up(tf.math.maximum(
+          tf.cast(optimal_num_samples, tf.int32) - num_pilot_samples, 0))
+      statistics = []
+      for level in range(num_levels):
+        extra_statistics = level_statistics(
+            level, num_extra_samples[level], num_levels + level,
+            num_pilot_samples)
+        statistics.append(path_reducers.merge(pilot_statistics[level],
+                                              extra_statistics))
+    statistics = _stack(statistics)
+    return MultilevelEstimate(
+        mean=tf.math.reduce_sum(statistics.mean),
+        variance=tf.math.reduce_sum(
+            statistics.variance / statistics.num_samples),
+        level_means=statistics.mean,
+        level_variances=statistics.variance,
+        num_samples=tf.cast(statistics.num_samples, tf.int32))
+
+
+def _batch_seed(seed, random_type, batch_index):
+  """Returns distinct seeds for the independent batches of draws."""
+  if seed is None:
+    return None
+  if random_type in (random.RandomType.STATELESS,
+                     random.RandomType.STATELESS_ANTITHETIC):
+    return tf.random.experimental.stateless_fold_in(
+        tf.convert_to_tensor(seed), batch_index)
+  return seed + batch_index
+
+
+def _stack(statistics):
+  """Finalizes and stacks the per-level statistics along the levels."""
+  statistics = [path_reducers.finalize(sums) for sums in statistics]
+  return path_reducers.MonteCarloStatistics(
+      mean=tf.stack([sums.mean for sums in statistics]),
+      variance=tf.stack([sums.variance for sums in statistics]),
+      num_samples=tf.stack([sums.num_samples for sums in statistics]))
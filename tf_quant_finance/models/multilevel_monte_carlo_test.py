@@ -0,0 +1,184 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for methods in `multilevel_monte_carlo`."""
+
+from absl.testing import parameterized
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+
+from tensorflow.python.framework import test_util  # pylint: disable=g-direct-tensorflow-import
+
+multilevel_monte_carlo = tff.models.multilevel_monte_carlo
+random = tff.math.random
+
+_MU = 0.05
+_SIGMA = 0.2
+
+
+def _drift_fn(t, x):
+  del t
+  return _MU * x
+
+
+def _volatility_fn(t, x):
+  del t
+  return _SIGMA * x[..., tf.newaxis]
+
+
+@test_util.run_all_in_graph_and_eager_modes
+class MultilevelMonteCarloTest(tf.test.TestCase, parameterized.TestCase):
+
+  def test_fixed_num_samples(self):
+    """Estimates the expected terminal value of a geometric Brownian motion."""
+    dtype = tf.float64
+    result = self.evaluate(multilevel_monte_carlo.estimate(
+        dim=1,
+        drift_fn=_drift_fn,
+        volatility_fn=_volatility_fn,
+        times=[1.0],
+        payoff_fn=lambda paths: paths[:, -1, 0],
+        initial_state=[1.0],
+        num_levels=4,
+        base_num_time_steps=2,
+        num_samples=[4000, 1000, 500, 250],
+        random_type=random.RandomType.STATELESS,
+        seed=[4, 2],
+        dtype=dtype))
+    with self.subTest('NumSamples'):
+      self.assertAllEqual(result.num_samples, [4000, 1000, 500, 250])
+    with self.subTest('Mean'):
+      self.assertAllClose(result.mean, np.exp(_MU),
+                          atol=4 * np.sqrt(result.variance))
+    with self.subTest('Variance'):
+      self.assertAllClose(
+          result.variance,
+          np.sum(result.level_variances / result.num_samples))
+    with self.subTest('Coupling'):
+      # The coupled fine and coarse paths are close.
+      self.assertAllLess(result.level_variances[1:],
+                         0.01 * result.level_variances[0])
+
+  @parameterized.named_parameters(
+      ('Euler', tff.models.euler_sampling.sample),
+      ('Milstein', tff.models.milstein_sampling.sample))
+  def test_tolerance(self, sampling_fn):
+    """Estimates the expected payoff of an Asian option to a tolerance."""
+    dtype = tf.float64
+    tolerance = 2e-3
+
+    def payoff_fn(paths):
+      return tf.nn.relu(tf.math.reduce_mean(paths[..., 0], axis=-1) - 1.0)
+
+    result = self.evaluate(multilevel_monte_carlo.estimate(
+        dim=1,
+        drift_fn=_drift_fn,
+        volatility_fn=_volatility_fn,
+        times=[0.25, 0.5, 0.75, 1.0],
+        payoff_fn=payoff_fn,
+        initial_state=[1.0],
+        num_levels=4,
+        base_num_time_steps=4,
+        sampling_fn=sampling_fn,
+        tolerance=tolerance,
+        num_pilot_samples=500,
+        random_type=random.RandomType.STATELESS,
+        seed=[1, 2],
+        dtype=dtype))
+    with self.subTest('Variance'):
+      # Half of the mean squared error budget is spent on the variance, up to
+      # the error of the pilot estimates of the level variances.
+      self.assertLess(result.variance, 0.75 * tolerance**2)
+    with self.subTest('NumSamples'):
+      self.assertAllGreaterEqual(result.num_samples, 500)
+      self.assertGreater(result.num_samples[0], result.num_samples[-1])
+    with self.subTest('Mean'):
+      # Reference value from a Monte Carlo simulation with 10^7 paths of the
+      # exact solution.
+      self.assertAllClose(result.mean, 0.0729, atol=3 * tolerance)
+
+  def test_large_payoff_offset(self):
+    """Level variances are not affected by a large mean of the payoffs."""
+    def estimate(offset):
+      return multilevel_monte_carlo.estimate(
+          dim=1,
+          drift_fn=_drift_fn,
+          volatility_fn=_volatility_fn,
+          times=[1.0],
+          payoff_fn=lambda paths: paths[:, -1, 0] + offset,
+          initial_state=[1.0],
+          num_levels=3,
+          tolerance=1e-2,
+          num_pilot_samples=200,
+          random_type=random.RandomType.STATELESS,
+          seed=[4, 2],
+          dtype=tf.float64)
+
+    result, offset_result = self.evaluate([estimate(0.0), estimate(1e8)])
+    with self.subTest('LevelVariances'):
+      self.assertAllClose(offset_result.level_variances,
+                          result.level_variances, rtol=1e-5, atol=0)
+    with self.subTest('NumSamples'):
+      self.assertAllEqual(offset_result.num_samples, result.num_samples)
+    with self.subTest('Mean'):
+      self.assertAllClose(offset_result.mean - 1e8, result.mean, atol=1e-6)
+
+  @parameterized.named_parameters(
+      ('FixedNumSamples', [301, 101], None),
+      ('Tolerance', None, 2e-2))
+  def test_antithetic_num_samples(self, num_samples, tolerance):
+    """Numbers of antithetic samples are rounded up to even numbers."""
+    result = self.evaluate(multilevel_monte_carlo.estimate(
+        dim=1,
+        drift_fn=_drift_fn,
+        volatility_fn=_volatility_fn,
+        times=[1.0],
+        payoff_fn=lambda paths: paths[:, -1, 0],
+        initial_state=[1.0],
+        num_levels=2,
+        num_samples=num_samples,
+        tolerance=tolerance,
+        num_pilot_samples=101,
+        random_type=random.RandomType.STATELESS_ANTITHETIC,
+        seed=[4, 2],
+        dtype=tf.float64))
+    with self.subTest('EvenNumSamples'):
+      self.assertAllEqual(result.num_samples % 2, [0, 0])
+    if num_samples is not None:
+      with self.subTest('NumSamples'):
+        self.assertAllEqual(result.num_samples, [302, 102])
+
+  def test_invalid_arguments(self):
+    """Error is raised if the number of samples is not specified correctly."""
+    kwargs = dict(
+        dim=1, drift_fn=_drift_fn, volatility_fn=_volatility_fn, times=[1.0],
+        payoff_fn=lambda paths: paths[:, -1, 0], num_levels=2,
+        dtype=tf.float64)
+    with self.subTest('NoSamples'):
+      with self.assertRaises(ValueError):
+        multilevel_monte_carlo.estimate(**kwargs)
+    with self.subTest('WrongNumLevels'):
+      with self.assertRaises(ValueError):
+        multilevel_monte_carlo.estimate(num_samples=[100], **kwargs)
+    with self.subTest('QuasiRandom'):
+      with self.assertRaises(ValueError):
+        multilevel_monte_carlo.estimate(
+            num_samples=[100, 100], random_type=random.RandomType.SOBOL,
+            **kwargs)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -0,0 +1,42 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Constructions of Brownian paths from normal draws."""
+
+import enum
+
+
+@enum.unique
+class PathConstruction(enum.Enum):
+  """Constructions of Brownian paths from independent normal draws.
+
+  The construction determines which of the normal draws of a sample path
+  drive which features of the path. This matters for quasi-Monte Carlo
+  methods, where the leading dimensions of a low-discrepancy sequence are
+  much better distributed than the trailing ones.
+
+  * `INCREMENTAL`: The `i`-th draw drives the `i`-th Brownian increment.
+  * `BROWNIAN_BRIDGE`: The first draw drives the terminal value of the path,
+    the next ones drive the midpoints of the previously constructed points,
+    bisecting the time grid (see Section 3.1 of [1]).
+  * `PCA`: The `i`-th draw drives the `i`-th principal component of the path,
+    i.e., the eigenvector of the covariance matrix of the path with the `i`-th
+    largest eigenvalue (see Section 3.1 of [1]).
+
+  #### References
+  [1] Paul Glasserman. Monte Carlo Methods in Financial Engineering. Springer,
+    2003.
+  """
+  INCREMENTAL = 1
+  BROWNIAN_BRIDGE = 2
+  PCA = 3
@@ -0,0 +1,369 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reduction of Monte Carlo sample paths to path statistics.
+
+A `PathReducer` describes how the states of a sample path at the requested
+times are folded into per-path values (e.g., discounted payoffs). Samplers which
+support reducers, such as `tff.models.euler_sampling.sample`, update the
+reducer as the paths are generated and return only the `MonteCarloStatistics`
+of the per-path values, so that the paths are never stored.
+
+#### Example
+
+```python
+import tensorflow as tf
+import tf_quant_finance as tff
+
+# Expected payoff of an arithmetic average option on a Brownian motion with
+# 10^6 paths simulated in blocks of 10^5 paths.
+strike = 0.1
+reducer = tff.models.path_reducers.path_average(
+    payoff_fn=lambda average: tf.nn.relu(average[..., 0] - strike))
+statistics = tff.models.euler_sampling.sample(
+    dim=1,
+    drift_fn=lambda t, x: tf.zeros_like(x),
+    volatility_fn=lambda t, x: tf.ones_like(x)[..., tf.newaxis],
+    times=[0.25, 0.5, 0.75, 1.0],
+    num_time_steps=100,
+    num_samples=1000000,
+    path_reducer=reducer,
+    block_size=100000,
+    seed=[1, 2],
+    random_type=tff.math.random.RandomType.STATELESS,
+    dtype=tf.float64)
+# statistics.mean is the Monte Carlo estimate of the expected payoff and
+# statistics.standard_error() its standard error.
+```
+"""
+
+import collections
+from typing import Callable, Optional
+
+import tensorflow.compat.v2 as tf
+
+from tf_quant_finance import types
+from tf_quant_finance import utils as tff_utils
+from tf_quant_finance.math import random_ops as random
+
+__all__ = [
+    'MonteCarloStatistics',
+    'PathReducer',
+    'path_average',
+    'path_maximum',
+    'path_minimum',
+    'terminal_value',
+]
+
+
+PathReducer = collections.namedtuple(
+    'PathReducer',
+    [
+        # A callable which maps the initial state of the paths, a `Tensor` of
+        # shape `batch_shape + [num_samples, dim]`, to the initial accumulator,
+        # a nested structure of `Tensor`s.
+        'initial_fn',
+        # A callable `(accumulator, time, state) -> accumulator` which folds
+        # the state of the paths at one of the requested times into the
+        # accumulator. The structure and the shapes of the accumulator should
+        # not change.
+        'update_fn',
+        # A callable which maps the final accumulator to the per-path values,
+        # a `Tensor` of shape `batch_shape + [num_samples] + values_shape`.
+        'result_fn',
+    ])
+
+
+@tff_utils.dataclass
+class MonteCarloStatistics:
+  """Statistics of the per-path values over the Monte Carlo sample paths.
+
+  Attributes:
+    mean: A real `Tensor` of shape `batch_shape + values_shape`. The sample mean
+      of the per-path values.
+    variance: A real `Tensor` of the same shape as `mean`. The (unbiased)
+      sample variance of the per-path values.
+    num_samples: A scalar real `Tensor`. The number of sample paths.
+  """
+  mean: types.RealTensor
+  variance: types.RealTensor
+  num_samples: types.RealTensor
+
+  def standard_error(self) -> types.RealTensor:
+    """The standard error of the sample mean."""
+    return tf.math.sqrt(self.variance / self.num_samples)
+
+
+def terminal_value(
+    payoff_fn: Optional[Callable[..., types.RealTensor]] = None
+    ) -> PathReducer:
+  """Reduces the paths to (a function of) their state at the last time.
+
+  Args:
+    payoff_fn: An optional Python callable which maps the terminal state of
+      shape `batch_shape + [num_samples, dim]` to the per-path values of shape
+      `batch_shape + [num_samples] + values_shape`.
+      Default value: `None` which means that the per-path values are the
+      terminal states.
+
+  Returns:
+    An instance of `PathReducer`.
+  """
+  return PathReducer(
+      initial_fn=tf.identity,
+      update_fn=lambda accumulator, time, state: state,
+      result_fn=payoff_fn or tf.identity)
+
+
+def path_average(
+    payoff_fn: Optional[Callable[..., types.RealTensor]] = None
+    ) -> PathReducer:
+  """Reduces the paths to (a function of) their average over the times.
+
+  The states are averaged over the requested times, which include the initial
+  time only if it is one of the requested times.
+
+  Args:
+    payoff_fn: An optional Python callable which maps the average state of
+      shape `batch_shape + [num_samples, dim]` to the per-path values of shape
+      `batch_shape + [num_samples] + values_shape`.
+      Default value: `None` which means that the per-path values are the
+      average states.
+
+  Returns:
+    An instance of `PathReducer`.
+  """
+  def initial_fn(state):
+    return tf.zeros_like(state), tf.zeros([], dtype=state.dtype)
+
+  def update_fn(accumulator, time, state):
+    del time
+    total, count = accumulator
+    return total + state, count + 1
+
+  def result_fn(accumulator):
+    total, count = accumulator
+    average = total / count
+    return average if payoff_fn is None else payoff_fn(average)
+
+  return PathReducer(initial_fn=initial_fn, update_fn=update_fn,
+                     result_fn=result_fn)
+
+
+def path_maximum(
+    payoff_fn: Optional[Callable[..., types.RealTensor]] = None
+    ) -> PathReducer:
+  """Reduces the paths to (a function of) their running maximum.
+
+  The maximum is taken componentwise over the requested times, which include
+  the initial time only if it is one of the requested times.
+
+  Args:
+    payoff_fn: An optional Python callable which maps the maximum state of
+      shape `batch_shape + [num_samples, dim]` to the per-path values of shape
+      `batch_shape + [num_samples] + values_shape`.
+      Default value: `None` which means that the per-path values are the
+      maximum states.
+
+  Returns:
+    An instance of `PathReducer`.
+  """
+  return PathReducer(
+      initial_fn=lambda state: tf.fill(tf.shape(state), state.dtype.min),
+      update_fn=lambda accumulator, time, state: tf.math.maximum(  # pylint: disable=g-long-lambda
+          accumulator, state),
+      result_fn=payoff_fn or tf.identity)
+
+
+def path_minimum(
+    payoff_fn: Optional[Callable[..., types.RealTensor]] = None
+    ) -> PathReducer:
+  """Reduces the paths to (a function of) their running minimum.
+
+  The minimum is taken componentwise over the requested times, which include
+  the initial time only if it is one of the requested times.
+
+  Args:
+    payoff_fn: An optional Python callable which maps the minimum state of
+      shape `batch_shape + [num_samples, dim]` to the per-path values of shape
+      `batch_shape + [num_samples] + values_shape`.
+      Default value: `None` which means that the per-path values are the
+      minimum states.
+
+  Returns:
+    An instance of `PathReducer`.
+  """
+  return PathReducer(
+      initial_fn=lambda state: tf.fill(tf.shape(state), state.dtype.max),
+      update_fn=lambda accumulator, time, state: tf.math.minimum(  # pylint: disable=g-long-lambda
+          accumulator, state),
+      result_fn=payoff_fn or tf.identity)
+
+
+def update(path_reducer: PathReducer,
+           accumulator,
+           keep: types.BoolTensor,
+           time: types.RealTensor,
+           state: types.RealTensor):
+  """Updates the accumulator of a reducer if `keep` is `True`.
+
+  Args:
+    path_reducer: An instance of `PathReducer`.
+    accumulator: The accumulator of the reducer.
+    keep: A scalar boolean `Tensor`. Whether `time` is one of the requested
+      times.
+    time: A scalar real `Tensor`. The time of the `state`.
+    state: A real `Tensor` of shape `batch_shape + [num_samples, dim]`. The
+      state of the paths at `time`.
+
+  Returns:
+    The updated accumulator.
+  """
+  updated = path_reducer.update_fn(accumulator, time, state)
+  return tf.nest.map_structure(
+      lambda new, old: tf.where(keep, new, old), updated, accumulator)
+
+
+def statistics(values: types.RealTensor,
+               sample_axis: int) -> MonteCarloStatistics:
+  """Computes the statistics of a block of per-path values.
+
+  Args:
+    values: A real `Tensor` of shape `batch_shape + [num_samples] +
+      values_shape`. The per-path values.
+    sample_axis: A Python `int`. The axis of the samples, i.e., the rank of
+      `batch_shape`.
+
+  Returns:
+    An instance of `MonteCarloStatistics` whose `variance` holds the sum of the
+    squared deviations from the mean (see `finalize`).
+  """
+  num_samples = tf.cast(tf.shape(values)[sample_axis], dtype=values.dtype)
+  # The mean of an empty block is zero, so that merging it is a no-op.
+  mean = tf.math.divide_no_nan(
+      tf.math.reduce_sum(values, axis=sample_axis), num_samples)
+  squares = tf.math.reduce_sum(
+      (values - tf.expand_dims(mean, axis=sample_axis))**2, axis=sample_axis)
+  return MonteCarloStatistics(mean=mean, variance=squares,
+                              num_samples=num_samples)
+
+
+def merge(first: MonteCarloStatistics,
+          second: MonteCarloStatistics) -> MonteCarloStatistics:
+  """Merges the statistics of two disjoint blocks of samples.
+
+  Uses the pairwise update of the mean and of the sum of the squared
+  deviations of Chan, Golub and LeVeque, which is stable for many blocks.
+
+  Args:
+    first: An instance of `MonteCarloStatistics` as returned by `statistics`.
+    second: An instance of `MonteCarloStatistics` as returned by `statistics`.
+
+  Returns:
+    An instance of `MonteCarloStatistics` for the union of the blocks.
+  """
+  num_samples = first.num_samples + second.num_samples
+  delta = second.mean - first.mean
+  mean = first.mean + delta * second.num_samples / num_samples
+  squares = (first.variance + second.variance
+             + delta**2 * first.num_samples * second.num_samples / num_samples)
+  return MonteCarloStatistics(mean=mean, variance=squares,
+                              num_samples=num_samples)
+
+
+def finalize(sums: MonteCarloStatistics) -> MonteCarloStatistics:
+  """Converts the sum of the squared deviations to the sample variance."""
+  return MonteCarloStatistics(
+      mean=sums.mean,
+      variance=sums.variance / tf.math.maximum(sums.num_samples - 1, 1),
+      num_samples=sums.num_samples)
+
+
+def reduce_in_blocks(
+    values_fn: Callable[..., types.RealTensor],
+    num_blocks: types.IntTensor,
+    sample_axis: int,
+    random_type: Optional[random.RandomType] = None,
+    seed: Optional[types.IntTensor] = None,
+    swap_memory: bool = True) -> MonteCarloStatistics:
+  """Computes the statistics of per-path values generated in blocks.
+
+  The blocks are generated one at a time in a `tf.while_loop` and only the
+  statistics of the blocks are kept. For the `STATELESS` random types the seed
+  is folded with the index of the block. For the stateful pseudo-random types
+  the random ops of the blocks generated in the loop are seeded differently
+  from those of the first block, so that they draw fresh numbers at every
+  iteration. The quasi-random types use the same `seed` for all the blocks so
+  that the blocks are consecutive parts of the same (randomized) sequence.
+
+  Args:
+    values_fn: A Python callable `(block, seed) -> values` which maps the
+      scalar integer index of a block and the seed to use for its draws to
+      the per-path values of the block, a real `Tensor` of shape
+      `batch_shape + [block_size] + values_shape`. Samplers using
+      quasi-random numbers should skip the points of the previous blocks.
+    num_blocks: A positive scalar integer `Tensor`. The number of blocks.
+    sample_axis: A Python `int`. The axis of the samples, i.e., the rank of
+      `batch_shape`.
+    random_type: Enum value of `RandomType`. The type of (quasi)-random
+      number generator used by `values_fn`.
+      Default value: `None` which maps to the standard pseudo-random numbers.
+    seed: The seed for the random number generator as accepted by
+      `random_type`.
+      Default value: `None` which means no seed is set.
+    swap_memory: A Python bool. Whether GPU-CPU memory swap is enabled for the
+      loop over the blocks.
+      Default value: True.
+
+  Returns:
+    An instance of `MonteCarloStatistics` for all the blocks.
+  """
+  def block_statistics(block, block_seed):
+    return statistics(values_fn(block, block_seed), sample_axis=sample_axis)
+
+  # The first block fixes the shapes of the statistics.
+  sums = block_statistics(0, _block_seed(seed, random_type, 0))
+  # The seeds of stateful random ops should be Python integers, so that a
+  # single seed is used for the blocks of the loop.
+  loop_seed = _block_seed(seed, random_type, 1)
+
+  def block_cond_fn(block, sums):
+    del sums
+    return block < num_blocks
+
+  def block_body_fn(block, sums):
+    if random_type in (random.RandomType.STATELESS,
+                       random.RandomType.STATELESS_ANTITHETIC):
+      block_seed = _block_seed(seed, random_type, block)
+    else:
+      block_seed = loop_seed
+    return block + 1, merge(sums, block_statistics(block, block_seed))
+
+  _, sums = tf.while_loop(block_cond_fn, block_body_fn, (1, sums),
+                          swap_memory=swap_memory)
+  return finalize(sums)
+
+
+def _block_seed(seed, random_type, block):
+  """Returns the seed of the draws of a block."""
+  if seed is None:
+    return None
+  if random_type in (random.RandomType.STATELESS,
+                     random.RandomType.STATELESS_ANTITHETIC):
+    return tf.random.experimental.stateless_fold_in(
+        tf.convert_to_tensor(seed), block)
+  if random_type in (None, random.RandomType.PSEUDO,
+                     random.RandomType.PSEUDO_ANTITHETIC):
+    return seed + block
+  # The quasi-random blocks are separated by skipping the previous points.
+  return seed
@@ -121,6 +121,7 @@ class SabrModel(generic_ito_process.GenericItoProcess):
                enable_unbiased_sampling: bool = False,
                psi_threshold: types.RealTensor = 2,
                ncx2_cdf_truncation: int = 10,
+               ncx2_cdf_grid_size: Optional[int] = None,
                dtype: Optional[tf.DType] = None,
                name: Optional[str] = None):
     """Initializes the SABR Model.
@@ -151,9 +152,22 @@ class SabrModel(generic_ito_process.GenericItoProcess):
         expression from 0 to infinity. In practice, it needs to be truncated to
         compute an approximate value. This argument is the index of the last
         term that will be included in the sum. Default value: 10.
+      ncx2_cdf_grid_size: An optional integer greater than 1. If supplied, the
+        terms of the noncentral X2 CDF series are tabulated once per simulation
+        on a grid of `ncx2_cdf_grid_size` points for the degrees of freedom of
+        the model and linearly interpolated when sampling the forwards, instead
+        of being evaluated with incomplete gamma functions at every time step.
+        This speeds up the unbiased sampling procedure at the cost of an
+        interpolation error of the CDF, which is of the order of `1e-5` for a
+        grid of `1000` points and decreases quadratically with the grid size.
+        Default value: `None` which means that the series is evaluated exactly.
       dtype: The float type to use. Default value: `tf.float32`
       name: str. The name to give to the ops created by this class.
         Default value: None which maps to the default name `sabr_model`.
+
+    Raises:
+      ValueError: If `ncx2_cdf_grid_size` is supplied and is less than 2.
+
     ### References:
     [1]: Chen B, Oosterlee CW, Van Der Weide H. Efficient unbiased simulation
       scheme for the SABR stochastic volatility model. 2011
@@ -162,6 +176,9 @@ class SabrModel(generic_ito_process.GenericItoProcess):
     Volatility Model (January 23, 2007). Available at SSRN:
     https://ssrn.com/abstract=946405 or http://dx.doi.org/10.2139/ssrn.946405
     """
+    if ncx2_cdf_grid_size is not None and ncx2_cdf_grid_size < 2:
+      raise ValueError('`ncx2_cdf_grid_size` should be greater than 1. '
+                       'Supplied: {}'.format(ncx2_cdf_grid_size))
     self._dtype = dtype or tf.float32
     self._name = name or 'sabr_model'
     self._enable_unbiased_sampling = enable_unbiased_sampling
@@ -175,6 +192,7 @@ class SabrModel(generic_ito_process.GenericItoProcess):
     self._psi_threshold = tf.convert_to_tensor(
         psi_threshold, dtype=self._dtype, name='psi_threshold')
     self._ncx2_cdf_truncation = ncx2_cdf_truncation
+    self._ncx2_cdf_grid_size = ncx2_cdf_grid_size
     self._shift = tf.convert_to_tensor(shift, dtype=self._dtype, name='shift')
 
     drift_fn = lambda _, x: tf.zeros_like(x)
@@ -409,13 +427,21 @@ class SabrModel(generic_ito_process.GenericItoProcess):
           dtype=self._dtype)
     else:
       normal_draws = None
+    if self._ncx2_cdf_grid_size is not None:
+      # The degrees of freedom are the same for all the samples and time steps
+      # so that the CDF terms are tabulated once for the whole simulation.
+      ncx2_table = _ncx2cdf_terms_table(
+          self._chi2_degrees_of_freedom(), self._ncx2_cdf_truncation,
+          self._ncx2_cdf_grid_size, self._dtype)
+    else:
+      ncx2_table = None
 
     def body_fn(index, current_time, forward, vol, forward_paths, vol_paths,
                 normal_draws_index):
       """Simulate Sabr process to the next time point."""
       forward, vol, normal_draws_index = self._propagate_to_time(
           forward, vol, current_time, times[index], time_step, random_type,
-          seed, normal_draws, normal_draws_index, num_time_steps)
+          seed, normal_draws, normal_draws_index, num_time_steps, ncx2_table)
       # Always update paths in outer loop.
       if record_samples:
         # Update volatility paths
@@ -450,7 +476,7 @@ class SabrModel(generic_ito_process.GenericItoProcess):
 
   def _propagate_to_time(self, start_forward, start_vol, start_time, end_time,
                          time_step, random_type, seed, normal_draws,
-                         normal_draws_index, num_time_steps):
+                         normal_draws_index, num_time_steps, ncx2_table):
     cond_fn = lambda t, *args: t < end_time
 
     def body_fn(current_time, forward, vol, normal_draws_index):
@@ -475,7 +501,7 @@ class SabrModel(generic_ito_process.GenericItoProcess):
       next_vol = self._sample_next_volatilities(vol, dt, dwv)
       iv = self._sample_integrated_variance(vol, next_vol, dt)
       next_forward = self._sample_forwards(forward, vol, next_vol, iv, uniforms,
-                                           z)
+                                           z, ncx2_table)
 
       return current_time + dt, next_forward, next_vol, normal_draws_index + 1
     _, next_forward, next_vol, normal_draws_index = tf.while_loop(
@@ -491,13 +517,17 @@ class SabrModel(generic_ito_process.GenericItoProcess):
   def _sample_integrated_variance(self, vol, next_vol, dt):
     return (1. - self._rho**2) * dt * (vol**2 + next_vol**2) / 2.
 
-  def _sample_forwards(self, forward, vol, next_vol, iv, uniforms, z):
+  def _chi2_degrees_of_freedom(self):
+    return (2. - (1. - 2 * self._beta - self._rho**2 * (1. - self._beta)) /
+            ((1. - self._beta) * (1 - self._rho**2)))
+
+  def _sample_forwards(self, forward, vol, next_vol, iv, uniforms, z,
+                       ncx2_table):
     # See the "Direct inversion scheme" in section 3.4 in Reference [1].
     a = 1. / iv * (forward**(1. - self._beta) /
                    (1. - self._beta) + self._rho / self._volvol *
                    (next_vol - vol))**2
-    b = (2. - (1. - 2 * self._beta - self._rho**2 * (1. - self._beta)) /
-         ((1. - self._beta) * (1 - self._rho**2)))
+    b = self._chi2_degrees_of_freedom()
     # Broadcast a to same shape as forward.
     b += tf.zeros_like(forward)
 
@@ -516,7 +546,7 @@ class SabrModel(generic_ito_process.GenericItoProcess):
     next_forward_cond_1 = ((1. - self._beta)**2 * iv * d *
                            (e + z)**2)**(0.5 / (1. - self._beta))
 
-    c_star = self._root_chi2(a, b, uniforms)
+    c_star = self._root_chi2(a, b, uniforms, ncx2_table)
     next_forward_cond_2 = (c_star * (1 - self._beta)**2 *
                            iv)**(1 / (2 - 2 * self._beta))
 
@@ -526,11 +556,17 @@ class SabrModel(generic_ito_process.GenericItoProcess):
     return tf.compat.v2.where(should_be_zero, tf.zeros_like(forward),
                               next_forward)
 
-  def _root_chi2(self, a, b, uniforms):
+  def _root_chi2(self, a, b, uniforms, ncx2_table):
     c_init = a
+    # The terms of the CDF series do not depend on the non-centrality parameter
+    # and are computed once for all the iterations of the root finder.
+    if ncx2_table is None:
+      terms = _ncx2cdf_terms(a, b, self._ncx2_cdf_truncation)
+    else:
+      terms = _interpolate_ncx2cdf_terms(ncx2_table, a)
 
     def equation(c_star):
-      p, dpc = ncx2cdf_and_gradient(a, b, c_star, self._ncx2_cdf_truncation)
+      p, dpc = _ncx2cdf_and_gradient_from_terms(terms, c_star)
       return 1 - p - uniforms, -dpc
 
     result, _, _ = root_finder(equation, c_init)
@@ -556,14 +592,40 @@ def ncx2cdf_and_gradient(x, k, l, truncation=10):
     `Tensor` is the gradient of the CDF over l. Both of the `Tensors` are of
     same shape as `x`.
   """
-  g = 0.
-  dg = 0.
+  return _ncx2cdf_and_gradient_from_terms(
+      _ncx2cdf_terms(x, k, truncation), l)
+
+
+def _ncx2cdf_terms(x, k, truncation):
+  """Returns the terms `P((k + 2 j) / 2, x / 2) / j!` of the CDF series.
+
+  Args:
+    x: Values of the random variable following a noncentral X2 distribution. A
+      real `Tensor`.
+    k: Degrees of freedom. A positive real `Tensor` broadcastable with `x`.
+    truncation: A positive integer. The index of the last term of the series.
+
+  Returns:
+    A `Tensor` of shape `[truncation + 1] + x.shape`.
+  """
+  terms = []
   factorial = 1.
   for j in range(truncation + 1):
     factorial *= j if j > 0 else 1
-    h = (1 - tf.math.igammac((k + 2 * j) / 2., x / 2.)) / factorial
-    g += h * (l * 0.5)**j
-    dg += h * 0.5 * j * (l * 0.5)**(j - 1)
+    terms.append((1 - tf.math.igammac((k + 2 * j) / 2., x / 2.)) / factorial)
+  return tf.stack(terms)
+
+
+def _ncx2cdf_and_gradient_from_terms(terms, l):
+  """Returns the CDF of noncentral X2 distribution and its gradient over l."""
+  # Horner's scheme for the series in `l / 2` and for its derivative.
+  y = l * 0.5
+  g = terms[-1]
+  dg = tf.zeros_like(g)
+  for j in range(terms.shape[0] - 2, -1, -1):
+    dg = dg * y + g
+    g = g * y + terms[j]
+  dg *= 0.5
   f = tf.math.exp(-0.5 * l)
   df = -0.5 * f
   p = f * g
@@ -571,6 +633,47 @@ def ncx2cdf_and_gradient(x, k, l, truncation=10):
   return p, dp
 
 
+def _ncx2cdf_terms_table(k, truncation, grid_size, dtype):
+  """Tabulates the terms of the noncentral X2 CDF series.
+
+  The terms are tabulated on a uniform grid in `sqrt(x)`, which resolves their
+  square root behaviour at `x = 0` for `k = 1`. The grid extends to the point
+  where all the terms are equal to their limits `1 / j!` up to the precision of
+  the `dtype`.
+
+  Args:
+    k: Degrees of freedom. A positive real scalar `Tensor`.
+    truncation: A positive integer. The index of the last term of the series.
+    grid_size: A positive integer greater than 1. The number of grid points.
+    dtype: The dtype of the table.
+
+  Returns:
+    A tuple of the grid step in `sqrt(x)` and of the `Tensor` of shape
+    `[truncation + 1, grid_size]` of the tabulated terms.
+  """
+  k = tf.convert_to_tensor(k, dtype=dtype)
+  # The gamma distribution of the last term has the largest mean `shape`.
+  shape = (k + 2 * truncation) / 2
+  grid_max = tf.math.sqrt(2 * (shape + 10 * tf.math.sqrt(shape) + 10))
+  grid_step = grid_max / (grid_size - 1)
+  grid = tf.range(grid_size, dtype=dtype) * grid_step
+  return grid_step, _ncx2cdf_terms(grid**2, k, truncation)
+
+
+def _interpolate_ncx2cdf_terms(table, x):
+  """Linearly interpolates the tabulated terms of the CDF series at `x`."""
+  grid_step, values = table
+  grid_size = values.shape[-1]
+  scaled_x = tf.math.sqrt(x) / grid_step
+  index = tf.clip_by_value(
+      tf.cast(tf.math.floor(scaled_x), tf.int32), 0, grid_size - 2)
+  # Values beyond the grid are mapped to the last grid point
+  weight = tf.clip_by_value(scaled_x - tf.cast(index, x.dtype), 0, 1)
+  lower = tf.gather(values, index, axis=1)
+  upper = tf.gather(values, index + 1, axis=1)
+  return lower + weight * (upper - lower)
+
+
 def _is_callable(var_or_fn):
   """Returns whether an object is callable or not."""
   # Python 2.7 as well as Python 3.x with x > 2 support 'callable'.
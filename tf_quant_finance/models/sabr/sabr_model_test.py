@@ -115,6 +115,42 @@ class SabrModelTest(parameterized.TestCase, tf.test.TestCase):
       mean = np.mean(paths[:, i, 0])
       self.assertAllClose(mean, initial_forward, rtol=0.1, atol=0.1)
 
+  @parameterized.named_parameters(
+      ("zero_beta", 0., 0., 0.1),
+      ("non_zero_beta", 0.5, 0.3, 0.05),
+      ("large_beta", 0.9, -0.5, 0.01))
+  def test_ncx2_cdf_grid(self, beta, rho, initial_forward):
+    """Tabulated noncentral X2 CDF gives the same paths as the exact one."""
+    dtype = tf.float64
+    times = [0.5, 1.0]
+    num_samples = 1000
+    test_seed = [123, 124]
+    paths = {}
+    for grid_size in (None, 1000):
+      process = SabrModel(
+          beta=beta,
+          volvol=1.0,
+          rho=rho,
+          dtype=dtype,
+          enable_unbiased_sampling=True,
+          ncx2_cdf_grid_size=grid_size)
+      paths[grid_size] = process.sample_paths(
+          initial_forward=initial_forward,
+          initial_volatility=0.1,
+          times=times,
+          time_step=0.1,
+          num_samples=num_samples,
+          seed=test_seed,
+          random_type=tff.math.random.RandomType.STATELESS_ANTITHETIC)
+    exact_paths, tabulated_paths = self.evaluate([paths[None], paths[1000]])
+    self.assertAllClose(exact_paths, tabulated_paths, rtol=0, atol=1e-4)
+
+  def test_ncx2_cdf_grid_size_too_small(self):
+    """Error is raised if the grid has less than two points."""
+    with self.assertRaises(ValueError):
+      SabrModel(beta=0.5, volvol=1.0, rho=0.0, dtype=tf.float64,
+                enable_unbiased_sampling=True, ncx2_cdf_grid_size=1)
+
   @parameterized.named_parameters(
       ("beta_too_small", -1, 1, 0, [1.]), ("beta_too_large", 1.1, 1, 0, [0.5]),
       ("negative_volvol", 0.5, -1, 0, [1.]),
@@ -0,0 +1,195 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reproducible Monte Carlo estimation sharded across worker processes."""
+
+from concurrent import futures
+import functools
+import multiprocessing
+import os
+from typing import Callable, Optional
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from tf_quant_finance import types
+from tf_quant_finance.math import random
+from tf_quant_finance.models import path_reducers
+
+__all__ = [
+    'estimate',
+]
+
+
+_REPRODUCIBLE_RANDOM_TYPES = (
+    random.RandomType.STATELESS,
+    random.RandomType.STATELESS_ANTITHETIC,
+    random.RandomType.SOBOL,
+    random.RandomType.HALTON,
+    random.RandomType.HALTON_RANDOMIZED,
+)
+
+
+def estimate(
+    sample_fn: Callable[..., types.RealTensor],
+    num_samples: int,
+    block_size: int,
+    random_type: random.RandomType,
+    seed: Optional[types.IntTensor] = None,
+    skip: int = 0,
+    num_workers: Optional[int] = None,
+    num_threads_per_worker: Optional[int] = None
+) -> path_reducers.MonteCarloStatistics:
+  """Estimates the statistics of per-path values in parallel processes.
+
+  The `num_samples` paths are partitioned into blocks of `block_size` paths
+  (the last block may be smaller). The block `i` is generated by
+  `sample_fn(num_samples=block_size, seed=seed_i, skip=skip_i)` where
+
+  * for the `STATELESS` random types `seed_i` is `seed` folded with `i` by
+    `tf.random.experimental.stateless_fold_in`;
+  * for the `SOBOL`, `HALTON` and `HALTON_RANDOMIZED` random types
+    `skip_i = skip + i * block_size`, so that the blocks are consecutive parts
+    of the same sequence, randomized with the same `seed` for
+    `HALTON_RANDOMIZED`.
+
+  The blocks are evaluated by a pool of `num_workers` processes and the
+  statistics of the blocks are merged in the order of the blocks. The result
+  depends on `block_size` but not on `num_workers`: it is identical to the
+  result of the sequential evaluation of the blocks with `num_workers=1`.
+
+  As the workers are started with the `spawn` method, `sample_fn` should be
+  picklable, i.e., a module level function or a `functools.partial` of one.
+
+  #### Example
+
+  ```python
+  import functools
+  import tensorflow as tf
+  import tf_quant_finance as tff
+
+  # Module level function
+  def terminal_values(num_samples, seed, skip, mu, sigma):
+    process = tff.models.GeometricBrownianMotion(mu, sigma, dtype=tf.float64)
+    paths = process.sample_paths(
+        times=[1.0], initial_state=1.0, num_samples=num_samples, seed=seed,
+        skip=skip, random_type=tff.math.random.RandomType.STATELESS)
+    return paths[:, -1, 0]
+
+  statistics = tff.models.sharded_monte_carlo.estimate(
+      functools.partial(terminal_values, mu=0.05, sigma=0.2),
+      num_samples=10000000,
+      block_size=100000,
+      random_type=tff.math.random.RandomType.STATELESS,
+      seed=[1, 2],
+      num_workers=8)
+  # statistics.mean is the estimate of E[S(1)] = exp(0.05)
+  ```
+
+  Args:
+    sample_fn: A picklable Python callable which accepts the keyword arguments
+      `num_samples`, `seed` and `skip` and returns the per-path values, a real
+      `Tensor` of shape `[num_samples] + values_shape`.
+    num_samples: A positive Python `int`. The total number of paths.
+    block_size: A positive Python `int`. The number of paths of a block.
+    random_type: Enum value of `RandomType`. The type of (quasi)-random number
+      generator used by `sample_fn`. Should be one of `STATELESS`,
+      `STATELESS_ANTITHETIC`, `SOBOL`, `HALTON` or `HALTON_RANDOMIZED`, which
+      are reproducible across processes.
+    seed: The seed of the random number generator. An integer `Tensor` of
+      shape `[2]` for the `STATELESS` random types. Passed unchanged to
+      `sample_fn` for the other random types. Required for the `STATELESS`
+      random types and for `HALTON_RANDOMIZED`, whose randomization should be
+      the same in all the workers.
+      Default value: `None`.
+    skip: A Python `int`. The number of initial points of the Sobol or Halton
+      sequence to skip.
+      Default value: 0.
+    num_workers: An optional positive Python `int`. The number of worker
+      processes. If 1, the blocks are evaluated in the current process.
+      Default value: `None` which maps to the number of CPUs.
+    num_threads_per_worker: An optional positive Python `int`. The number of
+      threads used by TensorFlow for the intra-op parallelism in each worker.
+      Default value: `None` which maps to the number of CPUs divided by
+      `num_workers`.
+
+  Returns:
+    An instance of `tff.models.path_reducers.MonteCarloStatistics` with
+    `float64` numpy values.
+
+  Raises:
+    ValueError: If `random_type` is not reproducible across processes or if a
+      `STATELESS` random type or `HALTON_RANDOMIZED` is used without a `seed`.
+  """
+  if random_type not in _REPRODUCIBLE_RANDOM_TYPES:
+    raise ValueError('`random_type` should be one of {0}. Supplied: {1}'
+                     .format(_REPRODUCIBLE_RANDOM_TYPES, random_type))
+  if (random_type in (random.RandomType.STATELESS,
+                      random.RandomType.STATELESS_ANTITHETIC,
+                      random.RandomType.HALTON_RANDOMIZED)
+      and seed is None):
+    raise ValueError('`seed` should be supplied for the STATELESS and '
+                     'HALTON_RANDOMIZED random types.')
+  if seed is not None:
+    seed = np.asarray(seed)
+  num_blocks = -(-num_samples // block_size)
+  block_sizes = [min(block_size, num_samples - block * block_size)
+                 for block in range(num_blocks)]
+  block_fn = functools.partial(
+      _block_statistics, sample_fn=sample_fn, block_size=block_size,
+      random_type=random_type, seed=seed, skip=skip)
+  num_cpus = os.cpu_count() or 1
+  num_workers = min(num_workers or num_cpus, num_blocks)
+  if num_workers == 1:
+    block_statistics = list(map(block_fn, range(num_blocks), block_sizes))
+  else:
+    with futures.ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_initialize_worker,
+        initargs=(num_threads_per_worker
+                  or max(num_cpus // num_workers, 1),)) as executor:
+      # `map` returns the results in the order of the blocks.
+      block_statistics = list(
+          executor.map(block_fn, range(num_blocks), block_sizes))
+  # Merge sequentially in the order of the blocks so that the result does not
+  # depend on the partition of the blocks between the workers.
+  sums = block_statistics[0]
+  for statistics in block_statistics[1:]:
+    sums = path_reducers.merge(sums, statistics)
+  return path_reducers.MonteCarloStatistics(
+      mean=sums.mean,
+      variance=sums.variance / max(sums.num_samples - 1, 1),
+      num_samples=sums.num_samples)
+
+
+def _initialize_worker(num_threads):
+  """Limits the threads of a worker to avoid oversubscribing the CPUs."""
+  tf.config.threading.set_intra_op_parallelism_threads(num_threads)
+  tf.config.threading.set_inter_op_parallelism_threads(num_threads)
+
+
+def _block_statistics(block, num_samples, *, sample_fn, block_size,
+                      random_type, seed, skip):
+  """Returns the statistics of a block of paths as numpy values."""
+  block_seed = seed
+  if random_type in (random.RandomType.STATELESS,
+                     random.RandomType.STATELESS_ANTITHETIC):
+    block_seed = tf.random.experimental.stateless_fold_in(
+        tf.convert_to_tensor(seed), block)
+  values = sample_fn(num_samples=num_samples, seed=block_seed,
+                     skip=skip + block * block_size)
+  values = tf.cast(values, tf.float64)
+  statistics = path_reducers.statistics(values, sample_axis=0)
+  return path_reducers.MonteCarloStatistics(
+      *(np.asarray(value) for value in statistics))
@@ -0,0 +1,107 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for methods in `sharded_monte_carlo`."""
+
+import functools
+
+from absl.testing import parameterized
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+import tf_quant_finance as tff
+
+sharded_monte_carlo = tff.models.sharded_monte_carlo
+random = tff.math.random
+
+
+def _terminal_values(num_samples, seed, skip, random_type):
+  """Terminal values of a geometric Brownian motion."""
+  process = tff.models.GeometricBrownianMotion(0.05, 0.2, dtype=tf.float64)
+  paths = process.sample_paths(
+      times=[0.5, 1.0], initial_state=1.0, num_samples=num_samples,
+      seed=seed, skip=skip, random_type=random_type)
+  return paths[:, :, 0]
+
+
+# The sharded estimation spawns processes and is only supported in eager mode.
+class ShardedMonteCarloTest(tf.test.TestCase, parameterized.TestCase):
+
+  @parameterized.named_parameters(
+      ('Stateless', random.RandomType.STATELESS, [1, 2]),
+      ('Sobol', random.RandomType.SOBOL, None))
+  def test_sequential(self, random_type, seed):
+    """Statistics are merged from the blocks."""
+    sample_fn = functools.partial(_terminal_values, random_type=random_type)
+    statistics = sharded_monte_carlo.estimate(
+        sample_fn, num_samples=1000, block_size=300,
+        random_type=random_type, seed=seed, num_workers=1)
+    # Values of all the blocks
+    if random_type == random.RandomType.SOBOL:
+      values = sample_fn(num_samples=1000, seed=None, skip=0)
+    else:
+      values = tf.concat(
+          [sample_fn(num_samples=min(300, 1000 - 300 * block),
+                     seed=tf.random.experimental.stateless_fold_in(
+                         seed, block),
+                     skip=0) for block in range(4)], axis=0)
+    values = self.evaluate(values)
+    with self.subTest('Mean'):
+      self.assertAllClose(statistics.mean, np.mean(values, axis=0))
+    with self.subTest('Variance'):
+      self.assertAllClose(statistics.variance,
+                          np.var(values, axis=0, ddof=1))
+    with self.subTest('NumSamples'):
+      self.assertEqual(statistics.num_samples, 1000)
+
+  def test_workers_are_reproducible(self):
+    """The result does not depend on the number of workers."""
+    sample_fn = functools.partial(_terminal_values,
+                                  random_type=random.RandomType.STATELESS)
+    kwargs = dict(num_samples=4000, block_size=1000,
+                  random_type=random.RandomType.STATELESS, seed=[4, 2])
+    sequential = sharded_monte_carlo.estimate(sample_fn, num_workers=1,
+                                              **kwargs)
+    sharded = sharded_monte_carlo.estimate(sample_fn, num_workers=2,
+                                           num_threads_per_worker=1, **kwargs)
+    with self.subTest('Mean'):
+      self.assertAllEqual(sharded.mean, sequential.mean)
+    with self.subTest('Variance'):
+      self.assertAllEqual(sharded.variance, sequential.variance)
+    with self.subTest('Expectation'):
+      standard_error = np.sqrt(sharded.variance / sharded.num_samples)
+      self.assertAllClose(sharded.mean, np.exp([0.025, 0.05]),
+                          atol=4 * np.max(standard_error))
+
+  def test_invalid_random_type(self):
+    """Error is raised for random types which are not reproducible."""
+    with self.subTest('Pseudo'):
+      with self.assertRaises(ValueError):
+        sharded_monte_carlo.estimate(
+            _terminal_values, num_samples=10, block_size=5,
+            random_type=random.RandomType.PSEUDO, seed=1)
+    with self.subTest('NoSeed'):
+      with self.assertRaises(ValueError):
+        sharded_monte_carlo.estimate(
+            _terminal_values, num_samples=10, block_size=5,
+            random_type=random.RandomType.STATELESS)
+    with self.subTest('HaltonRandomizedNoSeed'):
+      with self.assertRaises(ValueError):
+        sharded_monte_carlo.estimate(
+            _terminal_values, num_samples=10, block_size=5,
+            random_type=random.RandomType.HALTON_RANDOMIZED)
+
+
+if __name__ == '__main__':
+  tf.test.main()
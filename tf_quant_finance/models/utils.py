@@ -15,6 +15,9 @@
 
 import tensorflow.compat.v2 as tf
 from tf_quant_finance.math import random_ops as random
+from tf_quant_finance.models import path_construction as path_construction_lib
+
+PathConstruction = path_construction_lib.PathConstruction
 
 
 def generate_mc_normal_draws(num_normal_draws,
@@ -24,6 +27,8 @@ def generate_mc_normal_draws(num_normal_draws,
                              batch_shape=None,
                              skip=0,
                              seed=None,
+                             path_construction=None,
+                             time_step_sizes=None,
                              dtype=None,
                              name=None):
   """Generates normal random samples to be consumed by a Monte Carlo algorithm.
@@ -42,6 +47,17 @@ def generate_mc_normal_draws(num_normal_draws,
   quasi-`random_type` `x[i]` is correspond to different dimensions of the
   quasi-random sequence, so that it can be used in a Monte Carlo algorithm
 
+  By default, the dimensions of the quasi-random sequence are assigned to the
+  time steps in order. With a `path_construction` of `BROWNIAN_BRIDGE` or
+  `PCA`, the draws `z` of each sample path are instead mapped to the normalized
+  Brownian increments `x[i] = (W(t_{i+1}) - W(t_i)) / sqrt(t_{i+1} - t_i)` of
+  a Brownian path `W` constructed from `z` with a Brownian bridge or with the
+  principal components of the path. The map is orthogonal, so that the
+  output draws are still independent standard normals, but the leading
+  dimensions of the quasi-random sequence now drive the largest scale features
+  of the paths, which reduces the effective dimension of path-dependent
+  integrands.
+
   Args:
     num_normal_draws: A scalar int32 `Tensor`. The number of independent normal
       draws at each time step for each sample path. Should be a graph
@@ -71,6 +87,13 @@ def generate_mc_normal_draws(num_normal_draws,
         `STATELESS` and  `STATELESS_ANTITHETIC `must be supplied as an integer
         `Tensor` of shape `[2]`.
         Default value: `None` which means no seed is set.
+    path_construction: An optional instance of `PathConstruction`. The
+      construction of the Brownian paths from the draws.
+      Default value: `None` which maps to `PathConstruction.INCREMENTAL`.
+    time_step_sizes: An optional real `Tensor` of shape `[num_time_steps]`.
+      The sizes of the time steps. Used only when `path_construction` is
+      `BROWNIAN_BRIDGE` or `PCA`.
+      Default value: `None` which means that the time steps are uniform.
     dtype: The `dtype` of the output `Tensor`.
       Default value: `None` which maps to `float32`.
     name: Python string. The name to give this op.
@@ -79,6 +102,10 @@ def generate_mc_normal_draws(num_normal_draws,
   Returns:
    A `Tensor` of shape
    `[num_time_steps] + batch_shape + [num_sample_paths, num_normal_draws]`.
+
+  Raises:
+    ValueError: If `path_construction` is `BROWNIAN_BRIDGE` and
+      `num_time_steps` is not known statically.
   """
   if name is None:
     name = 'generate_mc_normal_draws'
@@ -125,7 +152,112 @@ def generate_mc_normal_draws(num_normal_draws,
       perm = [normal_draws_rank-2] + list(
           range(normal_draws_rank-2)) + [normal_draws_rank-1]
     normal_draws = tf.transpose(normal_draws, perm=perm)
-    return normal_draws
+    if path_construction in (None, PathConstruction.INCREMENTAL):
+      return normal_draws
+    # Shape [num_time_steps, num_time_steps]
+    construction_matrix = _increments_construction_matrix(
+        path_construction, num_time_steps, time_step_sizes,
+        dtype=normal_draws.dtype)
+    return tf.tensordot(construction_matrix, normal_draws, axes=[[1], [0]])
+
+
+def _increments_construction_matrix(path_construction, num_time_steps,
+                                    time_step_sizes, dtype):
+  """Maps the draws to the normalized increments of the constructed paths.
+
+  Args:
+    path_construction: An instance of `PathConstruction`. Either
+      `BROWNIAN_BRIDGE` or `PCA`.
+    num_time_steps: A scalar int32 `Tensor`. The number of time steps.
+    time_step_sizes: An optional real `Tensor` of shape `[num_time_steps]`.
+      The sizes of the time steps. If `None`, the time steps are uniform.
+    dtype: The `dtype` of the output `Tensor`.
+
+  Returns:
+    An orthogonal `Tensor` `Q` of shape `[num_time_steps, num_time_steps]`
+    such that `Q @ z` are the normalized Brownian increments of the path
+    constructed from the draws `z`.
+
+  Raises:
+    ValueError: If `path_construction` is `BROWNIAN_BRIDGE` and
+      `num_time_steps` is not known statically.
+  """
+  if time_step_sizes is None:
+    time_step_sizes = tf.ones([num_time_steps], dtype=dtype)
+  time_step_sizes = tf.convert_to_tensor(time_step_sizes, dtype=dtype,
+                                         name='time_step_sizes')
+  # Shape [num_time_steps]
+  times = tf.math.cumsum(time_step_sizes)
+  if path_construction == PathConstruction.PCA:
+    # Covariance matrix of the Brownian path `cov[i, j] = min(t_i, t_j)`
+    covariance = tf.math.minimum(tf.expand_dims(times, -1),
+                                 tf.expand_dims(times, 0))
+    eigenvalues, eigenvectors = tf.linalg.eigh(covariance)
+    # Sort the principal components by decreasing eigenvalue.
+    eigenvalues = tf.reverse(eigenvalues, axis=[0])
+    eigenvectors = tf.reverse(eigenvectors, axis=[1])
+    # Shape [num_time_steps, num_time_steps]. `paths = path_matrix @ z`.
+    path_matrix = eigenvectors * tf.math.sqrt(
+        tf.math.maximum(eigenvalues, 0))
+  elif path_construction == PathConstruction.BROWNIAN_BRIDGE:
+    num_steps = tf.get_static_value(num_time_steps)
+    if num_steps is None:
+      raise ValueError('`num_time_steps` should be known statically for the '
+                       'Brownian bridge construction.')
+    path_matrix = _brownian_bridge_matrix(int(num_steps), times)
+  else:
+    raise ValueError(f'Unsupported path construction: {path_construction}')
+  # Increments of the paths normalized by the square root of the time steps.
+  increments = path_matrix - tf.pad(path_matrix[:-1], [[1, 0], [0, 0]])
+  return increments / tf.expand_dims(tf.math.sqrt(time_step_sizes), -1)
+
+
+def _brownian_bridge_matrix(num_steps, times):
+  """Returns `B` such that `B @ z` is the Brownian bridge built from `z`.
+
+  The terminal value `W(t_{n-1}) = sqrt(t_{n-1}) z_0` is constructed first.
+  The next draws construct the points in the middle of the already constructed
+  ones (in the index space of `times`) one level at a time, using the
+  conditional distribution of the Brownian motion at `t` given its values at
+  `l < t < r`, which is normal with mean
+  `((r - t) W(l) + (t - l) W(r)) / (r - l)` and variance
+  `(t - l) (r - t) / (r - l)`.
+
+  Args:
+    num_steps: Python int. The number of times.
+    times: A real `Tensor` of shape `[num_steps]`. The increasing positive
+      times at which the path is constructed.
+
+  Returns:
+    A `Tensor` of shape `[num_steps, num_steps]`.
+  """
+  dtype = times.dtype
+  draws = tf.eye(num_steps, dtype=dtype)
+  zero = tf.zeros([num_steps], dtype=dtype)
+  # Rows of the path matrix keyed by time index. The index `-1` stands for the
+  # start of the path `W(0) = 0`.
+  rows = {-1: zero}
+  rows[num_steps - 1] = tf.math.sqrt(times[-1]) * draws[0]
+  draw_index = 1
+  intervals = [(-1, num_steps - 1)]
+  while intervals:
+    next_intervals = []
+    for left, right in intervals:
+      if right - left < 2:
+        continue
+      middle = (left + right + 1) // 2
+      t_left = times[left] if left >= 0 else tf.constant(0, dtype=dtype)
+      t_middle, t_right = times[middle], times[right]
+      width = t_right - t_left
+      rows[middle] = (
+          (t_right - t_middle) / width * rows[left]
+          + (t_middle - t_left) / width * rows[right]
+          + tf.math.sqrt((t_middle - t_left) * (t_right - t_middle) / width)
+          * draws[draw_index])
+      draw_index += 1
+      next_intervals += [(left, middle), (middle, right)]
+    intervals = next_intervals
+  return tf.stack([rows[i] for i in range(num_steps)], axis=0)
 
 
 def maybe_update_along_axis(*,
@@ -55,6 +55,41 @@ class UtilsTest(tf.test.TestCase, parameterized.TestCase):
                          [0.8871465, -1.5341204]]]
     self.assertAllClose(samples, expected_samples, rtol=1e-5, atol=1e-5)
 
+  @parameterized.named_parameters(
+      ('BrownianBridge', tff.models.PathConstruction.BROWNIAN_BRIDGE),
+      ('PCA', tff.models.PathConstruction.PCA),
+  )
+  def test_path_construction(self, path_construction):
+    """Path constructions are orthogonal maps of the incremental draws."""
+    dtype = np.float64
+    num_draws = 2
+    steps_num = 5
+    num_samples = 8
+    time_step_sizes = np.array([0.1, 0.3, 0.2, 0.25, 0.15], dtype=dtype)
+    draws_kwargs = dict(
+        num_normal_draws=num_draws, num_time_steps=steps_num,
+        num_sample_paths=num_samples,
+        random_type=tff.math.random.RandomType.SOBOL, batch_shape=[3],
+        dtype=dtype, skip=10)
+    incremental_draws = utils.generate_mc_normal_draws(**draws_kwargs)
+    draws = utils.generate_mc_normal_draws(
+        path_construction=path_construction, time_step_sizes=time_step_sizes,
+        **draws_kwargs)
+    incremental_draws, draws = self.evaluate([incremental_draws, draws])
+    with self.subTest('Shape'):
+      self.assertEqual(draws.shape, (steps_num, 3, num_samples, num_draws))
+    with self.subTest('Norm'):
+      self.assertAllClose(np.sum(draws**2, axis=0),
+                          np.sum(incremental_draws**2, axis=0))
+    if path_construction == tff.models.PathConstruction.BROWNIAN_BRIDGE:
+      with self.subTest('TerminalValue'):
+        # The terminal value of the path is driven by the first draws only.
+        terminal_values = np.sum(
+            np.sqrt(time_step_sizes).reshape([-1, 1, 1, 1]) * draws, axis=0)
+        self.assertAllClose(
+            terminal_values,
+            np.sqrt(np.sum(time_step_sizes)) * incremental_draws[0])
+
   @parameterized.named_parameters(
       ('SinglePrecision', np.float32),
       ('DoublePrecision', np.float64),